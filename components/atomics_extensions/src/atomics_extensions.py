@@ -2,7 +2,13 @@
 ES2024 Atomics API extensions.
 
 Implements Atomics.waitAsync() and enhanced notify() for asynchronous waiting
-on shared memory locations.
+on shared memory locations, plus the atomic read-modify-write operations.
+
+Atomic operations hold the buffer's atomic section for the element they
+touch. For a SharedArrayBuffer that section is a record lock in the shared
+memory segment, so the operations stay atomic when several worker processes
+share the buffer. Waiters live in the process that called waitAsync() and
+are woken by notify() calls made in that same process.
 """
 
 import threading
@@ -39,16 +45,43 @@ class Waiter:
         self.timed_out = False
 
 
+class _EventLoopTimeout:
+    """Cancellable waiter timeout scheduled with event_loop.call_later()."""
+
+    def __init__(self, event_loop, handle_id):
+        self._event_loop = event_loop
+        self._handle_id = handle_id
+
+    def cancel(self):
+        self._event_loop.cancel(self._handle_id)
+
+
+# Element formats Atomics operates on (Uint8ClampedArray is excluded by name)
+_INTEGER_FORMATS = frozenset('bBhHiIqQ')
+
+
+def _waiter_key(typed_array, index):
+    """Key a waiter list by memory location rather than Python object.
+
+    Two SharedArrayBuffer objects attached to the same segment (e.g. one
+    unpickled from another) share their waiters.
+    """
+    buffer = typed_array.buffer
+    buffer_key = getattr(buffer, 'name', None) or id(buffer)
+    return (buffer_key, typed_array.byteOffset + index * typed_array.BYTES_PER_ELEMENT)
+
+
 class AtomicsExtensions:
     """ES2024 Atomics API extensions.
 
     Provides Atomics.waitAsync() for asynchronous waiting on shared memory
-    locations and enhanced notify() for waking waiters.
+    locations, enhanced notify() for waking waiters, and the atomic
+    load/store/read-modify-write operations.
     """
 
     def __init__(self):
         """Initialize Atomics extensions."""
-        # Waiter queue: (buffer_id, index) -> list of Waiter objects
+        # Waiter queue: (buffer key, byte index) -> list of Waiter objects
         self._waiters: Dict[Tuple[int, int], List[Waiter]] = {}
         self._lock = threading.Lock()
         self._sab_integration = SharedArrayBufferIntegration()
@@ -121,8 +154,7 @@ class AtomicsExtensions:
                     waiter.timed_out = True
 
                     # Remove from waiters queue
-                    buffer_id = id(typed_array.buffer)
-                    key = (buffer_id, index)
+                    key = _waiter_key(typed_array, index)
 
                     if key in self._waiters:
                         try:
@@ -135,15 +167,19 @@ class AtomicsExtensions:
                 # Resolve promise with "timed-out"
                 event_loop.queue_microtask(lambda: resolve("timed-out"))
 
-            # Schedule timeout
-            timeout_timer = threading.Timer(timeout_ms / 1000.0, on_timeout)
-            timeout_timer.daemon = True
-            timeout_timer.start()
-            waiter.timeout_handle = timeout_timer
+            # Schedule timeout on the event loop when it has timers
+            # (AsyncioEventLoop), otherwise on a background thread
+            if hasattr(event_loop, 'call_later'):
+                handle_id = event_loop.call_later(timeout_ms, on_timeout)
+                waiter.timeout_handle = _EventLoopTimeout(event_loop, handle_id)
+            else:
+                timeout_timer = threading.Timer(timeout_ms / 1000.0, on_timeout)
+                timeout_timer.daemon = True
+                timeout_timer.start()
+                waiter.timeout_handle = timeout_timer
 
         # Add to waiters queue
-        buffer_id = id(typed_array.buffer)
-        key = (buffer_id, index)
+        key = _waiter_key(typed_array, index)
 
         with self._lock:
             if key not in self._waiters:
@@ -182,8 +218,7 @@ class AtomicsExtensions:
         if not self._sab_integration.is_shared_array_buffer(typed_array.buffer):
             raise JSTypeError("Atomics.notify can only be used with SharedArrayBuffer")
 
-        buffer_id = id(typed_array.buffer)
-        key = (buffer_id, int(index))
+        key = _waiter_key(typed_array, int(index))
 
         # Determine how many to notify
         if count == float('inf'):
@@ -225,3 +260,108 @@ class AtomicsExtensions:
             waiter.resolve("ok")
 
         return notified_count
+
+    # ------------------------------------------------------------------
+    # Atomic operations
+    # ------------------------------------------------------------------
+
+    def load(self, typed_array, index):
+        """Atomically read an element.
+
+        Args:
+            typed_array: Integer TypedArray
+            index: Element index
+
+        Returns:
+            The element value
+        """
+        return self._update(typed_array, index, None)
+
+    def store(self, typed_array, index, value):
+        """Atomically write an element.
+
+        Args:
+            typed_array: Integer TypedArray
+            index: Element index
+            value: Value to store
+
+        Returns:
+            The value as converted to the element type
+        """
+        index = self._validate_index(typed_array, index)
+        value = typed_array._convert_value(value)
+        with self._element_section(typed_array, index):
+            typed_array[index] = value
+        return value
+
+    def add(self, typed_array, index, value):
+        """Atomically add to an element; returns the previous value."""
+        return self._update(typed_array, index, lambda old: old + int(value))
+
+    def sub(self, typed_array, index, value):
+        """Atomically subtract from an element; returns the previous value."""
+        return self._update(typed_array, index, lambda old: old - int(value))
+
+    def and_(self, typed_array, index, value):
+        """Atomically bitwise-AND an element; returns the previous value."""
+        return self._update(typed_array, index, lambda old: old & int(value))
+
+    def or_(self, typed_array, index, value):
+        """Atomically bitwise-OR an element; returns the previous value."""
+        return self._update(typed_array, index, lambda old: old | int(value))
+
+    def xor(self, typed_array, index, value):
+        """Atomically bitwise-XOR an element; returns the previous value."""
+        return self._update(typed_array, index, lambda old: old ^ int(value))
+
+    def exchange(self, typed_array, index, value):
+        """Atomically replace an element; returns the previous value."""
+        return self._update(typed_array, index, lambda old: value)
+
+    def compare_exchange(self, typed_array, index, expected, replacement):
+        """Atomically replace an element if it equals expected.
+
+        Args:
+            typed_array: Integer TypedArray
+            index: Element index
+            expected: Value to compare against (converted to element type)
+            replacement: Value to store on match
+
+        Returns:
+            The previous value (equal to expected when the swap happened)
+        """
+        expected = typed_array._convert_value(expected)
+        return self._update(
+            typed_array, index, lambda old: replacement if old == expected else None
+        )
+
+    def _update(self, typed_array, index, compute):
+        """Run a read-modify-write on one element under its atomic section.
+
+        compute(old) returns the new value, or None to leave it unchanged.
+        """
+        index = self._validate_index(typed_array, index)
+        with self._element_section(typed_array, index):
+            old = typed_array[index]
+            if compute is not None:
+                new = compute(old)
+                if new is not None:
+                    typed_array[index] = new
+        return old
+
+    def _element_section(self, typed_array, index):
+        size = typed_array.BYTES_PER_ELEMENT
+        return typed_array.buffer._atomic_section(
+            typed_array.byteOffset + index * size, size
+        )
+
+    def _validate_index(self, typed_array, index):
+        if (
+            getattr(typed_array, '_format', None) not in _INTEGER_FORMATS
+            or type(typed_array).__name__ == 'Uint8ClampedArray'
+        ):
+            raise JSTypeError("Atomics operations require an integer TypedArray")
+        index = int(index)
+        if index < 0 or index >= typed_array.length:
+            raise RangeError(f"Index {index} out of bounds for array length {typed_array.length}")
+        return index
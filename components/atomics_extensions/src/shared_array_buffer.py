@@ -14,6 +14,7 @@ if str(typed_arrays_src) not in sys.path:
 
 from array_buffer import ArrayBuffer
 from exceptions import RangeError
+from shared_array_buffer import SharedArrayBuffer
 
 
 class SharedArrayBufferIntegration:
@@ -27,8 +28,8 @@ class SharedArrayBufferIntegration:
         """Create SharedArrayBuffer for concurrent access.
 
         Creates a new SharedArrayBuffer with the specified byte length.
-        The buffer can be shared across multiple threads/agents and used
-        with atomic operations.
+        The buffer lives in OS shared memory, so it can be shared across
+        threads and worker processes and used with atomic operations.
 
         Args:
             byte_length: Buffer size in bytes
@@ -52,11 +53,7 @@ class SharedArrayBufferIntegration:
         if byte_length < 0:
             raise RangeError(f"Invalid byte length: {byte_length}")
 
-        # Create ArrayBuffer and mark it as shared
-        buffer = ArrayBuffer(byte_length)
-        buffer._shared = True
-
-        return buffer
+        return SharedArrayBuffer(byte_length)
 
     def is_shared_array_buffer(self, buffer):
         """Check if buffer is SharedArrayBuffer.
@@ -4,6 +4,8 @@ Integration tests for Atomics extensions.
 Tests cross-component integration and real-world scenarios.
 """
 
+import multiprocessing
+import pickle
 import pytest
 import threading
 import time
@@ -19,6 +21,16 @@ from typed_array import Int32Array
 from components.event_loop.src import EventLoop
 
 
+def _increment_shared_counter(payload, iterations):
+    """Worker process: attach to a pickled buffer and add to element 0."""
+    from components.atomics_extensions.src.atomics_extensions import AtomicsExtensions
+
+    counter = Int32Array(pickle.loads(payload))
+    atomics = AtomicsExtensions()
+    for _ in range(iterations):
+        atomics.add(counter, 0, 1)
+
+
 class TestAtomicsIntegration:
     """Integration tests for Atomics with EventLoop and Promises."""
 
@@ -284,3 +296,57 @@ class TestAtomicsIntegration:
 
         # All resolved
         assert resolved_count[0] == num_waiters
+
+    def test_wait_async_timeout_on_asyncio_event_loop(self):
+        """
+        Given an asyncio-backed event loop
+        When a waitAsync waiter times out or is notified
+        Then the timeout is an asyncio timer and the promise settles on the host loop
+        """
+        import asyncio
+        from components.event_loop.src import AsyncioEventLoop
+        from components.atomics_extensions.src.atomics_extensions import AtomicsExtensions
+        from components.atomics_extensions.src.shared_array_buffer import SharedArrayBufferIntegration
+
+        sab = SharedArrayBufferIntegration()
+        shared_buffer = sab.create_shared_buffer(16)
+        int32_array = Int32Array(shared_buffer)
+        int32_array[0] = 0
+
+        atomics = AtomicsExtensions()
+
+        async def main():
+            loop = AsyncioEventLoop()
+            timed = atomics.wait_async(int32_array, 0, 0, timeout=5, event_loop=loop)
+            notified = atomics.wait_async(int32_array, 1, 0, timeout=1000, event_loop=loop)
+            loop.queue_task(lambda: atomics.notify(int32_array, 1, 1))
+            return await asyncio.gather(
+                loop.to_future(timed.promise),
+                loop.to_future(notified.promise),
+            )
+
+        assert asyncio.run(main()) == ["timed-out", "ok"]
+
+    def test_atomic_add_across_processes(self):
+        """
+        Given a SharedArrayBuffer handed to several worker processes
+        When each worker performs many atomic adds on the same element
+        Then no increment is lost
+        """
+        from components.atomics_extensions.src.shared_array_buffer import SharedArrayBufferIntegration
+
+        shared_buffer = SharedArrayBufferIntegration().create_shared_buffer(16)
+        payload = pickle.dumps(shared_buffer)
+        context = multiprocessing.get_context("fork")
+
+        workers = [
+            context.Process(target=_increment_shared_counter, args=(payload, 500))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert [worker.exitcode for worker in workers] == [0, 0, 0, 0]
+        assert Int32Array(shared_buffer)[0] == 2000
@@ -0,0 +1,109 @@
+"""
+Unit tests for atomic load/store and read-modify-write operations.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add typed_arrays src to path
+typed_arrays_src = Path(__file__).parent.parent.parent.parent / 'typed_arrays' / 'src'
+if str(typed_arrays_src) not in sys.path:
+    sys.path.insert(0, str(typed_arrays_src))
+
+from typed_array import Float64Array, Int32Array, Uint8Array, Uint8ClampedArray
+from exceptions import RangeError, TypeError as JSTypeError
+from components.atomics_extensions.src.atomics_extensions import AtomicsExtensions
+from components.atomics_extensions.src.shared_array_buffer import SharedArrayBufferIntegration
+
+
+class TestAtomicOperations:
+    """Test Atomics read-modify-write operations."""
+
+    def setup_method(self):
+        """Set up a shared Int32Array."""
+        self.atomics = AtomicsExtensions()
+        buffer = SharedArrayBufferIntegration().create_shared_buffer(16)
+        self.array = Int32Array(buffer)
+
+    def test_arithmetic_returns_previous_value(self):
+        """
+        Given an element holding 10
+        When add and sub are applied
+        Then each returns the value before the update
+        """
+        self.atomics.store(self.array, 0, 10)
+
+        assert self.atomics.add(self.array, 0, 5) == 10
+        assert self.atomics.sub(self.array, 0, 3) == 15
+        assert self.atomics.load(self.array, 0) == 12
+
+    def test_add_wraps_to_element_type(self):
+        """
+        Given an element holding INT32_MAX
+        When 1 is added
+        Then the element wraps to INT32_MIN
+        """
+        self.atomics.store(self.array, 1, 2**31 - 1)
+        self.atomics.add(self.array, 1, 1)
+
+        assert self.atomics.load(self.array, 1) == -2**31
+
+    def test_bitwise_operations(self):
+        """
+        Given an element holding 0b1100
+        When and/or/xor are applied
+        Then the bits update as expected
+        """
+        self.atomics.store(self.array, 2, 0b1100)
+
+        self.atomics.and_(self.array, 2, 0b0110)
+        assert self.array[2] == 0b0100
+        self.atomics.or_(self.array, 2, 0b0001)
+        assert self.array[2] == 0b0101
+        self.atomics.xor(self.array, 2, 0b0111)
+        assert self.array[2] == 0b0010
+
+    def test_exchange_and_compare_exchange(self):
+        """
+        Given an element holding 1
+        When compareExchange is called with a matching and a stale value
+        Then only the matching call swaps
+        """
+        self.atomics.store(self.array, 3, 1)
+
+        assert self.atomics.exchange(self.array, 3, 2) == 1
+        assert self.atomics.compare_exchange(self.array, 3, 2, 9) == 2
+        assert self.atomics.compare_exchange(self.array, 3, 2, 5) == 9
+        assert self.array[3] == 9
+
+    def test_works_on_non_shared_buffers(self):
+        """
+        Given a TypedArray over a regular ArrayBuffer
+        When an atomic add is applied
+        Then it behaves like on a shared buffer
+        """
+        array = Uint8Array(4)
+        self.atomics.add(array, 0, 300)
+
+        assert array[0] == 300 % 256
+
+    def test_rejects_non_integer_arrays(self):
+        """
+        Given float and clamped typed arrays
+        When atomic operations are applied
+        Then TypeError is raised
+        """
+        with pytest.raises(JSTypeError):
+            self.atomics.add(Float64Array(2), 0, 1)
+        with pytest.raises(JSTypeError):
+            self.atomics.load(Uint8ClampedArray(2), 0)
+
+    def test_rejects_out_of_range_index(self):
+        """
+        Given a 4-element array
+        When index 4 is used
+        Then RangeError is raised
+        """
+        with pytest.raises(RangeError):
+            self.atomics.load(self.array, 4)
@@ -8,7 +8,7 @@ Provides:
 - OSREntry: OSR entry point information
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from dataclasses import dataclass
 from components.baseline_jit.src.backends.x64_backend import Register, x64Backend
 from components.baseline_jit.src.register_allocator import RegisterAllocator
@@ -58,10 +58,14 @@ class OSREntry:
         bytecode_offset: Bytecode offset for OSR
         compiled_offset: Compiled code offset
         state_map: Interpreter state mapping
+        code: Executable entry taking (runtime, frame values), where the
+            frame values are the interpreter's locals followed by its
+            operand stack (None if no tier compiled the loop)
     """
     bytecode_offset: int
     compiled_offset: int
     state_map: Dict[str, Any]
+    code: Optional[Callable] = None
 
 
 class BaselineJITCompiler:
@@ -106,7 +110,8 @@ class BaselineJITCompiler:
 
         Args:
             function_id: Function ID
-            call_count: Number of times function has been called
+            call_count: Number of times function has been called (e.g. the
+                invocation_count of its FeedbackVector)
 
         Returns:
             True if should tier-up to baseline JIT
@@ -5,7 +5,7 @@ Handles tier-up from interpreter to JIT code during hot loop execution.
 Allows transitioning from interpreted to compiled code without returning.
 """
 
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional
 from components.baseline_jit.src.jit_compiler import OSREntry
 
 
@@ -29,7 +29,8 @@ class OSRManager:
         self._osr_entries: Dict[int, OSREntry] = {}  # bytecode_offset -> OSREntry
 
     def create_osr_entry(self, bytecode_offset: int,
-                         interpreter_state: Dict[str, Any]) -> OSREntry:
+                         interpreter_state: Dict[str, Any],
+                         code: Optional[Callable] = None) -> OSREntry:
         """
         Create OSR entry point for hot loop.
 
@@ -38,6 +39,7 @@ class OSRManager:
         Args:
             bytecode_offset: Bytecode offset where OSR entry is located
             interpreter_state: Current interpreter state (stack, locals, etc.)
+            code: Compiled loop entry (see OSREntry.code), if any
 
         Returns:
             OSREntry with state mapping
@@ -56,7 +58,8 @@ class OSRManager:
         entry = OSREntry(
             bytecode_offset=bytecode_offset,
             compiled_offset=compiled_offset,
-            state_map=dict(interpreter_state)  # Copy state
+            state_map=dict(interpreter_state),  # Copy state
+            code=code
         )
 
         # Store entry for later use
@@ -64,32 +67,32 @@ class OSRManager:
 
         return entry
 
-    def perform_osr(self, entry: OSREntry) -> None:
+    def perform_osr(self, entry: OSREntry, runtime: Any = None) -> Any:
         """
         Perform on-stack replacement.
 
-        Transitions from interpreter to JIT code at OSR entry point.
+        Transitions from interpreter to JIT code at OSR entry point: the
+        entry's code is called with the captured locals followed by the
+        captured operand stack and runs the rest of the function.
 
         Args:
             entry: OSR entry point to transition to
+            runtime: Runtime passed through to the compiled code
+
+        Returns:
+            Whatever the compiled code returns (the function's return
+            value), or None if the entry has no code
 
         Example:
             >>> manager = OSRManager()
             >>> entry = manager.create_osr_entry(10, {'stack': []})
             >>> manager.perform_osr(entry)
         """
-        # In real implementation:
-        # 1. Materialize interpreter state in registers
-        # 2. Jump to compiled code at entry.compiled_offset
-        # 3. Continue execution in JIT code
-
-        # For now, just validate entry
-        if entry.bytecode_offset not in self._osr_entries:
-            # Entry not in our registry (could be from different manager)
-            pass
-
-        # Transition would happen here in real implementation
-        # This is a simplified version for testing
+        if entry.code is None:
+            return None
+        state = entry.state_map
+        values = list(state.get('locals', ())) + list(state.get('stack', ()))
+        return entry.code(runtime, values)
 
     def get_entry(self, bytecode_offset: int) -> OSREntry | None:
         """
@@ -141,3 +141,28 @@ class TestOSREdgeCases:
 
         # Then
         assert entry.bytecode_offset == loop_header_offset
+
+    def test_perform_osr_runs_entry_code(self):
+        """
+        Given an OSR entry with compiled code
+        When performing OSR
+        Then the code gets the locals followed by the stack and its result is returned
+        """
+        # Given
+        manager = OSRManager()
+        received = []
+
+        def code(runtime, values):
+            received.append((runtime, values))
+            return sum(values)
+
+        entry = manager.create_osr_entry(
+            4, {'locals': [1, 2], 'stack': [3]}, code=code
+        )
+
+        # When
+        result = manager.perform_osr(entry, runtime='rt')
+
+        # Then
+        assert result == 6
+        assert received == [('rt', [1, 2, 3])]
@@ -11,12 +11,16 @@ Public API:
     Data Structures:
         - Instruction: Single bytecode instruction
         - BytecodeArray: Compiled bytecode with constant pool
+        - FeedbackVector: Type feedback collected per BytecodeArray
 
     Compiler:
         - BytecodeCompiler: AST to bytecode compiler
         - CompileError: Compilation error exception
         - Compile: Main entry point function
 
+    Optimizer:
+        - BytecodeOptimizer: Post-compile bytecode optimization passes
+
 Example:
     >>> from components.parser.src import Parse
     >>> from components.bytecode.src import Compile
@@ -36,19 +40,26 @@ from .instruction import Instruction
 # Export bytecode array
 from .bytecode_array import BytecodeArray
 
+# Export type feedback
+from .feedback_vector import FeedbackVector, value_type
+
 # Export compiler
 from .compiler import BytecodeCompiler, CompileError
 
+# Export optimizer
+from .optimizer import BytecodeOptimizer
+
 
-def Compile(ast) -> BytecodeArray:
+def Compile(ast, optimize: bool = True) -> BytecodeArray:
     """
     Compile AST to bytecode.
 
     Main entry point for bytecode compilation. Takes a parsed JavaScript AST
-    and generates executable bytecode.
+    and generates executable bytecode, then runs BytecodeOptimizer over it.
 
     Args:
         ast: Program AST node from parser
+        optimize: Run the bytecode optimizer (default: True)
 
     Returns:
         BytecodeArray containing compiled bytecode
@@ -60,7 +71,7 @@ def Compile(ast) -> BytecodeArray:
         >>> from components.parser.src import Parse
         >>> from components.bytecode.src import Compile
         >>>
-        >>> ast = Parse("1 + 2")
+        >>> ast = Parse("x + 2")
         >>> bytecode = Compile(ast)
         >>> len(bytecode.instructions) > 0
         True
@@ -68,7 +79,10 @@ def Compile(ast) -> BytecodeArray:
         True
     """
     compiler = BytecodeCompiler(ast)
-    return compiler.compile()
+    bytecode = compiler.compile()
+    if optimize:
+        bytecode = BytecodeOptimizer().optimize(bytecode)
+    return bytecode
 
 
 __all__ = [
@@ -77,10 +91,14 @@ __all__ = [
     # Data structures
     "Instruction",
     "BytecodeArray",
+    "FeedbackVector",
+    "value_type",
     # Compiler
     "BytecodeCompiler",
     "CompileError",
     "Compile",
+    # Optimizer
+    "BytecodeOptimizer",
 ]
 
 __version__ = "0.1.0"
@@ -8,7 +8,9 @@ Public API:
     - BytecodeArray: Container for compiled bytecode
 """
 
-from typing import List, Any
+from typing import Dict, List, Any
+
+from components.shared_types.src.atoms import atomize
 
 from .instruction import Instruction
 
@@ -26,6 +28,10 @@ class BytecodeArray:
         constant_pool: List of constant values
         local_count: Number of local variables
         parameter_count: Number of function parameters
+        name: Function name for diagnostics and profiling ("" for the
+            top-level script and anonymous functions)
+        feedback: Type feedback collected by the interpreter (None until
+            get_feedback_vector() allocates it)
 
     Example:
         >>> from components.bytecode.src.bytecode_array import BytecodeArray
@@ -42,18 +48,22 @@ class BytecodeArray:
         2
     """
 
-    def __init__(self, local_count: int = 0, parameter_count: int = 0):
+    def __init__(self, local_count: int = 0, parameter_count: int = 0, name: str = ""):
         """
         Initialize BytecodeArray.
 
         Args:
             local_count: Number of local variables (default: 0)
             parameter_count: Number of function parameters (default: 0)
+            name: Function name (default: "")
         """
         self.instructions: List[Instruction] = []
         self.constant_pool: List[Any] = []
+        self._name_indices: Dict[str, int] = {}  # atom -> constant pool index
         self.local_count = local_count
         self.parameter_count = parameter_count
+        self.name = name
+        self.feedback = None
 
     def add_instruction(self, instruction: Instruction) -> int:
         """
@@ -95,6 +105,55 @@ class BytecodeArray:
         self.constant_pool.append(value)
         return len(self.constant_pool) - 1
 
+    def add_name(self, name: str) -> int:
+        """
+        Add an identifier or property key to the constant pool as an atom.
+
+        The name is atomized (see shared_types.atoms), so runtime lookups
+        with it hit dict entries by identity, and each distinct name is
+        stored once per bytecode array.
+
+        Args:
+            name: Identifier or property name
+
+        Returns:
+            Index of the atom in the constant pool
+
+        Example:
+            >>> bytecode = BytecodeArray()
+            >>> bytecode.add_name("x") == bytecode.add_name("x")
+            True
+        """
+        atom = atomize(name)
+        index = self._name_indices.get(atom)
+        if index is None:
+            index = self.add_constant(atom)
+            self._name_indices[atom] = index
+        return index
+
+    def get_feedback_vector(self):
+        """
+        Get the type feedback vector, allocating it on first use.
+
+        Functions that never run never pay for a vector. Code that
+        rewrites instructions after execution started must reset
+        ``feedback`` to None, since slots are indexed by bytecode offset.
+
+        Returns:
+            FeedbackVector of this bytecode
+
+        Example:
+            >>> bytecode = BytecodeArray()
+            >>> bytecode.get_feedback_vector() is bytecode.get_feedback_vector()
+            True
+        """
+        feedback = self.feedback
+        if feedback is None:
+            from .feedback_vector import FeedbackVector
+
+            feedback = self.feedback = FeedbackVector(self)
+        return feedback
+
     def get_instruction(self, index: int) -> Instruction:
         """
         Get instruction by index.
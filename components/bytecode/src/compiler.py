@@ -267,6 +267,13 @@ class BytecodeCompiler:
             self.bytecode.add_instruction(Instruction(opcode=Opcode.LOAD_TRUE))
         elif value is False:
             self.bytecode.add_instruction(Instruction(opcode=Opcode.LOAD_FALSE))
+        elif isinstance(value, str):
+            # String literals are data, not names: they are not atomized
+            # (runtime property keys built from them are interned on use)
+            const_index = self.bytecode.add_constant(value)
+            self.bytecode.add_instruction(
+                Instruction(opcode=Opcode.LOAD_CONSTANT, operand1=const_index)
+            )
         else:
             # Add to constant pool and emit LOAD_CONSTANT
             const_index = self.bytecode.add_constant(value)
@@ -286,7 +293,7 @@ class BytecodeCompiler:
             )
         else:
             # Treat as global
-            name_index = self.bytecode.add_constant(name)
+            name_index = self.bytecode.add_name(name)
             self.bytecode.add_instruction(
                 Instruction(opcode=Opcode.LOAD_GLOBAL, operand1=name_index)
             )
@@ -310,7 +317,7 @@ class BytecodeCompiler:
                 if not expr.left.computed:
                     # obj.property - direct property access
                     property_name = expr.left.property.name
-                    property_index = self.bytecode.add_constant(property_name)
+                    property_index = self.bytecode.add_name(property_name)
                     # STORE_PROPERTY pops value, peeks object
                     self.bytecode.add_instruction(
                         Instruction(
@@ -361,7 +368,7 @@ class BytecodeCompiler:
                         Instruction(opcode=Opcode.STORE_LOCAL, operand1=local_index)
                     )
                 else:
-                    name_index = self.bytecode.add_constant(var_name)
+                    name_index = self.bytecode.add_name(var_name)
                     self.bytecode.add_instruction(
                         Instruction(opcode=Opcode.STORE_GLOBAL, operand1=name_index)
                     )
@@ -514,7 +521,7 @@ class BytecodeCompiler:
             # Load property value from object
             if isinstance(prop.key, Identifier):
                 # Direct property access - pass property name in operand
-                const_index = self.bytecode.add_constant(prop.key.name)
+                const_index = self.bytecode.add_name(prop.key.name)
                 self.bytecode.add_instruction(
                     Instruction(opcode=Opcode.LOAD_PROPERTY, operand1=const_index)
                 )
@@ -989,7 +996,7 @@ class BytecodeCompiler:
                         )
 
                     # Store property with key name in operand
-                    key_index = self.bytecode.add_constant(key_name)
+                    key_index = self.bytecode.add_name(key_name)
                     self.bytecode.add_instruction(
                         Instruction(opcode=Opcode.STORE_PROPERTY, operand1=key_index)
                     )
@@ -1039,7 +1046,7 @@ class BytecodeCompiler:
         saved_next_local_index = self.next_local_index
 
         # Create new bytecode for function body
-        self.bytecode = BytecodeArray(local_count=param_count)
+        self.bytecode = BytecodeArray(local_count=param_count, parameter_count=param_count)
         self.locals = {}
         self.next_local_index = 0
 
@@ -1115,7 +1122,9 @@ class BytecodeCompiler:
         saved_next_local_index = self.next_local_index
 
         # Create new bytecode for function body
-        self.bytecode = BytecodeArray(local_count=param_count)
+        self.bytecode = BytecodeArray(
+            local_count=param_count, parameter_count=param_count, name=function_name
+        )
         self.locals = {}
         self.next_local_index = 0
 
@@ -1163,7 +1172,7 @@ class BytecodeCompiler:
             )
         else:
             # Function declared at top level - use global storage
-            name_index = self.bytecode.add_constant(function_name)
+            name_index = self.bytecode.add_name(function_name)
             self.bytecode.add_instruction(
                 Instruction(opcode=Opcode.STORE_GLOBAL, operand1=name_index)
             )
@@ -1200,7 +1209,7 @@ class BytecodeCompiler:
         else:
             # obj.property - direct property
             property_name = node.property.name
-            property_index = self.bytecode.add_constant(property_name)
+            property_index = self.bytecode.add_name(property_name)
             self._emit(Opcode.LOAD_PROPERTY, property_index)
 
     def _compile_template_literal(self, node: TemplateLiteral) -> None:
@@ -1274,7 +1283,7 @@ class BytecodeCompiler:
                 Instruction(opcode=Opcode.STORE_LOCAL, operand1=local_index)
             )
         else:
-            name_index = self.bytecode.add_constant(class_name)
+            name_index = self.bytecode.add_name(class_name)
             self.bytecode.add_instruction(
                 Instruction(opcode=Opcode.STORE_GLOBAL, operand1=name_index)
             )
@@ -1340,6 +1349,7 @@ class BytecodeCompiler:
         # Extract method details from the FunctionExpression value
         function_expr = method.value
         param_names = function_expr.parameters
+        method_name = method.key.name if isinstance(method.key, Identifier) else ""
         param_count = len(param_names)
         function_body = function_expr.body
 
@@ -1349,7 +1359,9 @@ class BytecodeCompiler:
         saved_next_local_index = self.next_local_index
 
         # Create new bytecode for method body
-        self.bytecode = BytecodeArray(local_count=param_count)
+        self.bytecode = BytecodeArray(
+            local_count=param_count, parameter_count=param_count, name=method_name
+        )
         self.locals = {}
         self.next_local_index = 0
 
@@ -1476,7 +1488,7 @@ class BytecodeCompiler:
         )
 
         # Store in variable
-        name_index = self.bytecode.add_constant(node.id.name)
+        name_index = self.bytecode.add_name(node.id.name)
         if node.id.name in self.locals:
             local_index = self.locals[node.id.name]
             self.bytecode.add_instruction(
@@ -1946,7 +1958,7 @@ class BytecodeCompiler:
         self._emit(Opcode.LOAD_LOCAL, counter_local)
         # Load iterable and get length
         self._emit(Opcode.LOAD_LOCAL, iterable_local)
-        length_const = self.bytecode.add_constant("length")
+        length_const = self.bytecode.add_name("length")
         self._emit(Opcode.LOAD_PROPERTY, length_const)
         # Check if counter < length
         self._emit(Opcode.LESS_THAN)
@@ -2025,7 +2037,7 @@ class BytecodeCompiler:
         # Check: counter < source.length
         self._emit(Opcode.LOAD_LOCAL, counter_local)
         self._emit(Opcode.LOAD_LOCAL, source_local)
-        length_const = self.bytecode.add_constant("length")
+        length_const = self.bytecode.add_name("length")
         self._emit(Opcode.LOAD_PROPERTY, length_const)
         self._emit(Opcode.LESS_THAN)
 
@@ -2143,7 +2155,7 @@ class BytecodeCompiler:
         # Check: source_index < source.length
         self._emit(Opcode.LOAD_LOCAL, source_index_local)
         self._emit(Opcode.LOAD_LOCAL, source_local)
-        length_const = self.bytecode.add_constant("length")
+        length_const = self.bytecode.add_name("length")
         self._emit(Opcode.LOAD_PROPERTY, length_const)
         self._emit(Opcode.LESS_THAN)
 
@@ -2227,7 +2239,7 @@ class BytecodeCompiler:
         # Check: counter < source.length
         self._emit(Opcode.LOAD_LOCAL, counter_local)
         self._emit(Opcode.LOAD_LOCAL, source_local)
-        length_const = self.bytecode.add_constant("length")
+        length_const = self.bytecode.add_name("length")
         self._emit(Opcode.LOAD_PROPERTY, length_const)
         self._emit(Opcode.LESS_THAN)
 
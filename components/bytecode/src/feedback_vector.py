@@ -0,0 +1,439 @@
+"""
+Type feedback vectors collected by the interpreter.
+
+Each BytecodeArray lazily allocates one FeedbackVector the first time it
+runs (see BytecodeArray.get_feedback_vector()). The vector holds one slot
+per instruction that produces feedback, indexed by bytecode offset:
+
+- ArithmeticFeedback (arithmetic and comparison opcodes): union of the
+  operand types seen (Smi, Double, String, Object)
+- PropertyFeedback (property and element loads/stores): receiver maps
+  seen, up to MAX_POLYMORPHISM before going megamorphic
+- CallFeedback (CALL_FUNCTION, NEW): call targets seen and how often
+- BranchFeedback (conditional jumps): taken / not-taken counts
+- GlobalFeedback (LOAD_GLOBAL, STORE_GLOBAL): the global's property cell
+
+plus the invocation count and per-parameter types of the function.
+Recording is a list index and a couple of attribute updates, so the
+interpreter keeps it on by default. Tiers read the vector through
+dump() and optimizing_jit.ProfilingData.from_feedback().
+
+Public API:
+    - FeedbackVector: Per-function type feedback
+    - value_type: Feedback type bit of a Value
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .bytecode_array import BytecodeArray
+from .opcode import Opcode
+
+
+# Operand type bits
+TYPE_SMI = 0b0001
+TYPE_DOUBLE = 0b0010
+TYPE_STRING = 0b0100
+TYPE_OBJECT = 0b1000  # anything else: objects, functions, arrays, ...
+
+# Names as used by the speculation guards
+TYPE_NAMES = (
+    (TYPE_SMI, "Smi"),
+    (TYPE_DOUBLE, "Double"),
+    (TYPE_STRING, "String"),
+    (TYPE_OBJECT, "Object"),
+)
+
+# Distinct maps/targets a site records before it is megamorphic
+MAX_POLYMORPHISM = 4
+
+
+def value_type(value: Any) -> int:
+    """
+    Get the feedback type bit of a Value.
+
+    Args:
+        value: Tagged Value
+
+    Returns:
+        One of TYPE_SMI, TYPE_DOUBLE, TYPE_STRING, TYPE_OBJECT
+    """
+    if value.is_smi():
+        return TYPE_SMI
+    obj = value.to_object()
+    if type(obj) is float:
+        return TYPE_DOUBLE
+    if isinstance(obj, str) or hasattr(obj, "flatten"):  # str or rope
+        return TYPE_STRING
+    return TYPE_OBJECT
+
+
+def type_names(types: int) -> List[str]:
+    """
+    Get the names of the type bits set in a bitset.
+
+    Args:
+        types: Union of type bits
+
+    Returns:
+        Type names, e.g. ["Smi", "String"]
+    """
+    return [name for bit, name in TYPE_NAMES if types & bit]
+
+
+def receiver_map(obj: Any) -> Any:
+    """
+    Get the map recorded for a property access receiver.
+
+    Objects that carry a hidden class expose it as ``shape``; for the
+    rest the receiver's class stands in for its map.
+
+    Args:
+        obj: Receiver object
+
+    Returns:
+        Shape or class of obj
+    """
+    shape = getattr(obj, "shape", None)
+    return shape if shape is not None else type(obj)
+
+
+def call_target(callee: Any) -> Any:
+    """
+    Get the callee identity recorded for a call or construct instruction.
+
+    Bytecode functions are identified by their BytecodeArray, so all
+    closures created from one function literal count as one target.
+
+    Args:
+        callee: Called object
+
+    Returns:
+        The callee's BytecodeArray if it has one, otherwise callee
+    """
+    properties = getattr(callee, "_properties", None)
+    if properties is not None:
+        bytecode_value = properties.get("__bytecode__")
+        if bytecode_value is not None:
+            return bytecode_value.to_object()
+    return callee
+
+
+def _map_name(map_: Any) -> str:
+    return getattr(map_, "__name__", None) or str(getattr(map_, "shape_id", map_))
+
+
+def _target_name(target: Any) -> str:
+    if isinstance(target, BytecodeArray):
+        return target.name or "<anonymous>"
+    return getattr(target, "name", None) or getattr(
+        target, "__name__", type(target).__name__
+    )
+
+
+class ArithmeticFeedback:
+    """Operand types seen by an arithmetic or comparison instruction."""
+
+    __slots__ = ("types",)
+
+    def __init__(self):
+        self.types = 0
+
+    def record(self, left: Any, right: Any) -> None:
+        """Record the operands of one execution (unary ops pass it twice)."""
+        self.types |= value_type(left) | value_type(right)
+
+    def has_feedback(self) -> bool:
+        return self.types != 0
+
+    def dump(self) -> Dict[str, Any]:
+        names = type_names(self.types)
+        return {
+            "kind": "arithmetic",
+            "types": names,
+            "type": names[0] if len(names) == 1 else None,
+        }
+
+
+class PropertyFeedback:
+    """Receiver maps seen by a property or element access."""
+
+    __slots__ = ("maps", "megamorphic")
+
+    def __init__(self):
+        self.maps: List[Any] = []
+        self.megamorphic = False
+
+    def record(self, receiver: Any) -> None:
+        """Record the receiver object of one execution."""
+        if self.megamorphic:
+            return
+        map_ = receiver_map(receiver)
+        maps = self.maps
+        if map_ in maps:
+            return
+        if len(maps) < MAX_POLYMORPHISM:
+            maps.append(map_)
+        else:
+            self.maps = []
+            self.megamorphic = True
+
+    def has_feedback(self) -> bool:
+        return bool(self.maps) or self.megamorphic
+
+    def dump(self) -> Dict[str, Any]:
+        names = [_map_name(map_) for map_ in self.maps]
+        return {
+            "kind": "property",
+            "shapes": names,
+            "shape": names[0] if len(names) == 1 else None,
+            "megamorphic": self.megamorphic,
+        }
+
+
+class CallFeedback:
+    """Call targets seen by a call or construct instruction."""
+
+    __slots__ = ("targets", "count", "megamorphic")
+
+    def __init__(self):
+        self.targets: Dict[Any, int] = {}
+        self.count = 0
+        self.megamorphic = False
+
+    def record(self, target: Any) -> None:
+        """
+        Record the callee of one execution.
+
+        Args:
+            target: The callee's BytecodeArray if it has one (so all
+                closures of a function literal count as one target),
+                otherwise the callee itself
+        """
+        self.count += 1
+        if self.megamorphic:
+            return
+        targets = self.targets
+        try:
+            if target in targets:
+                targets[target] += 1
+            elif len(targets) < MAX_POLYMORPHISM:
+                targets[target] = 1
+            else:
+                targets.clear()
+                self.megamorphic = True
+        except TypeError:
+            # Unhashable callee: nothing useful to speculate on
+            targets.clear()
+            self.megamorphic = True
+
+    def has_feedback(self) -> bool:
+        return self.count != 0
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "kind": "call",
+            "count": self.count,
+            "targets": {
+                _target_name(target): count for target, count in self.targets.items()
+            },
+            "megamorphic": self.megamorphic,
+        }
+
+
+class BranchFeedback:
+    """Taken / not-taken counts of a conditional jump."""
+
+    __slots__ = ("taken", "not_taken")
+
+    def __init__(self):
+        self.taken = 0
+        self.not_taken = 0
+
+    def record(self, taken: bool) -> None:
+        """Record whether one execution jumped."""
+        if taken:
+            self.taken += 1
+        else:
+            self.not_taken += 1
+
+    def has_feedback(self) -> bool:
+        return self.taken != 0 or self.not_taken != 0
+
+    def dump(self) -> Dict[str, Any]:
+        return {"kind": "branch", "taken": self.taken, "not_taken": self.not_taken}
+
+
+class GlobalFeedback:
+    """Property cell cached by a global load or store."""
+
+    __slots__ = ("cell",)
+
+    def __init__(self):
+        # inline_caching.PropertyCell; the interpreter checks the cell's
+        # owner before using it, since bytecode can run in several realms
+        self.cell: Optional[Any] = None
+
+    def has_feedback(self) -> bool:
+        return self.cell is not None
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "kind": "global",
+            "name": self.cell.name,
+            "valid": self.cell.owner is not None,
+        }
+
+
+# Slot kind allocated for each opcode that produces feedback
+_SLOT_KINDS = {
+    Opcode.ADD: ArithmeticFeedback,
+    Opcode.SUBTRACT: ArithmeticFeedback,
+    Opcode.MULTIPLY: ArithmeticFeedback,
+    Opcode.DIVIDE: ArithmeticFeedback,
+    Opcode.MODULO: ArithmeticFeedback,
+    Opcode.NEGATE: ArithmeticFeedback,
+    Opcode.EQUAL: ArithmeticFeedback,
+    Opcode.NOT_EQUAL: ArithmeticFeedback,
+    Opcode.LESS_THAN: ArithmeticFeedback,
+    Opcode.LESS_EQUAL: ArithmeticFeedback,
+    Opcode.GREATER_THAN: ArithmeticFeedback,
+    Opcode.GREATER_EQUAL: ArithmeticFeedback,
+    Opcode.LOAD_PROPERTY: PropertyFeedback,
+    Opcode.STORE_PROPERTY: PropertyFeedback,
+    Opcode.LOAD_ELEMENT: PropertyFeedback,
+    Opcode.STORE_ELEMENT: PropertyFeedback,
+    Opcode.CALL_FUNCTION: CallFeedback,
+    Opcode.NEW: CallFeedback,
+    Opcode.JUMP_IF_TRUE: BranchFeedback,
+    Opcode.JUMP_IF_FALSE: BranchFeedback,
+    Opcode.LOAD_GLOBAL: GlobalFeedback,
+    Opcode.STORE_GLOBAL: GlobalFeedback,
+}
+
+
+class FeedbackVector:
+    """
+    Type feedback of one function (BytecodeArray).
+
+    Attributes:
+        slots: Feedback slot per bytecode offset (None for instructions
+            that record nothing)
+        invocation_count: Number of times the function was entered; this
+            is the call_count tier-up heuristics take (e.g.
+            BaselineJITCompiler.should_compile)
+        parameter_types: Union of argument type bits per parameter
+        optimized_code: Code the optimizing tier compiled from this
+            feedback (None until the function tiers up or after a deopt)
+        deopt_count: Number of times optimized code bailed out
+        optimization_disabled: Set once the function should stay in the
+            interpreter (unsupported bytecode or too many deopts)
+        back_edge_counts: Backward jumps taken per loop header offset
+        osr_code: On-stack replacement code per loop header offset
+
+    Example:
+        >>> from components.bytecode.src import BytecodeArray, Instruction, Opcode
+        >>> bytecode = BytecodeArray()
+        >>> bytecode.add_instruction(Instruction(Opcode.ADD))
+        0
+        >>> vector = bytecode.get_feedback_vector()
+        >>> type(vector.slots[0]).__name__
+        'ArithmeticFeedback'
+    """
+
+    __slots__ = (
+        "slots",
+        "invocation_count",
+        "parameter_types",
+        "optimized_code",
+        "deopt_count",
+        "optimization_disabled",
+        "back_edge_counts",
+        "osr_code",
+    )
+
+    def __init__(self, bytecode: BytecodeArray):
+        """
+        Allocate slots for the instructions of bytecode.
+
+        Args:
+            bytecode: Function the feedback is collected for
+        """
+        kinds = _SLOT_KINDS
+        self.slots: List[Optional[Any]] = [
+            kind() if kind is not None else None
+            for kind in (kinds.get(instr.opcode) for instr in bytecode.instructions)
+        ]
+        self.invocation_count = 0
+        self.parameter_types: List[int] = [0] * bytecode.parameter_count
+        self.optimized_code: Optional[Any] = None
+        self.deopt_count = 0
+        self.optimization_disabled = False
+        self.back_edge_counts: Dict[int, int] = {}
+        self.osr_code: Dict[int, Any] = {}
+
+    def record_invocation(self, arguments: List[Any]) -> None:
+        """
+        Record one entry into the function.
+
+        Args:
+            arguments: Argument Values passed
+        """
+        self.invocation_count += 1
+        parameter_types = self.parameter_types
+        for index in range(min(len(arguments), len(parameter_types))):
+            parameter_types[index] |= value_type(arguments[index])
+
+    def dump(self) -> Dict[str, Any]:
+        """
+        Get the collected feedback as plain data.
+
+        Returns:
+            Dict with "invocation_count", "parameters" (index -> type
+            info) and "slots" (bytecode offset -> slot info, only for
+            slots that recorded something)
+        """
+        slots = {}
+        for offset, slot in enumerate(self.slots):
+            if slot is None:
+                continue
+            if slot.has_feedback():
+                slots[offset] = slot.dump()
+        parameters = {}
+        for index, types in enumerate(self.parameter_types):
+            if types:
+                names = type_names(types)
+                parameters[index] = {
+                    "types": names,
+                    "type": names[0] if len(names) == 1 else None,
+                }
+        return {
+            "invocation_count": self.invocation_count,
+            "parameters": parameters,
+            "slots": slots,
+        }
+
+    def format(self, bytecode: Optional[BytecodeArray] = None) -> str:
+        """
+        Render the collected feedback as text, one line per slot.
+
+        Args:
+            bytecode: Function the vector belongs to, to show opcode names
+
+        Returns:
+            Human-readable dump
+        """
+        data = self.dump()
+        lines = [f"invocations: {data['invocation_count']}"]
+        for index, info in data["parameters"].items():
+            lines.append(f"  param {index}: {'|'.join(info['types'])}")
+        for offset, info in data["slots"].items():
+            label = (
+                bytecode.instructions[offset].opcode.name
+                if bytecode is not None
+                else info["kind"]
+            )
+            details = ", ".join(
+                f"{key}={value}" for key, value in info.items() if key != "kind"
+            )
+            lines.append(f"  {offset:4d} {label}: {details}")
+        return "\n".join(lines)
@@ -0,0 +1,604 @@
+"""
+Bytecode optimizer - post-compile passes over a BytecodeArray.
+
+BytecodeCompiler emits straightforward code: constant expressions are
+computed at runtime, branches on constant conditions and code after RETURN
+stay in, and jumps to jumps survive. BytecodeOptimizer rewrites a compiled
+BytecodeArray (and the function bytecode of its closures) in place so every
+tier dispatches fewer instructions.
+
+Passes, repeated until nothing changes:
+    - Jump threading: jumps to JUMP follow the chain, JUMP to RETURN
+      becomes RETURN, jumps to the next instruction disappear
+    - Constant folding: Smi arithmetic, comparisons and logical ops on
+      constants, and branches on constant conditions
+    - Strength reduction: ``x * -1`` becomes NEGATE, ``x * 1`` and
+      ``x - 0`` on numeric results and ``x + 0`` on Smi results disappear,
+      and LOGICAL_NOT before a conditional jump flips the jump
+    - Peephole: a push followed by POP disappears, DUP STORE_LOCAL POP
+      becomes STORE_LOCAL
+    - Dead stores: stores to locals nothing reads become POP
+    - Unreachable code: instructions no path from offset 0 reaches
+
+Folding follows the interpreter's semantics exactly (ECMAScript Number
+arithmetic, comparisons produce 1 or 0), so it only folds operands that the
+interpreter loads as Smis, and only to results that are Smis: fractions,
+-0, NaN, infinities and overflow are left for runtime.
+Finally the constant pool is compacted: duplicate constants are merged and
+unused ones dropped.
+
+Public API:
+    - BytecodeOptimizer: Optimizes compiled bytecode
+"""
+
+import operator
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from components.value_system.src import (
+    NumberDivide,
+    NumberMultiply,
+    NumberRemainder,
+    NumberUnaryMinus,
+)
+from components.value_system.src.value import SMI_MAX_VALUE, SMI_MIN_VALUE
+
+from .bytecode_array import BytecodeArray
+from .instruction import Instruction
+from .opcode import Opcode
+
+
+# Opcodes whose operand1 is an absolute instruction index
+JUMP_OPCODES = frozenset({Opcode.JUMP, Opcode.JUMP_IF_TRUE, Opcode.JUMP_IF_FALSE})
+
+# Opcodes whose operand1 indexes the constant pool
+CONSTANT_OPCODES = frozenset(
+    {
+        Opcode.LOAD_CONSTANT,
+        Opcode.LOAD_GLOBAL,
+        Opcode.STORE_GLOBAL,
+        Opcode.LOAD_PROPERTY,
+        Opcode.STORE_PROPERTY,
+        Opcode.DELETE_PROPERTY,
+    }
+)
+
+# Opcodes whose operand2 is the function's BytecodeArray
+CLOSURE_OPCODES = frozenset({Opcode.CREATE_CLOSURE, Opcode.CREATE_ASYNC_FUNCTION})
+
+# Binary operations on Smis, as the interpreter computes them (the result
+# may be a float, which is not folded)
+BINARY_FOLDS: Dict[Opcode, Callable[[int, int], Any]] = {
+    Opcode.ADD: operator.add,
+    Opcode.SUBTRACT: operator.sub,
+    Opcode.MULTIPLY: NumberMultiply,
+    Opcode.DIVIDE: NumberDivide,
+    Opcode.MODULO: NumberRemainder,
+    Opcode.EQUAL: lambda left, right: int(left == right),
+    Opcode.NOT_EQUAL: lambda left, right: int(left != right),
+    Opcode.LESS_THAN: lambda left, right: int(left < right),
+    Opcode.LESS_EQUAL: lambda left, right: int(left <= right),
+    Opcode.GREATER_THAN: lambda left, right: int(left > right),
+    Opcode.GREATER_EQUAL: lambda left, right: int(left >= right),
+    Opcode.LOGICAL_AND: lambda left, right: 1 if left and right else 0,
+    Opcode.LOGICAL_OR: lambda left, right: 1 if left or right else 0,
+}
+
+UNARY_FOLDS: Dict[Opcode, Callable[[int], Any]] = {
+    Opcode.NEGATE: NumberUnaryMinus,
+    Opcode.LOGICAL_NOT: lambda value: 0 if value else 1,
+}
+
+# Opcodes that always push a Smi
+SMI_RESULT_OPCODES = frozenset(
+    {
+        Opcode.EQUAL,
+        Opcode.NOT_EQUAL,
+        Opcode.LESS_THAN,
+        Opcode.LESS_EQUAL,
+        Opcode.GREATER_THAN,
+        Opcode.GREATER_EQUAL,
+        Opcode.LOGICAL_AND,
+        Opcode.LOGICAL_OR,
+        Opcode.LOGICAL_NOT,
+        Opcode.LOAD_TRUE,
+        Opcode.LOAD_FALSE,
+    }
+)
+
+# Opcodes that always push a number, Smi or heap number (ADD may
+# concatenate strings)
+NUMBER_RESULT_OPCODES = SMI_RESULT_OPCODES | {
+    Opcode.SUBTRACT,
+    Opcode.MULTIPLY,
+    Opcode.DIVIDE,
+    Opcode.MODULO,
+    Opcode.NEGATE,
+}
+
+# Opcodes that push one value without side effects
+PURE_PUSH_OPCODES = frozenset(
+    {
+        Opcode.LOAD_CONSTANT,
+        Opcode.LOAD_LOCAL,
+        Opcode.LOAD_UNDEFINED,
+        Opcode.LOAD_NULL,
+        Opcode.LOAD_TRUE,
+        Opcode.LOAD_FALSE,
+        Opcode.DUP,
+    }
+)
+
+# Opcodes after which execution does not fall through
+TERMINATORS = frozenset({Opcode.JUMP, Opcode.RETURN})
+
+
+class BytecodeOptimizer:
+    """
+    Optimizes compiled bytecode in place.
+
+    Example:
+        >>> from components.parser.src import Parse
+        >>> from components.bytecode.src import BytecodeCompiler, BytecodeOptimizer
+        >>>
+        >>> bytecode = BytecodeCompiler(Parse("1 + 2 * 3")).compile()
+        >>> bytecode = BytecodeOptimizer().optimize(bytecode)
+        >>> [instr.opcode.name for instr in bytecode.instructions]
+        ['LOAD_CONSTANT', 'RETURN']
+        >>> bytecode.constant_pool
+        [7]
+    """
+
+    def __init__(self, max_iterations: int = 16):
+        """
+        Initialize BytecodeOptimizer.
+
+        Args:
+            max_iterations: Maximum rounds of passes per bytecode array
+        """
+        self.max_iterations = max_iterations
+        self._passes = [
+            self._thread_jumps,
+            self._fold_constants,
+            self._reduce_strength,
+            self._peephole,
+            self._remove_dead_stores,
+            self._remove_unreachable_code,
+        ]
+
+    def optimize(self, bytecode: BytecodeArray) -> BytecodeArray:
+        """
+        Optimize bytecode and the bytecode of every closure it creates.
+
+        Instructions are rewritten in place, so any feedback vector already
+        collected for the bytecode is dropped (its slots are indexed by
+        bytecode offset).
+
+        bytecode is taken to be a script: stores to its locals are the
+        script's top-level bindings and are kept even if nothing reads
+        them. Dead stores are only removed from function bodies.
+
+        Args:
+            bytecode: Compiled bytecode
+
+        Returns:
+            The same BytecodeArray, optimized
+        """
+        self._optimize(bytecode, set(), script=True)
+        return bytecode
+
+    def _optimize(self, bytecode: BytecodeArray, seen: Set[int], script: bool) -> None:
+        if id(bytecode) in seen:
+            return
+        seen.add(id(bytecode))
+
+        for instruction in bytecode.instructions:
+            if instruction.opcode in CLOSURE_OPCODES and isinstance(
+                instruction.operand2, BytecodeArray
+            ):
+                self._optimize(instruction.operand2, seen, script=False)
+
+        passes = self._passes
+        if script:
+            passes = [
+                optimization for optimization in passes
+                if optimization != self._remove_dead_stores
+            ]
+        original = list(bytecode.instructions)
+        for _ in range(self.max_iterations):
+            changed = False
+            for optimization in passes:
+                changed |= optimization(bytecode)
+            if not changed:
+                break
+        self._compact_constant_pool(bytecode)
+
+        if bytecode.instructions != original:
+            bytecode.feedback = None
+
+    # ------------------------------------------------------------------
+    # Passes: each rewrites bytecode.instructions and reports a change
+    # ------------------------------------------------------------------
+
+    def _thread_jumps(self, bytecode: BytecodeArray) -> bool:
+        instructions = bytecode.instructions
+        rewritten: List[Optional[Instruction]] = list(instructions)
+        changed = False
+
+        for index, instruction in enumerate(instructions):
+            if instruction.opcode not in JUMP_OPCODES:
+                continue
+            target = self._final_target(instructions, instruction.operand1)
+            if instruction.opcode == Opcode.JUMP and target < len(instructions):
+                if instructions[target].opcode == Opcode.RETURN:
+                    rewritten[index] = _replace(instruction, Opcode.RETURN, None)
+                    changed = True
+                    continue
+            if target == index + 1:
+                # Jump to the next instruction: conditional ones still pop
+                if instruction.opcode == Opcode.JUMP:
+                    rewritten[index] = None
+                else:
+                    rewritten[index] = _replace(instruction, Opcode.POP, None)
+                changed = True
+            elif target != instruction.operand1:
+                rewritten[index] = _replace(instruction, instruction.opcode, target)
+                changed = True
+
+        if changed:
+            self._rewrite(bytecode, rewritten)
+        return changed
+
+    def _fold_constants(self, bytecode: BytecodeArray) -> bool:
+        instructions = bytecode.instructions
+        targets = _jump_targets(instructions)
+        rewritten: List[Optional[Instruction]] = list(instructions)
+        changed = False
+        index = 0
+
+        while index < len(instructions):
+            first = _smi_constant(bytecode, instructions[index])
+            if first is None:
+                index += 1
+                continue
+            following = instructions[index + 1 : index + 3]
+            # LOAD a, LOAD b, <binary op>
+            if (
+                len(following) == 2
+                and following[1].opcode in BINARY_FOLDS
+                and not targets.intersection((index + 1, index + 2))
+            ):
+                second = _smi_constant(bytecode, following[0])
+                if second is not None:
+                    result = _fold(BINARY_FOLDS[following[1].opcode], first, second)
+                    if result is not None:
+                        rewritten[index] = self._load_constant(
+                            bytecode, instructions[index], result
+                        )
+                        rewritten[index + 1] = rewritten[index + 2] = None
+                        changed = True
+                        index += 3
+                        continue
+            if following and index + 1 not in targets:
+                opcode = following[0].opcode
+                # LOAD a, <unary op>
+                if opcode in UNARY_FOLDS:
+                    result = _fold(UNARY_FOLDS[opcode], first)
+                    if result is not None:
+                        rewritten[index] = self._load_constant(
+                            bytecode, instructions[index], result
+                        )
+                        rewritten[index + 1] = None
+                        changed = True
+                        index += 2
+                        continue
+                # LOAD a, JUMP_IF_*: the branch always or never goes
+                if opcode in (Opcode.JUMP_IF_TRUE, Opcode.JUMP_IF_FALSE):
+                    taken = bool(first) == (opcode == Opcode.JUMP_IF_TRUE)
+                    if taken:
+                        rewritten[index] = _replace(
+                            following[0], Opcode.JUMP, following[0].operand1
+                        )
+                    else:
+                        rewritten[index] = None
+                    rewritten[index + 1] = None
+                    changed = True
+                    index += 2
+                    continue
+            index += 1
+
+        if changed:
+            self._rewrite(bytecode, rewritten)
+        return changed
+
+    def _reduce_strength(self, bytecode: BytecodeArray) -> bool:
+        instructions = bytecode.instructions
+        targets = _jump_targets(instructions)
+        rewritten: List[Optional[Instruction]] = list(instructions)
+        changed = False
+        index = 0
+
+        while index + 1 < len(instructions):
+            instruction = instructions[index]
+            following = instructions[index + 1]
+            if index + 1 in targets:
+                index += 1
+                continue
+
+            # LOGICAL_NOT, JUMP_IF_FALSE t -> JUMP_IF_TRUE t (and vice versa)
+            if instruction.opcode == Opcode.LOGICAL_NOT and following.opcode in (
+                Opcode.JUMP_IF_TRUE,
+                Opcode.JUMP_IF_FALSE,
+            ):
+                flipped = (
+                    Opcode.JUMP_IF_TRUE
+                    if following.opcode == Opcode.JUMP_IF_FALSE
+                    else Opcode.JUMP_IF_FALSE
+                )
+                rewritten[index] = None
+                rewritten[index + 1] = _replace(following, flipped, following.operand1)
+                changed = True
+                index += 2
+                continue
+
+            constant = _smi_constant(bytecode, instruction)
+            if constant is not None and instruction.opcode == Opcode.LOAD_CONSTANT:
+                opcode = following.opcode
+                # x * -1 -> NEGATE: both are Number::unaryMinus for numbers
+                if opcode == Opcode.MULTIPLY and constant == -1:
+                    rewritten[index] = None
+                    rewritten[index + 1] = _replace(following, Opcode.NEGATE, None)
+                    changed = True
+                    index += 2
+                    continue
+                # x * 1 and x - 0 are x when x is already a number, x + 0
+                # only when x is a Smi (-0 + 0 is 0)
+                if (opcode == Opcode.MULTIPLY and constant == 1) or (
+                    opcode == Opcode.SUBTRACT and constant == 0
+                ):
+                    producers = NUMBER_RESULT_OPCODES
+                elif opcode == Opcode.ADD and constant == 0:
+                    producers = SMI_RESULT_OPCODES
+                else:
+                    producers = frozenset()
+                if (
+                    index > 0
+                    and index not in targets
+                    and instructions[index - 1].opcode in producers
+                ):
+                    rewritten[index] = rewritten[index + 1] = None
+                    changed = True
+                    index += 2
+                    continue
+            index += 1
+
+        if changed:
+            self._rewrite(bytecode, rewritten)
+        return changed
+
+    def _peephole(self, bytecode: BytecodeArray) -> bool:
+        instructions = bytecode.instructions
+        targets = _jump_targets(instructions)
+        rewritten: List[Optional[Instruction]] = list(instructions)
+        changed = False
+        index = 0
+
+        while index + 1 < len(instructions):
+            instruction = instructions[index]
+            following = instructions[index + 1]
+            if index + 1 in targets:
+                index += 1
+                continue
+
+            # <push>, POP -> nothing
+            if (
+                instruction.opcode in PURE_PUSH_OPCODES
+                and following.opcode == Opcode.POP
+            ):
+                rewritten[index] = rewritten[index + 1] = None
+                changed = True
+                index += 2
+                continue
+
+            # DUP, STORE_LOCAL n, POP -> STORE_LOCAL n
+            if (
+                instruction.opcode == Opcode.DUP
+                and following.opcode == Opcode.STORE_LOCAL
+                and index + 2 < len(instructions)
+                and instructions[index + 2].opcode == Opcode.POP
+                and index + 2 not in targets
+            ):
+                rewritten[index] = rewritten[index + 2] = None
+                changed = True
+                index += 3
+                continue
+            index += 1
+
+        if changed:
+            self._rewrite(bytecode, rewritten)
+        return changed
+
+    def _remove_dead_stores(self, bytecode: BytecodeArray) -> bool:
+        instructions = bytecode.instructions
+        read: Set[int] = set()
+        for instruction in instructions:
+            if instruction.opcode in CLOSURE_OPCODES:
+                # Closures capture a snapshot of the locals
+                return False
+            if instruction.opcode == Opcode.LOAD_LOCAL:
+                read.add(instruction.operand1)
+
+        rewritten: List[Optional[Instruction]] = list(instructions)
+        changed = False
+        for index, instruction in enumerate(instructions):
+            if (
+                instruction.opcode == Opcode.STORE_LOCAL
+                and instruction.operand1 not in read
+            ):
+                rewritten[index] = _replace(instruction, Opcode.POP, None)
+                changed = True
+
+        if changed:
+            self._rewrite(bytecode, rewritten)
+        return changed
+
+    def _remove_unreachable_code(self, bytecode: BytecodeArray) -> bool:
+        instructions = bytecode.instructions
+        reachable: Set[int] = set()
+        worklist = [0]
+
+        while worklist:
+            index = worklist.pop()
+            while index < len(instructions) and index not in reachable:
+                reachable.add(index)
+                instruction = instructions[index]
+                if instruction.opcode in JUMP_OPCODES:
+                    worklist.append(instruction.operand1)
+                if instruction.opcode in TERMINATORS:
+                    break
+                index += 1
+
+        if len(reachable) == len(instructions):
+            return False
+        self._rewrite(
+            bytecode,
+            [
+                instruction if index in reachable else None
+                for index, instruction in enumerate(instructions)
+            ],
+        )
+        return True
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _final_target(self, instructions: List[Instruction], target: int) -> int:
+        """Follow a chain of unconditional jumps from target"""
+        visited = set()
+        while (
+            target < len(instructions)
+            and instructions[target].opcode == Opcode.JUMP
+            and target not in visited
+        ):
+            visited.add(target)
+            target = instructions[target].operand1
+        return target
+
+    def _load_constant(
+        self, bytecode: BytecodeArray, instruction: Instruction, value: int
+    ) -> Instruction:
+        return _replace(instruction, Opcode.LOAD_CONSTANT, bytecode.add_constant(value))
+
+    def _rewrite(
+        self, bytecode: BytecodeArray, rewritten: List[Optional[Instruction]]
+    ) -> None:
+        """
+        Drop the None entries of rewritten and remap jump targets.
+
+        A jump to a removed instruction goes to the next instruction kept.
+        """
+        new_index = []
+        count = 0
+        for instruction in rewritten:
+            new_index.append(count)
+            if instruction is not None:
+                count += 1
+        new_index.append(count)
+
+        instructions = []
+        for instruction in rewritten:
+            if instruction is None:
+                continue
+            if instruction.opcode in JUMP_OPCODES:
+                target = min(instruction.operand1, len(rewritten))
+                instruction = _replace(instruction, instruction.opcode, new_index[target])
+            instructions.append(instruction)
+        bytecode.instructions = instructions
+
+    def _compact_constant_pool(self, bytecode: BytecodeArray) -> None:
+        """Merge duplicate constants and drop the ones no instruction uses"""
+        pool = bytecode.constant_pool
+        names = set(bytecode._name_indices.values())
+        new_pool: List[Any] = []
+        remap: Dict[int, int] = {}
+        by_value: Dict[Any, int] = {}
+
+        for instruction in bytecode.instructions:
+            index = instruction.operand1
+            if (
+                instruction.opcode not in CONSTANT_OPCODES
+                or not isinstance(index, int)
+                or index in remap
+            ):
+                continue
+            value = pool[index]
+            try:
+                key = (type(value), value)
+                hash(key)
+            except TypeError:
+                key = (type(value), id(value))
+            if key not in by_value:
+                by_value[key] = len(new_pool)
+                new_pool.append(value)
+            if index in names:
+                # Keep the atom, so property lookups stay identity hits
+                new_pool[by_value[key]] = value
+            remap[index] = by_value[key]
+
+        if len(new_pool) == len(pool) and all(
+            old == new for old, new in remap.items()
+        ):
+            return
+
+        bytecode.instructions = [
+            _replace(instruction, instruction.opcode, remap[instruction.operand1])
+            if instruction.opcode in CONSTANT_OPCODES
+            and isinstance(instruction.operand1, int)
+            else instruction
+            for instruction in bytecode.instructions
+        ]
+        bytecode.constant_pool = new_pool
+        bytecode._name_indices = {
+            new_pool[remap[index]]: remap[index]
+            for index in names
+            if index in remap
+        }
+
+
+def _replace(instruction: Instruction, opcode: Opcode, operand1: Any) -> Instruction:
+    return Instruction(
+        opcode=opcode,
+        operand1=operand1,
+        operand2=instruction.operand2 if opcode == instruction.opcode else None,
+        operand3=instruction.operand3 if opcode == instruction.opcode else None,
+        location=instruction.location,
+    )
+
+
+def _jump_targets(instructions: List[Instruction]) -> Set[int]:
+    return {
+        instruction.operand1
+        for instruction in instructions
+        if instruction.opcode in JUMP_OPCODES
+    }
+
+
+def _smi_constant(bytecode: BytecodeArray, instruction: Instruction) -> Optional[int]:
+    """Value of a Smi the instruction pushes, or None"""
+    if instruction.opcode == Opcode.LOAD_TRUE:
+        return 1
+    if instruction.opcode == Opcode.LOAD_FALSE:
+        return 0
+    if instruction.opcode == Opcode.LOAD_CONSTANT:
+        value = bytecode.constant_pool[instruction.operand1]
+        if type(value) is int:
+            return value
+    return None
+
+
+def _fold(operation: Callable[..., Any], *operands: int) -> Optional[int]:
+    """Result of operation if it is a Smi, else None"""
+    result = operation(*operands)
+    if type(result) is int and SMI_MIN_VALUE <= result <= SMI_MAX_VALUE:
+        return result
+    return None
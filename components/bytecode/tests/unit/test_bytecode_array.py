@@ -173,3 +173,18 @@ def test_bytecode_array_constant_pool_can_store_any_values():
     assert bytecode.constant_pool[3] == "string"
     assert bytecode.constant_pool[4] == [1, 2, 3]
     assert bytecode.constant_pool[5] == {"key": "value"}
+
+
+def test_bytecode_array_add_name_atomizes_and_deduplicates():
+    """Test that names are added once per bytecode array, as atoms."""
+    from components.bytecode.src.bytecode_array import BytecodeArray
+    from components.shared_types.src.atoms import ATOMS
+
+    bytecode = BytecodeArray()
+    first = bytecode.add_name("".join(["co", "unt"]))
+    bytecode.add_constant(1)
+    second = bytecode.add_name("".join(["cou", "nt"]))
+
+    assert first == second
+    assert bytecode.constant_pool == ["count", 1]
+    assert ATOMS.is_atom(bytecode.constant_pool[first])
@@ -501,3 +501,33 @@ def test_compile_mixed_array_object_literals():
     instructions = bytecode.instructions
     assert any(inst.opcode == Opcode.CREATE_OBJECT for inst in instructions)
     assert any(inst.opcode == Opcode.CREATE_ARRAY for inst in instructions)
+
+
+def test_compile_string_literal_is_not_atomized():
+    """
+    Given a string literal expression
+    When the compiler compiles it
+    Then the string is a plain constant and does not grow the atom table
+    """
+    from components.shared_types.src.atoms import ATOMS
+
+    # Given
+    loc = SourceLocation(filename="test.js", line=1, column=1, offset=0)
+    text = "string literal data " * 3
+    ast = Program(
+        location=loc,
+        body=[
+            ExpressionStatement(
+                location=loc, expression=Literal(location=loc, value=text)
+            )
+        ],
+    )
+    size = len(ATOMS)
+
+    # When
+    bytecode = BytecodeCompiler(ast).compile()
+
+    # Then
+    assert text in bytecode.constant_pool
+    assert text not in ATOMS
+    assert len(ATOMS) == size
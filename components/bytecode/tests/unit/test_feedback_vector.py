@@ -0,0 +1,134 @@
+"""
+Tests for FeedbackVector.
+
+These tests verify slot allocation per opcode, the individual slot kinds
+and the dump formats.
+"""
+
+from components.bytecode.src import BytecodeArray, Instruction, Opcode
+from components.bytecode.src.feedback_vector import (
+    MAX_POLYMORPHISM,
+    ArithmeticFeedback,
+    BranchFeedback,
+    CallFeedback,
+    FeedbackVector,
+    GlobalFeedback,
+    PropertyFeedback,
+)
+from components.value_system.src import Value
+
+
+def _bytecode(*opcodes, parameter_count=0):
+    bytecode = BytecodeArray(parameter_count=parameter_count)
+    for opcode in opcodes:
+        bytecode.add_instruction(Instruction(opcode))
+    return bytecode
+
+
+def test_vector_is_allocated_lazily():
+    """The vector exists only after get_feedback_vector() and is reused."""
+    bytecode = _bytecode(Opcode.ADD)
+
+    assert bytecode.feedback is None
+    vector = bytecode.get_feedback_vector()
+    assert isinstance(vector, FeedbackVector)
+    assert bytecode.get_feedback_vector() is vector
+
+
+def test_slots_follow_opcodes():
+    """Only instructions that produce feedback get a slot."""
+    bytecode = _bytecode(
+        Opcode.LOAD_LOCAL,
+        Opcode.ADD,
+        Opcode.LOAD_PROPERTY,
+        Opcode.CALL_FUNCTION,
+        Opcode.JUMP_IF_FALSE,
+        Opcode.RETURN,
+        Opcode.LOAD_GLOBAL,
+    )
+
+    slots = bytecode.get_feedback_vector().slots
+
+    assert slots[0] is None
+    assert isinstance(slots[1], ArithmeticFeedback)
+    assert isinstance(slots[2], PropertyFeedback)
+    assert isinstance(slots[3], CallFeedback)
+    assert isinstance(slots[4], BranchFeedback)
+    assert slots[5] is None
+    assert isinstance(slots[6], GlobalFeedback)
+
+
+def test_arithmetic_feedback_accumulates_types():
+    """Operand types are unioned across executions."""
+    slot = ArithmeticFeedback()
+
+    slot.record(Value.from_smi(1), Value.from_smi(2))
+    assert slot.dump()["type"] == "Smi"
+
+    slot.record(Value.from_object("a"), Value.from_smi(2))
+    assert slot.dump()["types"] == ["Smi", "String"]
+    assert slot.dump()["type"] is None
+
+    slot.record(Value.from_object(1.5), Value.from_object([]))
+    assert slot.dump()["types"] == ["Smi", "Double", "String", "Object"]
+
+
+def test_property_feedback_goes_megamorphic():
+    """Receiver maps are kept up to MAX_POLYMORPHISM, then dropped."""
+    slot = PropertyFeedback()
+    receiver_classes = [type(f"Map{i}", (), {}) for i in range(MAX_POLYMORPHISM + 1)]
+
+    slot.record(receiver_classes[0]())
+    slot.record(receiver_classes[0]())
+    assert slot.dump()["shape"] == "Map0"
+
+    for cls in receiver_classes[1:]:
+        slot.record(cls())
+
+    assert slot.megamorphic
+    assert slot.dump()["shapes"] == []
+
+
+def test_call_feedback_counts_targets():
+    """Call sites count calls per target."""
+    slot = CallFeedback()
+    callee = _bytecode(Opcode.RETURN)
+    callee.name = "f"
+
+    slot.record(callee)
+    slot.record(callee)
+    slot.record(print)
+
+    assert slot.dump()["count"] == 3
+    assert slot.dump()["targets"] == {"f": 2, "print": 1}
+
+
+def test_branch_feedback_counts():
+    """Conditional jumps count taken and not-taken executions."""
+    slot = BranchFeedback()
+
+    slot.record(True)
+    slot.record(False)
+    slot.record(False)
+
+    assert slot.dump() == {"kind": "branch", "taken": 1, "not_taken": 2}
+
+
+def test_dump_and_format():
+    """dump() lists only used slots; format() renders them as text."""
+    bytecode = _bytecode(Opcode.ADD, Opcode.SUBTRACT, parameter_count=2)
+    vector = bytecode.get_feedback_vector()
+
+    vector.record_invocation([Value.from_smi(1), Value.from_object("s")])
+    vector.slots[0].record(Value.from_smi(1), Value.from_smi(1))
+    data = vector.dump()
+
+    assert data["invocation_count"] == 1
+    assert data["parameters"] == {
+        0: {"types": ["Smi"], "type": "Smi"},
+        1: {"types": ["String"], "type": "String"},
+    }
+    assert list(data["slots"]) == [0]
+    text = vector.format(bytecode)
+    assert "invocations: 1" in text
+    assert "ADD" in text and "SUBTRACT" not in text
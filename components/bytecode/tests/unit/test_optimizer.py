@@ -0,0 +1,304 @@
+"""
+Tests for BytecodeOptimizer.
+
+These tests verify each pass on hand-built bytecode, jump target remapping,
+constant pool compaction, and that optimized programs compute what the
+unoptimized ones do.
+"""
+
+import pytest
+
+from components.bytecode.src import (
+    BytecodeArray,
+    BytecodeCompiler,
+    BytecodeOptimizer,
+    Compile,
+    Instruction,
+    Opcode,
+)
+from components.parser.src import Parse
+
+
+def _bytecode(*instructions, constants=(), local_count=0):
+    bytecode = BytecodeArray(local_count=local_count)
+    for value in constants:
+        bytecode.add_constant(value)
+    for opcode, *operands in instructions:
+        bytecode.add_instruction(Instruction(opcode, *operands))
+    return bytecode
+
+
+def _listing(bytecode):
+    return [
+        (instr.opcode, instr.operand1)
+        if instr.opcode != Opcode.LOAD_CONSTANT
+        else (instr.opcode, bytecode.constant_pool[instr.operand1])
+        for instr in bytecode.instructions
+    ]
+
+
+def test_folds_nested_constant_arithmetic():
+    """1 + 2 * 3 compiles to a single constant load."""
+    bytecode = BytecodeOptimizer().optimize(BytecodeCompiler(Parse("1 + 2 * 3")).compile())
+
+    assert _listing(bytecode) == [(Opcode.LOAD_CONSTANT, 7), (Opcode.RETURN, None)]
+    assert bytecode.constant_pool == [7]
+
+
+def test_division_folds_like_the_interpreter():
+    """Exact quotients fold; fractions and division by zero stay for runtime."""
+    exact = _bytecode(
+        (Opcode.LOAD_CONSTANT, 0),
+        (Opcode.LOAD_CONSTANT, 1),
+        (Opcode.DIVIDE,),
+        (Opcode.RETURN,),
+        constants=(-6, 2),
+    )
+    fraction = _bytecode(
+        (Opcode.LOAD_CONSTANT, 0),
+        (Opcode.LOAD_CONSTANT, 1),
+        (Opcode.DIVIDE,),
+        (Opcode.RETURN,),
+        constants=(-7, 2),
+    )
+    by_zero = _bytecode(
+        (Opcode.LOAD_CONSTANT, 0),
+        (Opcode.LOAD_CONSTANT, 1),
+        (Opcode.DIVIDE,),
+        (Opcode.RETURN,),
+        constants=(7, 0),
+    )
+
+    for bytecode in (exact, fraction, by_zero):
+        BytecodeOptimizer().optimize(bytecode)
+
+    assert _listing(exact) == [(Opcode.LOAD_CONSTANT, -3), (Opcode.RETURN, None)]
+    assert len(fraction.instructions) == 4
+    assert len(by_zero.instructions) == 4
+
+
+def test_negative_zero_is_not_folded():
+    """0 * -1 is -0, which is not a Smi constant."""
+    bytecode = BytecodeOptimizer().optimize(BytecodeCompiler(Parse("0 * -1")).compile())
+
+    assert _listing(bytecode) == [
+        (Opcode.LOAD_CONSTANT, 0),
+        (Opcode.NEGATE, None),
+        (Opcode.RETURN, None),
+    ]
+
+
+def test_string_constants_are_not_folded():
+    """ADD on strings concatenates at runtime."""
+    bytecode = _bytecode(
+        (Opcode.LOAD_CONSTANT, 0),
+        (Opcode.LOAD_CONSTANT, 1),
+        (Opcode.ADD,),
+        (Opcode.RETURN,),
+        constants=("a", 1),
+    )
+
+    BytecodeOptimizer().optimize(bytecode)
+
+    assert [instr.opcode for instr in bytecode.instructions] == [
+        Opcode.LOAD_CONSTANT,
+        Opcode.LOAD_CONSTANT,
+        Opcode.ADD,
+        Opcode.RETURN,
+    ]
+
+
+def test_constant_condition_removes_dead_branch():
+    """An if on a constant keeps only the branch that runs."""
+    bytecode = Compile(Parse("var x = 0; if (1 < 0) { x = 3; } else { x = 4; } x;"))
+
+    assert _listing(bytecode) == [
+        (Opcode.LOAD_CONSTANT, 0),
+        (Opcode.STORE_LOCAL, 0),
+        (Opcode.LOAD_CONSTANT, 4),
+        (Opcode.STORE_LOCAL, 0),
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.RETURN, None),
+    ]
+
+
+def test_jump_chains_are_threaded_and_targets_remapped():
+    """Jumps to jumps go straight to the final target after compaction."""
+    bytecode = _bytecode(
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.JUMP_IF_FALSE, 4),
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.JUMP, 5),
+        (Opcode.JUMP, 0),  # 4
+        (Opcode.RETURN,),  # 5
+        local_count=1,
+    )
+
+    BytecodeOptimizer().optimize(bytecode)
+
+    assert _listing(bytecode) == [
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.JUMP_IF_FALSE, 0),
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.RETURN, None),
+    ]
+
+
+def test_unreachable_code_after_return_is_removed():
+    """Code after RETURN that nothing jumps to disappears."""
+    bytecode = _bytecode(
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.RETURN,),
+        (Opcode.LOAD_UNDEFINED,),
+        (Opcode.RETURN,),
+        local_count=1,
+    )
+
+    BytecodeOptimizer().optimize(bytecode)
+
+    assert _listing(bytecode) == [(Opcode.LOAD_LOCAL, 0), (Opcode.RETURN, None)]
+
+
+def test_peephole_and_dead_stores():
+    """DUP/STORE_LOCAL/POP becomes STORE_LOCAL; unread stores in functions disappear."""
+    script = Compile(Parse("function f() { var u = 5; var v = 6; var w; w = u; return w; }"))
+    bytecode = next(
+        instr.operand2
+        for instr in script.instructions
+        if instr.opcode == Opcode.CREATE_CLOSURE
+    )
+
+    assert _listing(bytecode) == [
+        (Opcode.LOAD_CONSTANT, 5),
+        (Opcode.STORE_LOCAL, 0),
+        (Opcode.LOAD_UNDEFINED, None),
+        (Opcode.STORE_LOCAL, 2),
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.STORE_LOCAL, 2),
+        (Opcode.LOAD_LOCAL, 2),
+        (Opcode.RETURN, None),
+    ]
+    assert bytecode.constant_pool == [5]
+
+
+def test_script_bindings_are_kept():
+    """Unread stores to a script's top-level bindings stay."""
+    bytecode = Compile(Parse("var u = 5; var v = 6; u;"))
+
+    assert (Opcode.STORE_LOCAL, 1) in _listing(bytecode)
+
+
+def test_jump_target_on_removed_pair_moves_to_next_instruction():
+    """A jump to a removed push/POP pair lands on the instruction after it."""
+    bytecode = _bytecode(
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.JUMP_IF_TRUE, 4),
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.RETURN,),
+        (Opcode.LOAD_LOCAL, 0),  # 4
+        (Opcode.POP,),
+        (Opcode.LOAD_UNDEFINED,),
+        (Opcode.RETURN,),
+        local_count=1,
+    )
+
+    BytecodeOptimizer().optimize(bytecode)
+
+    assert bytecode.instructions[1] == Instruction(Opcode.JUMP_IF_TRUE, 4)
+    assert bytecode.instructions[4].opcode == Opcode.LOAD_UNDEFINED
+
+
+def test_strength_reduction():
+    """x * -1 becomes NEGATE, x * 1 on a Smi result and NOT before a branch go away."""
+    bytecode = _bytecode(
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.LOAD_CONSTANT, 0),
+        (Opcode.MULTIPLY,),
+        (Opcode.LOAD_CONSTANT, 1),
+        (Opcode.MULTIPLY,),
+        (Opcode.LOGICAL_NOT,),
+        (Opcode.JUMP_IF_FALSE, 0),
+        (Opcode.LOAD_UNDEFINED,),
+        (Opcode.RETURN,),
+        constants=(-1, 1),
+        local_count=1,
+    )
+
+    BytecodeOptimizer().optimize(bytecode)
+
+    assert _listing(bytecode) == [
+        (Opcode.LOAD_LOCAL, 0),
+        (Opcode.NEGATE, None),
+        (Opcode.JUMP_IF_TRUE, 0),
+        (Opcode.LOAD_UNDEFINED, None),
+        (Opcode.RETURN, None),
+    ]
+
+
+def test_identity_on_possible_string_is_kept():
+    """x + 0 stays when x may be a string."""
+    bytecode = Compile(Parse('var a = "s"; a + 0;'))
+
+    assert Opcode.ADD in [instr.opcode for instr in bytecode.instructions]
+
+
+def test_constant_pool_is_deduplicated():
+    """Equal constants share one pool entry; unused ones are dropped."""
+    bytecode = _bytecode(
+        (Opcode.LOAD_CONSTANT, 0),
+        (Opcode.LOAD_CONSTANT, 2),
+        (Opcode.ADD,),
+        (Opcode.LOAD_GLOBAL, 3),
+        (Opcode.ADD,),
+        (Opcode.RETURN,),
+        constants=("a", "unused", "a", 1),
+    )
+
+    BytecodeOptimizer().optimize(bytecode)
+
+    assert bytecode.constant_pool == ["a", 1]
+    assert [instr.operand1 for instr in bytecode.instructions[:4]] == [0, 0, None, 1]
+
+
+def test_closures_are_optimized_and_feedback_reset():
+    """Function bytecode is optimized too and stale feedback is dropped."""
+    bytecode = BytecodeCompiler(Parse("function f() { return 2 * 3; } f();")).compile()
+    function = next(
+        instr.operand2
+        for instr in bytecode.instructions
+        if instr.opcode == Opcode.CREATE_CLOSURE
+    )
+    function.get_feedback_vector()
+
+    BytecodeOptimizer().optimize(bytecode)
+
+    assert _listing(function) == [(Opcode.LOAD_CONSTANT, 6), (Opcode.RETURN, None)]
+    assert function.feedback is None
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "var s = 0; var i = 0; while (i < 50) { s = s + i * 2; i = i + 1; "
+        "if (i == 25) { s = s - 1; } } s;",
+        "function f(a) { if (a) { return 1; } else { return 2; } } f(0) + f(3) * 10;",
+        "var x = 0; while (false) { x = 1; } x + 10 / 3;",
+        "var t = `a${1 + 2}b`; t;",
+        "var a = 7; var b = 2; a / b * 4 + 0.5;",
+        "var o = {a: 1, b: 2}; o.a - -o.b;",
+    ],
+)
+def test_optimized_program_computes_same_result(source):
+    """Optimized and unoptimized bytecode produce the same value."""
+    from components.interpreter.src import Interpreter
+    from components.memory_gc.src import GarbageCollector
+
+    def run(optimize):
+        result = Interpreter(GarbageCollector()).execute(
+            Compile(Parse(source), optimize=optimize)
+        )
+        assert result.is_success(), result.exception
+        value = result.value
+        return value.to_smi() if value.is_smi() else str(value.to_object())
+
+    assert run(True) == run(False)
@@ -1,176 +1,285 @@
 """
-Hash table implementation with separate chaining.
+Ordered hash table backed by a Python dict.
 
 Used internally by Map and Set.
-- Separate chaining for collision resolution
-- Insertion order preservation using linked list
-- SameValueZero equality for keys
-- Dynamic resizing for performance
+- Keys are normalized once so SameValueZero equality becomes plain dict
+  lookup: NaN is canonicalized, -0 becomes +0, integral floats share the
+  entry of the equal integer, booleans never collide with 0/1, and objects
+  are keyed by identity; rope strings (values with a flatten() method,
+  like object_runtime's ConsString) are flattened so they share the entry
+  of the equal str
+- Entries live in insertion-ordered arrays; deletion leaves a tombstone so
+  iterators created before a mutation keep their place
+- Tombstones are compacted once they outnumber live entries; live iterators
+  are moved to the equivalent position so iteration stays spec-compliant
+  (entries added during iteration are visited, deleted ones are skipped)
 """
 
-from .same_value_zero import same_value_zero
+import weakref
+from bisect import bisect_left
 
+# Marks a deleted slot in the entry arrays
+_DELETED = object()
 
-class HashNode:
-    """
-    Node in the hash table's linked list.
+# Canonical keys for values whose Python equality differs from SameValueZero
+_NAN_KEY = object()
+_TRUE_KEY = object()
+_FALSE_KEY = object()
 
-    Each bucket contains a linked list of nodes for collision handling.
-    The nodes also form a doubly-linked list to preserve insertion order.
-    """
+# Iterator kinds
+_KEYS = 0
+_VALUES = 1
+_ENTRIES = 2
+
+# Compact only when there are at least this many tombstones
+_COMPACT_MIN_TOMBSTONES = 16
+
+# How instances of a type become dict keys, filled lazily per type:
+# directly (their equality already is identity), flattened to a str (ropes)
+# or wrapped in an _IdentityKey
+_KEY_DIRECT = 0
+_KEY_FLATTEN = 1
+_KEY_IDENTITY = 2
+_key_kinds = {}
+
+
+class _IdentityKey:
+    """Dict key comparing a wrapped object by identity."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return type(other) is _IdentityKey and other.obj is self.obj
 
-    def __init__(self, key, value, hash_value):
-        self.key = key
-        self.value = value
-        self.hash_value = hash_value
 
-        # For separate chaining (collision resolution)
-        self.next = None
+def normalize_key(key):
+    """
+    Map a JS value to the dict key that represents its SameValueZero class.
+
+    Args:
+        key: Any value
 
-        # For maintaining insertion order
-        self.order_prev = None
-        self.order_next = None
+    Returns:
+        Hashable key such that two values are SameValueZero-equal exactly
+        when their normalized keys are equal
+    """
+    cls = type(key)
+    if cls is str or cls is int or key is None:
+        return key
+    if cls is float:
+        if key != key:
+            return _NAN_KEY
+        if key.is_integer():
+            # Covers -0.0 and lets 1.0 and 1 share an entry
+            return int(key)
+        return key
+    if cls is bool:
+        return _TRUE_KEY if key else _FALSE_KEY
+
+    kind = _key_kinds.get(cls)
+    if kind is None:
+        kind = _key_kinds[cls] = _key_kind(cls)
+    if kind == _KEY_DIRECT:
+        return key
+    if kind == _KEY_FLATTEN:
+        return key.flatten()
+    return _IdentityKey(key)
+
+
+def _key_kind(cls):
+    """Classify how instances of cls are normalized (see _key_kinds)."""
+    if callable(getattr(cls, "flatten", None)):
+        return _KEY_FLATTEN
+    if cls.__eq__ is object.__eq__ and cls.__hash__ is object.__hash__:
+        return _KEY_DIRECT
+    return _KEY_IDENTITY
 
 
 class HashTable:
     """
-    Hash table with separate chaining and insertion order preservation.
+    Insertion-ordered hash table with SameValueZero keys.
 
     Features:
-    - Separate chaining for collision resolution
-    - Insertion order preservation (doubly-linked list)
-    - SameValueZero equality for keys
-    - Dynamic resizing when load factor exceeds threshold
+    - O(1) average set/get/has/delete via a dict from normalized key to slot
+    - Insertion order preservation (parallel key/value slot arrays)
+    - SameValueZero equality for keys via up-front key normalization
+    - Iterators that tolerate mutation (tombstones plus position fix-up
+      when tombstones are compacted)
 
     Attributes:
         size: Number of key-value pairs in the table
     """
 
-    def __init__(self, initial_capacity=16, load_factor=0.75):
-        """
-        Initialize hash table.
-
-        Args:
-            initial_capacity: Initial number of buckets
-            load_factor: Threshold for resizing (resize when size/capacity > load_factor)
-        """
-        self._capacity = initial_capacity
-        self._load_factor = load_factor
-        self._buckets = [None] * self._capacity
+    def __init__(self):
+        """Initialize an empty hash table."""
+        self._index = {}  # normalized key -> slot
+        self._keys = []  # slot -> original key, or _DELETED
+        self._values = []  # slot -> value
         self._size = 0
+        self._iterators = weakref.WeakSet()
 
-        # Maintain insertion order with doubly-linked list
-        self._first = None  # First node in insertion order
-        self._last = None   # Last node in insertion order
-
-    @property
-    def size(self):
-        """Get number of entries in hash table."""
-        return self._size
-
-    def _hash(self, key):
+    @classmethod
+    def from_entries(cls, entries):
         """
-        Compute hash value for a key.
+        Build a table from an iterable of (key, value) pairs.
+
+        Later duplicates overwrite earlier values but keep the first
+        position, as repeated set() calls would.
 
         Args:
-            key: The key to hash
+            entries: Iterable of 2-element lists/tuples
 
         Returns:
-            int: Hash value
-        """
-        # Use Python's built-in hash function
-        # For objects, this gives identity-based hash
-        # For NaN, we need special handling
-        if isinstance(key, float):
-            import math
-            if math.isnan(key):
-                # All NaNs should hash to the same value
-                return hash("__NaN__")
+            HashTable: New table
 
-        try:
-            return hash(key)
-        except TypeError:
-            # For unhashable types, use id()
-            return id(key)
+        Raises:
+            TypeError: If an entry is not a key-value pair
+        """
+        table = cls()
+        table.set_many(entries)
+        return table
 
-    def _bucket_index(self, hash_value):
+    @classmethod
+    def from_keys(cls, keys):
         """
-        Get bucket index for a hash value.
+        Build a set-style table (each value is its key) from an iterable.
 
         Args:
-            hash_value: The hash value
+            keys: Iterable of keys
 
         Returns:
-            int: Bucket index (0 to capacity-1)
+            HashTable: New table
         """
-        return hash_value % self._capacity
+        table = cls()
+        table.add_many(keys)
+        return table
 
-    def _find_node(self, key, hash_value):
+    @property
+    def size(self):
+        """Get number of entries in hash table."""
+        return self._size
+
+    def set(self, key, value):
         """
-        Find a node with the given key.
+        Add or update a key-value pair.
 
         Args:
-            key: The key to find
-            hash_value: Hash value of the key
+            key: The key
+            value: The value
 
         Returns:
-            HashNode or None: The node if found, None otherwise
+            HashTable: self (for chaining)
         """
-        bucket_idx = self._bucket_index(hash_value)
-        node = self._buckets[bucket_idx]
-
-        while node is not None:
-            if same_value_zero(node.key, key):
-                return node
-            node = node.next
+        normalized = normalize_key(key)
+        slot = self._index.get(normalized)
+        if slot is not None:
+            self._values[slot] = value
+            return self
 
-        return None
+        if type(key) is float and key == 0.0:
+            key = 0.0  # Map/Set store -0 as +0
+        elif type(normalized) is str and type(key) is not str:
+            key = normalized
+        self._index[normalized] = len(self._keys)
+        self._keys.append(key)
+        self._values.append(value)
+        self._size += 1
+        return self
 
-    def set(self, key, value):
+    def add(self, key):
         """
-        Add or update a key-value pair.
+        Add a key stored as its own value (Set semantics).
 
         Args:
             key: The key
-            value: The value
 
         Returns:
             HashTable: self (for chaining)
         """
-        hash_value = self._hash(key)
-        existing_node = self._find_node(key, hash_value)
+        normalized = normalize_key(key)
+        if normalized not in self._index:
+            if type(key) is float and key == 0.0:
+                key = 0.0
+            elif type(normalized) is str and type(key) is not str:
+                key = normalized
+            self._index[normalized] = len(self._keys)
+            self._keys.append(key)
+            self._values.append(key)
+            self._size += 1
+        return self
 
-        if existing_node is not None:
-            # Update existing entry
-            existing_node.value = value
-            return self
+    def set_many(self, entries):
+        """
+        Add or update many key-value pairs.
 
-        # Add new entry
-        new_node = HashNode(key, value, hash_value)
-
-        # Add to bucket (separate chaining)
-        bucket_idx = self._bucket_index(hash_value)
-        new_node.next = self._buckets[bucket_idx]
-        self._buckets[bucket_idx] = new_node
-
-        # Add to insertion order list
-        if self._last is None:
-            # First entry
-            self._first = new_node
-            self._last = new_node
-        else:
-            # Append to end
-            self._last.order_next = new_node
-            new_node.order_prev = self._last
-            self._last = new_node
+        Faster than repeated set() calls; the iterable must not mutate
+        this table while it is consumed.
 
-        self._size += 1
+        Args:
+            entries: Iterable of 2-element lists/tuples
 
-        # Resize if load factor exceeded
-        if self._size / self._capacity > self._load_factor:
-            self._resize()
+        Raises:
+            TypeError: If an entry is not a key-value pair
+        """
+        index = self._index
+        keys = self._keys
+        values = self._values
+        added = 0
+        try:
+            for entry in entries:
+                if not isinstance(entry, (list, tuple)) or len(entry) != 2:
+                    raise TypeError("Iterator value must be a key-value pair")
+                key, value = entry
+                normalized = normalize_key(key)
+                slot = index.get(normalized)
+                if slot is not None:
+                    values[slot] = value
+                    continue
+                if type(key) is float and key == 0.0:
+                    key = 0.0
+                elif type(normalized) is str and type(key) is not str:
+                    key = normalized
+                index[normalized] = len(keys)
+                keys.append(key)
+                values.append(value)
+                added += 1
+        finally:
+            self._size += added
+
+    def add_many(self, keys):
+        """
+        Add many keys, each stored as its own value (Set semantics).
 
-        return self
+        The iterable must not mutate this table while it is consumed.
+
+        Args:
+            keys: Iterable of keys
+        """
+        index = self._index
+        slot_keys = self._keys
+        values = self._values
+        added = 0
+        try:
+            for key in keys:
+                normalized = normalize_key(key)
+                if normalized in index:
+                    continue
+                if type(key) is float and key == 0.0:
+                    key = 0.0
+                elif type(normalized) is str and type(key) is not str:
+                    key = normalized
+                index[normalized] = len(slot_keys)
+                slot_keys.append(key)
+                values.append(key)
+                added += 1
+        finally:
+            self._size += added
 
     def get(self, key):
         """
@@ -182,9 +291,8 @@ class HashTable:
         Returns:
             The value if key exists, None otherwise
         """
-        hash_value = self._hash(key)
-        node = self._find_node(key, hash_value)
-        return node.value if node is not None else None
+        slot = self._index.get(normalize_key(key))
+        return self._values[slot] if slot is not None else None
 
     def has(self, key):
         """
@@ -196,8 +304,7 @@ class HashTable:
         Returns:
             bool: True if key exists
         """
-        hash_value = self._hash(key)
-        return self._find_node(key, hash_value) is not None
+        return normalize_key(key) in self._index
 
     def delete(self, key):
         """
@@ -209,99 +316,122 @@ class HashTable:
         Returns:
             bool: True if key existed and was deleted, False otherwise
         """
-        hash_value = self._hash(key)
-        bucket_idx = self._bucket_index(hash_value)
-
-        # Find and remove from bucket chain
-        node = self._buckets[bucket_idx]
-        prev_node = None
-
-        while node is not None:
-            if same_value_zero(node.key, key):
-                # Found it - remove from bucket chain
-                if prev_node is None:
-                    self._buckets[bucket_idx] = node.next
-                else:
-                    prev_node.next = node.next
+        slot = self._index.pop(normalize_key(key), None)
+        if slot is None:
+            return False
 
-                # Remove from insertion order list
-                if node.order_prev is not None:
-                    node.order_prev.order_next = node.order_next
-                else:
-                    self._first = node.order_next
+        self._keys[slot] = _DELETED
+        self._values[slot] = None
+        self._size -= 1
 
-                if node.order_next is not None:
-                    node.order_next.order_prev = node.order_prev
-                else:
-                    self._last = node.order_prev
-
-                self._size -= 1
-                return True
-
-            prev_node = node
-            node = node.next
-
-        return False
+        tombstones = len(self._keys) - self._size
+        if tombstones >= _COMPACT_MIN_TOMBSTONES and tombstones > self._size:
+            self._compact()
+        return True
 
     def clear(self):
         """Remove all entries from the hash table."""
-        self._buckets = [None] * self._capacity
+        self._index = {}
+        self._keys = []
+        self._values = []
         self._size = 0
-        self._first = None
-        self._last = None
+        # Live iterators continue with entries added after the clear
+        for iterator in self._iterators:
+            iterator._position = 0
 
     def keys(self):
         """
         Iterate over keys in insertion order.
 
-        Yields:
-            Keys in insertion order
+        Returns:
+            Iterator over keys in insertion order
         """
-        node = self._first
-        while node is not None:
-            yield node.key
-            node = node.order_next
+        return self._iterator(_KEYS)
 
     def values(self):
         """
         Iterate over values in insertion order.
 
-        Yields:
-            Values in insertion order
+        Returns:
+            Iterator over values in insertion order
         """
-        node = self._first
-        while node is not None:
-            yield node.value
-            node = node.order_next
+        return self._iterator(_VALUES)
 
     def entries(self):
         """
         Iterate over (key, value) pairs in insertion order.
 
-        Yields:
-            (key, value) tuples in insertion order
+        Returns:
+            Iterator over (key, value) tuples in insertion order
         """
-        node = self._first
-        while node is not None:
-            yield (node.key, node.value)
-            node = node.order_next
+        return self._iterator(_ENTRIES)
+
+    def _iterator(self, kind):
+        iterator = _TableIterator(self, kind)
+        self._iterators.add(iterator)
+        return iterator
 
-    def _resize(self):
+    def _compact(self):
         """
-        Resize the hash table to maintain performance.
+        Drop tombstones and renumber slots.
 
-        Doubles the capacity and rehashes all entries.
+        Iterators positioned at old slot p move to the number of live
+        entries before p, which is the same point in the sequence.
         """
-        old_capacity = self._capacity
-        self._capacity = old_capacity * 2
-        old_buckets = self._buckets
-        self._buckets = [None] * self._capacity
-
-        # Rehash all entries (maintains insertion order through order_* links)
-        node = self._first
-        while node is not None:
-            # Re-add to new buckets
-            bucket_idx = self._bucket_index(node.hash_value)
-            node.next = self._buckets[bucket_idx]
-            self._buckets[bucket_idx] = node
-            node = node.order_next
+        old_keys = self._keys
+        live_slots = [slot for slot, key in enumerate(old_keys) if key is not _DELETED]
+
+        for iterator in self._iterators:
+            iterator._position = bisect_left(live_slots, iterator._position)
+
+        old_values = self._values
+        self._keys = [old_keys[slot] for slot in live_slots]
+        self._values = [old_values[slot] for slot in live_slots]
+        # The index dict's own order is insertion order of live entries,
+        # which is exactly slot order
+        self._index = dict(zip(self._index, range(self._size)))
+
+
+class _TableIterator:
+    """
+    Live iterator over a HashTable.
+
+    Walks the slot arrays from its position, skipping tombstones, so
+    entries appended during iteration are visited. Once exhausted it stays
+    exhausted, as JS iterators do.
+    """
+
+    __slots__ = ("_table", "_kind", "_position", "__weakref__")
+
+    def __init__(self, table, kind):
+        self._table = table
+        self._kind = kind
+        self._position = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        table = self._table
+        if table is None:
+            raise StopIteration
+
+        keys = table._keys
+        position = self._position
+        end = len(keys)
+        while position < end:
+            key = keys[position]
+            position += 1
+            if key is not _DELETED:
+                self._position = position
+                kind = self._kind
+                if kind == _KEYS:
+                    return key
+                if kind == _VALUES:
+                    return table._values[position - 1]
+                return (key, table._values[position - 1])
+
+        self._position = position
+        self._table = None
+        table._iterators.discard(self)
+        raise StopIteration
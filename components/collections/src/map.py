@@ -39,14 +39,10 @@ class Map:
         Args:
             iterable: Optional iterable of [key, value] pairs
         """
-        self._table = HashTable()
-
-        if iterable is not None:
-            for entry in iterable:
-                if not isinstance(entry, (list, tuple)) or len(entry) != 2:
-                    raise TypeError("Iterator value must be a key-value pair")
-                key, value = entry
-                self.set(key, value)
+        if iterable is None:
+            self._table = HashTable()
+        else:
+            self._table = HashTable.from_entries(iterable)
 
     @property
     def size(self):
@@ -38,11 +38,10 @@ class Set:
         Args:
             iterable: Optional iterable of values
         """
-        self._table = HashTable()
-
-        if iterable is not None:
-            for value in iterable:
-                self.add(value)
+        if iterable is None:
+            self._table = HashTable()
+        else:
+            self._table = HashTable.from_keys(iterable)
 
     @property
     def size(self):
@@ -66,8 +65,7 @@ class Set:
         Returns:
             Set: this (for chaining)
         """
-        # Use value as both key and value in hash table
-        self._table.set(value, value)
+        self._table.add(value)
         return self
 
     def has(self, value):
@@ -132,8 +130,7 @@ class Set:
         Yields:
             (value, value) tuples in insertion order
         """
-        for value in self._table.keys():
-            yield (value, value)
+        return self._table.entries()
 
     def forEach(self, callback, this_arg=None):
         """
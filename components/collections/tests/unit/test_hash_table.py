@@ -2,7 +2,7 @@
 Unit tests for hash table implementation.
 
 The hash table is used internally by Map and Set.
-- Separate chaining for collision resolution
+- Dict-backed storage with tombstones for live iteration
 - Insertion order preservation
 - SameValueZero equality for keys
 """
@@ -327,3 +327,209 @@ class TestHashTableEdgeCases:
         assert ht.get(True) == "true value"
         assert ht.get(False) == "false value"
         assert ht.size == 2
+
+
+class TestHashTableKeyNormalization:
+    """Test SameValueZero key normalization."""
+
+    def test_distinct_nan_objects_share_entry(self):
+        """Test NaNs with different identities map to one entry."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable()
+        ht.set(float('nan'), "a")
+        ht.set(float('inf') - float('inf'), "b")
+
+        assert ht.size == 1
+        assert ht.get(float('nan')) == "b"
+
+    def test_negative_zero_stored_as_positive_zero(self):
+        """Test -0 is stored as +0 (Map.prototype.set step 5)."""
+        import math
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable()
+        ht.set(-0.0, "zero")
+
+        key = next(ht.keys())
+        assert key == 0 and math.copysign(1.0, key) == 1.0
+
+    def test_integral_float_matches_integer(self):
+        """Test 1 and 1.0 are the same JS number."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable()
+        ht.set(1, "int")
+        ht.set(1.0, "float")
+
+        assert ht.size == 1
+        assert ht.get(1) == "float"
+
+    def test_booleans_do_not_collide_with_numbers(self):
+        """Test true/false are distinct from 1/0."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable()
+        ht.set(1, "one")
+        ht.set(True, "true")
+        ht.set(0, "zero")
+        ht.set(False, "false")
+
+        assert ht.size == 4
+        assert ht.get(1) == "one"
+        assert ht.get(True) == "true"
+
+    def test_rope_and_flat_string_share_entry(self):
+        """Test a rope string key (one with flatten()) finds the equal str key and vice versa."""
+        from components.collections.src.hash_table import HashTable
+
+        class Rope:
+            """Stand-in for object_runtime's ConsString."""
+
+            def __init__(self, *parts):
+                self.parts = parts
+
+            def flatten(self):
+                return "".join(self.parts)
+
+            def __eq__(self, other):
+                return self.flatten() == str(other)
+
+            def __hash__(self):
+                return hash(self.flatten())
+
+        flat = "key-" * 100 + "rope"
+
+        ht = HashTable()
+        ht.set(Rope("key-" * 100, "rope"), "rope")
+        ht.set(flat, "flat")
+        assert ht.size == 1
+        assert ht.get(flat) == "flat"
+        assert type(next(ht.keys())) is str
+
+        ht = HashTable.from_keys([flat])
+        ht.add(Rope("key-" * 100, "rope"))
+        assert ht.size == 1
+        assert ht.has(Rope("key-" * 100, "rope"))
+
+    def test_objects_with_value_equality_keyed_by_identity(self):
+        """Test objects are compared by reference even if they define __eq__."""
+        from components.collections.src.hash_table import HashTable
+
+        class Point:
+            def __init__(self, x):
+                self.x = x
+
+            def __eq__(self, other):
+                return isinstance(other, Point) and other.x == self.x
+
+            def __hash__(self):
+                return hash(self.x)
+
+        ht = HashTable()
+        first = Point(1)
+        ht.set(first, "first")
+        ht.set(Point(1), "second")
+        ht.set([1, 2], "unhashable")
+
+        assert ht.size == 3
+        assert ht.get(first) == "first"
+        assert ht.has(Point(1)) is False
+
+
+class TestHashTableBulkConstruction:
+    """Test bulk constructors."""
+
+    def test_from_entries(self):
+        """Test from_entries keeps first position and last value."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable.from_entries([("a", 1), ["b", 2], ("a", 3)])
+
+        assert ht.size == 2
+        assert list(ht.entries()) == [("a", 3), ("b", 2)]
+
+    def test_from_entries_rejects_non_pairs(self):
+        """Test from_entries validates each entry."""
+        from components.collections.src.hash_table import HashTable
+
+        with pytest.raises(TypeError):
+            HashTable.from_entries([("a", 1), "b"])
+
+    def test_from_keys(self):
+        """Test from_keys deduplicates by SameValueZero."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable.from_keys(range(5))
+        ht.add_many([3, 4.0, 5, float('nan'), float('nan')])
+
+        assert ht.size == 7
+        assert list(ht.values())[:6] == [0, 1, 2, 3, 4, 5]
+
+
+class TestHashTableLiveIteration:
+    """Test iteration while the table is mutated."""
+
+    def test_entries_added_during_iteration_are_visited(self):
+        """Test appended entries are visited by an active iterator."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable.from_keys([1, 2])
+        seen = []
+        for key in ht.keys():
+            seen.append(key)
+            if key < 4:
+                ht.add(key + 2)
+
+        assert seen == [1, 2, 3, 4, 5]
+
+    def test_entries_deleted_during_iteration_are_skipped(self):
+        """Test deleted entries ahead of the iterator are not visited."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable.from_keys("abcd")
+        seen = []
+        for key in ht.keys():
+            seen.append(key)
+            if key == "a":
+                ht.delete("c")
+
+        assert seen == ["a", "b", "d"]
+
+    def test_iteration_survives_compaction(self):
+        """Test iterator position is remapped when tombstones are compacted."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable.from_keys(range(100))
+        iterator = ht.keys()
+        assert [next(iterator) for _ in range(50)] == list(range(50))
+
+        for key in range(60):
+            ht.delete(key)
+        assert len(ht._keys) < 100  # tombstones were compacted
+
+        assert list(iterator) == list(range(60, 100))
+
+    def test_clear_during_iteration(self):
+        """Test an iterator continues with entries added after clear()."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable.from_keys([1, 2, 3])
+        iterator = ht.keys()
+        assert next(iterator) == 1
+
+        ht.clear()
+        ht.add(10)
+
+        assert list(iterator) == [10]
+
+    def test_exhausted_iterator_stays_done(self):
+        """Test an exhausted iterator does not resume after new entries."""
+        from components.collections.src.hash_table import HashTable
+
+        ht = HashTable.from_keys([1])
+        iterator = ht.keys()
+        assert list(iterator) == [1]
+
+        ht.add(2)
+        assert list(iterator) == []
@@ -7,6 +7,7 @@ from components.deoptimization.src.deopt_types import (
     DeoptStats,
     DeoptInfo,
     InterpreterFrame,
+    JITFrame,
 )
 from components.deoptimization.src.state_materializer import InterpreterState
 from components.deoptimization.src.frame_reconstructor import FrameReconstructor
@@ -17,12 +18,18 @@ from components.deoptimization.src.deopt_profiler import DeoptProfiler
 class DeoptimizationManager:
     """Main manager for deoptimization operations."""
 
-    def __init__(self):
-        """Initialize deoptimization manager."""
+    def __init__(self, profiler: Optional[DeoptProfiler] = None):
+        """
+        Initialize deoptimization manager.
+
+        Args:
+            profiler: Profiler to record deopts in (e.g. the interpreter's
+                profiler.deopt_profiler); a new one if not given
+        """
         self.functions: Dict[int, Any] = {}  # function_id -> OptimizedCode
         self.reconstructor = FrameReconstructor()
         self.lazy_deoptimizer = LazyDeoptimizer()
-        self.profiler = DeoptProfiler()
+        self.profiler = profiler if profiler is not None else DeoptProfiler()
 
     def register_optimized_function(
         self,
@@ -37,7 +44,8 @@ class DeoptimizationManager:
         function_id: int,
         deopt_point: int,
         reason: DeoptReason,
-        mode: Optional[DeoptMode]
+        mode: Optional[DeoptMode],
+        jit_frame: Optional[JITFrame] = None
     ) -> Optional[InterpreterState]:
         """
         Perform deoptimization.
@@ -47,6 +55,9 @@ class DeoptimizationManager:
             deopt_point: Deoptimization point offset
             reason: Deoptimization reason
             mode: Eager or lazy deoptimization
+            jit_frame: Optimized frame at the deopt point; with registered
+                deopt info for the point its values are reconstructed into
+                the interpreter frame
 
         Returns:
             Reconstructed interpreter state (None for lazy)
@@ -77,6 +88,9 @@ class DeoptimizationManager:
             # Get deopt info for this point (or create placeholder)
             if deopt_point in deopt_info_map:
                 deopt_info = deopt_info_map[deopt_point]
+                if jit_frame is not None:
+                    frame = self.reconstructor.reconstruct_frame(jit_frame, deopt_info)
+                    return InterpreterState(frame=frame)
             else:
                 # Create minimal deopt info
                 deopt_info = DeoptInfo(
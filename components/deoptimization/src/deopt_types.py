@@ -41,6 +41,7 @@ class DeoptInfo:
     value_map: Dict[str, ValueLocation]
     frame_size: int
     reason: DeoptReason
+    stack_map: List[str] = field(default_factory=list)  # value_map names on the operand stack
 
 
 @dataclass
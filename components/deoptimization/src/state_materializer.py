@@ -138,8 +138,12 @@ class StateMaterializer:
             value_type: Expected value type
 
         Returns:
-            JSValue representation
+            JSValue representation ("tagged" values are already engine
+            Values and are returned as they are)
         """
+        if value_type == "tagged":
+            return raw_value
+
         if value_type == "int":
             # Smi - small integer
             return JSValue(value=raw_value, type_tag="number")
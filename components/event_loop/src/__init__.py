@@ -8,6 +8,7 @@ Public API:
     EventLoop: Main event loop coordinator
     Task: Macrotask representation
     Microtask: Microtask representation
+    AsyncioEventLoop: Event loop running on a host asyncio loop
 
 Example:
     >>> from components.event_loop.src import EventLoop
@@ -22,7 +23,8 @@ Example:
 from .event_loop import EventLoop
 from .task import Task
 from .microtask import Microtask
+from .asyncio_event_loop import AsyncioEventLoop
 
-__all__ = ['EventLoop', 'Task', 'Microtask']
+__all__ = ['EventLoop', 'Task', 'Microtask', 'AsyncioEventLoop']
 
 __version__ = '0.1.0'
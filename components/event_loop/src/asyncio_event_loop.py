@@ -0,0 +1,354 @@
+"""asyncio-backed Event Loop for embedding the runtime in Python servers.
+
+AsyncioEventLoop keeps the EventLoop interface (queue_task, queue_microtask,
+run, stop) but schedules work on a host asyncio loop instead of draining its
+own queues synchronously:
+
+- Macrotasks become asyncio callbacks (loop.call_soon)
+- Timers become asyncio timer handles (loop.call_later)
+- Microtasks are drained at a checkpoint after every macrotask and timer,
+  or on the next loop iteration when queued from plain Python code
+
+Many AsyncioEventLoop instances (one per JS context) can share a single host
+loop, so JS contexts run concurrently without blocking threads.
+"""
+
+import asyncio
+from collections import deque
+from .event_loop import EventLoop
+from .task import Task
+from .microtask import Microtask
+
+
+class AsyncioEventLoop(EventLoop):
+    """JavaScript event loop running on top of a host asyncio loop.
+
+    Example:
+        >>> async def main():
+        ...     loop = AsyncioEventLoop()
+        ...     loop.queue_task(lambda: print("macrotask"))
+        ...     loop.queue_microtask(lambda: print("microtask"))
+        ...     await loop.run_async()
+        >>> asyncio.run(main())
+        microtask
+        macrotask
+
+    Attributes:
+        macrotask_queue: Always empty; macrotasks live in the host loop
+        microtask_queue: FIFO queue for microtasks (Promise reactions)
+        running: True until stop() is called
+        loop: Host asyncio event loop
+    """
+
+    def __init__(self, loop=None):
+        """Initialize an event loop bound to a host asyncio loop.
+
+        Args:
+            loop: Host asyncio loop (default: the running loop, or a new
+                loop when none is running)
+        """
+        super().__init__()
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = asyncio.new_event_loop()
+        self.loop = loop
+        self.running = True
+
+        self._handles = {}  # handle_id -> asyncio.Handle for pending work
+        self._next_handle_id = 1
+        self._checkpoint_scheduled = False
+        self._task_depth = 0  # >0 while a task runs; it ends with a checkpoint
+        self._idle_waiters = deque()
+
+    # ------------------------------------------------------------------
+    # Queueing
+    # ------------------------------------------------------------------
+
+    def queue_microtask(self, callback):
+        """Queue a microtask.
+
+        Microtasks run at the next checkpoint: right after the current
+        macrotask or timer, or on the next host loop iteration if queued
+        from outside the event loop (e.g. from a Python coroutine).
+
+        Args:
+            callback: Function to execute as a microtask
+        """
+        self.microtask_queue.append(Microtask(callback))
+        if not self._task_depth and not self._checkpoint_scheduled:
+            self._checkpoint_scheduled = True
+            self.loop.call_soon(self._scheduled_checkpoint)
+
+    def queue_task(self, callback):
+        """Queue a macrotask as a host loop callback.
+
+        Args:
+            callback: Function to execute as a macrotask
+
+        Returns:
+            Handle ID that can be passed to cancel()
+        """
+        return self._schedule(None, Task(callback))
+
+    def call_later(self, delay, callback):
+        """Run callback as a macrotask after delay milliseconds.
+
+        Args:
+            delay: Delay in milliseconds (negative or None treated as 0)
+            callback: Function to execute
+
+        Returns:
+            Handle ID that can be passed to cancel()
+        """
+        delay = max(0, delay or 0)
+        return self._schedule(delay, Task(callback))
+
+    def cancel(self, handle_id):
+        """Cancel a pending macrotask or timer.
+
+        Args:
+            handle_id: ID returned from queue_task() or call_later()
+
+        Returns:
+            True if the handle was pending and is now cancelled
+        """
+        handle = self._handles.pop(handle_id, None)
+        if handle is None:
+            return False
+        handle.cancel()
+        self._notify_if_idle()
+        return True
+
+    # ------------------------------------------------------------------
+    # Timers (setTimeout / setInterval semantics)
+    # ------------------------------------------------------------------
+
+    def setTimeout(self, callback, delay=0, *args):
+        """Schedule callback(*args) once after delay milliseconds.
+
+        Returns:
+            Positive integer timer ID
+        """
+        return self.call_later(delay, lambda: callback(*args))
+
+    def clearTimeout(self, timer_id):
+        """Cancel a timeout. No-op for unknown or already-fired IDs."""
+        self.cancel(timer_id)
+
+    def setInterval(self, callback, delay=0, *args):
+        """Schedule callback(*args) every delay milliseconds.
+
+        The interval keeps the same ID across repetitions so clearInterval
+        works from inside the callback.
+
+        Returns:
+            Positive integer interval ID
+        """
+        delay = max(0, delay or 0)
+        handle_id = self._next_handle_id
+        self._next_handle_id += 1
+        task = Task(lambda: callback(*args))
+        self._handles[handle_id] = self.loop.call_later(
+            delay / 1000, self._run_interval, handle_id, task, delay
+        )
+        return handle_id
+
+    def clearInterval(self, interval_id):
+        """Stop an interval. No-op for unknown IDs."""
+        self.cancel(interval_id)
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def has_pending_work(self):
+        """Check whether any macrotask, timer or microtask is pending.
+
+        Returns:
+            True if the loop still has work scheduled
+        """
+        return bool(self._handles or self.microtask_queue)
+
+    def run_microtasks(self):
+        """Perform a microtask checkpoint.
+
+        Executes all queued microtasks, including ones queued while
+        draining. If a microtask raises, the remaining microtasks are
+        rescheduled for the next checkpoint and the exception propagates.
+        """
+        queue = self.microtask_queue
+        self._task_depth += 1
+        try:
+            while self.running and queue:
+                queue.popleft().execute()
+        finally:
+            self._task_depth -= 1
+            if queue and self.running and not self._checkpoint_scheduled:
+                self._checkpoint_scheduled = True
+                self.loop.call_soon(self._scheduled_checkpoint)
+            self._notify_if_idle()
+
+    async def run_async(self):
+        """Wait until all scheduled JS work has completed.
+
+        Performs a microtask checkpoint, then yields to the host loop until
+        no macrotasks, timers or microtasks remain (or stop() is called).
+        """
+        self.run_microtasks()
+        if not self.running or not self.has_pending_work():
+            return
+        waiter = self.loop.create_future()
+        self._idle_waiters.append(waiter)
+        await waiter
+
+    def run(self):
+        """Run until all queues are empty.
+
+        When the host loop is already running (we are inside a coroutine or
+        callback) this only performs a microtask checkpoint, since blocking
+        would deadlock the host loop; pending macrotasks and timers are left
+        to the host. Otherwise the host loop is driven until the JS work is
+        done.
+        """
+        self.running = True
+        if self.loop.is_running():
+            self.run_microtasks()
+            return
+        self.loop.run_until_complete(self.run_async())
+
+    def stop(self):
+        """Stop the event loop and cancel all pending macrotasks and timers."""
+        self.running = False
+        for handle in self._handles.values():
+            handle.cancel()
+        self._handles.clear()
+        self.microtask_queue.clear()
+        self._notify_if_idle()
+
+    # ------------------------------------------------------------------
+    # Promise <-> asyncio bridging
+    # ------------------------------------------------------------------
+
+    def to_future(self, promise):
+        """Wrap a JSPromise in an asyncio.Future on the host loop.
+
+        Non-exception rejection reasons are wrapped in PromiseRejection.
+
+        Args:
+            promise: JSPromise using this event loop
+
+        Returns:
+            asyncio.Future settled with the promise's outcome
+        """
+        from components.promise.src.js_promise import PromiseRejection
+
+        future = self.loop.create_future()
+
+        def on_fulfilled(value):
+            if not future.done():
+                future.set_result(value)
+
+        def on_rejected(reason):
+            if not future.done():
+                if not isinstance(reason, BaseException):
+                    reason = PromiseRejection(reason)
+                future.set_exception(reason)
+
+        promise.then(on_fulfilled, on_rejected)
+        return future
+
+    def from_awaitable(self, awaitable):
+        """Create a JSPromise that settles with an awaitable's outcome.
+
+        Lets JS code await Python coroutines and futures.
+
+        Args:
+            awaitable: Coroutine, Task or Future
+
+        Returns:
+            JSPromise resolved with the result or rejected with the exception
+        """
+        from components.promise.src import JSPromise
+
+        deferred = JSPromise.withResolvers(self)
+        resolve = deferred["resolve"]
+        reject = deferred["reject"]
+        future = asyncio.ensure_future(awaitable, loop=self.loop)
+        handle_id = self._next_handle_id
+        self._next_handle_id += 1
+        self._handles[handle_id] = future
+
+        def on_done(done):
+            if self._handles.pop(handle_id, None) is None:
+                return  # Cancelled by stop()
+            self._task_depth += 1
+            try:
+                if done.cancelled():
+                    reject(asyncio.CancelledError())
+                elif done.exception() is not None:
+                    reject(done.exception())
+                else:
+                    resolve(done.result())
+            finally:
+                self._task_depth -= 1
+                self.run_microtasks()
+
+        future.add_done_callback(on_done)
+        return deferred["promise"]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _schedule(self, delay, task):
+        """Register a task with the host loop and return its handle ID."""
+        handle_id = self._next_handle_id
+        self._next_handle_id += 1
+        if delay is None:
+            handle = self.loop.call_soon(self._run_task, handle_id, task)
+        else:
+            handle = self.loop.call_later(delay / 1000, self._run_task, handle_id, task)
+        self._handles[handle_id] = handle
+        return handle_id
+
+    def _run_task(self, handle_id, task):
+        """Execute one macrotask followed by a microtask checkpoint."""
+        if self._handles.pop(handle_id, None) is None or not self.running:
+            return
+        self._task_depth += 1
+        try:
+            task.execute()
+        finally:
+            self._task_depth -= 1
+            self.run_microtasks()
+
+    def _run_interval(self, handle_id, task, delay):
+        """Execute one interval tick and reschedule it unless cleared."""
+        if handle_id not in self._handles or not self.running:
+            return
+        self._task_depth += 1
+        try:
+            task.execute()
+        finally:
+            self._task_depth -= 1
+            # clearInterval() from inside the callback removes the handle
+            if self.running and handle_id in self._handles:
+                self._handles[handle_id] = self.loop.call_later(
+                    delay / 1000, self._run_interval, handle_id, task, delay
+                )
+            self.run_microtasks()
+
+    def _scheduled_checkpoint(self):
+        """Host loop callback for a checkpoint queued outside a task."""
+        self._checkpoint_scheduled = False
+        self.run_microtasks()
+
+    def _notify_if_idle(self):
+        """Wake run_async() waiters once no work remains."""
+        if self._idle_waiters and (not self.running or not self.has_pending_work()):
+            while self._idle_waiters:
+                waiter = self._idle_waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
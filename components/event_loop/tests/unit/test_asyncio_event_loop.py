@@ -0,0 +1,169 @@
+"""Unit tests for the asyncio-backed Event Loop."""
+
+import asyncio
+import pytest
+from components.event_loop.src import AsyncioEventLoop
+from components.promise.src import JSPromise
+from components.promise.src.js_promise import PromiseRejection
+
+
+class TestAsyncioEventLoopOrdering:
+    """Microtask/macrotask ordering on a host asyncio loop."""
+
+    def test_microtasks_before_macrotasks(self):
+        """Microtasks drain before the next macrotask runs."""
+        order = []
+
+        async def main():
+            loop = AsyncioEventLoop()
+            loop.queue_task(lambda: order.append("task"))
+            loop.queue_microtask(lambda: order.append("micro"))
+            await loop.run_async()
+
+        asyncio.run(main())
+        assert order == ["micro", "task"]
+
+    def test_checkpoint_after_each_macrotask(self):
+        """Microtasks queued by a macrotask run before the next macrotask."""
+        order = []
+
+        async def main():
+            loop = AsyncioEventLoop()
+
+            def first():
+                order.append("task1")
+                loop.queue_microtask(lambda: order.append("micro1"))
+
+            loop.queue_task(first)
+            loop.queue_task(lambda: order.append("task2"))
+            await loop.run_async()
+
+        asyncio.run(main())
+        assert order == ["task1", "micro1", "task2"]
+
+    def test_run_without_running_host_loop(self):
+        """run() drives the host loop when it isn't already running."""
+        order = []
+        loop = AsyncioEventLoop()
+        loop.setTimeout(lambda: order.append("timeout"), 5)
+        loop.queue_task(lambda: order.append("task"))
+        loop.run()
+
+        assert order == ["task", "timeout"]
+        assert loop.has_pending_work() is False
+        loop.loop.close()
+
+
+class TestAsyncioEventLoopTimers:
+    """setTimeout/setInterval backed by asyncio timer handles."""
+
+    def test_timeouts_fire_in_delay_order(self):
+        """Timers fire in order of their delay."""
+        order = []
+
+        async def main():
+            loop = AsyncioEventLoop()
+            loop.setTimeout(lambda: order.append("b"), 20)
+            loop.setTimeout(lambda x: order.append(x), 5, "a")
+            await loop.run_async()
+
+        asyncio.run(main())
+        assert order == ["a", "b"]
+
+    def test_clear_timeout(self):
+        """A cleared timeout never fires."""
+        fired = []
+
+        async def main():
+            loop = AsyncioEventLoop()
+            timer_id = loop.setTimeout(lambda: fired.append(1), 5)
+            loop.clearTimeout(timer_id)
+            await loop.run_async()
+
+        asyncio.run(main())
+        assert fired == []
+
+    def test_interval_cleared_from_callback(self):
+        """An interval can clear itself from inside its callback."""
+        ticks = []
+
+        async def main():
+            loop = AsyncioEventLoop()
+
+            def tick():
+                ticks.append(1)
+                if len(ticks) == 3:
+                    loop.clearInterval(interval_id)
+
+            interval_id = loop.setInterval(tick, 1)
+            await loop.run_async()
+
+        asyncio.run(main())
+        assert len(ticks) == 3
+
+
+class TestPromiseBridging:
+    """JSPromise <-> asyncio future bridging."""
+
+    def test_await_js_promise(self):
+        """A JS promise can be awaited from Python."""
+        async def main():
+            loop = AsyncioEventLoop()
+            promise = JSPromise.resolve(1, loop).then(lambda x: x + 41)
+            return await loop.to_future(promise)
+
+        assert asyncio.run(main()) == 42
+
+    def test_rejected_promise_raises(self):
+        """Non-exception rejection reasons are wrapped in PromiseRejection."""
+        async def main():
+            loop = AsyncioEventLoop()
+            await loop.to_future(JSPromise.reject("boom", loop))
+
+        with pytest.raises(PromiseRejection):
+            asyncio.run(main())
+
+    def test_promise_from_coroutine(self):
+        """A Python coroutine can be exposed to JS as a promise."""
+        results = []
+
+        async def compute():
+            await asyncio.sleep(0.001)
+            return 7
+
+        async def main():
+            loop = AsyncioEventLoop()
+            promise = loop.from_awaitable(compute())
+            promise.then(lambda v: results.append(v * 6))
+            await loop.run_async()
+
+        asyncio.run(main())
+        assert results == [42]
+
+    def test_concurrent_contexts_share_host_loop(self):
+        """Several JS event loops run concurrently on one host loop."""
+        order = []
+
+        async def context(name, delay):
+            loop = AsyncioEventLoop()
+            loop.setTimeout(lambda: order.append(name), delay)
+            await loop.run_async()
+
+        async def main():
+            await asyncio.gather(context("slow", 20), context("fast", 5))
+
+        asyncio.run(main())
+        assert order == ["fast", "slow"]
+
+    def test_stop_cancels_pending_work(self):
+        """stop() cancels timers and wakes run_async()."""
+        fired = []
+
+        async def main():
+            loop = AsyncioEventLoop()
+            loop.setTimeout(lambda: fired.append(1), 50)
+            loop.queue_task(loop.stop)
+            await loop.run_async()
+
+        asyncio.run(main())
+        assert fired == []
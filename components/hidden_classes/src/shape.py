@@ -7,6 +7,8 @@ Shapes form a transition tree where adding a property creates a new child shape.
 
 from typing import Optional, Dict
 from enum import Enum
+
+from components.shared_types.src.atoms import intern_key
 from .property_descriptor import PropertyAttributes
 
 
@@ -43,7 +45,7 @@ class Shape:
             property_attributes: Attributes of the property (None for root)
         """
         self.parent = parent
-        self.property_name = property_name
+        self.property_name = intern_key(property_name)
         self.property_attributes = property_attributes
 
         # Deprecation support (for shape migration)
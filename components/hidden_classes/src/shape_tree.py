@@ -5,6 +5,9 @@ Manages the global tree of shapes and ensures shape reuse for performance.
 """
 
 from typing import Dict, Tuple
+
+from components.shared_types.src.atoms import intern_key
+
 from .shape import Shape
 from .property_descriptor import PropertyAttributes
 
@@ -74,7 +77,9 @@ class ShapeTree:
         Returns:
             Child shape (existing or newly created)
         """
-        # Create cache key: (parent identity, property name, attributes)
+        property_name = intern_key(property_name)
+
+        # Create cache key: (parent identity, interned property name, attributes)
         # Use id(parent) for parent identity (each shape has unique identity)
         cache_key = (id(parent), property_name, attributes)
 
@@ -11,6 +11,7 @@ Public API:
         - PropertyStoreIC: Inline cache for property stores (obj.prop = value)
         - CallIC: Inline cache for function calls
         - GlobalIC: Inline cache for global variable access
+        - PropertyCell: Mutable box holding one global binding
 
     Enums:
         - ICState: Inline cache state machine states
@@ -28,7 +29,7 @@ from .ic_state import ICState
 from .inline_cache import InlineCache
 from .property_ic import PropertyLoadIC, PropertyStoreIC
 from .call_ic import CallIC
-from .global_ic import GlobalIC
+from .global_ic import GlobalIC, PropertyCell
 
 __all__ = [
     # Enums
@@ -39,6 +40,7 @@ __all__ = [
     "PropertyStoreIC",
     "CallIC",
     "GlobalIC",
+    "PropertyCell",
 ]
 
 __version__ = "0.1.0"
@@ -5,6 +5,8 @@ This will be replaced with the real Shape class from hidden_classes
 component once it's implemented.
 """
 
+from components.shared_types.src.atoms import intern_key
+
 
 class Shape:
     """
@@ -25,7 +27,7 @@ class Shape:
         """
         self.shape_id = Shape._next_shape_id
         Shape._next_shape_id += 1
-        self.properties = properties or {}
+        self.properties = {intern_key(name): offset for name, offset in (properties or {}).items()}
 
     def __eq__(self, other):
         """Check shape equality by ID."""
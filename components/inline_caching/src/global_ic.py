@@ -1,22 +1,58 @@
 """
 Global Variable Inline Cache for optimized global access.
 
-Provides GlobalIC for fast global variable load/store.
+Provides GlobalIC for fast global variable load/store, backed by one
+PropertyCell per global binding.
 """
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from components.shared_types.src.atoms import intern_key
+
 from .inline_cache import InlineCache
 
 
+class PropertyCell:
+    """
+    Mutable box holding the value of one global binding.
+
+    Load and store sites cache the cell itself after their first lookup
+    and then read or write cell.value directly. A cell stays attached to
+    its GlobalIC until the binding is deleted or reconfigured; the IC then
+    sets owner to None so every site caching the cell misses and looks
+    the name up again.
+
+    Attributes:
+        name: Global variable name
+        value: Current value of the binding
+        owner: GlobalIC the cell belongs to (None once invalidated)
+    """
+
+    __slots__ = ("name", "value", "owner")
+
+    def __init__(self, name: str, value: Any, owner: "GlobalIC"):
+        self.name = name
+        self.value = value
+        self.owner = owner
+
+    def __repr__(self) -> str:
+        state = "valid" if self.owner is not None else "invalid"
+        return f"PropertyCell({self.name!r}, {state})"
+
+
 class GlobalIC(InlineCache):
     """
     Inline cache for global variable access.
 
-    Optimizes global variable loads and stores by caching offsets.
+    Keeps a PropertyCell per global binding next to the global variable
+    dictionary. Stores write both, so the dictionary stays usable by code
+    that reads globals by name, while cached sites only touch the cell.
+    Globals must be written through the IC for cells to see the change.
 
     Example:
         ic = GlobalIC()
         value = ic.load_global("globalVar")
         ic.store_global("globalVar", newValue)
+        cell = ic.lookup_cell("globalVar")  # cache at the access site
     """
 
     def __init__(self, global_dict: Dict[str, Any] = None):
@@ -29,7 +65,7 @@ class GlobalIC(InlineCache):
         super().__init__("global")
 
         # Global variable dictionary
-        self._globals = global_dict or {}
+        self._globals = global_dict if global_dict is not None else {}
 
         # Statistics
         self._load_hits = 0
@@ -37,8 +73,25 @@ class GlobalIC(InlineCache):
         self._store_hits = 0
         self._store_misses = 0
 
-        # Cached global slots (name -> value cache)
-        self._cached_globals = {}
+        # Property cells of the globals looked up so far (name -> cell)
+        self._cells: Dict[str, PropertyCell] = {}
+
+    def lookup_cell(self, name: str) -> Optional[PropertyCell]:
+        """
+        Get the property cell of a global binding.
+
+        Args:
+            name: Global variable name
+
+        Returns:
+            The binding's cell (created on first lookup), or None if the
+            global is undefined
+        """
+        cell = self._cells.get(name)
+        if cell is None and name in self._globals:
+            cell = PropertyCell(name, self._globals[name], self)
+            self._cells[name] = cell
+        return cell
 
     def load_global(self, name: str) -> Any:
         """
@@ -51,25 +104,17 @@ class GlobalIC(InlineCache):
             Global variable value (or None if undefined)
 
         Performance:
-            - Cache hit: O(1) - dict lookup in cached_globals
-            - Cache miss: O(1) - dict lookup in globals + cache update
+            - Cache hit: O(1) - dict lookup in cells
+            - Cache miss: O(1) - dict lookup in globals + cell creation
         """
-        # Check cache first
-        if name in self._cached_globals:
-            # Cache hit
+        cell = self._cells.get(name)
+        if cell is not None:
             self._load_hits += 1
-            return self._cached_globals[name]
-        else:
-            # Cache miss
-            self._load_misses += 1
-
-            # Load from globals
-            value = self._globals.get(name)
-
-            # Update cache
-            self._cached_globals[name] = value
+            return cell.value
 
-            return value
+        self._load_misses += 1
+        cell = self.lookup_cell(name)
+        return cell.value if cell is not None else None
 
     def store_global(self, name: str, value: Any) -> None:
         """
@@ -80,25 +125,48 @@ class GlobalIC(InlineCache):
             value: Value to store
 
         Performance:
-            - O(1) - dict insert + cache update
+            - O(1) - dict insert + cell update
         """
-        # Update globals
+        cell = self._cells.get(name)
+        if cell is not None:
+            cell.value = value
+            name = cell.name
+        elif name not in self._globals:
+            # New names are stored interned, like the compiler's atoms
+            name = intern_key(name)
         self._globals[name] = value
 
-        # Update cache
-        self._cached_globals[name] = value
-
         self._store_hits += 1
 
+    def delete_global(self, name: str) -> bool:
+        """
+        Delete a global binding and invalidate its cell.
+
+        Args:
+            name: Global variable name
+
+        Returns:
+            True if the global existed
+        """
+        self.invalidate_global(name)
+        if name not in self._globals:
+            return False
+        del self._globals[name]
+        return True
+
     def invalidate_global(self, name: str) -> None:
         """
-        Invalidate cached global variable.
+        Invalidate the cell of a global variable.
+
+        Call this when a binding is reconfigured; sites caching the old
+        cell miss and pick up a fresh one on their next lookup.
 
         Args:
             name: Global variable name to invalidate
         """
-        if name in self._cached_globals:
-            del self._cached_globals[name]
+        cell = self._cells.pop(name, None)
+        if cell is not None:
+            cell.owner = None
 
     def get_statistics(self) -> dict:
         """
@@ -116,6 +184,6 @@ class GlobalIC(InlineCache):
             'load_total': load_total,
             'load_hit_rate': load_hit_rate,
             'store_count': self._store_hits,
-            'cached_globals': len(self._cached_globals),
+            'cached_globals': len(self._cells),
             'state': str(self.get_state())
         }
@@ -4,7 +4,7 @@ Unit tests for GlobalIC (BDD style).
 Tests verify global variable access optimization with inline caching.
 """
 import pytest
-from components.inline_caching.src.global_ic import GlobalIC
+from components.inline_caching.src.global_ic import GlobalIC, PropertyCell
 
 
 class TestGlobalIC:
@@ -74,6 +74,63 @@ class TestGlobalIC:
         assert ic.get_statistics()['load_misses'] > initial_misses
 
 
+class TestPropertyCells:
+    """Test the property cells backing GlobalIC."""
+
+    def test_lookup_returns_one_cell_per_binding(self):
+        """
+        Given a GlobalIC over a global dictionary
+        When looking up the same global twice and storing to it
+        Then both lookups return the same cell, which holds the new value
+        """
+        globals_ = {"Math": 1}
+        ic = GlobalIC(globals_)
+
+        cell = ic.lookup_cell("Math")
+        ic.store_global("Math", 2)
+
+        assert isinstance(cell, PropertyCell)
+        assert ic.lookup_cell("Math") is cell
+        assert cell.value == 2
+        assert globals_["Math"] == 2
+        assert ic.lookup_cell("missing") is None
+
+    def test_delete_detaches_cell(self):
+        """
+        Given a cached cell
+        When its global is deleted and defined again
+        Then the old cell is detached and a new cell holds the new binding
+        """
+        ic = GlobalIC()
+        ic.store_global("x", 1)
+        cell = ic.lookup_cell("x")
+
+        assert ic.delete_global("x") is True
+        assert cell.owner is None
+        assert ic.load_global("x") is None
+
+        ic.store_global("x", 3)
+        assert ic.lookup_cell("x") is not cell
+        assert ic.lookup_cell("x").value == 3
+        assert ic.delete_global("y") is False
+
+    def test_invalidate_detaches_cell_but_keeps_value(self):
+        """
+        Given a cached cell
+        When its global is reconfigured (invalidated)
+        Then the old cell is detached and a fresh cell has the same value
+        """
+        ic = GlobalIC()
+        ic.store_global("x", 5)
+        cell = ic.lookup_cell("x")
+
+        ic.invalidate_global("x")
+
+        assert cell.owner is None
+        assert ic.lookup_cell("x").owner is ic
+        assert ic.lookup_cell("x").value == 5
+
+
 class TestGlobalICStatistics:
     """Test GlobalIC statistics tracking."""
 
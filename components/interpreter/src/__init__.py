@@ -10,9 +10,14 @@ Public API:
         - ExecutionContext: Execution state manager
         - CallFrame: Function call frame
         - EvaluationResult: Execution result container
+        - RealmSnapshot: Prebuilt globals/prototypes cloned per context
+        - ExecutionProfiler: Opcode counters, function timing, stack sampling
+        - TieringManager: Tier-up to the optimizing JIT and deoptimization
 
     Functions:
         - Execute: Main entry point for bytecode execution
+        - GetDefaultRealmSnapshot: Process-wide shared realm snapshot
+        - MeasureContextCreation: Contexts/sec benchmark (cold vs. snapshot)
 
 Example:
     >>> from components.interpreter.src import Execute
@@ -32,9 +37,10 @@ Example:
     42
 """
 
-from typing import Optional
+from typing import Dict, Optional
 from components.memory_gc.src import GarbageCollector
 from components.bytecode.src import BytecodeArray
+from components.value_system.src import Value
 from components.event_loop.src import EventLoop
 
 # Import all public classes
@@ -42,10 +48,17 @@ from .interpreter import Interpreter
 from .execution_context import ExecutionContext
 from .call_frame import CallFrame
 from .evaluation_result import EvaluationResult
+from .realm import RealmSnapshot, GetDefaultRealmSnapshot, MeasureContextCreation
+from .profiler import ExecutionProfiler, FunctionStats
+from .tiering import TieringManager
 
 
 def Execute(
-    bytecode: BytecodeArray, gc: Optional[GarbageCollector] = None
+    bytecode: BytecodeArray,
+    gc: Optional[GarbageCollector] = None,
+    realm: Optional[RealmSnapshot] = None,
+    profiler: Optional[ExecutionProfiler] = None,
+    host_globals: Optional[Dict[str, Value]] = None,
 ) -> EvaluationResult:
     """
     Execute bytecode with event loop support.
@@ -58,6 +71,12 @@ def Execute(
     Args:
         bytecode: Compiled bytecode to execute
         gc: Garbage collector instance (creates new one if not provided)
+        realm: Realm snapshot to clone globals from (see RealmSnapshot);
+            avoids rebuilding built-ins for every call
+        profiler: Execution profiler to record into; started for the
+            duration of the call unless it is already running
+        host_globals: Extra global bindings provided by the embedder
+            (name -> Value), installed before the script runs
 
     Returns:
         EvaluationResult containing return value or exception
@@ -82,13 +101,24 @@ def Execute(
     event_loop = EventLoop()
 
     # Create interpreter with event loop
-    interpreter = Interpreter(gc, event_loop)
+    interpreter = Interpreter(gc, event_loop, realm=realm, profiler=profiler)
+    if host_globals:
+        for name, value in host_globals.items():
+            interpreter.set_global(name, value)
 
-    # Execute main script
-    result = interpreter.execute(bytecode)
+    owns_profiler = profiler is not None and not profiler.is_running
+    if owns_profiler:
+        profiler.start(interpreter.context)
 
-    # Run event loop to process any queued microtasks
-    event_loop.run()
+    try:
+        # Execute main script
+        result = interpreter.execute(bytecode)
+
+        # Run event loop to process any queued microtasks
+        event_loop.run()
+    finally:
+        if owns_profiler:
+            profiler.stop()
 
     return result
 
@@ -99,8 +129,14 @@ __all__ = [
     "ExecutionContext",
     "CallFrame",
     "EvaluationResult",
+    "RealmSnapshot",
+    "ExecutionProfiler",
+    "FunctionStats",
+    "TieringManager",
     # Functions
     "Execute",
+    "GetDefaultRealmSnapshot",
+    "MeasureContextCreation",
 ]
 
 __version__ = "0.1.0"
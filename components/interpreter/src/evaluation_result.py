@@ -6,6 +6,7 @@ of bytecode execution, containing either a successful value or an exception.
 """
 
 from typing import Optional
+from components.object_runtime.src import ConsString
 from components.value_system.src import Value
 
 
@@ -16,6 +17,9 @@ class EvaluationResult:
     Contains either a successful value or an exception from execution.
     Used to propagate results and errors through the interpreter.
 
+    Strings are handed to the embedder flat: a rope (ConsString) result is
+    replaced by its str.
+
     Attributes:
         value: Return value if execution succeeded (None if exception occurred)
         exception: Exception if execution failed (None if successful)
@@ -38,6 +42,12 @@ class EvaluationResult:
             If neither value nor exception is provided, this represents
             a successful execution with undefined result.
         """
+        if (
+            isinstance(value, Value)
+            and value.is_object()
+            and type(value.to_object()) is ConsString
+        ):
+            value = Value.from_object(value.to_object().flatten())
         self.value = value
         self.exception = exception
         self.suspended = suspended
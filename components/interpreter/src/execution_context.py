@@ -18,11 +18,13 @@ class ExecutionContext:
     - Global variable bindings
     - Function call stack
     - Garbage collector reference
+    - Intrinsic objects (built-in prototypes) of the realm
 
     Attributes:
         global_scope: Dictionary of global variable bindings
         call_stack: Stack of function call frames
         gc: Garbage collector instance for memory management
+        intrinsics: Built-in objects by name (e.g. "ArrayPrototype")
     """
 
     def __init__(self, gc: GarbageCollector):
@@ -35,6 +37,7 @@ class ExecutionContext:
         self.gc = gc
         self.global_scope: Dict[str, any] = {}
         self.call_stack: List[CallFrame] = []
+        self.intrinsics: Dict[str, any] = {}
 
     def push_frame(self, frame: CallFrame) -> None:
         """
@@ -5,18 +5,41 @@ This module provides the Interpreter class which executes JavaScript bytecode
 using a register-based virtual machine with opcode dispatch loop.
 """
 
-from typing import List, Optional, Dict, Any
+from functools import partial
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from dataclasses import dataclass
 from components.memory_gc.src import GarbageCollector
-from components.value_system.src import Value
+from components.value_system.src import (
+    Value,
+    NumberDivide,
+    NumberMultiply,
+    NumberRemainder,
+    NumberToString,
+    NumberUnaryMinus,
+    ToBoolean,
+)
+from components.value_system.src.value import SMI_MAX_VALUE, SMI_MIN_VALUE
 from components.bytecode.src import BytecodeArray, Opcode
+from components.bytecode.src.feedback_vector import call_target
 from components.interpreter.src.execution_context import ExecutionContext
 from components.interpreter.src.call_frame import CallFrame
 from components.interpreter.src.evaluation_result import EvaluationResult
-from components.object_runtime.src import JSArray, JSObject
+from components.interpreter.src.tiering import TieringManager
+from components.object_runtime.src import JSArray, JSObject, ConsString, Concat
 from components.event_loop.src import EventLoop
+from components.inline_caching.src import GlobalIC, PropertyCell
 from components.promise.src import JSPromise
 
+if TYPE_CHECKING:
+    from components.interpreter.src.realm import RealmSnapshot
+    from components.interpreter.src.profiler import ExecutionProfiler
+
+
+# Bounds of tagged SMIs. The SMI tag is 0, so adding or subtracting the raw
+# values of two SMIs gives the raw value of the result
+_SMI_RAW_MIN = SMI_MIN_VALUE << 2
+_SMI_RAW_MAX = SMI_MAX_VALUE << 2
+
 
 class _AsyncSuspension(Exception):
     """Internal exception to signal async function suspension at await.
@@ -29,6 +52,29 @@ class _AsyncSuspension(Exception):
     pass
 
 
+class _BytecodeClosure:
+    """Python callable behind a JSFunction created by CREATE_CLOSURE.
+
+    Calling it runs the function bytecode through Interpreter.execute().
+    CALL_FUNCTION in the interpreter that created it skips the call and
+    runs the bytecode in a new CallFrame of the running dispatch loop.
+    """
+
+    __slots__ = ("interpreter", "bytecode")
+
+    def __init__(self, interpreter: "Interpreter", bytecode: BytecodeArray):
+        self.interpreter = interpreter
+        self.bytecode = bytecode
+
+    def __call__(self, *args: Value) -> Value:
+        result = self.interpreter.execute(
+            self.bytecode,
+            this_value=Value.from_smi(0),  # Phase 1: undefined this
+            arguments=list(args),
+        )
+        return result.value if result.is_success() else Value.from_smi(0)
+
+
 @dataclass
 class AsyncFunctionState:
     """State for suspended async function.
@@ -48,6 +94,136 @@ class AsyncFunctionState:
     promise: JSPromise
 
 
+def _truthy(value: Value) -> bool:
+    """ToBoolean with a fast path for Smis (tagged 0 is the only falsy one)."""
+    if not value._raw & 3:
+        return value._raw != 0
+    return ToBoolean(value)
+
+
+def _flat_arguments(arguments: List[Value]) -> List[Value]:
+    """Flatten rope (ConsString) arguments before they reach native code."""
+    flat = arguments
+    for index, argument in enumerate(arguments):
+        if argument.__class__ is Value and argument.is_object() and (
+            type(argument.to_object()) is ConsString
+        ):
+            if flat is arguments:
+                flat = list(arguments)
+            flat[index] = Value.from_object(argument.to_object().flatten())
+    return flat
+
+
+def _to_promise_list(promises) -> list:
+    """Unwrap a Value/JSArray of promises into a Python list."""
+    # Unwrap Value to get JSArray
+    if hasattr(promises, "to_object"):
+        array = promises.to_object()
+    else:
+        array = promises
+
+    if not isinstance(array, JSArray):
+        # If it's already a list, use it directly
+        return array
+
+    # Convert JSArray elements to Python list of promises
+    promise_list = []
+    for i in range(array._length):
+        elem = array.get_element(i)
+        # Unwrap Value to get actual promise
+        if hasattr(elem, "to_object"):
+            promise_list.append(elem.to_object())
+        else:
+            promise_list.append(elem)
+    return promise_list
+
+
+def _promise_construct(event_loop: EventLoop, executor):
+    """new Promise(executor)"""
+    # Unwrap executor from Value if needed
+    if hasattr(executor, "to_object"):
+        executor_obj = executor.to_object()
+    else:
+        executor_obj = executor
+
+    # Create wrapper that adapts JSFunction.call() to Python callable
+    from components.object_runtime.src import JSFunction
+
+    if isinstance(executor_obj, JSFunction):
+        # Create Python callable that calls JSFunction properly
+        def executor_fn(resolve, reject):
+            # Wrap resolve/reject as Values for JSFunction.call
+            resolve_value = Value.from_object(resolve)
+            reject_value = Value.from_object(reject)
+            # Call JSFunction with proper Value arguments
+            executor_obj.call([resolve_value, reject_value], this_context=None)
+            return None  # Executor doesn't return anything meaningful
+
+    else:
+        executor_fn = executor_obj
+
+    return JSPromise(executor_fn, event_loop)
+
+
+def _promise_resolve(event_loop: EventLoop, value):
+    # Value can be passed as-is - JSPromise.resolve handles both Value and raw values
+    return JSPromise.resolve(value, event_loop)
+
+
+def _promise_reject(event_loop: EventLoop, reason):
+    # Reason can be passed as-is - JSPromise.reject handles both Value and raw values
+    return JSPromise.reject(reason, event_loop)
+
+
+def _promise_all(event_loop: EventLoop, promises):
+    return JSPromise.all(_to_promise_list(promises), event_loop)
+
+
+def _promise_race(event_loop: EventLoop, promises):
+    return JSPromise.race(_to_promise_list(promises), event_loop)
+
+
+def _promise_any(event_loop: EventLoop, promises):
+    return JSPromise.any(_to_promise_list(promises), event_loop)
+
+
+def _promise_all_settled(event_loop: EventLoop, promises):
+    return JSPromise.allSettled(_to_promise_list(promises), event_loop)
+
+
+# Promise static methods; each takes the realm's event loop as first argument
+PROMISE_STATIC_METHODS = {
+    "resolve": _promise_resolve,
+    "reject": _promise_reject,
+    "all": _promise_all,
+    "race": _promise_race,
+    "any": _promise_any,
+    "allSettled": _promise_all_settled,
+}
+
+
+def create_promise_constructor(gc: GarbageCollector, event_loop: EventLoop) -> JSObject:
+    """Create Promise constructor with static methods bound to an event loop.
+
+    Args:
+        gc: Garbage collector managing the constructor object
+        event_loop: Event loop that created promises queue reactions on
+
+    Returns:
+        JSObject that acts as Promise constructor with static methods
+    """
+    promise_obj = JSObject(gc)
+
+    # Store the callable in the object (for NEW opcode)
+    promise_obj._callable = partial(_promise_construct, event_loop)
+
+    # Store static methods as properties
+    for name, method in PROMISE_STATIC_METHODS.items():
+        promise_obj.set_property(name, Value.from_object(partial(method, event_loop)))
+
+    return promise_obj
+
+
 class Interpreter:
     """
     Bytecode interpreter and execution engine.
@@ -60,15 +236,41 @@ class Interpreter:
         context: Current execution context
     """
 
-    def __init__(self, gc: GarbageCollector, event_loop: Optional[EventLoop] = None):
+    def __init__(
+        self,
+        gc: GarbageCollector,
+        event_loop: Optional[EventLoop] = None,
+        realm: Optional["RealmSnapshot"] = None,
+        profiler: Optional["ExecutionProfiler"] = None,
+        collect_feedback: bool = True,
+        optimize: Optional[bool] = None,
+    ):
         """
         Create a new interpreter.
 
         Args:
             gc: Garbage collector for memory management
             event_loop: Event loop for asynchronous operations (optional)
+            realm: Realm snapshot to clone globals and intrinsics from
+                (optional; builds the Promise constructor from scratch if None)
+            profiler: Execution profiler to feed (optional; see
+                ExecutionProfiler)
+            collect_feedback: Record type feedback into each executed
+                BytecodeArray's FeedbackVector (default: True)
+            optimize: Tier hot functions up to the optimizing JIT
+                (requires collect_feedback, see TieringManager). Defaults
+                to on unless a profiler is attached: optimized code does
+                not report its calls and opcodes to the profiler, so pass
+                True only to profile deoptimizations.
         """
         self.gc = gc
+        self.profiler = profiler
+        self.collect_feedback = collect_feedback
+        if optimize is None:
+            optimize = profiler is None
+        self.tiering = (
+            TieringManager(self) if optimize and collect_feedback else None
+        )
         self.event_loop = event_loop if event_loop is not None else EventLoop()
         self.context = ExecutionContext(gc)
 
@@ -76,9 +278,21 @@ class Interpreter:
         self.suspended_async_functions: Dict[str, AsyncFunctionState] = {}
         self.current_async_promise: Optional[JSPromise] = None
 
-        # Add Promise constructor to global scope (wrapped in Value)
-        promise_constructor = self._create_promise_constructor()
-        self.context.global_scope["Promise"] = Value.from_object(promise_constructor)
+        if realm is not None:
+            # Clone prebuilt globals and prototypes from the snapshot
+            global_scope, intrinsics = realm.instantiate(gc, self.event_loop)
+            self.context.global_scope.update(global_scope)
+            self.context.intrinsics.update(intrinsics)
+        else:
+            # Add Promise constructor to global scope (wrapped in Value)
+            promise_constructor = self._create_promise_constructor()
+            self.context.global_scope["Promise"] = Value.from_object(
+                promise_constructor
+            )
+
+        # Property cells of the globals; write globals through set_global()
+        # (not context.global_scope) so sites caching a cell see the change
+        self.global_ic = GlobalIC(self.context.global_scope)
 
     def execute(
         self,
@@ -103,21 +317,17 @@ class Interpreter:
             arguments = []
 
         try:
-            # Create call frame
-            frame = CallFrame(bytecode, bytecode.local_count, this_value)
-
-            # Initialize local variables with arguments
-            for i, arg in enumerate(arguments):
-                if i < len(frame.locals):
-                    frame.locals[i] = arg
-
-            # Push frame onto call stack
-            self.context.push_frame(frame)
+            frame = self._push_call_frame(bytecode, this_value, arguments)
 
             # Execute bytecode
-            result_value = self._execute_frame(frame)
+            if self.tiering is not None:
+                result_value = self.tiering.execute_frame(frame)
+            else:
+                result_value = self._execute_frame(frame)
 
             # Pop frame from call stack
+            if self.profiler is not None:
+                self.profiler.exit_function()
             self.context.pop_frame()
 
             return EvaluationResult(value=result_value)
@@ -125,10 +335,14 @@ class Interpreter:
         except _AsyncSuspension:
             # Async suspension - propagate up to caller (don't wrap in EvaluationResult)
             # Note: Frame already popped by AWAIT opcode, don't pop again
+            if self.profiler is not None:
+                self.profiler.exit_function()
             raise  # Re-raise to let _start_async_function catch it
 
         except Exception as e:
             # Clean up call stack on exception
+            if self.profiler is not None:
+                self.profiler.exit_function()
             if len(self.context.call_stack) > 0:
                 self.context.pop_frame()
             return EvaluationResult(exception=e)
@@ -139,168 +353,113 @@ class Interpreter:
         Returns:
             JSObject that acts as Promise constructor with static methods
         """
-        interpreter = self
-
-        # Create callable for Promise constructor
-        def promise_constructor(executor):
-            """new Promise(executor)"""
-            # Unwrap executor from Value if needed
-            if hasattr(executor, 'to_object'):
-                executor_obj = executor.to_object()
-            else:
-                executor_obj = executor
-
-            # Create wrapper that adapts JSFunction.call() to Python callable
-            from components.object_runtime.src import JSFunction
-            if isinstance(executor_obj, JSFunction):
-                # Create Python callable that calls JSFunction properly
-                def executor_fn(resolve, reject):
-                    # Wrap resolve/reject as Values for JSFunction.call
-                    from components.value_system.src import Value
-                    resolve_value = Value.from_object(resolve)
-                    reject_value = Value.from_object(reject)
-                    # Call JSFunction with proper Value arguments
-                    executor_obj.call([resolve_value, reject_value], this_context=None)
-                    return None  # Executor doesn't return anything meaningful
-            else:
-                executor_fn = executor_obj
-
-            return JSPromise(executor_fn, interpreter.event_loop)
-
-        # Create JSObject for Promise constructor
-        from components.object_runtime.src import JSObject
-
-        promise_obj = JSObject(self.gc)
-
-        # Store the callable in the object (for NEW opcode)
-        promise_obj._callable = promise_constructor
-
-        # Add static methods as properties
-        def resolve_method(value):
-            # Value can be passed as-is - JSPromise.resolve handles both Value and raw values
-            return JSPromise.resolve(value, interpreter.event_loop)
-
-        def reject_method(reason):
-            # Reason can be passed as-is - JSPromise.reject handles both Value and raw values
-            return JSPromise.reject(reason, interpreter.event_loop)
-
-        def all_method(promises):
-            # Unwrap Value to get JSArray
-            if hasattr(promises, 'to_object'):
-                array = promises.to_object()
-            else:
-                array = promises
-
-            # Convert JSArray elements to Python list of promises
-            from components.object_runtime.src import JSArray
-            if isinstance(array, JSArray):
-                promise_list = []
-                for i in range(array._length):
-                    elem = array.get_element(i)
-                    # Unwrap Value to get actual promise
-                    if hasattr(elem, 'to_object'):
-                        promise_list.append(elem.to_object())
-                    else:
-                        promise_list.append(elem)
-                return JSPromise.all(promise_list, interpreter.event_loop)
-            else:
-                # If it's already a list, use it directly
-                return JSPromise.all(array, interpreter.event_loop)
-
-        def race_method(promises):
-            # Unwrap Value to get JSArray
-            if hasattr(promises, 'to_object'):
-                array = promises.to_object()
-            else:
-                array = promises
-
-            # Convert JSArray elements to Python list of promises
-            from components.object_runtime.src import JSArray
-            if isinstance(array, JSArray):
-                promise_list = []
-                for i in range(array._length):
-                    elem = array.get_element(i)
-                    # Unwrap Value to get actual promise
-                    if hasattr(elem, 'to_object'):
-                        promise_list.append(elem.to_object())
-                    else:
-                        promise_list.append(elem)
-                return JSPromise.race(promise_list, interpreter.event_loop)
-            else:
-                # If it's already a list, use it directly
-                return JSPromise.race(array, interpreter.event_loop)
-
-        def any_method(promises):
-            # Unwrap Value to get JSArray
-            if hasattr(promises, 'to_object'):
-                array = promises.to_object()
-            else:
-                array = promises
-
-            # Convert JSArray elements to Python list of promises
-            from components.object_runtime.src import JSArray
-            if isinstance(array, JSArray):
-                promise_list = []
-                for i in range(array._length):
-                    elem = array.get_element(i)
-                    # Unwrap Value to get actual promise
-                    if hasattr(elem, 'to_object'):
-                        promise_list.append(elem.to_object())
-                    else:
-                        promise_list.append(elem)
-                return JSPromise.any(promise_list, interpreter.event_loop)
-            else:
-                # If it's already a list, use it directly
-                return JSPromise.any(array, interpreter.event_loop)
-
-        def allSettled_method(promises):
-            # Unwrap Value to get JSArray
-            if hasattr(promises, 'to_object'):
-                array = promises.to_object()
-            else:
-                array = promises
-
-            # Convert JSArray elements to Python list of promises
-            from components.object_runtime.src import JSArray
-            if isinstance(array, JSArray):
-                promise_list = []
-                for i in range(array._length):
-                    elem = array.get_element(i)
-                    # Unwrap Value to get actual promise
-                    if hasattr(elem, 'to_object'):
-                        promise_list.append(elem.to_object())
-                    else:
-                        promise_list.append(elem)
-                return JSPromise.allSettled(promise_list, interpreter.event_loop)
-            else:
-                # If it's already a list, use it directly
-                return JSPromise.allSettled(array, interpreter.event_loop)
-
-        # Store static methods as properties
-        promise_obj.set_property("resolve", Value.from_object(resolve_method))
-        promise_obj.set_property("reject", Value.from_object(reject_method))
-        promise_obj.set_property("all", Value.from_object(all_method))
-        promise_obj.set_property("race", Value.from_object(race_method))
-        promise_obj.set_property("any", Value.from_object(any_method))
-        promise_obj.set_property("allSettled", Value.from_object(allSettled_method))
-
-        return promise_obj
+        return create_promise_constructor(self.gc, self.event_loop)
+
+    def _push_call_frame(
+        self, bytecode: BytecodeArray, this_value: Value, arguments: List[Value]
+    ) -> CallFrame:
+        """Create a call frame for bytecode and push it onto the call stack"""
+        frame = CallFrame(bytecode, bytecode.local_count, this_value)
+
+        # Initialize local variables with arguments
+        for i, arg in enumerate(arguments[: len(frame.locals)]):
+            frame.locals[i] = arg
+
+        if self.collect_feedback:
+            bytecode.get_feedback_vector().record_invocation(arguments)
+
+        self.context.push_frame(frame)
+        if self.profiler is not None:
+            self.profiler.enter_function(frame)
+        return frame
+
+    def _return_to_caller(self, value: Value) -> CallFrame:
+        """Pop a frame entered by CALL_FUNCTION and push value onto its caller"""
+        if self.profiler is not None:
+            self.profiler.exit_function()
+        self.context.pop_frame()
+        caller = self.context.current_frame()
+        caller.push(value)
+        return caller
+
+    def _call_optimized(self, frame: CallFrame) -> Value:
+        """Run a pushed callee frame through tiering and pop it again"""
+        try:
+            value = self.tiering.execute_frame(frame)
+        except _AsyncSuspension:
+            raise
+        except Exception:
+            # Like a call through JSFunction.call(): exceptions become undefined
+            value = Value.from_smi(0)
+        if self.profiler is not None:
+            self.profiler.exit_function()
+        self.context.pop_frame()
+        return value
 
     def _execute_frame(self, frame: CallFrame) -> Value:
         """
         Execute bytecode in a call frame using dispatch loop.
 
+        Calls to functions compiled by this interpreter do not recurse:
+        CALL_FUNCTION pushes the callee's frame onto the call stack and the
+        loop continues in it until RETURN pops back to the caller.
+
         Args:
             frame: Call frame to execute
 
         Returns:
             Return value from execution
         """
+        base = frame
+        depth = len(self.context.call_stack)
+        while True:
+            try:
+                return self._run_frames(frame, base)
+            except _AsyncSuspension:
+                raise
+            except Exception:
+                if len(self.context.call_stack) <= depth:
+                    raise
+                # A callee frame failed: its caller sees undefined, like a
+                # call through JSFunction.call()
+                frame = self._return_to_caller(Value.from_smi(0))
+
+    def _run_frames(self, frame: CallFrame, base: CallFrame) -> Value:
+        """Run the dispatch loop from frame until base returns"""
         bytecode = frame.bytecode
-
-        while frame.pc < len(bytecode.instructions):
-            instruction = bytecode.instructions[frame.pc]
-            frame.pc += 1
+        opcode_counts = (
+            self.profiler.opcode_counts
+            if self.profiler is not None and self.profiler.count_opcodes
+            else None
+        )
+        # Feedback slot per bytecode offset (see FeedbackVector)
+        feedback = (
+            bytecode.get_feedback_vector().slots if self.collect_feedback else None
+        )
+        tiering = self.tiering
+        global_ic = self.global_ic
+        global_scope = self.context.global_scope
+
+        while True:
+            pc = frame.pc
+            if pc >= len(bytecode.instructions):
+                # Fell off the end: return top of stack if present
+                # This allows expression statements at top level to return their value
+                value = frame.pop() if frame.stack else Value.from_smi(0)
+                if frame is base:
+                    return value
+                frame = self._return_to_caller(value)
+                bytecode = frame.bytecode
+                feedback = (
+                    bytecode.get_feedback_vector().slots
+                    if self.collect_feedback
+                    else None
+                )
+                continue
+            instruction = bytecode.instructions[pc]
+            frame.pc = pc + 1
+            if opcode_counts is not None:
+                opcode_counts[instruction.opcode] += 1
 
             # Dispatch opcode
             match instruction.opcode:
@@ -308,8 +467,8 @@ class Interpreter:
                 case Opcode.LOAD_CONSTANT:
                     const_value = bytecode.constant_pool[instruction.operand1]
                     # Convert Python value to Value
-                    if isinstance(const_value, int):
-                        frame.push(Value.from_smi(const_value))
+                    if isinstance(const_value, (int, float)):
+                        frame.push(Value.from_number(const_value))
                     elif isinstance(const_value, str):
                         # Template literals: store strings as objects
                         frame.push(Value.from_object(const_value))
@@ -331,14 +490,34 @@ class Interpreter:
 
                 # Variables
                 case Opcode.LOAD_GLOBAL:
-                    name = bytecode.constant_pool[instruction.operand1]
-                    value = self.get_global(name)
-                    frame.push(value)
+                    if feedback is None:
+                        name = bytecode.constant_pool[instruction.operand1]
+                        frame.push(self.get_global(name))
+                        continue
+                    # The site caches the global's property cell until the
+                    # binding is deleted or reconfigured (see GlobalIC)
+                    slot = feedback[pc]
+                    cell = slot.cell
+                    if cell is None or cell.owner is not global_ic:
+                        name = bytecode.constant_pool[instruction.operand1]
+                        cell = slot.cell = self._global_cell(name)
+                    frame.push(cell.value)
 
                 case Opcode.STORE_GLOBAL:
-                    name = bytecode.constant_pool[instruction.operand1]
                     value = frame.pop()
-                    self.set_global(name, value)
+                    if feedback is None:
+                        name = bytecode.constant_pool[instruction.operand1]
+                        self.set_global(name, value)
+                        continue
+                    slot = feedback[pc]
+                    cell = slot.cell
+                    if cell is None or cell.owner is not global_ic:
+                        name = bytecode.constant_pool[instruction.operand1]
+                        self.set_global(name, value)
+                        slot.cell = global_ic.lookup_cell(name)
+                        continue
+                    cell.value = value
+                    global_scope[cell.name] = value
 
                 case Opcode.LOAD_LOCAL:
                     value = frame.locals[instruction.operand1]
@@ -366,137 +545,262 @@ class Interpreter:
                 case Opcode.ADD:
                     right = frame.pop()
                     left = frame.pop()
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+
+                    if not (left._raw | right._raw) & 3:
+                        # Smi + Smi, promoted to a heap number on overflow
+                        raw = left._raw + right._raw
+                        if _SMI_RAW_MIN <= raw <= _SMI_RAW_MAX:
+                            frame.push(Value(raw))
+                        else:
+                            frame.push(Value.from_double(raw >> 2))
+                        continue
 
-                    # Handle string concatenation for template literals
-                    left_is_string = left.is_object() and isinstance(
-                        left.to_object(), str
-                    )
-                    right_is_string = right.is_object() and isinstance(
-                        right.to_object(), str
-                    )
+                    # Handle string concatenation for template literals.
+                    # Strings may be ropes (ConsString): Concat links the
+                    # operands instead of copying them
+                    left_obj = left.to_object() if left.is_object() else None
+                    right_obj = right.to_object() if right.is_object() else None
+                    left_is_string = isinstance(left_obj, (str, ConsString))
+                    right_is_string = isinstance(right_obj, (str, ConsString))
 
                     if left_is_string or right_is_string:
                         # String concatenation (JavaScript coercion)
                         left_str = (
-                            left.to_object() if left_is_string else str(left.to_smi())
+                            left_obj
+                            if left_is_string
+                            else NumberToString(left.to_number())
                         )
                         right_str = (
-                            right.to_object()
+                            right_obj
                             if right_is_string
-                            else str(right.to_smi())
+                            else NumberToString(right.to_number())
                         )
-                        result = Value.from_object(left_str + right_str)
-                        frame.push(result)
+                        frame.push(Value.from_object(Concat(left_str, right_str)))
                     else:
                         # Numeric addition
-                        result = Value.from_smi(left.to_smi() + right.to_smi())
+                        result = Value.from_number(
+                            left.to_number() + right.to_number()
+                        )
                         frame.push(result)
 
                 case Opcode.SUBTRACT:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(left.to_smi() - right.to_smi())
-                    frame.push(result)
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3:
+                        raw = left._raw - right._raw
+                        if _SMI_RAW_MIN <= raw <= _SMI_RAW_MAX:
+                            frame.push(Value(raw))
+                        else:
+                            frame.push(Value.from_double(raw >> 2))
+                    else:
+                        result = Value.from_number(left.to_number() - right.to_number())
+                        frame.push(result)
 
                 case Opcode.MULTIPLY:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(left.to_smi() * right.to_smi())
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3:
+                        raw = (left._raw >> 2) * right._raw
+                        # A zero product may be -0
+                        if raw and _SMI_RAW_MIN <= raw <= _SMI_RAW_MAX:
+                            frame.push(Value(raw))
+                            continue
+                    result = Value.from_number(
+                        NumberMultiply(left.to_number(), right.to_number())
+                    )
                     frame.push(result)
 
                 case Opcode.DIVIDE:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(int(left.to_smi() / right.to_smi()))
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3:
+                        dividend = left._raw >> 2
+                        divisor = right._raw >> 2
+                        if divisor > 0 and not dividend % divisor:
+                            # Exact: the quotient is a Smi
+                            frame.push(Value((dividend // divisor) << 2))
+                            continue
+                    result = Value.from_number(
+                        NumberDivide(left.to_number(), right.to_number())
+                    )
                     frame.push(result)
 
                 case Opcode.MODULO:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(left.to_smi() % right.to_smi())
-                    frame.push(result)
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3 and (
+                        left._raw >= 0 and right._raw > 0
+                    ):
+                        frame.push(Value(left._raw % right._raw))
+                    else:
+                        result = Value.from_number(
+                            NumberRemainder(left.to_number(), right.to_number())
+                        )
+                        frame.push(result)
 
                 case Opcode.NEGATE:
                     value = frame.pop()
-                    result = Value.from_smi(-value.to_smi())
-                    frame.push(result)
+                    if feedback is not None:
+                        feedback[pc].record(value, value)
+                    if not value._raw & 3 and value._raw and value._raw != _SMI_RAW_MIN:
+                        frame.push(Value(-value._raw))
+                    else:
+                        frame.push(Value.from_number(NumberUnaryMinus(value.to_number())))
 
                 # Comparison
                 case Opcode.EQUAL:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(1 if left.to_smi() == right.to_smi() else 0)
-                    frame.push(result)
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3:
+                        # Tagged Smis compare like their values
+                        holds = left._raw == right._raw
+                    else:
+                        holds = left.to_number() == right.to_number()
+                    frame.push(Value.from_smi(1 if holds else 0))
 
                 case Opcode.NOT_EQUAL:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(1 if left.to_smi() != right.to_smi() else 0)
-                    frame.push(result)
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3:
+                        # Tagged Smis compare like their values
+                        holds = left._raw != right._raw
+                    else:
+                        holds = left.to_number() != right.to_number()
+                    frame.push(Value.from_smi(1 if holds else 0))
 
                 case Opcode.LESS_THAN:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(1 if left.to_smi() < right.to_smi() else 0)
-                    frame.push(result)
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3:
+                        # Tagged Smis compare like their values
+                        holds = left._raw < right._raw
+                    else:
+                        holds = left.to_number() < right.to_number()
+                    frame.push(Value.from_smi(1 if holds else 0))
 
                 case Opcode.LESS_EQUAL:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(1 if left.to_smi() <= right.to_smi() else 0)
-                    frame.push(result)
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3:
+                        # Tagged Smis compare like their values
+                        holds = left._raw <= right._raw
+                    else:
+                        holds = left.to_number() <= right.to_number()
+                    frame.push(Value.from_smi(1 if holds else 0))
 
                 case Opcode.GREATER_THAN:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(1 if left.to_smi() > right.to_smi() else 0)
-                    frame.push(result)
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3:
+                        # Tagged Smis compare like their values
+                        holds = left._raw > right._raw
+                    else:
+                        holds = left.to_number() > right.to_number()
+                    frame.push(Value.from_smi(1 if holds else 0))
 
                 case Opcode.GREATER_EQUAL:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(1 if left.to_smi() >= right.to_smi() else 0)
-                    frame.push(result)
+                    if feedback is not None:
+                        feedback[pc].record(left, right)
+                    if not (left._raw | right._raw) & 3:
+                        # Tagged Smis compare like their values
+                        holds = left._raw >= right._raw
+                    else:
+                        holds = left.to_number() >= right.to_number()
+                    frame.push(Value.from_smi(1 if holds else 0))
 
                 # Logical
                 case Opcode.LOGICAL_AND:
                     right = frame.pop()
                     left = frame.pop()
                     result = Value.from_smi(
-                        1 if left.to_smi() and right.to_smi() else 0
+                        1 if _truthy(left) and _truthy(right) else 0
                     )
                     frame.push(result)
 
                 case Opcode.LOGICAL_OR:
                     right = frame.pop()
                     left = frame.pop()
-                    result = Value.from_smi(1 if left.to_smi() or right.to_smi() else 0)
+                    result = Value.from_smi(1 if _truthy(left) or _truthy(right) else 0)
                     frame.push(result)
 
                 case Opcode.LOGICAL_NOT:
                     value = frame.pop()
-                    result = Value.from_smi(1 if not value.to_smi() else 0)
+                    result = Value.from_smi(0 if _truthy(value) else 1)
                     frame.push(result)
 
                 # Control flow
                 case Opcode.JUMP:
-                    frame.pc = instruction.operand1
+                    target = instruction.operand1
+                    frame.pc = target
+                    if target <= pc and tiering is not None:
+                        # Loop back edge: may continue in OSR code
+                        result = tiering.on_back_edge(frame, target)
+                        if result is not None:
+                            # Loop ran to the end of the function in OSR code
+                            frame.stack = [result]
+                            frame.pc = len(bytecode.instructions)
 
                 case Opcode.JUMP_IF_TRUE:
                     value = frame.pop()
-                    if value.to_smi():
-                        frame.pc = instruction.operand1
+                    taken = _truthy(value)
+                    if feedback is not None:
+                        feedback[pc].record(taken)
+                    if taken:
+                        target = instruction.operand1
+                        frame.pc = target
+                        if target <= pc and tiering is not None:
+                            # Threaded loop back edge (see BytecodeOptimizer)
+                            result = tiering.on_back_edge(frame, target)
+                            if result is not None:
+                                frame.stack = [result]
+                                frame.pc = len(bytecode.instructions)
 
                 case Opcode.JUMP_IF_FALSE:
                     value = frame.pop()
-                    if not value.to_smi():
-                        frame.pc = instruction.operand1
+                    taken = not _truthy(value)
+                    if feedback is not None:
+                        feedback[pc].record(taken)
+                    if taken:
+                        target = instruction.operand1
+                        frame.pc = target
+                        if target <= pc and tiering is not None:
+                            # Threaded loop back edge (see BytecodeOptimizer)
+                            result = tiering.on_back_edge(frame, target)
+                            if result is not None:
+                                frame.stack = [result]
+                                frame.pc = len(bytecode.instructions)
 
                 case Opcode.RETURN:
-                    if len(frame.stack) > 0:
-                        return frame.pop()
-                    else:
-                        return Value.from_smi(0)  # Return undefined
+                    if frame is base:
+                        if len(frame.stack) > 0:
+                            return frame.pop()
+                        else:
+                            return Value.from_smi(0)  # Return undefined
+                    # Return value (or undefined) is left for the end of
+                    # the function to hand to the caller
+                    frame.pc = len(bytecode.instructions)
 
                 # Stack manipulation
                 case Opcode.POP:
@@ -544,6 +848,8 @@ class Interpreter:
                     # Peek object from stack (don't pop - keep for next property)
                     obj_value = frame.peek()
                     obj = obj_value.to_object()
+                    if feedback is not None:
+                        feedback[pc].record(obj)
                     # Set property
                     obj.set_property(key, value)
 
@@ -556,6 +862,8 @@ class Interpreter:
                     # Pop object from stack
                     obj_value = frame.pop()
                     obj = obj_value.to_object()
+                    if feedback is not None:
+                        feedback[pc].record(obj)
                     # Get property value
                     prop_value = obj.get_property(key)
                     # Push property value to stack
@@ -567,6 +875,8 @@ class Interpreter:
                     # Pop array from stack
                     array_value = frame.pop()
                     array = array_value.to_object()
+                    if feedback is not None:
+                        feedback[pc].record(array)
                     # Get element at index
                     element = array.get_element(index_value.to_smi())
                     # Push element to stack
@@ -580,6 +890,8 @@ class Interpreter:
                     # Pop array from stack (compiler uses DUP to keep reference)
                     array_value = frame.pop()
                     array = array_value.to_object()
+                    if feedback is not None:
+                        feedback[pc].record(array)
                     # Store element at index
                     array.set_element(index_value.to_smi(), value)
 
@@ -599,25 +911,13 @@ class Interpreter:
                     # Capture current frame locals for closure support
                     closure_locals = frame.locals.copy()
 
-                    def bytecode_callable(*args, captured_bytecode=function_bytecode):
-                        """Execute bytecode with arguments."""
-                        # Convert args to list of Values
-                        arg_values = list(args)
-                        # Execute the function bytecode
-                        result = self.execute(
-                            captured_bytecode,  # Use captured value, not reference
-                            this_value=Value.from_smi(0),  # Phase 1: undefined this
-                            arguments=arg_values,
-                        )
-                        return (
-                            result.value if result.is_success() else Value.from_smi(0)
-                        )
-
                     # Import JSFunction here to avoid circular dependency
                     from components.object_runtime.src import JSFunction
 
                     function = JSFunction(
-                        self.gc, bytecode_callable, name="<anonymous>"
+                        self.gc,
+                        _BytecodeClosure(self, function_bytecode),
+                        name="<anonymous>",
                     )
 
                     # Store bytecode and closure for later access
@@ -643,26 +943,33 @@ class Interpreter:
                     # Pop function from stack
                     function_value = frame.pop()
                     function_obj = function_value.to_object()
+                    if feedback is not None:
+                        feedback[pc].record(call_target(function_obj))
 
-                    # Check if it's a JSFunction
-                    from components.object_runtime.src import JSFunction
+                    closure = getattr(function_obj, "_callable", None)
+                    if closure.__class__ is not _BytecodeClosure or (
+                        closure.interpreter is not self
+                    ):
+                        frame.push(self.call_value(function_value, args))
+                        continue
 
-                    if isinstance(function_obj, JSFunction):
-                        # Call the function
-                        result = function_obj.call(args, this_context=None)
-                        # Push result to stack
-                        frame.push(result)
-                    elif callable(function_obj):
-                        # Plain Python callable (e.g., Promise static methods, async function wrappers)
-                        result = function_obj(*args)
-                        # Wrap result in Value if it's not already
-                        if isinstance(result, Value):
-                            frame.push(result)
-                        else:
-                            frame.push(Value.from_object(result))
-                    else:
-                        # Not a function - push undefined
-                        frame.push(Value.from_smi(0))
+                    callee = self._push_call_frame(
+                        closure.bytecode, Value.from_smi(0), args
+                    )
+                    if tiering is not None and (
+                        tiering.optimized_code(closure.bytecode) is not None
+                    ):
+                        frame.push(self._call_optimized(callee))
+                        continue
+
+                    # Continue the dispatch loop in the callee
+                    frame = callee
+                    bytecode = frame.bytecode
+                    feedback = (
+                        bytecode.get_feedback_vector().slots
+                        if self.collect_feedback
+                        else None
+                    )
 
                 case Opcode.NEW:
                     # Get argument count
@@ -684,6 +991,9 @@ class Interpreter:
                         constructor = constructor_value.to_object()
                     else:
                         constructor = constructor_value
+                    if feedback is not None:
+                        feedback[pc].record(call_target(constructor))
+                    arguments = _flat_arguments(arguments)
 
                     # Check if constructor is a JSObject with _callable attribute
                     if hasattr(constructor, "_callable") and callable(
@@ -785,12 +1095,6 @@ class Interpreter:
                         f"Opcode {instruction.opcode} not yet implemented"
                     )
 
-        # If we reach here without return, return top of stack if present
-        # This allows expression statements at top level to return their value
-        if len(frame.stack) > 0:
-            return frame.pop()
-        return Value.from_smi(0)
-
     def get_global(self, name: str) -> Value:
         """
         Get global variable value.
@@ -804,9 +1108,14 @@ class Interpreter:
         Raises:
             ReferenceError: If variable not defined
         """
-        if name not in self.context.global_scope:
+        return self._global_cell(name).value
+
+    def _global_cell(self, name: str) -> PropertyCell:
+        """Get the property cell of a global, raising ReferenceError if undefined"""
+        cell = self.global_ic.lookup_cell(name)
+        if cell is None:
             raise ReferenceError(f"Undefined variable: {name}")
-        return self.context.global_scope[name]
+        return cell
 
     def set_global(self, name: str, value: Value) -> None:
         """
@@ -816,7 +1125,51 @@ class Interpreter:
             name: Variable name
             value: Variable value
         """
-        self.context.global_scope[name] = value
+        self.global_ic.store_global(name, value)
+
+    def delete_global(self, name: str) -> bool:
+        """
+        Delete a global variable.
+
+        Sites that cached the binding's property cell look the name up
+        again on their next execution.
+
+        Args:
+            name: Variable name
+
+        Returns:
+            True if the variable existed
+        """
+        return self.global_ic.delete_global(name)
+
+    def call_value(self, function_value: Value, arguments: List[Value]) -> Value:
+        """
+        Call a function value the way CALL_FUNCTION does.
+
+        Args:
+            function_value: Callee (JSFunction or Python callable)
+            arguments: Argument values
+
+        Returns:
+            Return value (undefined if the callee is not callable)
+        """
+        from components.object_runtime.src import JSFunction
+
+        function_obj = function_value.to_object()
+        if isinstance(function_obj, JSFunction):
+            if getattr(function_obj, "_callable", None).__class__ is not _BytecodeClosure:
+                arguments = _flat_arguments(arguments)
+            return function_obj.call(arguments, this_context=None)
+        if callable(function_obj):
+            arguments = _flat_arguments(arguments)
+            # Plain Python callable (e.g., Promise static methods, async function wrappers)
+            result = function_obj(*arguments)
+            # Wrap result in Value if it's not already
+            if isinstance(result, Value):
+                return result
+            return Value.from_object(result)
+        # Not a function - undefined
+        return Value.from_smi(0)
 
     def call_function(
         self, function, this_value: Value, arguments: List[Value]  # JSFunction
@@ -0,0 +1,419 @@
+"""
+Execution profiler - opt-in instrumentation for the bytecode interpreter.
+
+Attach an ExecutionProfiler to an Interpreter to record where time goes:
+
+- Per-opcode execution counters
+- Per-function call counts, self time and total time
+- Stack samples taken on a timer signal (SIGPROF) from
+  ExecutionContext.call_stack, or from a sampler thread where signals are
+  unavailable
+
+Results are exported as collapsed stacks (the input format of flamegraph.pl,
+speedscope and inferno) and as Chrome trace-event JSON (chrome://tracing,
+Perfetto). When no profiler is attached the interpreter pays a single
+``is None`` check per instruction.
+"""
+
+import json
+import os
+import signal
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from components.bytecode.src import BytecodeArray
+from components.deoptimization.src.deopt_profiler import DeoptProfiler
+
+if TYPE_CHECKING:
+    from components.interpreter.src.call_frame import CallFrame
+    from components.interpreter.src.execution_context import ExecutionContext
+
+
+PROGRAM_FRAME_NAME = "(program)"
+ANONYMOUS_FRAME_NAME = "(anonymous)"
+
+
+def FrameName(bytecode: BytecodeArray, is_root: bool = False) -> str:
+    """
+    Get the display name of a function for profiles.
+
+    Args:
+        bytecode: Function bytecode
+        is_root: True for the outermost (script) frame
+
+    Returns:
+        Function name, "(program)" for the script or "(anonymous)"
+    """
+    name = getattr(bytecode, "name", "")
+    if name:
+        return name
+    return PROGRAM_FRAME_NAME if is_root else ANONYMOUS_FRAME_NAME
+
+
+@dataclass
+class FunctionStats:
+    """
+    Timing statistics for one function.
+
+    Attributes:
+        name: Function name
+        calls: Number of completed calls
+        self_time_ns: Time spent in the function excluding callees
+        total_time_ns: Time spent in the function including callees
+            (recursive activations are counted once)
+    """
+
+    name: str
+    calls: int = 0
+    self_time_ns: int = 0
+    total_time_ns: int = 0
+
+
+class _ActiveCall:
+    """Bookkeeping for a function activation currently on the stack."""
+
+    __slots__ = ("stats", "start_ns", "child_ns", "recursive")
+
+    def __init__(self, stats: FunctionStats, start_ns: int, recursive: bool):
+        self.stats = stats
+        self.start_ns = start_ns
+        self.child_ns = 0
+        self.recursive = recursive
+
+
+class ExecutionProfiler:
+    """
+    Opt-in execution profiler for the bytecode interpreter.
+
+    Each instrumentation feature can be enabled independently. Timing and
+    sampling are active between start() and stop(); opcode counting is
+    active whenever the profiler is attached to an interpreter.
+
+    Attaching a profiler turns the optimizing JIT off by default, because
+    optimized (and inlined) activations bypass the per-call and per-opcode
+    hooks. Interpreters created with optimize=True still tier up and
+    record deopts into deopt_profiler, but then only count the activations
+    that run in the interpreter.
+
+    Attributes:
+        opcode_counts: Opcode -> number of times it was executed
+        function_stats: Function name -> FunctionStats
+        samples: Stack (tuple of names, outermost first) -> sample count
+        deopt_profiler: DeoptProfiler that optimizing tiers record into
+
+    Example:
+        >>> profiler = ExecutionProfiler()
+        >>> interpreter = Interpreter(gc, profiler=profiler)
+        >>> profiler.start(interpreter.context)
+        >>> interpreter.execute(bytecode)
+        >>> profiler.stop()
+        >>> print(profiler.to_collapsed_stacks())
+        (program);fib 12
+    """
+
+    def __init__(
+        self,
+        count_opcodes: bool = True,
+        time_functions: bool = True,
+        sample_interval_ms: Optional[float] = 1.0,
+        trace_events: bool = True,
+        max_trace_events: int = 100_000,
+    ):
+        """
+        Create a profiler.
+
+        Args:
+            count_opcodes: Count executed opcodes
+            time_functions: Measure per-function self/total time
+            sample_interval_ms: Stack sampling period (None disables sampling)
+            trace_events: Record one trace event per function call
+                (requires time_functions)
+            max_trace_events: Stop recording trace events after this many
+        """
+        self.count_opcodes = count_opcodes
+        self.time_functions = time_functions
+        self.sample_interval_ms = sample_interval_ms
+        self.trace_events = trace_events and time_functions
+        self.max_trace_events = max_trace_events
+
+        self.opcode_counts: Counter = Counter()
+        self.function_stats: Dict[str, FunctionStats] = {}
+        self.samples: Counter = Counter()
+        self.deopt_profiler = DeoptProfiler()
+
+        self._events: List[Dict[str, Any]] = []
+        self._active: List[_ActiveCall] = []
+        self._active_counts: Counter = Counter()
+        self._context: Optional["ExecutionContext"] = None
+        self._running = False
+        self._origin_ns = 0
+        self._wall_ns = 0
+
+        self._previous_handler = None
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        """True between start() and stop()."""
+        return self._running
+
+    def start(self, context: "ExecutionContext") -> None:
+        """
+        Start timing and sampling.
+
+        Args:
+            context: Execution context whose call stack is sampled
+        """
+        if self._running:
+            return
+        self._context = context
+        self._running = True
+        self._origin_ns = time.perf_counter_ns()
+        if self.sample_interval_ms:
+            self._start_sampler()
+
+    def stop(self) -> None:
+        """Stop timing and sampling."""
+        if not self._running:
+            return
+        self._stop_sampler()
+        self._running = False
+        self._wall_ns += time.perf_counter_ns() - self._origin_ns
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    # ------------------------------------------------------------------
+    # Interpreter hooks
+    # ------------------------------------------------------------------
+
+    def enter_function(self, frame: "CallFrame") -> None:
+        """
+        Record entry into a function (called by Interpreter.execute).
+
+        Args:
+            frame: Frame that is about to run
+        """
+        if not (self._running and self.time_functions):
+            return
+        name = FrameName(frame.bytecode, is_root=not self._active)
+        stats = self.function_stats.get(name)
+        if stats is None:
+            stats = self.function_stats[name] = FunctionStats(name)
+        recursive = self._active_counts[name] > 0
+        self._active_counts[name] += 1
+        self._active.append(_ActiveCall(stats, time.perf_counter_ns(), recursive))
+
+    def exit_function(self) -> None:
+        """Record exit from the innermost function entered."""
+        if not self._active:
+            return
+        now = time.perf_counter_ns()
+        call = self._active.pop()
+        elapsed = now - call.start_ns
+        stats = call.stats
+        stats.calls += 1
+        stats.self_time_ns += elapsed - call.child_ns
+        if not call.recursive:
+            stats.total_time_ns += elapsed
+        self._active_counts[stats.name] -= 1
+        if self._active:
+            self._active[-1].child_ns += elapsed
+
+        if self.trace_events and len(self._events) < self.max_trace_events:
+            self._events.append(
+                {
+                    "name": stats.name,
+                    "cat": "js",
+                    "ph": "X",
+                    "ts": (call.start_ns - self._origin_ns) / 1000,
+                    "dur": elapsed / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def take_sample(self) -> None:
+        """Record the current JS call stack as one sample."""
+        context = self._context
+        if context is None:
+            return
+        # Copy first: the interpreter may push/pop while a thread samples
+        frames = list(context.call_stack)
+        if not frames:
+            return
+        stack = tuple(
+            FrameName(frame.bytecode, is_root=index == 0)
+            for index, frame in enumerate(frames)
+        )
+        self.samples[stack] += 1
+
+    def _start_sampler(self) -> None:
+        interval = self.sample_interval_ms / 1000
+        if (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        ):
+            self._previous_handler = signal.signal(
+                signal.SIGPROF, lambda signum, frame: self.take_sample()
+            )
+            signal.setitimer(signal.ITIMER_PROF, interval, interval)
+            return
+
+        self._sampler_stop.clear()
+
+        def run():
+            while not self._sampler_stop.wait(interval):
+                self.take_sample()
+
+        self._sampler_thread = threading.Thread(
+            target=run, name="js-profiler-sampler", daemon=True
+        )
+        self._sampler_thread.start()
+
+    def _stop_sampler(self) -> None:
+        if self._sampler_thread is not None:
+            self._sampler_stop.set()
+            self._sampler_thread.join()
+            self._sampler_thread = None
+        elif self._previous_handler is not None:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+            self._previous_handler = None
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def hot_functions(self, limit: int = 10) -> List[FunctionStats]:
+        """
+        Get the functions with the most self time.
+
+        Args:
+            limit: Maximum number of functions to return
+
+        Returns:
+            FunctionStats sorted by self time, descending
+        """
+        ranked = sorted(
+            self.function_stats.values(), key=lambda s: s.self_time_ns, reverse=True
+        )
+        return ranked[:limit]
+
+    def to_collapsed_stacks(self) -> str:
+        """
+        Export samples as collapsed stacks.
+
+        Returns:
+            One "outer;inner count" line per distinct stack
+        """
+        lines = [
+            f"{';'.join(stack)} {count}"
+            for stack, count in sorted(self.samples.items())
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Export recorded calls in Chrome trace-event format.
+
+        Returns:
+            Dictionary with "traceEvents" (complete "X" events in
+            microseconds) and "displayTimeUnit"
+        """
+        metadata = {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {"name": "JavaScript"},
+        }
+        events = sorted(self._events, key=lambda e: e["ts"])
+        return {"traceEvents": [metadata] + events, "displayTimeUnit": "ms"}
+
+    def write_collapsed_stacks(self, path: str) -> None:
+        """Write to_collapsed_stacks() to path."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_collapsed_stacks())
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write to_chrome_trace() to path as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def format_report(self, limit: int = 10) -> str:
+        """
+        Format a human-readable summary.
+
+        Args:
+            limit: Number of functions and opcodes to list
+
+        Returns:
+            Multi-line report text
+        """
+        lines = [f"Wall time: {self._wall_ns / 1e6:.3f} ms"]
+
+        lines.append("Functions (by self time):")
+        lines.append(f"  {'self ms':>10} {'total ms':>10} {'calls':>8}  name")
+        for stats in self.hot_functions(limit):
+            lines.append(
+                f"  {stats.self_time_ns / 1e6:10.3f} {stats.total_time_ns / 1e6:10.3f}"
+                f" {stats.calls:8d}  {stats.name}"
+            )
+
+        if self.opcode_counts:
+            lines.append("Opcodes:")
+            for opcode, count in self.opcode_counts.most_common(limit):
+                lines.append(f"  {count:10d}  {opcode.name}")
+
+        total_samples = sum(self.samples.values())
+        if total_samples:
+            leaf_counts: Counter = Counter()
+            for stack, count in self.samples.items():
+                leaf_counts[stack[-1]] += count
+            lines.append(f"Samples ({total_samples} total, by leaf function):")
+            for name, count in leaf_counts.most_common(limit):
+                lines.append(f"  {100 * count / total_samples:6.1f}%  {name}")
+
+        deopt_stats = self.deopt_profiler.get_stats()
+        if deopt_stats.total_deopts:
+            lines.append(f"Deoptimizations: {deopt_stats.total_deopts}")
+
+        return "\n".join(lines)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all collected data as plain Python values.
+
+        Returns:
+            Dictionary with opcodeCounts, functions, samples and wallTimeMs
+        """
+        return {
+            "opcodeCounts": {op.name: n for op, n in self.opcode_counts.items()},
+            "functions": {
+                name: {
+                    "calls": s.calls,
+                    "selfTimeMs": s.self_time_ns / 1e6,
+                    "totalTimeMs": s.total_time_ns / 1e6,
+                }
+                for name, s in self.function_stats.items()
+            },
+            "samples": {";".join(stack): n for stack, n in self.samples.items()},
+            "wallTimeMs": self._wall_ns / 1e6,
+        }
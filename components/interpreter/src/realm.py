@@ -0,0 +1,285 @@
+"""
+Realm snapshots - prebuilt globals and prototypes for fast context creation.
+
+Building the built-in prototypes and the Promise constructor is the most
+expensive part of creating an execution context (JSFunction construction
+inspects every callable's signature). A RealmSnapshot builds that object
+graph once. Each new context then gets a structural clone: objects are copied
+with their property dicts, internal references are remapped onto the copies,
+and no constructors or signature inspection run again.
+
+The snapshot's own objects are never handed out, so one context mutating a
+built-in (e.g. adding a method to Array.prototype) cannot affect the snapshot
+or any other context.
+"""
+
+import gc as pygc
+import time
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from components.memory_gc.src import GarbageCollector
+from components.value_system.src import Value
+from components.event_loop.src import EventLoop
+from components.object_runtime.src import (
+    JSObject,
+    CreateObjectPrototype,
+    CreateArrayPrototype,
+    CreateFunctionPrototype,
+)
+
+
+class _EventLoopBound:
+    """Placeholder for a callable that takes the context's event loop first.
+
+    Stored in the snapshot in place of event-loop-bound callables (the
+    Promise constructor and its static methods); replaced by
+    ``partial(func, event_loop)`` when a context is instantiated.
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func):
+        self.func = func
+
+
+class RealmSnapshot:
+    """
+    Frozen template of a realm's global bindings and intrinsic objects.
+
+    Build once, then call instantiate() (or pass the snapshot to
+    Interpreter/Execute) for every new context.
+
+    Attributes:
+        globals: Read-only mapping of global name -> Value in the template
+        intrinsics: Read-only mapping of intrinsic name -> template object
+
+    Example:
+        >>> realm = RealmSnapshot()
+        >>> interpreter = Interpreter(GarbageCollector(), realm=realm)
+        >>> "Promise" in interpreter.context.global_scope
+        True
+    """
+
+    def __init__(self):
+        """Build the template realm on a private garbage collector."""
+        # Imported here: interpreter.py imports this module
+        from .interpreter import PROMISE_STATIC_METHODS, _promise_construct
+
+        self._gc = GarbageCollector()
+
+        object_proto = CreateObjectPrototype(self._gc)
+        intrinsics = {
+            "ObjectPrototype": object_proto,
+            "ArrayPrototype": CreateArrayPrototype(self._gc, object_proto),
+            "FunctionPrototype": CreateFunctionPrototype(self._gc, object_proto),
+        }
+
+        promise_obj = JSObject(self._gc)
+        promise_obj._callable = _EventLoopBound(_promise_construct)
+        for name, method in PROMISE_STATIC_METHODS.items():
+            promise_obj.set_property(name, Value.from_object(_EventLoopBound(method)))
+
+        self.intrinsics: Mapping[str, Any] = MappingProxyType(intrinsics)
+        self.globals: Mapping[str, Value] = MappingProxyType(
+            {"Promise": Value.from_object(promise_obj)}
+        )
+
+        # Flatten the template graph once so instantiate() is a straight copy
+        self._plan = _ClonePlan()
+        self._global_refs = {
+            name: self._plan.add(value.to_object()) for name, value in self.globals.items()
+        }
+        self._intrinsic_refs = {
+            name: self._plan.add(obj) for name, obj in self.intrinsics.items()
+        }
+
+    def instantiate(self, gc: GarbageCollector, event_loop: EventLoop):
+        """
+        Clone the template into a fresh set of globals and intrinsics.
+
+        Args:
+            gc: Garbage collector that will own the cloned objects
+            event_loop: Event loop the cloned Promise constructor binds to
+
+        Returns:
+            Tuple of (global_scope dict, intrinsics dict) for a new context
+        """
+        copies = self._plan.instantiate(gc, event_loop)
+        global_scope = {
+            name: Value.from_object(copies[index])
+            for name, index in self._global_refs.items()
+        }
+        intrinsics = {name: copies[index] for name, index in self._intrinsic_refs.items()}
+        return global_scope, intrinsics
+
+
+class _ClonePlan:
+    """
+    Flattened description of a template object graph.
+
+    Every JSObject reachable from the template gets an index. For each one
+    the plan keeps its instance state, its shared (non-object) property
+    values, and the indices its object-valued properties, elements and
+    prototype refer to, so cloning needs no graph traversal.
+    """
+
+    def __init__(self):
+        self._index: Dict[int, int] = {}  # id(template object) -> node index
+        self._nodes = []
+
+    def add(self, obj: JSObject) -> int:
+        """Add obj and everything reachable from it; return obj's index."""
+        index = self._index.get(id(obj))
+        if index is not None:
+            return index
+
+        index = len(self._nodes)
+        self._index[id(obj)] = index
+        node = {
+            "cls": type(obj),
+            "state": dict(obj.__dict__),
+            "properties": {},  # key -> shared Value
+            "property_refs": [],  # (key, ref)
+            "elements": {},  # index -> shared Value
+            "element_refs": [],  # (element index, ref)
+            "prototype": None,
+            "callable": None,
+        }
+        self._nodes.append(node)
+
+        for key, value in obj._properties.items():
+            ref = self._ref_for(value)
+            if ref is None:
+                node["properties"][key] = value
+            else:
+                node["property_refs"].append((key, ref))
+        for element_index, value in obj.__dict__.get("_elements", {}).items():
+            ref = self._ref_for(value)
+            if ref is None:
+                node["elements"][element_index] = value
+            else:
+                node["element_refs"].append((element_index, ref))
+        if obj._prototype is not None:
+            node["prototype"] = self.add(obj._prototype)
+        callable_impl = obj.__dict__.get("_callable")
+        if isinstance(callable_impl, _EventLoopBound):
+            node["callable"] = callable_impl
+        return index
+
+    def _ref_for(self, value: Value):
+        """Return a node index or _EventLoopBound for values that need cloning."""
+        if not value.is_object():
+            return None
+        target = value.to_object()
+        if isinstance(target, _EventLoopBound):
+            return target
+        if isinstance(target, JSObject):
+            return self.add(target)
+        return None
+
+    def instantiate(self, gc: GarbageCollector, event_loop: EventLoop) -> list:
+        """Create one copy of every node, owned by gc, and wire them together."""
+        nodes = self._nodes
+        copies = [object.__new__(node["cls"]) for node in nodes]
+
+        def resolve(ref):
+            if isinstance(ref, _EventLoopBound):
+                return Value.from_object(partial(ref.func, event_loop))
+            return Value.from_object(copies[ref])
+
+        heap = gc.heap
+        for copy, node in zip(copies, nodes):
+            state = node["state"].copy()
+            state["_gc"] = gc
+            state["marked"] = False
+
+            properties = node["properties"].copy()
+            for key, ref in node["property_refs"]:
+                properties[key] = resolve(ref)
+            state["_properties"] = properties
+
+            if "_elements" in state:
+                elements = node["elements"].copy()
+                for element_index, ref in node["element_refs"]:
+                    elements[element_index] = resolve(ref)
+                state["_elements"] = elements
+
+            if node["prototype"] is not None:
+                state["_prototype"] = copies[node["prototype"]]
+            if node["callable"] is not None:
+                state["_callable"] = partial(node["callable"].func, event_loop)
+
+            copy.__dict__ = state
+            heap.add(copy)
+            gc.used_bytes += copy.size
+
+        return copies
+
+
+_default_snapshot: Optional[RealmSnapshot] = None
+
+
+def GetDefaultRealmSnapshot() -> RealmSnapshot:
+    """
+    Get the process-wide realm snapshot, building it on first use.
+
+    Returns:
+        Shared RealmSnapshot instance
+    """
+    global _default_snapshot
+    if _default_snapshot is None:
+        _default_snapshot = RealmSnapshot()
+    return _default_snapshot
+
+
+def MeasureContextCreation(count: int = 1000) -> Dict[str, float]:
+    """
+    Benchmark context creation with and without a realm snapshot.
+
+    A "cold" context builds its prototypes and Promise constructor from
+    scratch; a "warm" context is cloned from the default snapshot.
+
+    Args:
+        count: Number of contexts to create per variant
+
+    Returns:
+        Dictionary with coldContextsPerSecond, warmContextsPerSecond and speedup
+    """
+    from .interpreter import Interpreter
+
+    def cold():
+        gc = GarbageCollector()
+        interpreter = Interpreter(gc, EventLoop())
+        object_proto = CreateObjectPrototype(gc)
+        interpreter.context.intrinsics = {
+            "ObjectPrototype": object_proto,
+            "ArrayPrototype": CreateArrayPrototype(gc, object_proto),
+            "FunctionPrototype": CreateFunctionPrototype(gc, object_proto),
+        }
+
+    snapshot = GetDefaultRealmSnapshot()
+
+    def warm():
+        Interpreter(GarbageCollector(), EventLoop(), realm=snapshot)
+
+    rates = {}
+    for name, create in (("cold", cold), ("warm", warm)):
+        # Like timeit: keep Python's cycle collector out of the measurement
+        gc_was_enabled = pygc.isenabled()
+        pygc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(count):
+                create()
+            elapsed = time.perf_counter() - start
+        finally:
+            if gc_was_enabled:
+                pygc.enable()
+        rates[name] = count / elapsed if elapsed > 0 else float("inf")
+
+    return {
+        "coldContextsPerSecond": rates["cold"],
+        "warmContextsPerSecond": rates["warm"],
+        "speedup": rates["warm"] / rates["cold"] if rates["cold"] else 0.0,
+    }
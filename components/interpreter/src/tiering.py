@@ -0,0 +1,229 @@
+"""
+Tiering - tier-up from the interpreter to the optimizing JIT and back.
+
+Once a function's FeedbackVector shows it is hot
+(OptimizingJITCompiler.should_optimize), its BytecodeArray is compiled with
+OptimizingJITCompiler.compile_function() and the optimized code is cached
+on the feedback vector. Later calls run the optimized code on the
+interpreter CallFrame's locals.
+
+When a speculation guard fails the optimized code raises
+DeoptimizationExit. The DeoptimizationManager reconstructs the interpreter
+frame for that deopt point (recording the deopt in the profiler's
+deopt_profiler), the CallFrame is resumed at the guard's bytecode offset,
+and the optimized code is dropped so the function re-optimizes with the
+feedback the interpreter keeps collecting - or stays in the interpreter
+after MAX_DEOPTS bailouts.
+
+Functions that are entered rarely but loop for long (top-level scripts)
+tier up through on-stack replacement instead: the interpreter counts
+backward jumps per loop header, and after OSR_BACK_EDGE_THRESHOLD of them
+the loop is compiled with OptimizingJITCompiler.compile_osr() and the
+running CallFrame's locals and operand stack are handed to it through
+OSRManager.perform_osr().
+"""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from components.baseline_jit.src import OSRManager
+from components.bytecode.src.feedback_vector import TYPE_SMI, value_type
+from components.deoptimization.src import DeoptimizationManager, DeoptMode, JITFrame
+from components.optimizing_jit.src import (
+    DeoptimizationExit,
+    OptimizingJITCompiler,
+    ProfilingData,
+)
+
+if TYPE_CHECKING:
+    from components.interpreter.src.call_frame import CallFrame
+    from components.interpreter.src.interpreter import Interpreter
+
+
+# Deopts after which a function is no longer optimized
+MAX_DEOPTS = 5
+
+# Backward jumps to one loop header before the loop is compiled for OSR
+OSR_BACK_EDGE_THRESHOLD = 1000
+
+# Optimized code calls functions through Python calls; beyond this many
+# nested optimized activations calls stay in the interpreter's dispatch
+# loop, which does not grow the Python stack
+MAX_NESTED_OPTIMIZED_CALLS = 32
+
+
+class TieringManager:
+    """
+    Runs hot functions in optimized code, falling back to the interpreter.
+
+    Attributes:
+        compiler: Optimizing compiler used for tier-up
+        deopt_manager: Reconstructs interpreter frames on deopt
+        osr_manager: Transfers running frames into OSR code
+        nested_optimized_calls: Optimized activations currently running
+    """
+
+    def __init__(self, interpreter: "Interpreter"):
+        """
+        Create a tiering manager for an interpreter.
+
+        Args:
+            interpreter: Interpreter whose functions are tiered up; deopts
+                are recorded in its profiler's deopt_profiler if it has one
+        """
+        profiler = interpreter.profiler
+        self.interpreter = interpreter
+        self.compiler = OptimizingJITCompiler()
+        self.deopt_manager = DeoptimizationManager(
+            profiler=profiler.deopt_profiler if profiler is not None else None
+        )
+        self.osr_manager = OSRManager()
+        self.nested_optimized_calls = 0
+
+    def execute_frame(self, frame: "CallFrame") -> Any:
+        """
+        Execute a freshly pushed call frame in the best available tier.
+
+        Args:
+            frame: Call frame with its arguments filled in
+
+        Returns:
+            Return value of the function
+        """
+        feedback = frame.bytecode.feedback
+        code = self.optimized_code(frame.bytecode)
+        if code is None:
+            return self.interpreter._execute_frame(frame)
+
+        self.nested_optimized_calls += 1
+        try:
+            return code.function(self.interpreter, frame.locals)
+        except DeoptimizationExit as exit:
+            feedback.optimized_code = None
+            self._deoptimize(frame, feedback, code, exit)
+        finally:
+            self.nested_optimized_calls -= 1
+        return self.interpreter._execute_frame(frame)
+
+    def optimized_code(self, bytecode: Any) -> Optional[Any]:
+        """
+        Get the optimized code a call to bytecode should run, if any.
+
+        Compiles the function once its feedback shows it is hot.
+
+        Args:
+            bytecode: Function bytecode with a feedback vector
+
+        Returns:
+            Optimized code, or None to run the call in the interpreter
+            (also while MAX_NESTED_OPTIMIZED_CALLS optimized activations
+            are running)
+        """
+        if self.nested_optimized_calls >= MAX_NESTED_OPTIMIZED_CALLS:
+            return None
+        feedback = bytecode.feedback
+        code = feedback.optimized_code
+        if code is None:
+            code = self._maybe_optimize(bytecode, feedback)
+        return code
+
+    def on_back_edge(self, frame: "CallFrame", target: int) -> Optional[Any]:
+        """
+        Count a backward jump and enter OSR code once the loop is hot.
+
+        Args:
+            frame: Running call frame, with frame.pc already at target
+            target: Bytecode offset of the loop header
+
+        Returns:
+            The function's return value if OSR code ran it to completion,
+            None to keep interpreting frame (possibly resumed elsewhere
+            after a deopt)
+        """
+        feedback = frame.bytecode.feedback
+        if feedback.optimization_disabled:
+            return None
+        counts = feedback.back_edge_counts
+        count = counts.get(target, 0) + 1
+        counts[target] = count
+        if count < OSR_BACK_EDGE_THRESHOLD:
+            return None
+
+        code = feedback.osr_code.get(target)
+        if code is None:
+            code = self._compile_osr(frame, feedback, target)
+            if code is None:
+                return None
+        counts[target] = 0
+
+        entry = self.osr_manager.create_osr_entry(
+            target,
+            {"locals": frame.locals, "stack": frame.stack},
+            code=code.function,
+        )
+        try:
+            return self.osr_manager.perform_osr(entry, self.interpreter)
+        except DeoptimizationExit as exit:
+            del feedback.osr_code[target]
+            self._deoptimize(frame, feedback, code, exit)
+        return None
+
+    def _compile_osr(
+        self, frame: "CallFrame", feedback: Any, target: int
+    ) -> Optional[Any]:
+        bytecode = frame.bytecode
+        profile = ProfilingData.from_feedback(feedback)
+        # Speculate on the live frame slots rather than the arguments
+        profile.parameter_types = {
+            index: {"types": ["Smi"], "type": "Smi"}
+            for index, value in enumerate(frame.locals + frame.stack)
+            if value is not None and value_type(value) == TYPE_SMI
+        }
+        code = self.compiler.compile_osr(bytecode, target, len(frame.stack), profile)
+        if code is None:
+            feedback.optimization_disabled = True
+            return None
+        feedback.osr_code[target] = code
+        return code
+
+    def _maybe_optimize(self, bytecode: Any, feedback: Any) -> Optional[Any]:
+        if feedback.optimization_disabled or not self.compiler.should_optimize(
+            id(bytecode), feedback.invocation_count, 0.0
+        ):
+            return None
+        code = self.compiler.compile_function(
+            bytecode, ProfilingData.from_feedback(feedback)
+        )
+        if code is None:
+            feedback.optimization_disabled = True
+            return None
+        feedback.optimized_code = code
+        return code
+
+    def _deoptimize(
+        self,
+        frame: "CallFrame",
+        feedback: Any,
+        code: Any,
+        exit: DeoptimizationExit,
+    ) -> None:
+        """Resume frame in the interpreter at the failed guard's deopt point"""
+        deopt_info = code.deopt_info[exit.deopt_id]
+        # A function can have whole-function and OSR code; register the
+        # one that bailed out
+        self.deopt_manager.register_optimized_function(id(frame.bytecode), code)
+        state = self.deopt_manager.deoptimize(
+            id(frame.bytecode),
+            exit.deopt_id,
+            deopt_info.reason,
+            DeoptMode.EAGER,
+            jit_frame=JITFrame(
+                return_address=exit.deopt_id, registers={}, stack=list(exit.values)
+            ),
+        )
+        frame.locals[: len(state.frame.locals)] = state.frame.locals
+        frame.stack = state.frame.stack
+        frame.pc = state.frame.bytecode_offset
+
+        feedback.deopt_count += 1
+        if feedback.deopt_count >= MAX_DEOPTS:
+            feedback.optimization_disabled = True
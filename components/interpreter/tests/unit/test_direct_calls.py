@@ -0,0 +1,96 @@
+"""
+Unit tests for calls between interpreted functions.
+
+CALL_FUNCTION runs functions created by the same interpreter in a new
+CallFrame of the running dispatch loop instead of a recursive Python call;
+these tests check recursion depth, the call stack, and error handling.
+"""
+
+import pytest
+
+from components.bytecode.src import Compile
+from components.interpreter.src import Interpreter
+from components.memory_gc.src import GarbageCollector
+from components.parser.src import Parse
+from components.value_system.src import Value
+
+
+def _run(interpreter, source):
+    result = interpreter.execute(Compile(Parse(source)))
+    assert result.is_success(), result.exception
+    return result.value
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+def test_deep_recursion_does_not_exhaust_python_stack(optimize):
+    """
+    Given a function recursing far deeper than Python's recursion limit
+    When it is called
+    Then it returns the right result and leaves the call stack empty
+    """
+    interpreter = Interpreter(GarbageCollector(), optimize=optimize)
+
+    value = _run(
+        interpreter,
+        "function depth(n) { if (n == 0) { return 0; } return 1 + depth(n - 1); }"
+        " depth(20000);",
+    )
+
+    assert value.to_smi() == 20000
+    assert interpreter.context.call_stack == []
+
+
+def test_callee_frames_are_pushed_on_the_call_stack():
+    """
+    Given nested calls that end in a native function
+    When the native function runs
+    Then every JS frame is on the interpreter's call stack
+    """
+    interpreter = Interpreter(GarbageCollector())
+    frames = []
+    interpreter.set_global(
+        "probe",
+        Value.from_object(
+            lambda: frames.extend(interpreter.context.call_stack) or Value.from_smi(0)
+        ),
+    )
+
+    _run(
+        interpreter,
+        "function inner() { return probe(); } function outer() { return inner(); } outer();",
+    )
+
+    assert [frame.bytecode.name for frame in frames[1:]] == ["outer", "inner"]
+    assert interpreter.context.call_stack == []
+
+
+def test_failing_callee_returns_undefined_to_its_caller():
+    """
+    Given a function whose callee raises
+    When it is called
+    Then the callee's frame is popped and the caller continues with undefined
+    """
+    interpreter = Interpreter(GarbageCollector())
+
+    value = _run(
+        interpreter,
+        "function bad() { return missing.x; }"
+        " function caller() { var r = bad(); return 7; } caller();",
+    )
+
+    assert value.to_smi() == 7
+    assert interpreter.context.call_stack == []
+
+
+def test_closure_called_from_python_runs_its_bytecode():
+    """
+    Given a function value created by the interpreter
+    When it is called through call_value()
+    Then it runs like a call from bytecode
+    """
+    interpreter = Interpreter(GarbageCollector())
+    _run(interpreter, "function twice(x) { return x + x; }")
+
+    result = interpreter.call_value(interpreter.get_global("twice"), [Value.from_smi(21)])
+
+    assert result.to_smi() == 42
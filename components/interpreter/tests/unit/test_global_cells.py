@@ -0,0 +1,113 @@
+"""
+Unit tests for global variable access through property cells.
+
+LOAD_GLOBAL and STORE_GLOBAL cache the property cell of their global in
+the instruction's feedback slot; these tests check the cached cells stay
+coherent with set_global(), delete_global() and other realms.
+"""
+
+import pytest
+
+from components.bytecode.src import Compile, Opcode
+from components.interpreter.src import Interpreter
+from components.memory_gc.src import GarbageCollector
+from components.parser.src import Parse
+from components.value_system.src import Value
+
+
+def _run(interpreter, bytecode):
+    result = interpreter.execute(bytecode)
+    assert result.is_success(), result.exception
+    return result.value
+
+
+def _global_slots(bytecode):
+    return [
+        bytecode.feedback.slots[offset]
+        for offset, instruction in enumerate(bytecode.instructions)
+        if instruction.opcode in (Opcode.LOAD_GLOBAL, Opcode.STORE_GLOBAL)
+    ]
+
+
+@pytest.mark.parametrize("collect_feedback", [True, False])
+def test_loop_reads_and_writes_globals(collect_feedback):
+    """
+    Given a loop that updates globals
+    When it runs with and without feedback slots
+    Then it computes the same result
+    """
+    interpreter = Interpreter(GarbageCollector(), collect_feedback=collect_feedback)
+    bytecode = Compile(
+        Parse("t = 0; i = 0; while (i < 100) { t = t + i; i = i + 1; } t;")
+    )
+
+    assert _run(interpreter, bytecode).to_smi() == 4950
+    assert interpreter.get_global("i").to_smi() == 100
+
+
+def test_sites_cache_the_cell_of_their_global():
+    """
+    Given a script that reads and writes a global
+    When it runs
+    Then every global site caches the global's property cell
+    """
+    interpreter = Interpreter(GarbageCollector(), optimize=False)
+    bytecode = Compile(Parse("n = 1; n = n + 1; n;"))
+
+    _run(interpreter, bytecode)
+
+    cell = interpreter.global_ic.lookup_cell("n")
+    assert all(slot.cell is cell for slot in _global_slots(bytecode))
+    assert cell.value.to_smi() == 2
+
+
+def test_cached_sites_see_set_global():
+    """
+    Given a site that cached a host-provided global
+    When the host rebinds it with set_global()
+    Then the next execution reads the new value
+    """
+    interpreter = Interpreter(GarbageCollector())
+    interpreter.set_global("limit", Value.from_smi(1))
+    bytecode = Compile(Parse("limit + 1;"))
+    assert _run(interpreter, bytecode).to_smi() == 2
+
+    interpreter.set_global("limit", Value.from_smi(10))
+
+    assert _run(interpreter, bytecode).to_smi() == 11
+
+
+def test_deleted_global_invalidates_cached_sites():
+    """
+    Given a site that cached a global's cell
+    When the global is deleted, and later defined again
+    Then the site throws ReferenceError, then reads the new binding
+    """
+    interpreter = Interpreter(GarbageCollector())
+    interpreter.set_global("g", Value.from_smi(1))
+    bytecode = Compile(Parse("g;"))
+    _run(interpreter, bytecode)
+
+    assert interpreter.delete_global("g") is True
+    result = interpreter.execute(bytecode)
+    assert not result.is_success()
+    assert "g" in str(result.exception)
+
+    interpreter.set_global("g", Value.from_smi(3))
+    assert _run(interpreter, bytecode).to_smi() == 3
+
+
+def test_bytecode_shared_between_interpreters_reads_own_globals():
+    """
+    Given one script run by two interpreters with different globals
+    When each runs it after the other cached a cell
+    Then each reads its own global
+    """
+    bytecode = Compile(Parse("x;"))
+    first = Interpreter(GarbageCollector())
+    second = Interpreter(GarbageCollector())
+    first.set_global("x", Value.from_smi(1))
+    second.set_global("x", Value.from_smi(2))
+
+    assert [_run(first, bytecode).to_smi(), _run(second, bytecode).to_smi()] == [1, 2]
+    assert _run(first, bytecode).to_smi() == 1
@@ -0,0 +1,136 @@
+"""
+Unit tests for number arithmetic in the interpreter.
+
+Tests the Smi fast paths of the arithmetic opcodes, promotion of
+overflowing Smi results to heap numbers, and arithmetic on doubles.
+"""
+
+import math
+
+import pytest
+
+from components.bytecode.src import BytecodeArray, Compile, Instruction, Opcode
+from components.interpreter.src import Interpreter
+from components.memory_gc.src import GarbageCollector
+from components.parser.src import Parse
+from components.value_system.src import ToString
+
+
+def _run(source, optimize=True):
+    result = Interpreter(GarbageCollector(), optimize=optimize).execute(
+        Compile(Parse(source))
+    )
+    assert result.is_success(), result.exception
+    return result.value
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("7 / 2;", 3.5),
+        ("var a = -9; var b = 3; a / b;", -3),
+        ("1.5 + 2.25;", 3.75),
+        ("var x = 0.5; x * 4;", 2),
+        ("var x = 2.5; x - 0.5 < 2.5;", 1),
+        ("var a = 1073741823; a + 1;", 2**30),
+        ("var a = 65536; a * a;", 2**32),
+        ("var a = -7; var b = 2; a - a / b;", -3.5),
+    ],
+)
+def test_arithmetic_results(source, expected):
+    """
+    Given arithmetic on Smis and doubles
+    When it runs
+    Then the result has the JavaScript value, as a Smi when it fits
+    """
+    value = _run(source)
+
+    assert value.to_number() == expected
+    assert value.is_smi() == (type(expected) is int and abs(expected) < 2**30)
+
+
+def test_division_by_zero_gives_infinity():
+    """
+    Given a division by zero
+    When it runs
+    Then the result is an infinity instead of an error
+    """
+    assert _run("var z = 0; 1 / z;").to_number() == math.inf
+    assert math.isnan(_run("var z = 0; z / z;").to_number())
+
+
+def test_doubles_concatenate_like_javascript():
+    """
+    Given a string plus a double
+    When it runs
+    Then the number is formatted like JavaScript
+    """
+    assert ToString(_run("'r=' + 10 / 4;")) == "r=2.5"
+
+
+def test_float_loop_matches_across_tiers():
+    """
+    Given a hot function dividing Smis into fractions
+    When it runs optimized and unoptimized
+    Then both produce the same result
+    """
+    source = (
+        "function mean(s, n) { return s / n; } var t = 0; var i = 1;"
+        " while (i < 1500) { t = t + mean(i, 4); i = i + 1; } t;"
+    )
+
+    assert _run(source).to_number() == _run(source, optimize=False).to_number()
+
+
+@pytest.mark.parametrize(
+    "condition, expected",
+    [
+        ("0.5", 7),
+        ("0 / 0", 3),
+        ("0 * -1.5", 3),
+        ("1073741824", 7),
+    ],
+)
+def test_double_conditions(condition, expected):
+    """
+    Given doubles, NaN, -0 and integers past the Smi range as conditions
+    When if (at top level and in a function), !, && and || test them
+    Then they follow ToBoolean (0, -0 and NaN are false)
+    """
+    assert _run(f"var x = {condition}; var r = 3; if (x) {{ r = 7; }} r;").to_smi() == expected
+    assert _run(f"function f(x) {{ if (x) return 7; return 3; }} f({condition});").to_smi() == expected
+
+    number = _run(f"{condition};").to_number()
+    truthy = 1 if expected == 7 else 0
+    for opcodes, result in (
+        ([Opcode.LOGICAL_NOT], 1 - truthy),
+        ([Opcode.LOAD_CONSTANT, Opcode.LOGICAL_OR], truthy),
+        ([Opcode.LOAD_CONSTANT, Opcode.LOGICAL_AND], truthy),
+    ):
+        bytecode = BytecodeArray()
+        operand = bytecode.add_constant(number)
+        other = bytecode.add_constant(1 if opcodes[-1] == Opcode.LOGICAL_AND else 0)
+        bytecode.add_instruction(Instruction(Opcode.LOAD_CONSTANT, operand))
+        for opcode in opcodes:
+            bytecode.add_instruction(
+                Instruction(opcode, other if opcode == Opcode.LOAD_CONSTANT else None)
+            )
+        bytecode.add_instruction(Instruction(Opcode.RETURN))
+
+        value = Interpreter(GarbageCollector()).execute(bytecode).value
+        assert value.to_smi() == result
+
+
+def test_loop_on_large_counter_matches_across_tiers():
+    """
+    Given a hot loop whose condition is a counter past the Smi range
+    When it runs optimized and unoptimized
+    Then both count the same iterations
+    """
+    source = (
+        "function count(x) { var t = 4294967296; var n = 0;"
+        " while (t) { t = t - 1073741824; if (x) { n = n + 1; } } return n; }"
+        " var s = 0; var i = 0; while (i < 1500) { s = s + count(0.5) + count(0 / 0); i = i + 1; } s;"
+    )
+
+    assert _run(source).to_smi() == _run(source, optimize=False).to_smi() == 6000
@@ -0,0 +1,180 @@
+"""
+Unit tests for ExecutionProfiler.
+
+Tests opcode counting, per-function timing, stack sampling and the
+collapsed-stack / Chrome trace exports.
+"""
+
+import json
+
+from components.bytecode.src import BytecodeArray, Compile, Instruction, Opcode
+from components.memory_gc.src import GarbageCollector
+from components.parser.src import Parse
+
+
+FIB_SOURCE = """
+function fib(n) { if (n < 2) { return n; } return fib(n - 1) + fib(n - 2); }
+function main() { return fib(10); }
+main();
+"""
+
+
+def _run_profiled(source, **profiler_options):
+    from components.interpreter.src import Execute, ExecutionProfiler
+
+    profiler = ExecutionProfiler(**profiler_options)
+    result = Execute(Compile(Parse(source)), profiler=profiler)
+    assert result.is_success()
+    return result, profiler
+
+
+def test_opcode_counts():
+    """
+    Given a profiler attached to an interpreter
+    When executing bytecode
+    Then every executed opcode is counted
+    """
+    from components.interpreter.src import Interpreter, ExecutionProfiler
+
+    bytecode = BytecodeArray()
+    bytecode.add_constant(1)
+    bytecode.add_instruction(Instruction(Opcode.LOAD_CONSTANT, 0))
+    bytecode.add_instruction(Instruction(Opcode.LOAD_CONSTANT, 0))
+    bytecode.add_instruction(Instruction(Opcode.ADD))
+    bytecode.add_instruction(Instruction(Opcode.RETURN))
+
+    profiler = ExecutionProfiler(sample_interval_ms=None)
+    Interpreter(GarbageCollector(), profiler=profiler).execute(bytecode)
+
+    assert profiler.opcode_counts[Opcode.LOAD_CONSTANT] == 2
+    assert profiler.opcode_counts[Opcode.ADD] == 1
+    assert profiler.opcode_counts[Opcode.RETURN] == 1
+
+
+def test_function_timing_is_named_and_nested():
+    """
+    Given a recursive script
+    When profiling it
+    Then calls are attributed to named functions with self <= total time
+    """
+    result, profiler = _run_profiled(FIB_SOURCE, sample_interval_ms=None)
+
+    assert result.value.to_smi() == 55
+    stats = profiler.function_stats
+    assert set(stats) == {"(program)", "main", "fib"}
+    assert stats["fib"].calls == 177
+    assert stats["main"].calls == 1
+    for function in stats.values():
+        assert 0 <= function.self_time_ns <= function.total_time_ns
+    # Recursive activations are not double counted in total time
+    assert stats["fib"].total_time_ns <= stats["main"].total_time_ns
+    assert profiler.hot_functions(1)[0].name == "fib"
+
+
+def test_sampling_records_call_stacks():
+    """
+    Given a sampling interval
+    When a long-running script is profiled
+    Then samples hold full JS stacks rooted at the program frame
+    """
+    source = FIB_SOURCE.replace("fib(10)", "fib(15)")
+    _, profiler = _run_profiled(source, sample_interval_ms=0.5)
+
+    assert sum(profiler.samples.values()) > 0
+    for stack in profiler.samples:
+        assert stack[0] == "(program)"
+
+    collapsed = profiler.to_collapsed_stacks()
+    line = collapsed.splitlines()[0]
+    frames, count = line.rsplit(" ", 1)
+    assert frames.startswith("(program)")
+    assert int(count) > 0
+
+
+def test_take_sample_reads_context_call_stack():
+    """
+    Given a profiler started on a context
+    When sampling directly
+    Then the current call stack is recorded
+    """
+    from components.interpreter.src import ExecutionProfiler, Interpreter, CallFrame
+    from components.value_system.src import Value
+
+    interpreter = Interpreter(GarbageCollector())
+    profiler = ExecutionProfiler(sample_interval_ms=None)
+    profiler.start(interpreter.context)
+    interpreter.context.push_frame(CallFrame(BytecodeArray(), 0, Value.from_smi(0)))
+    interpreter.context.push_frame(
+        CallFrame(BytecodeArray(name="work"), 0, Value.from_smi(0))
+    )
+    profiler.take_sample()
+    profiler.stop()
+
+    assert profiler.samples == {("(program)", "work"): 1}
+
+
+def test_chrome_trace_export(tmp_path):
+    """
+    Given a profiled run
+    When exporting a Chrome trace
+    Then it is valid trace-event JSON with one complete event per call
+    """
+    _, profiler = _run_profiled(FIB_SOURCE, sample_interval_ms=None)
+    path = tmp_path / "trace.json"
+
+    profiler.write_chrome_trace(str(path))
+    trace = json.loads(path.read_text())
+
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert len(events) == 179
+    assert all(e["dur"] >= 0 for e in events)
+    assert events[0]["name"] == "(program)"
+
+
+def test_profiler_disabled_features():
+    """
+    Given a profiler with timing and counting disabled
+    When executing
+    Then nothing is recorded
+    """
+    _, profiler = _run_profiled(
+        FIB_SOURCE, count_opcodes=False, time_functions=False, sample_interval_ms=None
+    )
+
+    assert not profiler.opcode_counts
+    assert not profiler.function_stats
+    assert profiler.to_chrome_trace()["traceEvents"][1:] == []
+    assert "Wall time" in profiler.format_report()
+
+
+HOT_LOOP_SOURCE = """
+function sq(x) { return x * x; }
+var total = 0;
+var i = 0;
+while (i < 3000) { total = sq(i); i = i + 1; }
+total;
+"""
+
+
+def test_counts_include_code_that_would_be_optimized():
+    """
+    Given a hot loop calling a small function (OSR and inlining candidates)
+    When profiling it with the default and with the JIT explicitly off
+    Then every call and opcode is counted the same in both runs
+    """
+    from components.interpreter.src import ExecutionProfiler, Interpreter
+
+    counts = []
+    for options in ({}, {"optimize": False}):
+        profiler = ExecutionProfiler(sample_interval_ms=None)
+        interpreter = Interpreter(GarbageCollector(), profiler=profiler, **options)
+        profiler.start(interpreter.context)
+        result = interpreter.execute(Compile(Parse(HOT_LOOP_SOURCE)))
+        profiler.stop()
+        assert result.value.to_smi() == 2999 * 2999
+        counts.append((profiler.function_stats["sq"].calls, profiler.opcode_counts))
+
+    (calls, opcodes), (expected_calls, expected_opcodes) = counts
+    assert calls == expected_calls == 3000
+    assert opcodes[Opcode.MULTIPLY] == 3000
+    assert opcodes == expected_opcodes
@@ -0,0 +1,126 @@
+"""
+Unit tests for RealmSnapshot.
+
+Tests that contexts cloned from a realm snapshot get working, isolated
+copies of the built-in globals and prototypes.
+"""
+
+import pytest
+from components.value_system.src import Value
+from components.memory_gc.src import GarbageCollector
+from components.event_loop.src import EventLoop
+from components.bytecode.src import BytecodeArray, Instruction, Opcode
+from components.promise.src import JSPromise
+
+
+def test_realm_snapshot_provides_promise_global():
+    """
+    Given a realm snapshot
+    When creating an interpreter from it
+    Then the Promise constructor is available and bound to its event loop
+    """
+    from components.interpreter.src import Interpreter, RealmSnapshot
+
+    # Given
+    realm = RealmSnapshot()
+    event_loop = EventLoop()
+
+    # When
+    interpreter = Interpreter(GarbageCollector(), event_loop, realm=realm)
+
+    # Then
+    promise_ctor = interpreter.context.global_scope["Promise"].to_object()
+    promise = promise_ctor._callable(lambda resolve, reject: resolve(1))
+    assert isinstance(promise, JSPromise)
+    assert promise.event_loop is event_loop
+
+    resolved = promise_ctor.get_property("resolve").to_object()(5)
+    assert resolved.event_loop is event_loop
+
+
+def test_realm_snapshot_provides_prototypes():
+    """
+    Given a realm snapshot
+    When creating an interpreter from it
+    Then intrinsics hold cloned prototypes with a working prototype chain
+    """
+    from components.interpreter.src import Interpreter, RealmSnapshot
+
+    realm = RealmSnapshot()
+    gc = GarbageCollector()
+    interpreter = Interpreter(gc, realm=realm)
+
+    intrinsics = interpreter.context.intrinsics
+    array_proto = intrinsics["ArrayPrototype"]
+    assert array_proto.has_property("push")
+    assert array_proto.has_property("hasOwnProperty")
+    assert array_proto.get_prototype() is intrinsics["ObjectPrototype"]
+    assert array_proto in gc.heap
+
+
+def test_realm_contexts_are_isolated():
+    """
+    Given two contexts created from one snapshot
+    When one context mutates a built-in
+    Then neither the other context nor the snapshot sees the change
+    """
+    from components.interpreter.src import Interpreter, RealmSnapshot
+
+    realm = RealmSnapshot()
+    first = Interpreter(GarbageCollector(), realm=realm)
+    second = Interpreter(GarbageCollector(), realm=realm)
+
+    first.context.intrinsics["ArrayPrototype"].set_property("custom", Value.from_smi(1))
+    first.context.global_scope["Promise"] = Value.from_smi(0)
+
+    assert not second.context.intrinsics["ArrayPrototype"].has_property("custom")
+    assert not realm.intrinsics["ArrayPrototype"].has_property("custom")
+    assert second.context.global_scope["Promise"].is_object()
+    assert (
+        first.context.intrinsics["ObjectPrototype"]
+        is not second.context.intrinsics["ObjectPrototype"]
+    )
+
+
+def test_execute_with_realm_snapshot():
+    """
+    Given a realm snapshot
+    When executing bytecode through Execute with the snapshot
+    Then execution succeeds as without one
+    """
+    from components.interpreter.src import Execute, GetDefaultRealmSnapshot
+
+    bytecode = BytecodeArray()
+    bytecode.add_constant(42)
+    bytecode.add_instruction(Instruction(Opcode.LOAD_CONSTANT, 0))
+    bytecode.add_instruction(Instruction(Opcode.RETURN))
+
+    result = Execute(bytecode, realm=GetDefaultRealmSnapshot())
+
+    assert result.is_success()
+    assert result.value.to_smi() == 42
+
+
+def test_default_realm_snapshot_is_shared():
+    """
+    Given repeated calls to GetDefaultRealmSnapshot
+    Then the same snapshot is returned
+    """
+    from components.interpreter.src import GetDefaultRealmSnapshot
+
+    assert GetDefaultRealmSnapshot() is GetDefaultRealmSnapshot()
+
+
+def test_measure_context_creation_reports_rates():
+    """
+    Given the context creation benchmark
+    When running it
+    Then it reports cold and warm contexts per second
+    """
+    from components.interpreter.src import MeasureContextCreation
+
+    stats = MeasureContextCreation(count=20)
+
+    assert stats["coldContextsPerSecond"] > 0
+    assert stats["warmContextsPerSecond"] > 0
+    assert stats["speedup"] > 0
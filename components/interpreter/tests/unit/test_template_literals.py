@@ -151,3 +151,66 @@ class TestTemplateLiteralExecution:
         assert result.is_success()
         # Once string support is added, check value.to_string() == ""
         assert result.value is not None
+
+
+class TestStringBuilding:
+    """Test incremental string building uses ropes that stay inside the engine."""
+
+    def _compile(self, source):
+        parser = Parser(Lexer(source, "test.js"))
+        return BytecodeCompiler(parser.parse()).compile()
+
+    def test_loop_concatenation_result_is_flat(self):
+        """
+        Given a loop appending to a string many times (building a rope)
+        When executed by the interpreter
+        Then the result handed back is a flat str equal to the built string
+        """
+        import json
+
+        # Given
+        bytecode = self._compile("""
+        var s = "";
+        for (var i = 0; i < 500; i = i + 1) { s = s + "row " + i + "; "; }
+        s;
+        """)
+
+        # When
+        result = Interpreter(GarbageCollector()).execute(bytecode)
+
+        # Then
+        assert result.is_success()
+        value = result.value.to_object()
+        assert type(value) is str
+        assert value == "".join(f"row {i}; " for i in range(500))
+        assert json.loads(json.dumps(value)) == value
+
+    def test_native_functions_receive_flat_strings(self):
+        """
+        Given a host function called with a string built by appending
+        When the script calls it
+        Then the host function receives a flat str
+        """
+        from components.interpreter.src import Execute
+        from components.value_system.src import Value
+
+        # Given
+        received = []
+
+        def record(value):
+            received.append(value.to_object())
+            return Value.from_smi(0)
+
+        bytecode = self._compile("""
+        var s = "";
+        for (var i = 0; i < 50; i = i + 1) { s = s + "item " + i + ","; }
+        record(s);
+        """)
+
+        # When
+        result = Execute(bytecode, host_globals={"record": Value.from_object(record)})
+
+        # Then
+        assert result.is_success()
+        assert [type(value) for value in received] == [str]
+        assert received[0] == "".join(f"item {i}," for i in range(50))
@@ -0,0 +1,196 @@
+"""
+Unit tests for tier-up to the optimizing JIT and deoptimization.
+
+Tests that hot functions run optimized code, that a failed speculation
+resumes the function in the interpreter with the right result, and that
+the deopt is recorded in the profiler.
+"""
+
+from components.bytecode.src import Compile, Opcode
+from components.deoptimization.src import DeoptReason
+from components.memory_gc.src import GarbageCollector
+from components.parser.src import Parse
+from components.value_system.src import Value
+
+
+SOURCE = """
+function sum(n, start) {
+    var s = start;
+    var i = 0;
+    while (i < n) { s = s + i; i = i + 1; }
+    return s;
+}
+sum(1, 1);
+"""
+
+
+def _function_bytecode():
+    bytecode = Compile(Parse(SOURCE))
+    return next(
+        instr.operand2
+        for instr in bytecode.instructions
+        if instr.opcode == Opcode.CREATE_CLOSURE
+    )
+
+
+def _call(interpreter, bytecode, *arguments):
+    result = interpreter.execute(bytecode, arguments=list(arguments))
+    assert result.is_success(), result.exception
+    return result.value
+
+
+def _warm_up(interpreter, bytecode):
+    while bytecode.feedback is None or bytecode.feedback.optimized_code is None:
+        _call(interpreter, bytecode, Value.from_smi(5), Value.from_smi(2))
+        assert bytecode.feedback.invocation_count <= 1000
+
+
+def test_hot_function_tiers_up():
+    """
+    Given a function called often enough to be hot
+    When it is called again
+    Then it runs in optimized code and returns the same result
+    """
+    from components.interpreter.src import Interpreter
+
+    bytecode = _function_bytecode()
+    interpreter = Interpreter(GarbageCollector())
+
+    _warm_up(interpreter, bytecode)
+    code = bytecode.feedback.optimized_code
+
+    assert _call(interpreter, bytecode, Value.from_smi(10), Value.from_smi(3)).to_smi() == 48
+    assert bytecode.feedback.optimized_code is code
+    assert bytecode.feedback.deopt_count == 0
+
+
+def test_type_change_deoptimizes_and_resumes():
+    """
+    Given a function optimized for Smi arguments
+    When it is called with a string start value
+    Then it deoptimizes, finishes in the interpreter and records the deopt
+    """
+    from components.interpreter.src import ExecutionProfiler, Interpreter
+
+    bytecode = _function_bytecode()
+    profiler = ExecutionProfiler(sample_interval_ms=None)
+    interpreter = Interpreter(GarbageCollector(), profiler=profiler, optimize=True)
+    _warm_up(interpreter, bytecode)
+
+    expected = Interpreter(GarbageCollector(), optimize=False).execute(
+        bytecode, arguments=[Value.from_smi(4), Value.from_object("x")]
+    )
+    result = _call(interpreter, bytecode, Value.from_smi(4), Value.from_object("x"))
+
+    assert str(result.to_object()) == str(expected.value.to_object()) == "x0123"
+    assert bytecode.feedback.optimized_code is None
+    assert bytecode.feedback.deopt_count == 1
+    stats = profiler.deopt_profiler.get_stats()
+    assert stats.total_deopts == 1
+    assert stats.reason_counts == {DeoptReason.TYPE_MISMATCH: 1}
+
+
+LOOP_SOURCE = """
+var total = 0;
+var i = 0;
+while (i < 3000) { total = total + i * 2; i = i + 1; if (i == 2500) { total = "t"; } }
+total;
+"""
+
+
+def test_hot_top_level_loop_enters_osr_code():
+    """
+    Given a top-level loop that runs past the back-edge threshold
+    When the script runs
+    Then the loop continues in OSR code with the live locals
+    """
+    from components.interpreter.src import Interpreter
+    from components.interpreter.src.tiering import OSR_BACK_EDGE_THRESHOLD
+
+    source = LOOP_SOURCE.replace('if (i == 2500) { total = "t"; }', "")
+    bytecode = Compile(Parse(source))
+    interpreter = Interpreter(GarbageCollector())
+    entered = []
+    osr_manager = interpreter.tiering.osr_manager
+    perform_osr = osr_manager.perform_osr
+    osr_manager.perform_osr = lambda entry, runtime: entered.append(entry) or perform_osr(
+        entry, runtime
+    )
+
+    result = _call(interpreter, bytecode)
+
+    assert result.to_smi() == 2 * sum(range(3000))
+    (entry,) = entered
+    assert entry.state_map["locals"][1].to_smi() == OSR_BACK_EDGE_THRESHOLD
+    assert bytecode.feedback.deopt_count == 0
+
+
+def test_osr_code_deoptimizes_mid_loop():
+    """
+    Given a loop running in OSR code
+    When a local changes type inside the loop
+    Then the frame resumes in the interpreter and finishes with the same result
+    """
+    from components.interpreter.src import ExecutionProfiler, Interpreter
+
+    expected = Interpreter(GarbageCollector(), optimize=False).execute(
+        Compile(Parse(LOOP_SOURCE))
+    )
+    profiler = ExecutionProfiler(sample_interval_ms=None)
+    bytecode = Compile(Parse(LOOP_SOURCE))
+
+    result = _call(Interpreter(GarbageCollector(), profiler=profiler, optimize=True), bytecode)
+
+    assert str(result.to_object()) == str(expected.value.to_object())
+    assert bytecode.feedback.deopt_count == 1
+    assert profiler.deopt_profiler.get_stats().total_deopts == 1
+
+
+def test_optimization_can_be_disabled():
+    """
+    Given an interpreter created with optimize=False
+    When a function gets hot
+    Then it keeps running in the interpreter
+    """
+    from components.interpreter.src import Interpreter
+
+    bytecode = _function_bytecode()
+    interpreter = Interpreter(GarbageCollector(), optimize=False)
+
+    for _ in range(1001):
+        _call(interpreter, bytecode, Value.from_smi(2), Value.from_smi(2))
+
+    assert interpreter.tiering is None
+    assert bytecode.feedback.optimized_code is None
+
+
+CALLER_SOURCE = """
+function sq(x) { return x * x; }
+function sumsq(n) { var s = 0; var i = 0; while (i < n) { s = s + sq(i); i = i + 1; } return s; }
+"""
+
+
+def test_small_callee_is_inlined_until_it_is_replaced():
+    """
+    Given a hot function calling one small function
+    When it is optimized and the callee is later rebound
+    Then the callee is inlined, and the new callee deoptimizes the caller
+    """
+    from components.interpreter.src import ExecutionProfiler, Interpreter
+
+    profiler = ExecutionProfiler(sample_interval_ms=None)
+    interpreter = Interpreter(GarbageCollector(), profiler=profiler, optimize=True)
+    assert interpreter.execute(Compile(Parse(CALLER_SOURCE))).is_success()
+    sumsq = interpreter.get_global("sumsq")
+    bytecode = sumsq.to_object().get_property("__bytecode__").to_object()
+    while bytecode.feedback is None or bytecode.feedback.optimized_code is None:
+        interpreter.call_value(sumsq, [Value.from_smi(3)])
+        assert bytecode.feedback.invocation_count <= 1000
+
+    assert b"call_value" not in bytecode.feedback.optimized_code.code
+    assert interpreter.call_value(sumsq, [Value.from_smi(4)]).to_smi() == 14
+
+    interpreter.execute(Compile(Parse("function sq(x) { return x + x; }")))
+    assert interpreter.call_value(sumsq, [Value.from_smi(4)]).to_smi() == 12
+    assert bytecode.feedback.deopt_count == 1
+    assert profiler.deopt_profiler.get_stats().reason_counts == {DeoptReason.IC_MISS: 1}
@@ -0,0 +1,106 @@
+"""
+Unit tests for type feedback collection in the interpreter.
+
+Tests that executing bytecode fills the BytecodeArray's FeedbackVector
+and that the feedback converts to optimizing JIT profiling data.
+"""
+
+from components.bytecode.src import BytecodeArray, Compile, Instruction, Opcode
+from components.memory_gc.src import GarbageCollector
+from components.parser.src import Parse
+from components.value_system.src import Value
+
+
+def _add_function():
+    bytecode = BytecodeArray(local_count=2, parameter_count=2, name="add")
+    bytecode.add_instruction(Instruction(Opcode.LOAD_LOCAL, 0))
+    bytecode.add_instruction(Instruction(Opcode.LOAD_LOCAL, 1))
+    bytecode.add_instruction(Instruction(Opcode.ADD))
+    bytecode.add_instruction(Instruction(Opcode.RETURN))
+    return bytecode
+
+
+def test_execute_records_invocations_and_operand_types():
+    """
+    Given a function executed with SMI and then string arguments
+    When reading its feedback vector
+    Then invocations, parameter types and ADD operand types are recorded
+    """
+    from components.interpreter.src import Interpreter
+
+    bytecode = _add_function()
+    interpreter = Interpreter(GarbageCollector())
+
+    interpreter.execute(bytecode, arguments=[Value.from_smi(1), Value.from_smi(2)])
+    assert bytecode.feedback.dump()["slots"][2]["type"] == "Smi"
+
+    interpreter.execute(bytecode, arguments=[Value.from_object("a"), Value.from_smi(2)])
+    data = bytecode.feedback.dump()
+
+    assert data["invocation_count"] == 2
+    assert data["parameters"][0]["types"] == ["Smi", "String"]
+    assert data["parameters"][1]["type"] == "Smi"
+    assert data["slots"][2]["types"] == ["Smi", "String"]
+
+
+def test_feedback_collection_can_be_disabled():
+    """
+    Given an interpreter created with collect_feedback=False
+    When executing bytecode
+    Then no feedback vector is allocated
+    """
+    from components.interpreter.src import Interpreter
+
+    bytecode = _add_function()
+    Interpreter(GarbageCollector(), collect_feedback=False).execute(
+        bytecode, arguments=[Value.from_smi(1), Value.from_smi(2)]
+    )
+
+    assert bytecode.feedback is None
+
+
+def test_compiled_program_feedback_to_profiling_data():
+    """
+    Given a compiled program with a loop, property loads and calls
+    When converting its feedback to ProfilingData
+    Then call targets, branch frequencies and receiver maps are present
+    """
+    from components.interpreter.src import Interpreter
+    from components.optimizing_jit.src import ProfilingData
+
+    source = """
+    function inc(o) { return o.n + 1; }
+    var obj = {n: 1};
+    var total = 0;
+    var i = 0;
+    while (i < 5) { total = total + inc(obj); i = i + 1; }
+    total;
+    """
+    bytecode = Compile(Parse(source))
+    result = Interpreter(GarbageCollector()).execute(bytecode)
+    assert result.is_success()
+    assert result.value.to_smi() == 10
+
+    profile = ProfilingData.from_feedback(bytecode.feedback)
+
+    assert profile.invocation_count == 1
+    (call_site,) = profile.call_targets.values()
+    assert call_site["count"] == 5
+    assert call_site["targets"] == {"inc": 5}
+    # Loop condition ran 6 times and exited once
+    (exit_frequency,) = profile.branch_frequencies.values()
+    assert exit_frequency == 1 / 6
+
+    callee = next(
+        instr.operand2
+        for instr in bytecode.instructions
+        if instr.opcode == Opcode.CREATE_CLOSURE
+    )
+    callee_profile = ProfilingData.from_feedback(callee.feedback)
+    assert callee_profile.invocation_count == 5
+    shapes = [
+        info["shape"]
+        for info in callee_profile.type_feedback.values()
+        if "shape" in info
+    ]
+    assert shapes == ["JSObject"]
@@ -3,7 +3,7 @@ Intl.DateTimeFormat implementation for ES2024.
 Provides locale-aware date and time formatting.
 """
 
-from .datetime_format import IntlDateTimeFormat
+from .datetime_format import IntlDateTimeFormat, get_cached_date_time_format
 
-__all__ = ['IntlDateTimeFormat']
+__all__ = ['IntlDateTimeFormat', 'get_cached_date_time_format']
 __version__ = '0.1.0'
@@ -3,6 +3,8 @@ Main IntlDateTimeFormat class.
 Implements the Intl.DateTimeFormat API.
 """
 
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from .options import (
     DateTimeFormatOptions,
@@ -15,7 +17,7 @@ from .options import (
 )
 from .locale_support import negotiate_locale, canonicalize_locale, LocaleSupport
 from .timezone import apply_timezone
-from .formatter import create_date_time_parts, assemble_pattern, format_range_pattern
+from .formatter import compile_format_plan, format_range_pattern
 
 
 class IntlDateTimeFormat:
@@ -124,6 +126,15 @@ class IntlDateTimeFormat:
         if 'dayPeriod' in options:
             set_day_period(options['dayPeriod'])
 
+        # Compile the resolved options once; every format call reuses it
+        self._plan = compile_format_plan(
+            self._options,
+            self._locale,
+            self._calendar,
+            self._timeZone,
+            self._hourCycle
+        )
+
     def format(self, date=None):
         """
         Format date to string.
@@ -137,18 +148,24 @@ class IntlDateTimeFormat:
         # Convert date if needed
         date = self._normalize_date(date)
 
-        # Get formatted parts
-        parts = create_date_time_parts(
-            date,
-            self._options,
-            self._locale,
-            self._calendar,
-            self._timeZone,
-            self._hourCycle
-        )
+        return self._plan.format(date)
+
+    def formatMany(self, dates):
+        """
+        Format a batch of dates to strings.
+
+        Converting to the time zone is done for the whole batch with one
+        transition table lookup per offset period, which makes this much
+        cheaper than calling format() in a loop for long runs of
+        timestamps (e.g. log lines).
 
-        # Assemble into string
-        return assemble_pattern(parts, self._locale)
+        Args:
+            dates: Iterable of datetimes or timestamps (int/float)
+
+        Returns:
+            List of formatted date/time strings, in input order
+        """
+        return self._plan.format_many([self._normalize_date(date) for date in dates])
 
     def formatToParts(self, date=None):
         """
@@ -163,17 +180,7 @@ class IntlDateTimeFormat:
         # Convert date if needed
         date = self._normalize_date(date)
 
-        # Get formatted parts
-        parts = create_date_time_parts(
-            date,
-            self._options,
-            self._locale,
-            self._calendar,
-            self._timeZone,
-            self._hourCycle
-        )
-
-        return parts
+        return self._plan.format_to_parts(date)
 
     def formatRange(self, startDate, endDate):
         """
@@ -195,23 +202,8 @@ class IntlDateTimeFormat:
             raise RangeError("startDate must be before or equal to endDate")
 
         # Get parts for both dates
-        startParts = create_date_time_parts(
-            start,
-            self._options,
-            self._locale,
-            self._calendar,
-            self._timeZone,
-            self._hourCycle
-        )
-
-        endParts = create_date_time_parts(
-            end,
-            self._options,
-            self._locale,
-            self._calendar,
-            self._timeZone,
-            self._hourCycle
-        )
+        startParts = self._plan.format_to_parts(start)
+        endParts = self._plan.format_to_parts(end)
 
         # Format range
         return format_range_pattern(startParts, endParts, self._locale)
@@ -236,23 +228,8 @@ class IntlDateTimeFormat:
             raise RangeError("startDate must be before or equal to endDate")
 
         # Get parts for both dates
-        startParts = create_date_time_parts(
-            start,
-            self._options,
-            self._locale,
-            self._calendar,
-            self._timeZone,
-            self._hourCycle
-        )
-
-        endParts = create_date_time_parts(
-            end,
-            self._options,
-            self._locale,
-            self._calendar,
-            self._timeZone,
-            self._hourCycle
-        )
+        startParts = self._plan.format_to_parts(start)
+        endParts = self._plan.format_to_parts(end)
 
         # Add source indicators
         result = []
@@ -387,6 +364,51 @@ class IntlDateTimeFormat:
         raise TypeError(f"Invalid date type: {type(date)}")
 
 
+# Formatters shared by get_cached_date_time_format(), least recently used first
+_FORMATTER_CACHE_SIZE = 64
+_formatter_cache = OrderedDict()
+_formatter_cache_lock = threading.Lock()
+
+
+def get_cached_date_time_format(locales=None, options=None):
+    """
+    Get a shared IntlDateTimeFormat for (locales, options).
+
+    For toLocaleString-style callers that would otherwise construct (and
+    compile) a new formatter on every call. Formatters are immutable, so
+    equal arguments share one instance; the cache keeps the most recently
+    used formatters.
+
+    Args:
+        locales: String, array of strings, or None for default locale
+        options: Formatting options dictionary
+
+    Returns:
+        IntlDateTimeFormat (a new, uncached one if options are unhashable)
+    """
+    try:
+        key = (
+            (locales,) if isinstance(locales, str) else tuple(locales or ()),
+            tuple(sorted(options.items())) if options else (),
+        )
+        hash(key)
+    except (TypeError, AttributeError):
+        return IntlDateTimeFormat(locales, options)
+
+    with _formatter_cache_lock:
+        formatter = _formatter_cache.get(key)
+        if formatter is not None:
+            _formatter_cache.move_to_end(key)
+            return formatter
+
+    formatter = IntlDateTimeFormat(locales, options)
+    with _formatter_cache_lock:
+        _formatter_cache[key] = formatter
+        if len(_formatter_cache) > _FORMATTER_CACHE_SIZE:
+            _formatter_cache.popitem(last=False)
+    return formatter
+
+
 # Custom errors
 class RangeError(ValueError):
     """Range error for invalid date ranges."""
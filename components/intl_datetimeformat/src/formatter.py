@@ -1,11 +1,16 @@
 """
 Core date/time formatting engine.
 Handles formatting logic, pattern assembly, and part generation.
+
+Options are compiled once into a DateTimeFormatPlan (field layout plus one
+emitter per field, with the locale's name tables already looked up), which
+formatters reuse for every date they format.
 """
 
 from datetime import datetime, timezone
+from string import Formatter
 from .calendar import convert_to_calendar, get_month_names, get_calendar_era
-from .timezone import apply_timezone, get_timezone_name
+from .timezone import apply_timezone, get_timezone_name, localize_timestamps
 
 
 class FormattingEngine:
@@ -59,159 +64,177 @@ class FormattingEngine:
     }
 
 
-def format_date_part(date, part, style, calendar, locale):
+def _date_part_emitter(part, style, calendar, locale):
     """
-    Format individual date/time component.
+    Build the formatter of one date component.
+
+    Month, weekday and era name tables are looked up here, once, so the
+    returned function only indexes them.
 
     Args:
-        date: Date to format
-        part: Part to format (year, month, day, etc.)
+        part: Part to format (year, month, day, weekday, era)
         style: Style (numeric, 2-digit, narrow, short, long)
         calendar: Calendar system
         locale: Locale for formatting
 
     Returns:
-        Formatted part value string
+        Function (date, cal_date) -> formatted value, where cal_date is
+        convert_to_calendar(date, calendar)
     """
-    if not isinstance(date, datetime):
-        if isinstance(date, (int, float)):
-            date = datetime.fromtimestamp(date / 1000.0 if date > 1e10 else date, tz=timezone.utc)
-        else:
-            date = datetime.now()
-
-    # Convert to calendar
-    cal_date = convert_to_calendar(date, calendar)
     lang = locale.split('-')[0] if locale else 'en'
 
     if part == 'year':
-        year = cal_date['year']
         if style == '2-digit':
-            return f"{year % 100:02d}"
-        else:  # numeric
-            return str(year)
+            return lambda date, cal_date: f"{cal_date['year'] % 100:02d}"
+        return lambda date, cal_date: str(cal_date['year'])
 
-    elif part == 'month':
-        month = cal_date['month']
+    if part == 'month':
         if style == 'numeric':
-            return str(month)
-        elif style == '2-digit':
-            return f"{month:02d}"
-        else:
-            # Get month names
-            month_names = get_month_names(calendar, locale, style)
+            return lambda date, cal_date: str(cal_date['month'])
+        if style == '2-digit':
+            return lambda date, cal_date: f"{cal_date['month']:02d}"
+
+        month_names = get_month_names(calendar, locale, style)
+
+        def month_name(date, cal_date):
+            month = cal_date['month']
             return month_names[month - 1] if month <= len(month_names) else str(month)
+        return month_name
 
-    elif part == 'day':
-        day = cal_date['day']
+    if part == 'day':
         if style == '2-digit':
-            return f"{day:02d}"
-        else:  # numeric
-            return str(day)
-
-    elif part == 'weekday':
-        weekday_idx = date.weekday()
-        if weekday_idx == 6:  # Python: Monday=0, Sunday=6
-            weekday_idx = 0
-        else:
-            weekday_idx += 1
+            return lambda date, cal_date: f"{cal_date['day']:02d}"
+        return lambda date, cal_date: str(cal_date['day'])
 
+    if part == 'weekday':
         weekdays = FormattingEngine.WEEKDAYS.get(lang, FormattingEngine.WEEKDAYS['en'])
-        return weekdays.get(style, weekdays['long'])[weekday_idx]
+        names = weekdays.get(style, weekdays['long'])
+        # Python: Monday=0 ... Sunday=6; names start with Sunday
+        return lambda date, cal_date: names[(date.weekday() + 1) % 7]
 
-    elif part == 'era':
-        era = cal_date.get('era', 'AD')
+    if part == 'era':
         eras = FormattingEngine.ERAS.get(lang, FormattingEngine.ERAS['en'])
-        era_info = eras.get(era, {'long': era, 'short': era, 'narrow': era})
-        return era_info.get(style, era_info.get('long', era))
 
-    return str(date.__getattribute__(part))
+        def era_name(date, cal_date):
+            era = cal_date.get('era', 'AD')
+            era_info = eras.get(era, {'long': era, 'short': era, 'narrow': era})
+            return era_info.get(style, era_info.get('long', era))
+        return era_name
 
+    return lambda date, cal_date: str(getattr(date, part))
 
-def format_time_part(date, part, style, hourCycle, locale):
+
+def _time_part_emitter(part, style, hourCycle, locale):
     """
-    Format individual time component.
+    Build the formatter of one time component.
+
+    Hours, minutes, seconds and day periods are precomputed as tables of
+    strings indexed by the datetime field.
 
     Args:
-        date: Date to format
         part: Part (hour, minute, second, fractionalSecondDigits, dayPeriod)
         style: Style or digit count
         hourCycle: Hour cycle preference
         locale: Locale for formatting
 
     Returns:
-        Formatted part value string
+        Function (date, cal_date) -> formatted value
     """
-    if not isinstance(date, datetime):
-        if isinstance(date, (int, float)):
-            date = datetime.fromtimestamp(date / 1000.0 if date > 1e10 else date, tz=timezone.utc)
-        else:
-            date = datetime.now()
-
     lang = locale.split('-')[0] if locale else 'en'
+    pattern = '{:02d}' if style == '2-digit' else '{}'
 
     if part == 'hour':
-        hour = date.hour
-
-        # Apply hour cycle
         if hourCycle == 'h11':
-            # 0-11
-            hour = hour % 12
+            hours = [hour % 12 for hour in range(24)]
         elif hourCycle == 'h12':
-            # 1-12
-            hour = hour % 12
-            if hour == 0:
-                hour = 12
-        elif hourCycle == 'h23':
-            # 0-23 (default)
-            pass
+            hours = [hour % 12 or 12 for hour in range(24)]
         elif hourCycle == 'h24':
-            # 1-24
-            if hour == 0:
-                hour = 24
+            hours = [hour or 24 for hour in range(24)]
+        else:  # h23 (default)
+            hours = list(range(24))
+        hour_names = tuple(pattern.format(hour) for hour in hours)
+        return lambda date, cal_date: hour_names[date.hour]
+
+    if part in ('minute', 'second'):
+        sixtieths = tuple(pattern.format(value) for value in range(60))
+        if part == 'minute':
+            return lambda date, cal_date: sixtieths[date.minute]
+        return lambda date, cal_date: sixtieths[date.second]
+
+    if part == 'fractionalSecondDigits':
+        # style is the number of digits (1, 2, or 3)
+        if style == 1:
+            return lambda date, cal_date: str(date.microsecond // 100000)
+        if style == 2:
+            return lambda date, cal_date: f"{date.microsecond // 10000:02d}"
+        if style == 3:
+            return lambda date, cal_date: f"{date.microsecond // 1000:03d}"
+        return lambda date, cal_date: None
+
+    if part == 'dayPeriod':
+        periods = FormattingEngine.DAY_PERIODS.get(lang, FormattingEngine.DAY_PERIODS['en'])
+        names = periods.get(style, periods['short'])
 
-        if style == '2-digit':
-            return f"{hour:02d}"
-        else:  # numeric
-            return str(hour)
+        def period_of(hour):
+            if hour == 0:
+                return 'midnight'
+            if hour == 12:
+                return 'noon'
+            return 'am' if hour < 12 else 'pm'
 
-    elif part == 'minute':
-        if style == '2-digit':
-            return f"{date.minute:02d}"
-        else:  # numeric
-            return str(date.minute)
+        period_names = tuple(
+            names.get(period_of(hour), period_of(hour).upper()) for hour in range(24)
+        )
+        return lambda date, cal_date: period_names[date.hour]
 
-    elif part == 'second':
-        if style == '2-digit':
-            return f"{date.second:02d}"
-        else:  # numeric
-            return str(date.second)
+    return lambda date, cal_date: ''
 
-    elif part == 'fractionalSecondDigits':
-        # style is the number of digits (1, 2, or 3)
-        micros = date.microsecond
-        if style == 1:
-            return str(micros // 100000)
-        elif style == 2:
-            return f"{micros // 10000:02d}"
-        elif style == 3:
-            return f"{micros // 1000:03d}"
-
-    elif part == 'dayPeriod':
-        hour = date.hour
-        periods = FormattingEngine.DAY_PERIODS.get(lang, FormattingEngine.DAY_PERIODS['en'])
 
-        if hour == 0:
-            period_key = 'midnight'
-        elif hour == 12:
-            period_key = 'noon'
-        elif hour < 12:
-            period_key = 'am'
+def _to_datetime(date):
+    """Interpret a timestamp (seconds or milliseconds) as a UTC datetime."""
+    if not isinstance(date, datetime):
+        if isinstance(date, (int, float)):
+            date = datetime.fromtimestamp(date / 1000.0 if date > 1e10 else date, tz=timezone.utc)
         else:
-            period_key = 'pm'
+            date = datetime.now()
+    return date
+
+
+def format_date_part(date, part, style, calendar, locale):
+    """
+    Format individual date/time component.
+
+    Args:
+        date: Date to format
+        part: Part to format (year, month, day, etc.)
+        style: Style (numeric, 2-digit, narrow, short, long)
+        calendar: Calendar system
+        locale: Locale for formatting
+
+    Returns:
+        Formatted part value string
+    """
+    date = _to_datetime(date)
+    emit = _date_part_emitter(part, style, calendar, locale)
+    return emit(date, convert_to_calendar(date, calendar))
 
-        return periods.get(style, periods['short']).get(period_key, period_key.upper())
 
-    return ''
+def format_time_part(date, part, style, hourCycle, locale):
+    """
+    Format individual time component.
+
+    Args:
+        date: Date to format
+        part: Part (hour, minute, second, fractionalSecondDigits, dayPeriod)
+        style: Style or digit count
+        hourCycle: Hour cycle preference
+        locale: Locale for formatting
+
+    Returns:
+        Formatted part value string
+    """
+    date = _to_datetime(date)
+    return _time_part_emitter(part, style, hourCycle, locale)(date, None)
 
 
 def assemble_pattern(parts, locale):
@@ -295,314 +318,276 @@ def format_range_pattern(startParts, endParts, locale):
     return ''.join(result)
 
 
-def create_date_time_parts(date, options, locale, calendar, timeZone, hourCycle):
+
+
+# dateStyle -> (month style, year style, English layout, layout for other languages)
+_DATE_STYLE_LAYOUTS = {
+    'full': ('long', 'numeric', '{weekday}, {month} {day}, {year}', '{weekday}, {day} {month} {year}'),
+    'long': ('long', 'numeric', '{month} {day}, {year}', '{day} {month} {year}'),
+    'medium': ('short', 'numeric', '{month} {day}, {year}', '{day} {month} {year}'),
+    'short': ('numeric', '2-digit', '{month}/{day}/{year}', '{day}/{month}/{year}'),
+}
+
+# timeStyle -> (layout, time zone name style or None)
+_TIME_STYLE_LAYOUTS = {
+    'full': ('{hour}:{minute}:{second}', 'long'),
+    'long': ('{hour}:{minute}:{second}', 'short'),
+    'medium': ('{hour}:{minute}:{second}', None),
+    'short': ('{hour}:{minute}', None),
+}
+
+_DATE_COMPONENTS = ('era', 'year', 'month', 'day', 'weekday')
+_TIME_COMPONENTS = ('hour', 'minute', 'second', 'fractionalSecondDigits', 'dayPeriod', 'timeZoneName')
+
+# Order matters for proper formatting
+_COMPONENT_ORDER = _DATE_COMPONENTS + _TIME_COMPONENTS
+
+
+class DateTimeFormatPlan:
     """
-    Create array of formatted parts from date and options.
+    Formatting plan compiled from resolved DateTimeFormat options.
+
+    compile_format_plan() resolves the style or component layout, the
+    separators, the hour cycle and the localized name tables once; the plan
+    then formats a date by converting it to the time zone (and calendar)
+    and running one emitter per field.
+
+    Attributes:
+        fields: Tuple of (type, literal value, emitter) entries; literals
+            have no emitter, other fields are formatted as
+            emitter(date, cal_date)
+        timeZone: Time zone dates are converted to (None: keep the date's)
+        calendar: Calendar system of the date fields
+    """
+
+    __slots__ = ('fields', 'timeZone', 'calendar', '_needs_calendar')
+
+    def __init__(self, fields, timeZone, calendar):
+        self.fields = tuple(fields)
+        self.timeZone = timeZone
+        self.calendar = calendar
+        self._needs_calendar = any(type_ in _DATE_COMPONENTS for type_, _, _ in self.fields)
+
+    def format(self, date):
+        """
+        Format a datetime to a string.
+
+        Args:
+            date: datetime to format
+
+        Returns:
+            Formatted date/time string
+        """
+        return self._format_local(self._localize(date))
+
+    def format_to_parts(self, date):
+        """
+        Format a datetime to parts.
+
+        Args:
+            date: datetime to format
+
+        Returns:
+            Array of part dictionaries with 'type' and 'value'
+        """
+        date = self._localize(date)
+        cal_date = convert_to_calendar(date, self.calendar) if self._needs_calendar else None
+        return [
+            {'type': type_, 'value': value if emit is None else emit(date, cal_date)}
+            for type_, value, emit in self.fields
+        ]
+
+    def format_many(self, dates):
+        """
+        Format a batch of datetimes to strings.
+
+        Args:
+            dates: Iterable of datetimes
+
+        Returns:
+            List of formatted strings, in input order
+        """
+        if self.timeZone:
+            dates = localize_timestamps(dates, self.timeZone)
+        format_local = self._format_local
+        return [format_local(date) for date in dates]
+
+    def _localize(self, date):
+        if self.timeZone:
+            return apply_timezone(date, self.timeZone)
+        return date
+
+    def _format_local(self, date):
+        cal_date = convert_to_calendar(date, self.calendar) if self._needs_calendar else None
+        return ''.join([
+            value if emit is None else emit(date, cal_date)
+            for _, value, emit in self.fields
+        ])
+
+
+def _layout_fields(layout, emitters):
+    """Expand a '{field}' layout into plan fields."""
+    fields = []
+    for literal, name, _, _ in Formatter().parse(layout):
+        if literal:
+            fields.append(('literal', literal, None))
+        if name is not None:
+            fields.append((name, None, emitters[name]))
+    return fields
+
+
+def _time_zone_name_emitter(timeZone, locale, style):
+    # The name depends on the zone's current period, so it is looked up
+    # on every call
+    return lambda date, cal_date: get_timezone_name(timeZone, locale, style)
+
+
+def compile_format_plan(options, locale, calendar, timeZone, hourCycle):
+    """
+    Compile resolved formatting options into a formatting plan.
 
     Args:
-        date: Date to format
-        options: Formatting options
+        options: Formatting options (dateStyle/timeStyle or components)
         locale: Locale
         calendar: Calendar system
         timeZone: Time zone
         hourCycle: Hour cycle
 
     Returns:
-        Array of part dictionaries with 'type' and 'value'
+        DateTimeFormatPlan
     """
-    if not isinstance(date, datetime):
-        if isinstance(date, (int, float)):
-            date = datetime.fromtimestamp(date / 1000.0 if date > 1e10 else date, tz=timezone.utc)
-        else:
-            date = datetime.now()
-
-    # Apply timezone
-    if timeZone:
-        from .timezone import apply_timezone
-        date = apply_timezone(date, timeZone)
-
-    parts = []
-
-    # Determine what to format based on options
     dateStyle = options.get('dateStyle')
     timeStyle = options.get('timeStyle')
 
-    # Use style-based formatting or component-based
     if dateStyle or timeStyle:
-        # Style-based formatting
+        fields = []
         if dateStyle:
-            parts.extend(_get_date_style_parts(date, dateStyle, locale, calendar))
+            fields.extend(_date_style_fields(dateStyle, locale, calendar))
 
         if dateStyle and timeStyle:
-            parts.append({'type': 'literal', 'value': ' at ' if locale.startswith('en') else ' '})
+            fields.append(('literal', ' at ' if locale.startswith('en') else ' ', None))
 
         if timeStyle:
-            parts.extend(_get_time_style_parts(date, timeStyle, locale, hourCycle, timeZone))
-
+            fields.extend(_time_style_fields(timeStyle, locale, hourCycle, timeZone))
     else:
-        # Component-based formatting
-        parts = _get_component_parts(date, options, locale, calendar, hourCycle, timeZone)
+        fields = _component_fields(options, locale, calendar, hourCycle, timeZone)
 
-    return parts
+    return DateTimeFormatPlan(fields, timeZone, calendar)
 
 
-def _get_date_style_parts(date, style, locale, calendar):
-    """Get parts for dateStyle formatting."""
-    parts = []
-    lang = locale.split('-')[0]
+def create_date_time_parts(date, options, locale, calendar, timeZone, hourCycle):
+    """
+    Create array of formatted parts from date and options.
 
-    if style == 'full':
-        # Full: "Monday, January 15, 2024"
-        weekday = format_date_part(date, 'weekday', 'long', calendar, locale)
-        month = format_date_part(date, 'month', 'long', calendar, locale)
-        day = format_date_part(date, 'day', 'numeric', calendar, locale)
-        year = format_date_part(date, 'year', 'numeric', calendar, locale)
-
-        if lang == 'en':
-            parts = [
-                {'type': 'weekday', 'value': weekday},
-                {'type': 'literal', 'value': ', '},
-                {'type': 'month', 'value': month},
-                {'type': 'literal', 'value': ' '},
-                {'type': 'day', 'value': day},
-                {'type': 'literal', 'value': ', '},
-                {'type': 'year', 'value': year},
-            ]
-        else:
-            # Generic format for other locales
-            parts = [
-                {'type': 'weekday', 'value': weekday},
-                {'type': 'literal', 'value': ', '},
-                {'type': 'day', 'value': day},
-                {'type': 'literal', 'value': ' '},
-                {'type': 'month', 'value': month},
-                {'type': 'literal', 'value': ' '},
-                {'type': 'year', 'value': year},
-            ]
-
-    elif style == 'long':
-        # Long: "January 15, 2024"
-        month = format_date_part(date, 'month', 'long', calendar, locale)
-        day = format_date_part(date, 'day', 'numeric', calendar, locale)
-        year = format_date_part(date, 'year', 'numeric', calendar, locale)
-
-        if lang == 'en':
-            parts = [
-                {'type': 'month', 'value': month},
-                {'type': 'literal', 'value': ' '},
-                {'type': 'day', 'value': day},
-                {'type': 'literal', 'value': ', '},
-                {'type': 'year', 'value': year},
-            ]
-        else:
-            parts = [
-                {'type': 'day', 'value': day},
-                {'type': 'literal', 'value': ' '},
-                {'type': 'month', 'value': month},
-                {'type': 'literal', 'value': ' '},
-                {'type': 'year', 'value': year},
-            ]
-
-    elif style == 'medium':
-        # Medium: "Jan 15, 2024"
-        month = format_date_part(date, 'month', 'short', calendar, locale)
-        day = format_date_part(date, 'day', 'numeric', calendar, locale)
-        year = format_date_part(date, 'year', 'numeric', calendar, locale)
-
-        if lang == 'en':
-            parts = [
-                {'type': 'month', 'value': month},
-                {'type': 'literal', 'value': ' '},
-                {'type': 'day', 'value': day},
-                {'type': 'literal', 'value': ', '},
-                {'type': 'year', 'value': year},
-            ]
-        else:
-            parts = [
-                {'type': 'day', 'value': day},
-                {'type': 'literal', 'value': ' '},
-                {'type': 'month', 'value': month},
-                {'type': 'literal', 'value': ' '},
-                {'type': 'year', 'value': year},
-            ]
-
-    elif style == 'short':
-        # Short: "1/15/24" or "15/1/24"
-        month = format_date_part(date, 'month', 'numeric', calendar, locale)
-        day = format_date_part(date, 'day', 'numeric', calendar, locale)
-        year = format_date_part(date, 'year', '2-digit', calendar, locale)
-
-        if lang == 'en':
-            parts = [
-                {'type': 'month', 'value': month},
-                {'type': 'literal', 'value': '/'},
-                {'type': 'day', 'value': day},
-                {'type': 'literal', 'value': '/'},
-                {'type': 'year', 'value': year},
-            ]
-        else:
-            parts = [
-                {'type': 'day', 'value': day},
-                {'type': 'literal', 'value': '/'},
-                {'type': 'month', 'value': month},
-                {'type': 'literal', 'value': '/'},
-                {'type': 'year', 'value': year},
-            ]
+    Formatters that format more than one date should compile the options
+    once with compile_format_plan() instead.
 
-    return parts
+    Args:
+        date: Date to format
+        options: Formatting options
+        locale: Locale
+        calendar: Calendar system
+        timeZone: Time zone
+        hourCycle: Hour cycle
 
+    Returns:
+        Array of part dictionaries with 'type' and 'value'
+    """
+    plan = compile_format_plan(options, locale, calendar, timeZone, hourCycle)
+    return plan.format_to_parts(_to_datetime(date))
 
-def _get_time_style_parts(date, style, locale, hourCycle, timeZone):
-    """Get parts for timeStyle formatting."""
-    parts = []
 
-    # Default to h12 for en-US, h23 for others
-    if not hourCycle:
-        hourCycle = 'h12' if locale.startswith('en-US') else 'h23'
+def _date_style_fields(style, locale, calendar):
+    """Get plan fields for dateStyle formatting."""
+    if style not in _DATE_STYLE_LAYOUTS:
+        return []
 
-    if style == 'full':
-        # Full: "2:30:45 PM Eastern Standard Time"
-        hour = format_time_part(date, 'hour', '2-digit', hourCycle, locale)
-        minute = format_time_part(date, 'minute', '2-digit', hourCycle, locale)
-        second = format_time_part(date, 'second', '2-digit', hourCycle, locale)
-
-        parts = [
-            {'type': 'hour', 'value': hour},
-            {'type': 'literal', 'value': ':'},
-            {'type': 'minute', 'value': minute},
-            {'type': 'literal', 'value': ':'},
-            {'type': 'second', 'value': second},
-        ]
+    month_style, year_style, en_layout, layout = _DATE_STYLE_LAYOUTS[style]
+    emitters = {
+        'weekday': _date_part_emitter('weekday', 'long', calendar, locale),
+        'month': _date_part_emitter('month', month_style, calendar, locale),
+        'day': _date_part_emitter('day', 'numeric', calendar, locale),
+        'year': _date_part_emitter('year', year_style, calendar, locale),
+    }
+    return _layout_fields(en_layout if locale.split('-')[0] == 'en' else layout, emitters)
 
-        if hourCycle in ('h11', 'h12'):
-            dayPeriod = format_time_part(date, 'dayPeriod', 'short', hourCycle, locale)
-            parts.append({'type': 'literal', 'value': ' '})
-            parts.append({'type': 'dayPeriod', 'value': dayPeriod})
-
-        if timeZone:
-            tzName = get_timezone_name(timeZone, locale, 'long')
-            parts.append({'type': 'literal', 'value': ' '})
-            parts.append({'type': 'timeZoneName', 'value': tzName})
-
-    elif style == 'long':
-        # Long: "2:30:45 PM UTC"
-        hour = format_time_part(date, 'hour', '2-digit', hourCycle, locale)
-        minute = format_time_part(date, 'minute', '2-digit', hourCycle, locale)
-        second = format_time_part(date, 'second', '2-digit', hourCycle, locale)
-
-        parts = [
-            {'type': 'hour', 'value': hour},
-            {'type': 'literal', 'value': ':'},
-            {'type': 'minute', 'value': minute},
-            {'type': 'literal', 'value': ':'},
-            {'type': 'second', 'value': second},
-        ]
 
-        if hourCycle in ('h11', 'h12'):
-            dayPeriod = format_time_part(date, 'dayPeriod', 'short', hourCycle, locale)
-            parts.append({'type': 'literal', 'value': ' '})
-            parts.append({'type': 'dayPeriod', 'value': dayPeriod})
-
-        if timeZone:
-            tzName = get_timezone_name(timeZone, locale, 'short')
-            parts.append({'type': 'literal', 'value': ' '})
-            parts.append({'type': 'timeZoneName', 'value': tzName})
-
-    elif style == 'medium':
-        # Medium: "2:30:45 PM"
-        hour = format_time_part(date, 'hour', '2-digit', hourCycle, locale)
-        minute = format_time_part(date, 'minute', '2-digit', hourCycle, locale)
-        second = format_time_part(date, 'second', '2-digit', hourCycle, locale)
-
-        parts = [
-            {'type': 'hour', 'value': hour},
-            {'type': 'literal', 'value': ':'},
-            {'type': 'minute', 'value': minute},
-            {'type': 'literal', 'value': ':'},
-            {'type': 'second', 'value': second},
-        ]
+def _time_style_fields(style, locale, hourCycle, timeZone):
+    """Get plan fields for timeStyle formatting."""
+    # Default to h12 for en-US, h23 for others
+    if not hourCycle:
+        hourCycle = 'h12' if locale.startswith('en-US') else 'h23'
 
-        if hourCycle in ('h11', 'h12'):
-            dayPeriod = format_time_part(date, 'dayPeriod', 'short', hourCycle, locale)
-            parts.append({'type': 'literal', 'value': ' '})
-            parts.append({'type': 'dayPeriod', 'value': dayPeriod})
+    if style not in _TIME_STYLE_LAYOUTS:
+        return []
 
-    elif style == 'short':
-        # Short: "2:30 PM"
-        hour = format_time_part(date, 'hour', '2-digit', hourCycle, locale)
-        minute = format_time_part(date, 'minute', '2-digit', hourCycle, locale)
+    layout, zone_style = _TIME_STYLE_LAYOUTS[style]
+    emitters = {
+        part: _time_part_emitter(part, '2-digit', hourCycle, locale)
+        for part in ('hour', 'minute', 'second')
+    }
+    fields = _layout_fields(layout, emitters)
 
-        parts = [
-            {'type': 'hour', 'value': hour},
-            {'type': 'literal', 'value': ':'},
-            {'type': 'minute', 'value': minute},
-        ]
+    if hourCycle in ('h11', 'h12'):
+        fields.append(('literal', ' ', None))
+        fields.append(('dayPeriod', None, _time_part_emitter('dayPeriod', 'short', hourCycle, locale)))
 
-        if hourCycle in ('h11', 'h12'):
-            dayPeriod = format_time_part(date, 'dayPeriod', 'short', hourCycle, locale)
-            parts.append({'type': 'literal', 'value': ' '})
-            parts.append({'type': 'dayPeriod', 'value': dayPeriod})
+    if zone_style and timeZone:
+        fields.append(('literal', ' ', None))
+        fields.append(('timeZoneName', None, _time_zone_name_emitter(timeZone, locale, zone_style)))
 
-    return parts
+    return fields
 
 
-def _get_component_parts(date, options, locale, calendar, hourCycle, timeZone):
-    """Get parts for component-based formatting."""
-    parts = []
+def _component_fields(options, locale, calendar, hourCycle, timeZone):
+    """Get plan fields for component-based formatting."""
+    fields = []
     lang = locale.split('-')[0]
 
-    # Order matters for proper formatting
-    component_order = ['era', 'year', 'month', 'day', 'weekday', 'hour', 'minute', 'second',
-                      'fractionalSecondDigits', 'dayPeriod', 'timeZoneName']
-
     prev_was_date = False
     prev_was_time = False
 
-    for component in component_order:
+    for component in _COMPONENT_ORDER:
         if component not in options:
             continue
 
         style = options[component]
 
         # Add separator between date and time
-        is_time_component = component in ('hour', 'minute', 'second', 'fractionalSecondDigits', 'dayPeriod', 'timeZoneName')
-        is_date_component = component in ('era', 'year', 'month', 'day', 'weekday')
+        is_time_component = component in _TIME_COMPONENTS
+        is_date_component = component in _DATE_COMPONENTS
 
         if is_time_component and prev_was_date and not prev_was_time:
-            parts.append({'type': 'literal', 'value': ', ' if lang == 'en' else ' '})
+            fields.append(('literal', ', ' if lang == 'en' else ' ', None))
 
-        # Format the component
-        if component in ('year', 'month', 'day', 'weekday', 'era'):
-            value = format_date_part(date, component, style, calendar, locale)
-            parts.append({'type': component, 'value': value})
+        if is_date_component:
+            fields.append((component, None, _date_part_emitter(component, style, calendar, locale)))
 
             # Add separators between date components
             if component == 'month' and 'day' in options:
-                parts.append({'type': 'literal', 'value': ' ' if style in ('long', 'short', 'narrow') else '/'})
+                fields.append(('literal', ' ' if style in ('long', 'short', 'narrow') else '/', None))
             elif component == 'day' and 'year' in options:
-                parts.append({'type': 'literal', 'value': ', ' if 'month' in options and options['month'] in ('long', 'short', 'narrow') else '/'})
+                named_month = options.get('month') in ('long', 'short', 'narrow')
+                fields.append(('literal', ', ' if named_month else '/', None))
 
-        elif component in ('hour', 'minute', 'second', 'fractionalSecondDigits', 'dayPeriod'):
-            value = format_time_part(date, component, style, hourCycle or 'h23', locale)
-            parts.append({'type': component, 'value': value})
+        elif component == 'timeZoneName':
+            if timeZone:
+                fields.append((component, None, _time_zone_name_emitter(timeZone, locale, style)))
+
+        else:
+            fields.append((component, None, _time_part_emitter(component, style, hourCycle or 'h23', locale)))
 
             # Add time separators
             if component == 'hour' and 'minute' in options:
-                parts.append({'type': 'literal', 'value': ':'})
+                fields.append(('literal', ':', None))
             elif component == 'minute' and 'second' in options:
-                parts.append({'type': 'literal', 'value': ':'})
+                fields.append(('literal', ':', None))
             elif component == 'second' and 'fractionalSecondDigits' in options:
-                parts.append({'type': 'literal', 'value': '.'})
-            elif component in ('dayPeriod', 'timeZoneName'):
-                if parts and parts[-1]['type'] != 'literal':
-                    parts.append({'type': 'literal', 'value': ' '})
-
-        elif component == 'timeZoneName':
-            if timeZone:
-                value = get_timezone_name(timeZone, locale, style)
-                parts.append({'type': component, 'value': value})
+                fields.append(('literal', '.', None))
+            elif component == 'dayPeriod':
+                fields.append(('literal', ' ', None))
 
         prev_was_date = is_date_component
         prev_was_time = is_time_component
 
-    return parts
+    return fields
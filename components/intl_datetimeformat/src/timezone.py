@@ -1,11 +1,38 @@
 """
 IANA time zone support.
 Handles time zone validation, offset calculation, and conversions.
+
+Each zone is resolved and validated once. Its UTC offset history is then
+cached as a transition table: sorted arrays of period start times (epoch
+seconds), offsets and fixed-offset tzinfo objects, filled in lazily one
+year at a time. Offset queries and conversions are a bisect over that
+table, and localize_timestamps() converts whole batches of timestamps
+with one table lookup per instant.
 """
 
+import calendar
+import threading
+from bisect import bisect_right
 from datetime import datetime, timezone, timedelta
-from zoneinfo import ZoneInfo, available_timezones
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+
+try:
+    import pytz
+except ImportError:  # zoneinfo already covers the IANA database
+    pytz = None
+
+
+# Zones whose offset is always zero (validated without a database lookup)
+_UTC_ZONES = ('UTC', 'GMT')
+
+# Years covered by transition tables; other instants are computed directly
+_FIRST_TABLE_YEAR = 1900
+_END_TABLE_YEAR = 2200
+
+# Sampling interval used to find transitions while building a table
+_SCAN_STEP = 86400
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
 class TimeZoneSupport:
@@ -14,6 +41,193 @@ class TimeZoneSupport:
     # Cache of validated time zones
     _validated_zones = set()
 
+    # Cache of zones known to be invalid
+    _invalid_zones = set()
+
+    # Map: time zone identifier -> ZoneTransitions
+    _transition_tables = {}
+
+    # Identifiers of the installed IANA database (loaded on first use)
+    _available_zones = None
+
+    _lock = threading.Lock()
+
+
+class ZoneTransitions:
+    """
+    Cached UTC offset transition table of one time zone.
+
+    Periods are stored in parallel sorted arrays; period i starts at
+    starts[i] (epoch seconds) and lasts until starts[i + 1]. The table
+    covers a contiguous range of whole years and grows on demand; it is
+    replaced as a whole, so lock-free readers always see a consistent one.
+
+    Attributes:
+        name: Time zone identifier
+    """
+
+    def __init__(self, name, tz):
+        """
+        Create an empty table for a zone.
+
+        Args:
+            name: Time zone identifier
+            tz: tzinfo implementing the zone's rules
+        """
+        self.name = name
+        self._tz = tz
+        self._fixed_zones = {}  # (offset, abbreviation) -> shared tzinfo
+        # (starts, offsets, tzinfos, low, high): period start times, their
+        # offsets in seconds and fixed-offset tzinfos named after the
+        # abbreviation, for instants in [low, high)
+        self._table = ([], [], [], 0, 0)
+        self._lock = threading.Lock()
+
+    def offset_at(self, epoch_seconds):
+        """
+        Get the UTC offset in effect at an instant.
+
+        Args:
+            epoch_seconds: Instant as seconds since the Unix epoch
+
+        Returns:
+            Offset in seconds east of UTC
+        """
+        starts, offsets, _, low, high = self._table
+        if not low <= epoch_seconds < high:
+            starts, offsets, _, low, high = self._cover(epoch_seconds)
+            if not low <= epoch_seconds < high:
+                return int(self._sample(epoch_seconds)[0].total_seconds())
+        return offsets[bisect_right(starts, epoch_seconds) - 1]
+
+    def tzinfo_at(self, epoch_seconds):
+        """
+        Get a fixed-offset tzinfo equivalent to the zone at an instant.
+
+        The tzinfo's name is the zone abbreviation (e.g. "EST"), and the
+        same object is returned for every instant of a period.
+
+        Args:
+            epoch_seconds: Instant as seconds since the Unix epoch
+
+        Returns:
+            datetime.timezone for the offset in effect
+        """
+        return self.period_at(epoch_seconds)[0]
+
+    def period_at(self, epoch_seconds):
+        """
+        Get the offset period containing an instant.
+
+        Args:
+            epoch_seconds: Instant as seconds since the Unix epoch
+
+        Returns:
+            (tzinfo, start, end) where the tzinfo is valid for instants in
+            [start, end); start == end when the instant lies outside the
+            years covered by tables
+        """
+        starts, _, tzinfos, low, high = self._table
+        if not low <= epoch_seconds < high:
+            starts, _, tzinfos, low, high = self._cover(epoch_seconds)
+            if not low <= epoch_seconds < high:
+                return self._fixed_zone(*self._sample(epoch_seconds)), 0, 0
+        index = bisect_right(starts, epoch_seconds) - 1
+        end = starts[index + 1] if index + 1 < len(starts) else high
+        return tzinfos[index], starts[index], end
+
+    def _cover(self, epoch_seconds):
+        """Extend the table to the year containing an instant."""
+        year = _year_of(epoch_seconds)
+        if not _FIRST_TABLE_YEAR <= year < _END_TABLE_YEAR:
+            return self._table
+        with self._lock:
+            starts, _, tzinfos, low, high = self._table
+            if not starts:
+                low = calendar.timegm((year, 1, 1, 0, 0, 0))
+                high = low
+            # Scan whole years until the range reaches the instant
+            while high <= epoch_seconds:
+                end = calendar.timegm((_year_of(high) + 1, 1, 1, 0, 0, 0))
+                new_starts, new_tzinfos = self._scan(high, end)
+                if tzinfos and new_tzinfos[0] is tzinfos[-1]:
+                    # The last known period continues into the new year
+                    new_starts, new_tzinfos = new_starts[1:], new_tzinfos[1:]
+                starts, tzinfos, high = starts + new_starts, tzinfos + new_tzinfos, end
+            while epoch_seconds < low:
+                start = calendar.timegm((_year_of(low - 1), 1, 1, 0, 0, 0))
+                new_starts, new_tzinfos = self._scan(start, low)
+                if new_tzinfos[-1] is tzinfos[0]:
+                    # The first known period really began earlier
+                    starts, tzinfos = starts[1:], tzinfos[1:]
+                starts, tzinfos, low = new_starts + starts, new_tzinfos + tzinfos, start
+            offsets = [int(tz.utcoffset(None).total_seconds()) for tz in tzinfos]
+            self._table = (starts, offsets, tzinfos, low, high)
+            return self._table
+
+    def _scan(self, start, end):
+        """
+        Find the periods of [start, end) by sampling daily and bisecting
+        each change down to the second.
+        """
+        current = self._fixed_zone(*self._sample(start))
+        starts = [start]
+        tzinfos = [current]
+        previous = start
+        while previous < end - 1:
+            instant = min(previous + _SCAN_STEP, end - 1)
+            zone = self._fixed_zone(*self._sample(instant))
+            if zone is not current:
+                low, high = previous, instant
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._fixed_zone(*self._sample(middle)) is current:
+                        low = middle
+                    else:
+                        high = middle
+                starts.append(high)
+                tzinfos.append(zone)
+                current = zone
+            previous = instant
+        return starts, tzinfos
+
+    def _sample(self, epoch_seconds):
+        local = (_EPOCH + timedelta(seconds=epoch_seconds)).astimezone(self._tz)
+        return local.utcoffset(), local.tzname()
+
+    def _fixed_zone(self, offset, abbreviation):
+        key = (offset, abbreviation)
+        zone = self._fixed_zones.get(key)
+        if zone is None:
+            zone = timezone(offset, abbreviation) if abbreviation else timezone(offset)
+            self._fixed_zones[key] = zone
+        return zone
+
+
+def _year_of(epoch_seconds):
+    return (_EPOCH + timedelta(seconds=epoch_seconds)).year
+
+
+def _load_zone(timeZone):
+    """Load the tzinfo for an identifier, or None if it is unknown."""
+    try:
+        return ZoneInfo(timeZone)
+    except (ZoneInfoNotFoundError, ValueError, OSError):
+        pass
+    if pytz is not None:
+        try:
+            return pytz.timezone(timeZone)
+        except pytz.UnknownTimeZoneError:
+            pass
+    return None
+
+
+def _is_available(timeZone):
+    zones = TimeZoneSupport._available_zones
+    if zones is None:
+        zones = TimeZoneSupport._available_zones = frozenset(available_timezones())
+    return timeZone in zones
+
 
 def validate_iana_timezone(timeZone):
     """
@@ -25,36 +239,69 @@ def validate_iana_timezone(timeZone):
     Returns:
         True if valid, False otherwise
     """
-    if not timeZone:
+    if not timeZone or not isinstance(timeZone, str):
         return False
 
-    # Check cache first
+    # Check caches first
     if timeZone in TimeZoneSupport._validated_zones:
         return True
+    if timeZone in TimeZoneSupport._invalid_zones:
+        return False
 
-    # UTC is always valid
-    if timeZone.upper() in ('UTC', 'GMT'):
+    # UTC is always valid; otherwise the zone must be in the database
+    valid = timeZone in _UTC_ZONES or (
+        _is_available(timeZone) or (pytz is not None and _load_zone(timeZone) is not None)
+    )
+    if valid:
         TimeZoneSupport._validated_zones.add(timeZone)
-        return True
+    else:
+        TimeZoneSupport._invalid_zones.add(timeZone)
+    return valid
 
-    # Check against available time zones
-    try:
-        # Try zoneinfo first (Python 3.9+)
-        if timeZone in available_timezones():
-            TimeZoneSupport._validated_zones.add(timeZone)
-            return True
-    except:
-        pass
 
-    # Fallback to pytz
-    try:
-        pytz.timezone(timeZone)
-        TimeZoneSupport._validated_zones.add(timeZone)
-        return True
-    except:
-        pass
+def get_zone_transitions(timeZone):
+    """
+    Get the cached transition table of a time zone.
+
+    Args:
+        timeZone: IANA time zone identifier
+
+    Returns:
+        ZoneTransitions for the zone
+
+    Raises:
+        ValueError: If the time zone is invalid
+    """
+    table = TimeZoneSupport._transition_tables.get(timeZone)
+    if table is not None:
+        return table
+
+    if not validate_iana_timezone(timeZone):
+        raise ValueError(f"Invalid time zone: {timeZone}")
+    tz = timezone.utc if timeZone in _UTC_ZONES else _load_zone(timeZone)
+    if tz is None:
+        raise ValueError(f"Invalid time zone: {timeZone}")
+
+    with TimeZoneSupport._lock:
+        table = TimeZoneSupport._transition_tables.get(timeZone)
+        if table is None:
+            table = ZoneTransitions(timeZone, tz)
+            TimeZoneSupport._transition_tables[timeZone] = table
+    return table
+
+
+def _to_datetime(date):
+    """Convert a datetime or timestamp to an aware datetime."""
+    if not isinstance(date, datetime):
+        # Convert timestamp to datetime
+        if isinstance(date, (int, float)):
+            return datetime.fromtimestamp(date / 1000.0 if date > 1e10 else date, tz=timezone.utc)
+        return datetime.now(timezone.utc)
 
-    return False
+    # Ensure date has timezone info
+    if date.tzinfo is None:
+        return date.replace(tzinfo=timezone.utc)
+    return date
 
 
 def get_timezone_offset(timeZone, date):
@@ -67,37 +314,13 @@ def get_timezone_offset(timeZone, date):
 
     Returns:
         Offset in minutes from UTC
-    """
-    if not isinstance(date, datetime):
-        # Convert timestamp to datetime
-        if isinstance(date, (int, float)):
-            date = datetime.fromtimestamp(date / 1000.0 if date > 1e10 else date, tz=timezone.utc)
-        else:
-            date = datetime.now(timezone.utc)
-
-    # Handle UTC/GMT specially
-    if timeZone.upper() in ('UTC', 'GMT'):
-        return 0
 
-    try:
-        # Try zoneinfo (preferred for Python 3.9+)
-        tz = ZoneInfo(timeZone)
-        localized = date.astimezone(tz)
-        offset = localized.utcoffset()
-        return int(offset.total_seconds() / 60)
-    except:
-        pass
-
-    try:
-        # Fallback to pytz
-        tz = pytz.timezone(timeZone)
-        if date.tzinfo is None:
-            date = date.replace(tzinfo=timezone.utc)
-        localized = date.astimezone(tz)
-        offset = localized.utcoffset()
-        return int(offset.total_seconds() / 60)
-    except:
-        return 0
+    Raises:
+        ValueError: If the time zone is invalid
+    """
+    date = _to_datetime(date)
+    table = get_zone_transitions(timeZone)
+    return table.offset_at(date.timestamp()) // 60
 
 
 def apply_timezone(date, timeZone):
@@ -109,36 +332,52 @@ def apply_timezone(date, timeZone):
         timeZone: Target time zone
 
     Returns:
-        Date adjusted to time zone
+        Date adjusted to time zone, with a fixed-offset tzinfo named after
+        the zone abbreviation in effect
+
+    Raises:
+        ValueError: If the time zone is invalid
     """
-    if not isinstance(date, datetime):
-        # Convert timestamp to datetime
-        if isinstance(date, (int, float)):
-            date = datetime.fromtimestamp(date / 1000.0 if date > 1e10 else date, tz=timezone.utc)
-        else:
-            date = datetime.now(timezone.utc)
+    date = _to_datetime(date)
+    tzinfo = get_zone_transitions(timeZone).tzinfo_at(date.timestamp())
+    if date.tzinfo is tzinfo:
+        return date
+    return date.astimezone(tzinfo)
 
-    # Ensure date has timezone info
-    if date.tzinfo is None:
-        date = date.replace(tzinfo=timezone.utc)
 
-    # Handle UTC/GMT
-    if timeZone.upper() in ('UTC', 'GMT'):
-        return date.astimezone(timezone.utc)
+def localize_timestamps(timestamps, timeZone):
+    """
+    Convert a batch of instants to local datetimes in one time zone.
 
-    try:
-        # Try zoneinfo
-        tz = ZoneInfo(timeZone)
-        return date.astimezone(tz)
-    except:
-        pass
+    Consecutive instants in the same offset period (the common case for
+    sorted log timestamps) reuse the previous table lookup.
 
-    try:
-        # Fallback to pytz
-        tz = pytz.timezone(timeZone)
-        return date.astimezone(tz)
-    except:
-        return date
+    Args:
+        timestamps: Iterable of datetimes or epoch timestamps (numbers
+            above 1e10 are milliseconds, as in format())
+        timeZone: IANA time zone identifier
+
+    Returns:
+        List of aware datetimes in the zone
+
+    Raises:
+        ValueError: If the time zone is invalid
+    """
+    table = get_zone_transitions(timeZone)
+    result = []
+    append = result.append
+    fromtimestamp = datetime.fromtimestamp
+    tzinfo, start, end = None, 0, 0
+    for date in timestamps:
+        number_type = type(date)
+        if number_type is int or number_type is float:
+            seconds = date / 1000.0 if date > 1e10 else date
+        else:
+            seconds = _to_datetime(date).timestamp()
+        if not start <= seconds < end:
+            tzinfo, start, end = table.period_at(seconds)
+        append(fromtimestamp(seconds, tzinfo))
+    return result
 
 
 def get_timezone_name(timeZone, locale, style):
@@ -152,6 +391,9 @@ def get_timezone_name(timeZone, locale, style):
 
     Returns:
         Localized time zone name
+
+    Raises:
+        ValueError: If the time zone is invalid
     """
     # Simplified timezone name mapping
     # In a full implementation, this would use CLDR data
@@ -167,40 +409,30 @@ def get_timezone_name(timeZone, locale, style):
             return 'UTC+00:00'
         return 'UTC'
 
-    # For other time zones, construct a simple name
-    try:
-        # Get current offset
-        now = datetime.now(timezone.utc)
-        offset_minutes = get_timezone_offset(timeZone, now)
-        offset_hours = offset_minutes // 60
-        offset_mins = abs(offset_minutes % 60)
-
-        if style in ('shortOffset', 'longOffset'):
-            sign = '+' if offset_minutes >= 0 else '-'
-            offset_str = f"{sign}{abs(offset_hours):02d}:{offset_mins:02d}"
-            if style == 'longOffset':
-                return f"UTC{offset_str}"
-            return offset_str
-
-        # Try to get abbreviated name from pytz
-        try:
-            tz = pytz.timezone(timeZone)
-            now_tz = now.astimezone(tz)
-            tzname = now_tz.strftime('%Z')
-            if tzname and tzname != timeZone:
-                return tzname
-        except:
-            pass
-
-        # Fallback to timezone name
-        if style == 'long':
-            return timeZone.replace('_', ' ')
-        elif style == 'short':
-            # Try to create abbreviation
-            parts = timeZone.split('/')
-            return parts[-1].replace('_', ' ') if parts else timeZone
-
-        return timeZone
-
-    except:
-        return timeZone
+    # For other time zones, construct a simple name from the current period
+    now = datetime.now(timezone.utc)
+    tzinfo = get_zone_transitions(timeZone).tzinfo_at(now.timestamp())
+    offset_minutes = int(tzinfo.utcoffset(None).total_seconds()) // 60
+
+    if style in ('shortOffset', 'longOffset'):
+        sign = '+' if offset_minutes >= 0 else '-'
+        offset_hours, offset_mins = divmod(abs(offset_minutes), 60)
+        offset_str = f"{sign}{offset_hours:02d}:{offset_mins:02d}"
+        if style == 'longOffset':
+            return f"UTC{offset_str}"
+        return offset_str
+
+    # Abbreviation recorded in the transition table
+    tzname = tzinfo.tzname(None)
+    if tzname and tzname != timeZone and not tzname.startswith('UTC'):
+        return tzname
+
+    # Fallback to timezone name
+    if style == 'long':
+        return timeZone.replace('_', ' ')
+    elif style == 'short':
+        # Try to create abbreviation
+        parts = timeZone.split('/')
+        return parts[-1].replace('_', ' ') if parts else timeZone
+
+    return timeZone
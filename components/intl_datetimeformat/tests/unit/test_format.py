@@ -5,7 +5,11 @@ Tests FR-ES24-C-010: format() method for date/time formatting.
 
 import pytest
 from datetime import datetime, timezone
-from components.intl_datetimeformat.src.datetime_format import IntlDateTimeFormat
+from components.intl_datetimeformat.src.datetime_format import (
+    IntlDateTimeFormat,
+    get_cached_date_time_format,
+)
+from components.intl_datetimeformat.src.formatter import compile_format_plan, create_date_time_parts
 
 
 class TestFormat:
@@ -218,3 +222,45 @@ class TestFormat:
         after_dst = datetime(2024, 3, 10, 7, 0, 0, tzinfo=timezone.utc)
         result_after = formatter.format(after_dst)
         assert 'Eastern' in result_after
+
+
+class TestFormatMany:
+    """Test batch formatting."""
+
+    def test_format_many_matches_format(self):
+        """Test formatMany returns what format returns for each date."""
+        dtf = IntlDateTimeFormat('en-US', {
+            'timeZone': 'America/New_York',
+            'hour': 'numeric',
+            'minute': 'numeric'
+        })
+        dates = [1704067200000 + i * 3_600_000 for i in range(0, 24 * 200, 97)]
+
+        assert dtf.formatMany(dates) == [dtf.format(date) for date in dates]
+
+
+class TestFormatPlan:
+    """Test compiled format plans and shared formatters."""
+
+    def test_plan_matches_create_date_time_parts(self):
+        """Test a compiled plan produces the parts of the one-shot path."""
+        options = {'weekday': 'long', 'month': 'short', 'day': 'numeric',
+                   'hour': 'numeric', 'minute': '2-digit', 'dayPeriod': 'short'}
+        plan = compile_format_plan(options, 'en-US', 'gregory', 'UTC', 'h12')
+        date = datetime(2024, 1, 15, 14, 5, 0, tzinfo=timezone.utc)
+
+        parts = create_date_time_parts(date, options, 'en-US', 'gregory', 'UTC', 'h12')
+        assert plan.format_to_parts(date) == parts
+        assert plan.format(date) == ''.join(part['value'] for part in parts)
+        assert 'Monday' in plan.format(date)
+
+    def test_cached_formatter_is_shared(self):
+        """Test equal locales and options share one formatter."""
+        first = get_cached_date_time_format('en-US', {'year': 'numeric', 'month': 'long'})
+        second = get_cached_date_time_format(['en-US'], {'month': 'long', 'year': 'numeric'})
+        other = get_cached_date_time_format('en-US', {'year': 'numeric'})
+
+        assert first is second
+        assert other is not first
+        result = first.format(datetime(2024, 1, 15, tzinfo=timezone.utc))
+        assert 'January' in result and '2024' in result
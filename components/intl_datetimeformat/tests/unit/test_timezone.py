@@ -5,12 +5,15 @@ Tests FR-ES24-C-016: IANA time zone support.
 
 import pytest
 from datetime import datetime, timezone, timedelta
+from zoneinfo import ZoneInfo
 from components.intl_datetimeformat.src.timezone import (
     TimeZoneSupport,
     validate_iana_timezone,
     get_timezone_offset,
     apply_timezone,
-    get_timezone_name
+    get_timezone_name,
+    get_zone_transitions,
+    localize_timestamps
 )
 
 
@@ -224,3 +227,45 @@ class TestTimeZoneName:
         """Test invalid style raises ValueError."""
         with pytest.raises(ValueError, match='Invalid style'):
             get_timezone_name('UTC', 'en-US', 'invalid')
+
+
+class TestZoneTransitions:
+    """Test cached transition tables and batch conversion."""
+
+    def test_table_is_cached_per_zone(self):
+        """Test each zone is resolved once."""
+        assert get_zone_transitions('Europe/Berlin') is get_zone_transitions('Europe/Berlin')
+
+    def test_invalid_zone_raises_error(self):
+        """Test invalid zones are rejected (and remembered as invalid)."""
+        with pytest.raises(ValueError, match='Invalid time zone'):
+            get_zone_transitions('Invalid/Zone')
+        assert 'Invalid/Zone' in TimeZoneSupport._invalid_zones
+
+    def test_offsets_match_zoneinfo_across_years(self):
+        """Test table lookups agree with zoneinfo, including DST edges."""
+        table = get_zone_transitions('America/New_York')
+        tz = ZoneInfo('America/New_York')
+        spring_forward = int(datetime(2024, 3, 10, 7, 0, tzinfo=timezone.utc).timestamp())
+
+        instants = [spring_forward - 1, spring_forward, 0, -1_000_000_000, 2_000_000_000]
+        instants += list(range(1_500_000_000, 1_800_000_000, 7_777_777))
+        for instant in instants:
+            expected = datetime.fromtimestamp(instant, tz).utcoffset().total_seconds()
+            assert table.offset_at(instant) == expected
+
+    def test_period_tzinfo_carries_abbreviation(self):
+        """Test converted dates keep the zone abbreviation."""
+        date = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        assert apply_timezone(date, 'America/New_York').tzname() == 'EST'
+
+    def test_localize_timestamps_batch(self):
+        """Test batch conversion of millisecond timestamps and datetimes."""
+        winter = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        summer_ms = int(datetime(2024, 7, 15, 12, 0, tzinfo=timezone.utc).timestamp() * 1000)
+
+        results = localize_timestamps([winter, summer_ms, summer_ms + 60_000], 'America/New_York')
+
+        assert [d.hour for d in results] == [7, 8, 8]
+        assert results[2].minute == 1
+        assert results[1].utcoffset() == timedelta(hours=-4)
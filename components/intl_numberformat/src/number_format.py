@@ -8,9 +8,11 @@ Provides locale-aware number formatting with support for:
 - Range formatting
 """
 
-from typing import Union, List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import Union, List, Dict, Any, Optional, Callable, Tuple
 import re
 import math
+import threading
 
 
 class IntlNumberFormat:
@@ -46,6 +48,28 @@ class IntlNumberFormat:
         'percent', 'bit', 'byte', 'kilobyte', 'megabyte', 'gigabyte'
     }
 
+    # Currency symbols and names, and unit symbols and names
+    CURRENCY_SYMBOLS = {
+        'USD': '$', 'EUR': '€', 'JPY': '¥', 'GBP': '£',
+        'CHF': 'CHF', 'CNY': '¥', 'INR': '₹'
+    }
+    CURRENCY_NAMES = {
+        'USD': 'US dollars', 'EUR': 'euros', 'JPY': 'yen',
+        'GBP': 'pounds', 'CHF': 'francs'
+    }
+    UNITS_SHORT = {
+        'meter': 'm', 'kilometer': 'km', 'centimeter': 'cm',
+        'kilogram': 'kg', 'gram': 'g',
+        'celsius': '°C', 'fahrenheit': '°F',
+        'liter': 'L', 'milliliter': 'mL',
+        'second': 's', 'minute': 'min', 'hour': 'hr'
+    }
+    UNITS_LONG = {
+        'meter': 'meters', 'kilometer': 'kilometers',
+        'kilogram': 'kilograms', 'gram': 'grams',
+        'celsius': 'degrees Celsius', 'fahrenheit': 'degrees Fahrenheit'
+    }
+
     def __init__(self, locales: Union[str, List[str], None] = None,
                  options: Optional[Dict[str, Any]] = None):
         """
@@ -61,6 +85,7 @@ class IntlNumberFormat:
         self._options = options or {}
         self._locale = self._resolve_locale(locales)
         self._resolved = self._resolve_options(self._locale, self._options)
+        self._plan = self._compile_plan()
 
     def _resolve_locale(self, locales: Union[str, List[str], None]) -> str:
         """Resolve locale from input."""
@@ -250,106 +275,148 @@ class IntlNumberFormat:
         if math.isinf(value):
             return '-∞' if value < 0 else '∞'
 
-        # Apply rounding
-        rounded = self._apply_rounding(value)
+        return self._plan(value)
 
-        # Format based on style
-        style = self._resolved['style']
+    def _compile_plan(self) -> Callable[[Union[int, float]], str]:
+        """
+        Compile the resolved options into a format plan.
+
+        Rounding mode, sign display, grouping, digit counts and the style's
+        symbol or unit are resolved here, once; the returned function only
+        does the arithmetic and string building for one (finite) number.
+
+        Returns:
+            Function formatting a finite number to a string
+        """
+        resolved = self._resolved
+        round_value = self._compile_rounding()
+        format_standard = self._compile_standard()
+        style = resolved['style']
 
         if style == 'percent':
-            return self._format_percent(rounded)
+            def plan(value):
+                return f"{format_standard(round_value(value) * 100)}%"
+
         elif style == 'currency':
-            return self._format_currency(rounded)
+            # Currency (FR-ES24-C-027)
+            currency = resolved['currency']
+            display = resolved.get('currencyDisplay', 'symbol')
+            if display == 'code':
+                symbol = currency
+            elif display == 'name':
+                symbol = self.CURRENCY_NAMES.get(currency, currency)
+            else:  # symbol or narrowSymbol
+                symbol = self.CURRENCY_SYMBOLS.get(currency, currency)
+            accounting = resolved.get('currencySign', 'standard') == 'accounting'
+            zero_sign, positive_sign = self._compile_signs()
+
+            def plan(value):
+                value = round_value(value)
+                formatted = format_standard(abs(value))
+                # Handle negative with accounting format
+                if value < 0:
+                    return f"({symbol}{formatted})" if accounting else f"-{symbol}{formatted}"
+                sign = positive_sign if value > 0 else zero_sign
+                return f"{sign}{symbol}{formatted}"
+
         elif style == 'unit':
-            return self._format_unit(rounded)
+            # Unit (FR-ES24-C-028)
+            unit = resolved['unit']
+            display = resolved.get('unitDisplay', 'short')
+            if display == 'long':
+                suffix = ' ' + self.UNITS_LONG.get(unit, unit)
+            elif display == 'narrow':
+                short = self.UNITS_SHORT.get(unit)
+                suffix = short[0] if short else unit[0]
+            else:  # short
+                suffix = ' ' + self.UNITS_SHORT.get(unit, unit)
+
+            def plan(value):
+                return format_standard(round_value(value)) + suffix
+
         else:  # decimal
-            return self._format_decimal(rounded)
+            notation = resolved.get('notation', 'standard')
+            if notation == 'scientific':
+                format_notation = self._format_scientific
+            elif notation == 'engineering':
+                format_notation = self._format_engineering
+            elif notation == 'compact':
+                format_notation = self._format_compact
+            else:
+                format_notation = format_standard
+
+            def plan(value):
+                return format_notation(round_value(value))
 
-    def _apply_rounding(self, value: float) -> float:
-        """Apply rounding according to options."""
+        return plan
+
+    def _compile_rounding(self) -> Callable[[Union[int, float]], float]:
+        """Build the rounding function for the resolved rounding options."""
         mode = self._resolved.get('roundingMode', 'halfExpand')
         max_frac = self._resolved.get('maximumFractionDigits', 3)
 
         multiplier = 10 ** max_frac
 
         if mode == 'ceil':
-            return math.ceil(value * multiplier) / multiplier
+            return lambda value: math.ceil(value * multiplier) / multiplier
         elif mode == 'floor':
-            return math.floor(value * multiplier) / multiplier
+            return lambda value: math.floor(value * multiplier) / multiplier
         elif mode == 'trunc':
-            return math.trunc(value * multiplier) / multiplier
-        elif mode == 'halfExpand':
-            return round(value, max_frac)
-        else:
-            return round(value, max_frac)
-
-    def _format_decimal(self, value: float) -> str:
-        """Format as decimal number."""
-        notation = self._resolved.get('notation', 'standard')
-
-        if notation == 'scientific':
-            return self._format_scientific(value)
-        elif notation == 'engineering':
-            return self._format_engineering(value)
-        elif notation == 'compact':
-            return self._format_compact(value)
-        else:
-            return self._format_standard(value)
+            return lambda value: math.trunc(value * multiplier) / multiplier
+        else:  # halfExpand and others
+            return lambda value: round(value, max_frac)
 
-    def _format_standard(self, value: float) -> str:
-        """Format in standard notation."""
-        sign = self._get_sign(value)
-        abs_value = abs(value)
+    def _compile_signs(self) -> Tuple[str, str]:
+        """Get the (zero, positive) sign prefixes for signDisplay; negatives use '-'."""
+        sign_display = self._resolved.get('signDisplay', 'auto')
+        zero_sign = '+' if sign_display == 'always' else ''
+        positive_sign = '+' if sign_display in ('always', 'exceptZero') else ''
+        return zero_sign, positive_sign
 
-        # Format digits
+    def _compile_standard(self) -> Callable[[float], str]:
+        """Build the standard notation formatter for the resolved digit options."""
         min_int = self._resolved.get('minimumIntegerDigits', 1)
         min_frac = self._resolved.get('minimumFractionDigits', 0)
         max_frac = self._resolved.get('maximumFractionDigits', 3)
+        zero_sign, positive_sign = self._compile_signs()
 
-        # Integer part
-        int_part = int(abs_value)
-        int_str = str(int_part).zfill(min_int)
+        use_grouping = self._resolved.get('useGrouping', 'auto')
+        if not isinstance(use_grouping, bool):
+            use_grouping = use_grouping in ('always', 'auto')
+
+        if use_grouping and min_int == 1:
+            # US-style grouping: every 3 digits from right
+            integer_digits = '{:,}'.format
+        elif use_grouping:
+            apply_grouping = self._apply_grouping
+            integer_digits = lambda int_part: apply_grouping(str(int_part).zfill(min_int))
+        else:
+            integer_digits = lambda int_part: str(int_part).zfill(min_int)
 
-        # Apply grouping
-        if self._should_use_grouping():
-            int_str = self._apply_grouping(int_str)
+        fraction_spec = f".{max_frac}f"
 
-        # Fraction part
-        frac = abs_value - int_part
-        if max_frac > 0:
-            frac_str = f"{frac:.{max_frac}f}".split('.')[1]
-            # Ensure minimum fraction digits
-            frac_str = frac_str.ljust(min_frac, '0')
-            if frac_str and frac_str != '0' * len(frac_str):
-                return f"{sign}{int_str}.{frac_str}"
+        def format_standard(value):
+            if value < 0:
+                sign = '-'
+            elif value == 0:
+                sign = zero_sign
+            else:
+                sign = positive_sign
+            abs_value = abs(value)
 
-        return f"{sign}{int_str}"
+            int_part = int(abs_value)
+            int_str = integer_digits(int_part)
 
-    def _get_sign(self, value: float) -> str:
-        """Get sign prefix based on signDisplay option."""
-        sign_display = self._resolved.get('signDisplay', 'auto')
+            if max_frac > 0:
+                frac_str = format(abs_value - int_part, fraction_spec).split('.')[1]
+                # Ensure minimum fraction digits
+                frac_str = frac_str.ljust(min_frac, '0')
+                if frac_str.strip('0'):
+                    return f"{sign}{int_str}.{frac_str}"
 
-        if value < 0:
-            return '-'
-        elif value == 0:
-            if sign_display == 'exceptZero':
-                return ''
-            elif sign_display == 'always':
-                return '+'
-            else:
-                return ''
-        else:  # positive
-            if sign_display in ('always', 'exceptZero'):
-                return '+'
-            else:
-                return ''
+            return f"{sign}{int_str}"
 
-    def _should_use_grouping(self) -> bool:
-        """Check if grouping should be used."""
-        use_grouping = self._resolved.get('useGrouping', 'auto')
-        if isinstance(use_grouping, bool):
-            return use_grouping
-        return use_grouping in ('always', 'auto')
+        return format_standard
 
     def _apply_grouping(self, int_str: str) -> str:
         """Apply thousand grouping."""
@@ -365,79 +432,6 @@ class IntlNumberFormat:
 
         return ''.join(reversed(parts))
 
-    def _format_percent(self, value: float) -> str:
-        """Format as percentage."""
-        percent_value = value * 100
-        formatted = self._format_standard(percent_value)
-        return f"{formatted}%"
-
-    def _format_currency(self, value: float) -> str:
-        """Format as currency (FR-ES24-C-027)."""
-        currency = self._resolved['currency']
-        display = self._resolved.get('currencyDisplay', 'symbol')
-        sign_type = self._resolved.get('currencySign', 'standard')
-
-        # Get currency symbol
-        symbols = {
-            'USD': '$', 'EUR': '€', 'JPY': '¥', 'GBP': '£',
-            'CHF': 'CHF', 'CNY': '¥', 'INR': '₹'
-        }
-
-        if display == 'code':
-            symbol = currency
-        elif display == 'name':
-            names = {
-                'USD': 'US dollars', 'EUR': 'euros', 'JPY': 'yen',
-                'GBP': 'pounds', 'CHF': 'francs'
-            }
-            symbol = names.get(currency, currency)
-        else:  # symbol or narrowSymbol
-            symbol = symbols.get(currency, currency)
-
-        # Format value
-        formatted = self._format_standard(abs(value))
-
-        # Handle negative with accounting format
-        if value < 0 and sign_type == 'accounting':
-            return f"({symbol}{formatted})"
-        elif value < 0:
-            return f"-{symbol}{formatted}"
-        else:
-            sign = self._get_sign(value)
-            return f"{sign}{symbol}{formatted}"
-
-    def _format_unit(self, value: float) -> str:
-        """Format with unit (FR-ES24-C-028)."""
-        unit = self._resolved['unit']
-        display = self._resolved.get('unitDisplay', 'short')
-
-        # Unit symbols/names
-        units_short = {
-            'meter': 'm', 'kilometer': 'km', 'centimeter': 'cm',
-            'kilogram': 'kg', 'gram': 'g',
-            'celsius': '°C', 'fahrenheit': '°F',
-            'liter': 'L', 'milliliter': 'mL',
-            'second': 's', 'minute': 'min', 'hour': 'hr'
-        }
-
-        units_long = {
-            'meter': 'meters', 'kilometer': 'kilometers',
-            'kilogram': 'kilograms', 'gram': 'grams',
-            'celsius': 'degrees Celsius', 'fahrenheit': 'degrees Fahrenheit'
-        }
-
-        formatted = self._format_standard(value)
-
-        if display == 'long':
-            unit_str = units_long.get(unit, unit)
-            return f"{formatted} {unit_str}"
-        elif display == 'narrow':
-            unit_str = units_short.get(unit, unit)[0] if units_short.get(unit) else unit[0]
-            return f"{formatted}{unit_str}"
-        else:  # short
-            unit_str = units_short.get(unit, unit)
-            return f"{formatted} {unit_str}"
-
     def _format_scientific(self, value: float) -> str:
         """Format in scientific notation."""
         if value == 0:
@@ -656,6 +650,52 @@ class IntlNumberFormat:
             raise AttributeError(f"can't set attribute '{name}'")
 
 
+# Formatters shared by get_cached_number_format(), least recently used first
+_FORMATTER_CACHE_SIZE = 64
+_formatter_cache: "OrderedDict[tuple, IntlNumberFormat]" = OrderedDict()
+_formatter_cache_lock = threading.Lock()
+
+
+def get_cached_number_format(locales: Union[str, List[str], None] = None,
+                             options: Optional[Dict[str, Any]] = None) -> IntlNumberFormat:
+    """
+    Get a shared IntlNumberFormat for (locales, options).
+
+    For toLocaleString-style callers that would otherwise construct (and
+    compile) a new formatter on every call. Formatters are immutable, so
+    equal arguments share one instance; the cache keeps the most recently
+    used formatters.
+
+    Args:
+        locales: BCP 47 language tag(s)
+        options: Formatting options
+
+    Returns:
+        IntlNumberFormat (a new, uncached one if options are unhashable)
+    """
+    try:
+        key = (
+            (locales,) if isinstance(locales, str) else tuple(locales or ()),
+            tuple(sorted(options.items())) if options else (),
+        )
+        hash(key)
+    except (TypeError, AttributeError):
+        return IntlNumberFormat(locales, options)
+
+    with _formatter_cache_lock:
+        formatter = _formatter_cache.get(key)
+        if formatter is not None:
+            _formatter_cache.move_to_end(key)
+            return formatter
+
+    formatter = IntlNumberFormat(locales, options)
+    with _formatter_cache_lock:
+        _formatter_cache[key] = formatter
+        if len(_formatter_cache) > _FORMATTER_CACHE_SIZE:
+            _formatter_cache.popitem(last=False)
+    return formatter
+
+
 class RangeError(Exception):
     """ECMAScript RangeError exception."""
     pass
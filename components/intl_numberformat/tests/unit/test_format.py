@@ -18,11 +18,15 @@ These tests cover:
 - NaN and Infinity
 - Rounding modes
 - Sign display options
+- Shared formatters
 """
 
 import pytest
 import math
-from components.intl_numberformat.src.number_format import IntlNumberFormat
+from components.intl_numberformat.src.number_format import (
+    IntlNumberFormat,
+    get_cached_number_format,
+)
 
 
 class TestFormatDecimal:
@@ -464,3 +468,22 @@ class TestFormatErrorHandling:
         formatter = IntlNumberFormat('en-US')
         with pytest.raises(TypeError):
             formatter.format({'not': 'a number'})
+
+
+class TestCachedFormatter:
+    """Test the process-wide formatter cache."""
+
+    def test_cached_formatter_is_shared(self):
+        """Equal locales and options share one formatter."""
+        first = get_cached_number_format('en-US', {'style': 'currency', 'currency': 'EUR'})
+        second = get_cached_number_format(['en-US'], {'currency': 'EUR', 'style': 'currency'})
+        assert first is second
+        assert first.format(1234.5) == '€1,234.50'
+        assert get_cached_number_format('en-US') is not first
+
+    def test_unhashable_options_are_not_cached(self):
+        """Options that cannot be keyed get a fresh formatter."""
+        options = {'minimumIntegerDigits': 3, 'extra': ['unhashable']}
+        first = get_cached_number_format('en-US', options)
+        assert first is not get_cached_number_format('en-US', options)
+        assert first.format(7) == '007'
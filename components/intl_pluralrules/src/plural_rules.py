@@ -4,7 +4,9 @@ Intl.PluralRules implementation
 ES2024 Wave C - Internationalization
 Provides locale-aware plural form selection for cardinal and ordinal numbers.
 """
-from typing import Union, List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import Union, List, Dict, Any, Optional, Iterable
 
 # Handle both relative and absolute imports
 try:
@@ -13,6 +15,10 @@ except ImportError:
     from rules import PluralRulesEngine, CLDRDataProvider
 
 
+# Number of recent non-integer results each PluralRules instance remembers
+SELECT_CACHE_SIZE = 256
+
+
 # Use ValueError for RangeError (Python doesn't have built-in RangeError)
 # TypeError is built-in
 class RangeError(ValueError):
@@ -118,6 +124,21 @@ class PluralRules:
         self._engine = PluralRulesEngine()
         self._provider = CLDRDataProvider()
 
+        # Compiled rules, operand options and recent results for select()
+        self._table = self._provider.getDecisionTable(self._locale, self._type)
+        self._number_options = {
+            'minimumIntegerDigits': min_integer,
+            'minimumFractionDigits': min_fraction,
+            'maximumFractionDigits': max_fraction,
+            'minimumSignificantDigits': min_significant,
+            'maximumSignificantDigits': max_significant,
+        }
+        # Integers are shown without fraction digits unless the options
+        # force some, so their operands are known without formatting
+        self._integer_fast_path = min_fraction == 0 and max_significant is None
+        self._recent: "OrderedDict[Any, str]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+
     def select(self, number: Union[int, float]) -> str:
         """
         Select appropriate plural category for a number
@@ -128,26 +149,68 @@ class PluralRules:
         Returns:
             CLDR plural category: 'zero', 'one', 'two', 'few', 'many', or 'other'
 
+        Integers are looked up in the locale's compiled decision table
+        without formatting them; other numbers go through operand
+        extraction, and their results are kept in a small LRU.
+
         Performance: <100µs per call
 
         Implements FR-ES24-C-032: select() returns CLDR plural category
         Implements FR-ES24-C-034: Cardinal vs ordinal type support
         Implements FR-ES24-C-035: All CLDR plural categories
         """
-        # Build number options for operand calculation
-        number_options = {
-            'minimumIntegerDigits': self._minimum_integer_digits,
-            'minimumFractionDigits': self._minimum_fraction_digits,
-            'maximumFractionDigits': self._maximum_fraction_digits,
-            'minimumSignificantDigits': self._minimum_significant_digits,
-            'maximumSignificantDigits': self._maximum_significant_digits,
-        }
+        if self._integer_fast_path:
+            number_type = type(number)
+            if number_type is int or (number_type is float and number.is_integer()):
+                n = abs(number)
+                # Larger integers are not exact as Numbers; leave them to the engine
+                if n <= 2 ** 53:
+                    return self._table.selectInteger(int(n))
+
+        recent = self._recent
+        with self._recent_lock:
+            category = recent.get(number)
+            if category is not None:
+                recent.move_to_end(number)
+                return category
+
+        operands = self._engine.getPluralOperands(float(number), self._number_options)
+        category = self._table.select(operands)
+
+        with self._recent_lock:
+            recent[number] = category
+            if len(recent) > SELECT_CACHE_SIZE:
+                recent.popitem(last=False)
+        return category
+
+    def selectMany(self, numbers: Iterable[Union[int, float]]) -> List[str]:
+        """
+        Select plural categories for a sequence of numbers
+
+        Equivalent to calling select() on each number, with the integer
+        fast path applied inline.
 
-        # Evaluate using engine
-        if self._type == 'cardinal':
-            return self._engine.evaluateCardinalRule(self._locale, float(number), number_options)
-        else:  # ordinal
-            return self._engine.evaluateOrdinalRule(self._locale, float(number), number_options)
+        Args:
+            numbers: Numbers to get plural categories for
+
+        Returns:
+            List of CLDR plural categories, in input order
+        """
+        select = self.select
+        if not self._integer_fast_path:
+            return [select(number) for number in numbers]
+
+        table = self._table
+        integers = table.integers
+        size = len(integers)
+        categories = []
+        append = categories.append
+        for number in numbers:
+            if type(number) is int and -size < number < size:
+                append(integers[number if number >= 0 else -number])
+            else:
+                append(select(number))
+        return categories
 
     def selectRange(self, start_range: Union[int, float], end_range: Union[int, float]) -> str:
         """
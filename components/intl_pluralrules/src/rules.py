@@ -4,8 +4,96 @@ PluralRulesEngine and CLDRDataProvider
 Internal engine for evaluating CLDR plural rules
 """
 import re
+import threading
 from decimal import Decimal
-from typing import Dict, List, Callable, Any
+from typing import Dict, List, Callable, Any, Tuple
+
+
+# Evaluation order of the categories: specific categories first, 'other' last
+CARDINAL_CATEGORY_ORDER = ('zero', 'one', 'two', 'few', 'many', 'other')
+ORDINAL_CATEGORY_ORDER = ('one', 'two', 'few', 'many', 'other')
+
+# Integers below this have their category precomputed in the decision table
+INTEGER_TABLE_SIZE = 1000
+
+
+class PluralDecisionTable:
+    """
+    Plural rules of one locale and type compiled for evaluation
+
+    The rule dictionary is flattened into the (category, predicate) pairs
+    to test, in evaluation order, so selecting a category no longer looks
+    up the locale's rules or tests for each category's presence. The
+    categories of the integers 0 to INTEGER_TABLE_SIZE - 1 (with no visible
+    fraction digits) are precomputed, so the common integer case is a
+    single index.
+    """
+
+    __slots__ = ('locale', 'rule_type', 'branches', 'integers')
+
+    def __init__(self, locale: str, rule_type: str, rules: Dict[str, Callable]):
+        """
+        Compile a locale's rules
+
+        Args:
+            locale: Normalized locale identifier
+            rule_type: 'cardinal' or 'ordinal'
+            rules: Dictionary mapping category names to rule functions
+        """
+        order = CARDINAL_CATEGORY_ORDER if rule_type == 'cardinal' else ORDINAL_CATEGORY_ORDER
+        self.locale = locale
+        self.rule_type = rule_type
+        self.branches: Tuple[Tuple[str, Callable], ...] = tuple(
+            (category, rules[category]) for category in order if category in rules
+        )
+        self.integers: Tuple[str, ...] = tuple(
+            self.select(integerOperands(n)) for n in range(INTEGER_TABLE_SIZE)
+        )
+
+    def select(self, operands: Dict[str, Any]) -> str:
+        """
+        Select the category for plural operands
+
+        Args:
+            operands: CLDR operands (n, i, v, w, f, t)
+
+        Returns:
+            First category whose rule matches, 'other' if none does
+        """
+        for category, rule in self.branches:
+            if rule(operands):
+                return category
+        return 'other'
+
+    def selectInteger(self, n: int) -> str:
+        """
+        Select the category for a non-negative integer shown without fraction digits
+
+        Args:
+            n: Absolute value of the number
+
+        Returns:
+            CLDR plural category
+        """
+        if n < INTEGER_TABLE_SIZE:
+            return self.integers[n]
+        return self.select(integerOperands(n))
+
+
+def integerOperands(n: int) -> Dict[str, Any]:
+    """
+    Get the CLDR operands of a non-negative integer with no visible fraction digits
+
+    Equivalent to PluralRulesEngine.getPluralOperands() for such numbers,
+    without formatting the number to a string.
+
+    Args:
+        n: Absolute value of the number
+
+    Returns:
+        Dictionary with operands n, i, v, w, f, t
+    """
+    return {'n': float(n), 'i': n, 'v': 0, 'w': 0, 'f': 0, 't': 0}
 
 
 class CLDRDataProvider:
@@ -13,8 +101,13 @@ class CLDRDataProvider:
     Provider for CLDR plural rule data
 
     Implements lazy loading of locale-specific plural rules from CLDR data.
+    Compiled decision tables are shared by all providers.
     """
 
+    # Map: (normalized locale, rule type) -> PluralDecisionTable
+    _decision_tables: Dict[tuple, PluralDecisionTable] = {}
+    _decision_tables_lock = threading.Lock()
+
     def __init__(self):
         """Initialize CLDR data provider with lazy loading cache"""
         self._cardinal_rules_cache: Dict[str, Dict[str, Callable]] = {}
@@ -108,6 +201,33 @@ class CLDRDataProvider:
         self._categories_cache[cache_key] = categories
         return categories
 
+    def getDecisionTable(self, locale: str, rule_type: str) -> PluralDecisionTable:
+        """
+        Get the compiled plural rules for locale
+
+        Each locale and type is compiled once per process.
+
+        Args:
+            locale: BCP 47 locale identifier
+            rule_type: 'cardinal' or 'ordinal'
+
+        Returns:
+            PluralDecisionTable
+        """
+        locale = self._normalizeLocale(locale)
+        key = (locale, rule_type)
+
+        table = self._decision_tables.get(key)
+        if table is None:
+            if rule_type == 'cardinal':
+                rules = self.getCardinalRules(locale)
+            else:
+                rules = self.getOrdinalRules(locale)
+            table = PluralDecisionTable(locale, rule_type, rules)
+            with self._decision_tables_lock:
+                table = self._decision_tables.setdefault(key, table)
+        return table
+
     def _normalizeLocale(self, locale: str) -> str:
         """Normalize locale identifier"""
         if locale is None:
@@ -314,21 +434,8 @@ class PluralRulesEngine:
         Returns:
             CLDR plural category ('zero', 'one', 'two', 'few', 'many', 'other')
         """
-        # Get operands
         operands = self.getPluralOperands(number, number_options)
-
-        # Get rules for locale
-        rules = self._provider.getCardinalRules(locale)
-
-        # Evaluate rules in order of specificity
-        # Check specific categories first, 'other' last
-        for category in ['zero', 'one', 'two', 'few', 'many', 'other']:
-            if category in rules:
-                if rules[category](operands):
-                    return category
-
-        # Default to 'other'
-        return 'other'
+        return self._provider.getDecisionTable(locale, 'cardinal').select(operands)
 
     def evaluateOrdinalRule(self, locale: str, number: float, number_options: Dict[str, Any]) -> str:
         """
@@ -343,14 +450,7 @@ class PluralRulesEngine:
             CLDR plural category
         """
         operands = self.getPluralOperands(number, number_options)
-        rules = self._provider.getOrdinalRules(locale)
-
-        for category in ['one', 'two', 'few', 'many', 'other']:
-            if category in rules:
-                if rules[category](operands):
-                    return category
-
-        return 'other'
+        return self._provider.getDecisionTable(locale, 'ordinal').select(operands)
 
     def evaluateRangeRule(self, locale: str, start_category: str, end_category: str) -> str:
         """
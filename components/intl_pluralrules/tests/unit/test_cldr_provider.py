@@ -178,3 +178,13 @@ class TestCLDRDataProvider:
 
         # Categories should match rule keys
         assert set(categories) == set(rules.keys())
+
+    def test_provider_decision_table_shared(self):
+        """Decision tables should be compiled once and shared by providers"""
+        table = CLDRDataProvider().getDecisionTable('pl-PL', 'cardinal')
+
+        assert CLDRDataProvider().getDecisionTable('pl-PL', 'cardinal') is table
+        assert [category for category, _ in table.branches] == ['one', 'few', 'many', 'other']
+        assert table.selectInteger(22) == 'few'
+        assert table.selectInteger(1022) == 'few'
+        assert table.selectInteger(1012) == 'many'
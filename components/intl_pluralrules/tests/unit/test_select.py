@@ -266,6 +266,24 @@ class TestSelectWithFormattingOptions:
         assert result in ['one', 'other']
 
 
+class TestSelectMany:
+    """Test selectMany() batch selection"""
+
+    def test_select_many_matches_select(self):
+        """selectMany() should return select() for each number"""
+        pr = PluralRules('ru-RU')
+        numbers = list(range(-30, 130)) + [1.0, 1.5, 21.0, 1011, 10 ** 6 + 1]
+
+        assert pr.selectMany(numbers) == [pr.select(n) for n in numbers]
+
+    def test_select_many_with_fraction_digits(self):
+        """Integers shown with fraction digits should not use integer categories"""
+        pr = PluralRules('en-US', {'minimumFractionDigits': 1})
+
+        assert pr.selectMany([1, 2, 1.5]) == ['other', 'other', 'other']
+        assert PluralRules('en-US').selectMany([1, 2, 1.5]) == ['one', 'other', 'other']
+
+
 class TestSelectPerformance:
     """Test select() performance requirements"""
 
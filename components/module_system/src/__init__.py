@@ -3,7 +3,8 @@
 from components.module_system.src.module import Module
 from components.module_system.src.module_status import ModuleStatus
 from components.module_system.src.module_loader import ModuleLoader, ModuleLoadError
-from components.module_system.src.module_registry import ModuleRegistry
+from components.module_system.src.module_registry import CompiledModule, ModuleRegistry
+from components.module_system.src.module_cache import CachedModule, ModuleCache
 from components.module_system.src.module_linker import (
     ModuleLinker,
     ModuleLinkError,
@@ -16,6 +17,9 @@ __all__ = [
     'ModuleLoader',
     'ModuleLoadError',
     'ModuleRegistry',
+    'CompiledModule',
+    'ModuleCache',
+    'CachedModule',
     'ModuleLinker',
     'ModuleLinkError',
     'CircularDependencyError',
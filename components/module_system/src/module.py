@@ -13,7 +13,8 @@ class Module:
     Attributes:
         url: Absolute file path or URL to module
         source: Module source code
-        ast: Parsed AST (populated during linking)
+        ast: Parsed AST (populated during linking; None if the module was
+            restored from a ModuleCache)
         bytecode: Compiled bytecode (populated during linking)
         namespace: Module namespace object (exported bindings)
         imports: List of import declarations (extracted from AST)
@@ -0,0 +1,304 @@
+"""Module cache - persists compiled modules on disk across processes."""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import components.bytecode.src as bytecode_package
+import components.parser.src as parser_package
+import components.value_system.src as value_system_package
+
+
+def source_fingerprint(paths: Iterable[str]) -> str:
+    """
+    Hash the Python sources of files and directories.
+
+    Args:
+        paths: Source files, or directories whose *.py files are hashed
+
+    Returns:
+        Hex SHA-256 digest over the file names and contents
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith(".py")
+            )
+        else:
+            files.append(path)
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Cached entries are only valid for the parser, compiler (including the
+# constant folding it does with value_system) and Python (pickle/AST
+# classes) that produced them. The package versions are never bumped, so
+# the engine is identified by its sources instead
+ENGINE_VERSION = "py{}.{}/{}".format(
+    sys.version_info.major,
+    sys.version_info.minor,
+    source_fingerprint(
+        [
+            os.path.dirname(parser_package.__file__),
+            os.path.dirname(bytecode_package.__file__),
+            os.path.dirname(value_system_package.__file__),
+            # Decides what part of a module body gets compiled
+            os.path.join(os.path.dirname(__file__), "module_linker.py"),
+        ]
+    )[:16],
+)
+
+_INDEX_FILE = "index.pickle"
+
+
+def content_hash(source: str) -> str:
+    """
+    Hash module source code.
+
+    Args:
+        source: Module source as read by ModuleLoader
+
+    Returns:
+        Hex SHA-256 digest of the UTF-8 encoded source
+    """
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedModule:
+    """
+    Compile results of one module, as stored in the module cache.
+
+    Attributes:
+        url: Absolute normalized module URL (resolved path)
+        content_hash: Hash of the source the results were produced from
+        engine_version: ENGINE_VERSION of the engine that produced them
+        imports: Import declarations of the module
+        exports: Export declarations of the module
+        bytecode: Compiled bytecode
+    """
+    url: str
+    content_hash: str
+    engine_version: str
+    imports: List[Any] = field(default_factory=list)
+    exports: List[Any] = field(default_factory=list)
+    bytecode: Optional[Any] = None
+
+
+class ModuleCache:
+    """
+    On-disk cache of compiled modules.
+
+    Stores each module's import/export declarations and bytecode, keyed by
+    resolved path, content hash and engine version, so a new process can
+    link an unchanged module without parsing it. The dependency graphs of
+    linked modules (ModuleLinker.get_dependency_graph) are kept in an
+    index: when a module changes, the entries of every module that
+    transitively imports it are dropped too.
+
+    Entries are pickles; only point the cache at a directory the user
+    trusts, like any other bytecode cache.
+
+    Example:
+        cache = ModuleCache('/home/user/.cache/jsruntime/modules')
+        linker = ModuleLinker(ModuleLoader(), cache=cache)
+        linker.link(module)  # parses only modules that changed
+    """
+
+    def __init__(self, cache_dir: str, engine_version: Optional[str] = None):
+        """
+        Initialize module cache.
+
+        Args:
+            cache_dir: Directory for cache files (created if missing)
+            engine_version: Version entries must match (default: ENGINE_VERSION)
+        """
+        self.cache_dir = cache_dir
+        self.engine_version = engine_version if engine_version is not None else ENGINE_VERSION
+        os.makedirs(cache_dir, exist_ok=True)
+        self._graph: Optional[Dict[str, List[str]]] = None
+
+    def get(self, url: str, source: str) -> Optional[CachedModule]:
+        """
+        Get the cached compile results of a module.
+
+        Args:
+            url: Absolute normalized module URL
+            source: Current source of the module
+
+        Returns:
+            CachedModule if one matches the source and engine version,
+            None otherwise
+        """
+        entry = self._read(self._entry_path(url))
+        if (
+            not isinstance(entry, CachedModule)
+            or entry.url != url
+            or entry.engine_version != self.engine_version
+            or entry.content_hash != content_hash(source)
+        ):
+            return None
+        return entry
+
+    def put(self, url: str, source: str, imports: List[Any], exports: List[Any], bytecode: Any):
+        """
+        Store the compile results of a module.
+
+        Args:
+            url: Absolute normalized module URL
+            source: Source the results were produced from
+            imports: Import declarations of the module
+            exports: Export declarations of the module
+            bytecode: Compiled bytecode
+        """
+        entry = CachedModule(
+            url=url,
+            content_hash=content_hash(source),
+            engine_version=self.engine_version,
+            imports=imports,
+            exports=exports,
+            bytecode=bytecode,
+        )
+        self._write(self._entry_path(url), entry)
+
+    def store_graph(self, graph: Dict[str, List[str]]):
+        """
+        Record the dependency graph of a linked module.
+
+        Args:
+            graph: Module URL -> dependency URLs, as returned by
+                ModuleLinker.get_dependency_graph()
+        """
+        # Merge with the index on disk, which other processes may have updated
+        self._graph = None
+        index = self._load_graph()
+        index.update(graph)
+        self._write(
+            os.path.join(self.cache_dir, _INDEX_FILE),
+            {"engine_version": self.engine_version, "graph": index},
+        )
+
+    def invalidate(self, url: str) -> List[str]:
+        """
+        Drop the entries of a module and of every module importing it.
+
+        Args:
+            url: Absolute normalized module URL
+
+        Returns:
+            URLs whose entries were dropped
+        """
+        dependents: Dict[str, List[str]] = {}
+        for module_url, dependencies in self._load_graph().items():
+            for dependency in dependencies:
+                dependents.setdefault(dependency, []).append(module_url)
+
+        invalidated = []
+        pending = [url]
+        seen = {url}
+        while pending:
+            current = pending.pop()
+            try:
+                os.remove(self._entry_path(current))
+            except FileNotFoundError:
+                pass
+            invalidated.append(current)
+            for dependent in dependents.get(current, []):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    pending.append(dependent)
+        return invalidated
+
+    def invalidate_changed(self, url: str) -> List[str]:
+        """
+        Invalidate the modules reachable from url whose files changed.
+
+        Walks the recorded dependency graph from url, compares each file
+        with its entry and invalidates changed (or deleted) modules along
+        with their dependents.
+
+        Args:
+            url: Absolute normalized URL of the root module
+
+        Returns:
+            URLs whose entries were dropped
+        """
+        graph = self._load_graph()
+        changed = []
+        pending = [url]
+        seen = {url}
+        while pending:
+            current = pending.pop()
+            entry = self._read(self._entry_path(current))
+            if isinstance(entry, CachedModule) and not self._is_current(entry):
+                changed.append(current)
+            for dependency in graph.get(current, []):
+                if dependency not in seen:
+                    seen.add(dependency)
+                    pending.append(dependency)
+
+        invalidated = []
+        for current in changed:
+            for dropped in self.invalidate(current):
+                if dropped not in invalidated:
+                    invalidated.append(dropped)
+        return invalidated
+
+    def clear(self):
+        """Remove all cache files."""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pickle"):
+                os.remove(os.path.join(self.cache_dir, name))
+        self._graph = None
+
+    def _is_current(self, entry: CachedModule) -> bool:
+        if entry.engine_version != self.engine_version:
+            return False
+        try:
+            # Read like ModuleLoader.load_source() so the hashes agree
+            with open(entry.url, 'r', encoding='utf-8') as f:
+                source = f.read()
+        except (OSError, UnicodeDecodeError):
+            return False
+        return entry.content_hash == content_hash(source)
+
+    def _load_graph(self) -> Dict[str, List[str]]:
+        if self._graph is None:
+            index = self._read(os.path.join(self.cache_dir, _INDEX_FILE))
+            if isinstance(index, dict) and index.get("engine_version") == self.engine_version:
+                self._graph = index["graph"]
+            else:
+                self._graph = {}
+        return self._graph
+
+    def _entry_path(self, url: str) -> str:
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.pickle")
+
+    def _read(self, path: str) -> Any:
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # Missing, truncated or from an incompatible engine: a miss
+            return None
+
+    def _write(self, path: str, data: Any):
+        # Write to a temporary file first so readers never see partial entries
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
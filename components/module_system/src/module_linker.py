@@ -1,18 +1,30 @@
 """Module linker - links modules together, resolving dependencies."""
 
-from typing import List, Dict, Optional
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple, Any
 from components.parser.src import Parse
 from components.bytecode.src import Compile
 from components.module_system.src.module import Module
 from components.module_system.src.module_status import ModuleStatus
 from components.module_system.src.module_loader import ModuleLoader
-from components.module_system.src.module_registry import ModuleRegistry
+from components.module_system.src.module_cache import ModuleCache
+from components.module_system.src.module_registry import CompiledModule, ModuleRegistry
 from components.parser.src.ast_nodes import (
     ImportDeclaration, ExportNamedDeclaration,
-    ExportDefaultDeclaration, ExportAllDeclaration
+    ExportDefaultDeclaration, ExportAllDeclaration,
+    ExpressionStatement, Program, Statement,
 )
 
 
+# Sources at least this long are parsed and compiled in a worker process
+# (parsing is CPU-bound, so threads only overlap the file reads)
+LARGE_MODULE_SIZE = 256 * 1024
+
+
 class ModuleLinkError(Exception):
     """Raised when module linking fails."""
     pass
@@ -23,6 +35,55 @@ class CircularDependencyError(ModuleLinkError):
     pass
 
 
+def _module_program(ast: Program) -> Program:
+    """
+    Get the part of a module body the bytecode compiler can compile.
+
+    Import declarations are dropped (imported names compile as free
+    variables) and export declarations are replaced by what they declare.
+    """
+    body = []
+    for statement in ast.body:
+        if isinstance(statement, ImportDeclaration):
+            continue
+        if isinstance(statement, ExportNamedDeclaration):
+            if statement.declaration is not None:
+                body.append(statement.declaration)
+        elif isinstance(statement, ExportDefaultDeclaration):
+            declaration = statement.declaration
+            if not isinstance(declaration, Statement):
+                declaration = ExpressionStatement(
+                    expression=declaration, location=statement.location
+                )
+            body.append(declaration)
+        elif not isinstance(statement, ExportAllDeclaration):
+            body.append(statement)
+    return Program(body=body, location=ast.location)
+
+
+def _parse_and_compile(url: str, source: str) -> Tuple[Any, Any]:
+    """
+    Parse and compile module source.
+
+    Module-level so it can run in a worker process.
+
+    Returns:
+        Tuple of (AST, bytecode)
+
+    Raises:
+        ModuleLinkError: On parse or compile errors
+    """
+    try:
+        ast = Parse(source)
+    except Exception as e:
+        raise ModuleLinkError(f"Parse error in {url}: {e}") from e
+    try:
+        bytecode = Compile(_module_program(ast))
+    except Exception as e:
+        raise ModuleLinkError(f"Compile error in {url}: {e}") from e
+    return ast, bytecode
+
+
 class ModuleLinker:
     """
     Links modules together, resolving import/export dependencies.
@@ -30,24 +91,40 @@ class ModuleLinker:
     Responsibilities:
     - Parse module AST
     - Extract import/export declarations
-    - Load dependencies recursively
+    - Load dependencies breadth-first, fetching and parsing the modules
+      of each level of the graph concurrently
     - Build dependency graph
     - Detect circular dependencies
-    - Compile modules to bytecode
+    - Compile modules to bytecode (cached per URL and mtime in the registry,
+      and across processes in an optional ModuleCache)
     - Manage module lifecycle
     """
 
-    def __init__(self, loader: ModuleLoader, registry: Optional[ModuleRegistry] = None):
+    def __init__(
+        self,
+        loader: ModuleLoader,
+        registry: Optional[ModuleRegistry] = None,
+        max_workers: Optional[int] = None,
+        cache: Optional[ModuleCache] = None,
+    ):
         """
         Initialize module linker.
 
         Args:
             loader: ModuleLoader instance for loading modules
             registry: ModuleRegistry for caching (default: global singleton)
+            max_workers: Threads loading and parsing modules concurrently
+                (default: ThreadPoolExecutor's default)
+            cache: On-disk cache of compiled modules (default: none)
         """
         self.loader = loader
         self.registry = registry or ModuleRegistry()
+        self.max_workers = max_workers
+        self.cache = cache
         self.linking_stack: List[str] = []  # For cycle detection
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
+        self._process_pool_finalizer: Optional[weakref.finalize] = None
 
     def link(self, module: Module) -> None:
         """
@@ -62,11 +139,13 @@ class ModuleLinker:
             ModuleLinkError: If linking fails
 
         Process:
-        1. Parse module AST
-        2. Extract imports/exports
-        3. Load dependencies recursively
-        4. Compile to bytecode
-        5. Update status to LINKED
+        1. Invalidate cached modules of the graph whose files changed
+        2. Parse module AST, extract imports/exports and compile it to
+           bytecode (or take all three from a cache)
+        3. Load, parse and compile the dependencies of all modules found
+           so far concurrently, then repeat with the new modules
+        4. Update status of every module of the graph to LINKED and
+           record the dependency graph in the cache
 
         Note:
             Circular dependencies are allowed and detected.
@@ -83,27 +162,39 @@ class ModuleLinker:
 
         # Mark as linking
         module.status = ModuleStatus.LINKING
+        if not self.registry.has(module.url):
+            self.registry.register(module)
 
         # Add to linking stack for cycle tracking
         self.linking_stack.append(module.url)
 
+        # Modules linked by this call, in discovery order
+        linking = [module]
         try:
-            # Step 1: Parse AST
-            self._parse_module(module)
-
-            # Step 2: Extract imports/exports
-            self._extract_imports_exports(module)
-
-            # Step 3: Load dependencies recursively
-            self._load_dependencies(module)
-
-            # Step 4: Compile to bytecode
-            self._compile_module(module)
-
-            # Step 5: Update status
-            module.status = ModuleStatus.LINKED
+            # Step 1: Drop cache entries that depend on changed files
+            if self.cache is not None:
+                self.cache.invalidate_changed(module.url)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                # Step 2: Parse and compile the root
+                self._parse_module(module)
+                level = [module]
+                while level:
+                    # Step 3: Load the next level of the graph
+                    level = self._load_dependencies(level, pool)
+                    linking.extend(level)
+
+            # Step 4: Update status
+            for mod in linking:
+                mod.status = ModuleStatus.LINKED
+            if self.cache is not None:
+                self.cache.store_graph(self.get_dependency_graph(module))
 
         except Exception as e:
+            for mod in linking:
+                if mod.status == ModuleStatus.LINKING:
+                    # Link again with the next module that imports it
+                    mod.status = ModuleStatus.UNLINKED
             module.status = ModuleStatus.ERROR
             module.error = e
             raise ModuleLinkError(f"Failed to link module {module.url}: {e}") from e
@@ -114,15 +205,111 @@ class ModuleLinker:
 
     def _parse_module(self, module: Module):
         """
-        Parse module source to AST.
+        Parse module source to AST, extract imports/exports and compile it
+        to bytecode.
+
+        Reuses the registry's results if the module's file has not
+        changed since it was last compiled, or the cache's if its content
+        was compiled by an earlier process (module.ast stays None then).
 
         Args:
             module: Module to parse
+
+        Raises:
+            ModuleLinkError: On parse or compile errors
         """
         try:
-            module.ast = Parse(module.source)
-        except Exception as e:
-            raise ModuleLinkError(f"Parse error in {module.url}: {e}") from e
+            mtime = os.stat(module.url).st_mtime_ns
+        except OSError:
+            # Not backed by a file: nothing to key the cache on
+            mtime = None
+
+        if mtime is not None:
+            entry = self.registry.get_compiled(module.url, mtime, module.source)
+            if entry is not None:
+                module.ast = entry.ast
+                module.bytecode = entry.bytecode
+                module.imports = list(entry.imports)
+                module.exports = list(entry.exports)
+                return
+
+        cached = self.cache.get(module.url, module.source) if self.cache is not None else None
+        if cached is not None:
+            module.ast = None
+            module.bytecode = cached.bytecode
+            module.imports = list(cached.imports)
+            module.exports = list(cached.exports)
+        else:
+            self._compile_module(module)
+            if self.cache is not None:
+                self.cache.put(
+                    module.url, module.source, module.imports, module.exports, module.bytecode
+                )
+
+        if mtime is not None:
+            self.registry.store_compiled(
+                module.url,
+                CompiledModule(
+                    mtime, module.source, module.ast, module.bytecode,
+                    module.imports, module.exports,
+                ),
+            )
+
+    def _compile_module(self, module: Module):
+        """
+        Parse and compile module source, extracting imports/exports.
+
+        Sources of LARGE_MODULE_SIZE or more go to a worker process.
+
+        Args:
+            module: Module to compile
+
+        Raises:
+            ModuleLinkError: On parse or compile errors
+        """
+        try:
+            if len(module.source) >= LARGE_MODULE_SIZE:
+                ast, bytecode = self._get_process_pool().submit(
+                    _parse_and_compile, module.url, module.source
+                ).result()
+            else:
+                ast, bytecode = _parse_and_compile(module.url, module.source)
+        except ModuleLinkError as e:
+            module.status = ModuleStatus.ERROR
+            module.error = e
+            raise
+
+        module.ast = ast
+        module.bytecode = bytecode
+        self._extract_imports_exports(module)
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the worker processes for large modules, starting them on first use"""
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                # Forking a process that runs loader threads is unsafe
+                self._process_pool = ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                # Kept for the linker's lifetime; stopped by close(), when
+                # the linker is collected, or at interpreter exit
+                self._process_pool_finalizer = weakref.finalize(
+                    self, self._process_pool.shutdown
+                )
+            return self._process_pool
+
+    def close(self):
+        """Stop the worker processes used for large modules, if any."""
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool_finalizer()
+                self._process_pool = None
+
+    def __enter__(self) -> "ModuleLinker":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def _extract_imports_exports(self, module: Module):
         """
@@ -144,69 +331,83 @@ class ModuleLinker:
             elif isinstance(statement, (ExportNamedDeclaration, ExportDefaultDeclaration, ExportAllDeclaration)):
                 module.exports.append(statement)
 
-    def _load_dependencies(self, module: Module):
+    def _load_dependencies(self, level: List[Module], pool: ThreadPoolExecutor) -> List[Module]:
         """
-        Load all dependencies (imported modules) recursively.
+        Load the dependencies (imported modules) of one level of the graph.
+
+        Modules not in the registry yet are loaded, parsed and compiled
+        concurrently on the pool.
 
         Args:
-            module: Module with imports extracted
+            level: Modules with imports extracted
+            pool: Threads to load modules on
+
+        Returns:
+            Modules to link next: the new modules, plus registered modules
+            that were not linked yet
 
         Populates:
             module.dependencies - List of dependency Module objects
         """
-        for import_decl in module.imports:
-            # Get module specifier (source URL)
-            specifier = import_decl.source.value
-
-            # Resolve specifier to absolute URL
-            dep_url = self.loader.resolve_url(specifier, referrer=module.url)
-            dep_url = self.loader.normalize_url(dep_url)
-
-            # Check if already loaded (cache)
-            dep_module = self.registry.get(dep_url)
-
-            if dep_module is None:
-                # Load dependency
-                dep_module = self.loader.load(specifier, referrer=module.url)
-
-                # Register in cache
-                self.registry.register(dep_module)
-
-                # Link dependency recursively
-                # Note: link() will detect and handle circular dependencies
-                self.link(dep_module)
-            elif dep_module.status == ModuleStatus.LINKED:
-                # Already linked - good to use
-                pass
-            elif dep_module.status == ModuleStatus.LINKING:
-                # Circular dependency detected
-                # This is allowed in ES Modules
-                # The module is being linked higher up in the call stack
-                # We still add it to dependencies, but don't try to link it
-                pass
-            elif dep_module.status == ModuleStatus.UNLINKED:
-                # Found in cache but not yet linked - link it now
-                self.link(dep_module)
-
-            # Add to dependencies (even for circular dependencies)
-            module.dependencies.append(dep_module)
-
-    def _compile_module(self, module: Module):
+        next_level = []
+        pending: Dict[str, Any] = {}  # URL -> future of a module being loaded
+
+        for module in level:
+            for import_decl in module.imports:
+                # Get module specifier (source URL)
+                specifier = import_decl.source.value
+
+                # Resolve specifier to absolute URL
+                dep_url = self.loader.resolve_url(specifier, referrer=module.url)
+                dep_url = self.loader.normalize_url(dep_url)
+
+                # Check if already loaded (cache)
+                if dep_url in pending or self.registry.has(dep_url):
+                    continue
+                pending[dep_url] = pool.submit(self._fetch_module, specifier, module.url)
+
+        # Wait for the whole level (raises the error of a failed load)
+        loaded = [future.result() for future in pending.values()]
+        for dep_module in loaded:
+            # Register in cache
+            self.registry.register(dep_module)
+            dep_module.status = ModuleStatus.LINKING
+            next_level.append(dep_module)
+
+        for module in level:
+            module.dependencies = []
+            for import_decl in module.imports:
+                dep_url = self.loader.normalize_url(
+                    self.loader.resolve_url(import_decl.source.value, referrer=module.url)
+                )
+                dep_module = self.registry.get(dep_url)
+                if dep_module.status in (ModuleStatus.UNLINKED, ModuleStatus.ERROR):
+                    # Found in cache but not yet linked - link it now
+                    self._parse_module(dep_module)
+                    dep_module.status = ModuleStatus.LINKING
+                    next_level.append(dep_module)
+                # LINKED modules are good to use; LINKING ones are part of a
+                # cycle being linked by this call (allowed in ES Modules)
+
+                # Add to dependencies (even for circular dependencies)
+                module.dependencies.append(dep_module)
+
+        return next_level
+
+    def _fetch_module(self, specifier: str, referrer: str) -> Module:
         """
-        Compile module AST to bytecode.
+        Load, parse and compile a dependency (runs on a pool thread).
 
         Args:
-            module: Module with parsed AST
+            specifier: Module specifier from the import declaration
+            referrer: URL of the importing module
 
-        Note:
-            Currently skipped as bytecode compiler doesn't support
-            ES Modules (import/export) yet. Will be implemented in
-            Phase 2.7.4: Module Bytecode Compilation.
+        Returns:
+            Module with source, AST and bytecode
         """
-        # TODO(Phase 2.7.4): Implement module bytecode compilation
-        # For now, we skip compilation as the bytecode compiler
-        # doesn't support import/export statements yet
-        module.bytecode = None
+        module = self.loader.load(specifier, referrer=referrer)
+        self._parse_module(module)
+        return module
 
     def get_dependency_graph(self, module: Module) -> Dict[str, List[str]]:
         """
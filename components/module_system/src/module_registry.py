@@ -1,15 +1,41 @@
 """Module registry - caches loaded modules."""
 
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 from components.module_system.src.module import Module
 
 
+@dataclass
+class CompiledModule:
+    """
+    Parse and compile results of one version of a module file.
+
+    Attributes:
+        mtime: Modification time (st_mtime_ns) of the file version
+        source: Source code the results were produced from
+        ast: Parsed AST (None if restored from a ModuleCache)
+        bytecode: Compiled bytecode
+        imports: Import declarations of the module
+        exports: Export declarations of the module
+    """
+    mtime: int
+    source: str
+    ast: Any
+    bytecode: Any
+    imports: List[Any] = field(default_factory=list)
+    exports: List[Any] = field(default_factory=list)
+
+
 class ModuleRegistry:
     """
     Global registry of loaded modules (singleton pattern).
 
     Ensures each module is loaded only once (caching).
     Modules are keyed by absolute normalized URL.
+
+    Also caches parse/compile results per URL and file modification time,
+    so a module whose file has not changed is not parsed again when it is
+    loaded anew (e.g. after clear()).
     """
 
     _instance = None
@@ -19,6 +45,7 @@ class ModuleRegistry:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.modules = {}
+            cls._instance.compiled = {}
         return cls._instance
 
     def get(self, url: str) -> Optional[Module]:
@@ -53,3 +80,36 @@ class ModuleRegistry:
     def get_all(self) -> Dict[str, Module]:
         """Get all registered modules."""
         return self.modules.copy()
+
+    def get_compiled(self, url: str, mtime: int, source: str) -> Optional[CompiledModule]:
+        """
+        Get cached parse/compile results of a module file.
+
+        Args:
+            url: Absolute normalized module URL
+            mtime: File modification time (st_mtime_ns)
+            source: Source code the module was loaded with
+
+        Returns:
+            CompiledModule if that version was compiled, None otherwise
+        """
+        entry = self.compiled.get(url)
+        if entry is None or entry.mtime != mtime or entry.source != source:
+            return None
+        return entry
+
+    def store_compiled(self, url: str, entry: CompiledModule):
+        """
+        Cache parse/compile results of a module file.
+
+        Replaces the results of older versions of the file.
+
+        Args:
+            url: Absolute normalized module URL
+            entry: Results to cache
+        """
+        self.compiled[url] = entry
+
+    def clear_compiled(self):
+        """Clear cached parse/compile results."""
+        self.compiled.clear()
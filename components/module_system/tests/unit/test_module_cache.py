@@ -0,0 +1,154 @@
+"""Unit tests for ModuleCache (persistent compiled-module cache)."""
+
+import pytest
+from components.module_system.src import (
+    ModuleCache, ModuleLinker, ModuleLoader, ModuleRegistry, ModuleStatus
+)
+from components.module_system.src import module_cache, module_linker
+
+
+@pytest.fixture
+def registry():
+    """Fresh module registry for each test."""
+    reg = ModuleRegistry()
+    reg.clear()
+    reg.clear_compiled()
+    return reg
+
+
+@pytest.fixture
+def project(tmp_path):
+    """main.js imports mid.js (which imports leaf.js) and other.js."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "leaf.js").write_text("export const leaf = 1;")
+    (src / "mid.js").write_text("import { leaf } from './leaf.js';\nexport const mid = leaf;")
+    (src / "other.js").write_text("export function other() { return 2; }")
+    (src / "main.js").write_text(
+        "import { mid } from './mid.js';\nimport { other } from './other.js';\n"
+        "export default mid;"
+    )
+    return src
+
+
+def _link(project, cache_dir, registry):
+    """Link main.js as a new process would: empty registry, new cache object."""
+    registry.clear()
+    registry.clear_compiled()
+    loader = ModuleLoader(base_url=str(project))
+    linker = ModuleLinker(loader, registry, cache=ModuleCache(str(cache_dir)))
+    module = loader.load("main.js")
+    linker.link(module)
+    return module, linker
+
+
+class TestWarmStart:
+    """Test linking from a populated cache."""
+
+    def test_unchanged_graph_is_not_parsed(self, tmp_path, project, registry, monkeypatch):
+        """Test that a warm start restores every module without the parser."""
+        cold, _ = _link(project, tmp_path / "cache", registry)
+
+        def fail(source):
+            raise AssertionError("parsed on a warm start")
+
+        monkeypatch.setattr(module_linker, "Parse", fail)
+        warm, linker = _link(project, tmp_path / "cache", registry)
+
+        assert warm.status == ModuleStatus.LINKED
+        assert warm.ast is None
+        assert linker.get_dependency_graph(warm) == linker.get_dependency_graph(cold)
+        assert [decl.source.value for decl in warm.imports] == ["./mid.js", "./other.js"]
+        assert len(warm.exports) == 1
+        assert warm.bytecode.constant_pool == cold.bytecode.constant_pool
+
+    def test_other_engine_version_misses(self, tmp_path, project, registry):
+        """Test that entries written by another engine version are ignored."""
+        module, _ = _link(project, tmp_path / "cache", registry)
+
+        current = ModuleCache(str(tmp_path / "cache"))
+        other = ModuleCache(str(tmp_path / "cache"), engine_version="other")
+
+        assert current.get(module.url, module.source) is not None
+        assert other.get(module.url, module.source) is None
+
+    def test_engine_change_invalidates_cache(self, tmp_path, project, registry, monkeypatch):
+        """Test that a new engine version reparses every module on the next link."""
+        _link(project, tmp_path / "cache", registry)
+        parsed = []
+        parse = module_linker.Parse
+        monkeypatch.setattr(
+            module_linker, "Parse", lambda source: parsed.append(source) or parse(source)
+        )
+        monkeypatch.setattr(module_cache, "ENGINE_VERSION", "newer compiler")
+
+        module, _ = _link(project, tmp_path / "cache", registry)
+
+        assert module.status == ModuleStatus.LINKED
+        assert len(parsed) == 4
+
+    def test_engine_version_follows_compiler_sources(self, tmp_path):
+        """Test that editing a compiler source changes the fingerprint in ENGINE_VERSION."""
+        compiler = tmp_path / "compiler.py"
+        compiler.write_text("FOLD = True\n")
+        before = module_cache.source_fingerprint([str(tmp_path)])
+
+        compiler.write_text("FOLD = False\n")
+
+        assert module_cache.source_fingerprint([str(tmp_path)]) != before
+
+    def test_corrupt_entry_misses(self, tmp_path, project, registry):
+        """Test that an unreadable entry is treated as a miss."""
+        module, _ = _link(project, tmp_path / "cache", registry)
+        cache = ModuleCache(str(tmp_path / "cache"))
+        with open(cache._entry_path(module.url), "wb") as f:
+            f.write(b"not a pickle")
+
+        assert cache.get(module.url, module.source) is None
+
+
+class TestInvalidation:
+    """Test dependency-aware invalidation."""
+
+    def test_changed_module_invalidates_its_importers(self, tmp_path, project, registry):
+        """Test that a change drops the module and everything importing it, transitively."""
+        module, _ = _link(project, tmp_path / "cache", registry)
+        (project / "leaf.js").write_text("export const leaf = 2;")
+
+        cache = ModuleCache(str(tmp_path / "cache"))
+        invalidated = cache.invalidate_changed(module.url)
+
+        assert sorted(invalidated) == sorted(
+            str(project / name) for name in ("leaf.js", "mid.js", "main.js")
+        )
+        other = project / "other.js"
+        assert cache.get(str(other), other.read_text()) is not None
+
+    def test_relink_after_change_parses_only_invalidated_modules(
+        self, tmp_path, project, registry, monkeypatch
+    ):
+        """Test that relinking reparses the changed subgraph and nothing else."""
+        _link(project, tmp_path / "cache", registry)
+        (project / "leaf.js").write_text("export const leaf = 2;")
+        parsed = []
+        parse = module_linker.Parse
+        monkeypatch.setattr(
+            module_linker, "Parse", lambda source: parsed.append(source) or parse(source)
+        )
+
+        module, _ = _link(project, tmp_path / "cache", registry)
+
+        assert module.status == ModuleStatus.LINKED
+        assert sorted(parsed) == sorted(
+            (project / name).read_text() for name in ("leaf.js", "mid.js", "main.js")
+        )
+
+    def test_clear_removes_entries(self, tmp_path, project, registry):
+        """Test that clear() empties the cache."""
+        module, _ = _link(project, tmp_path / "cache", registry)
+        cache = ModuleCache(str(tmp_path / "cache"))
+
+        cache.clear()
+
+        assert cache.get(module.url, module.source) is None
+        assert cache.invalidate(module.url) == [module.url]
@@ -1,5 +1,8 @@
 """Unit tests for ModuleLinker (Phase 2.7.3)."""
 
+import os
+import threading
+
 import pytest
 from pathlib import Path
 from components.module_system.src import (
@@ -97,8 +100,7 @@ class TestBasicLinking:
         # Verify
         assert module.status == ModuleStatus.LINKED
         assert module.ast is not None
-        # Note: bytecode is None until Phase 2.7.4 implements module compilation
-        assert module.bytecode is None
+        assert module.bytecode is not None
         assert len(module.imports) == 0
         assert len(module.exports) == 1
 
@@ -503,3 +505,129 @@ class TestImportExportExtraction:
         # Verify imports and exports extracted
         assert len(module.imports) == 2
         assert len(module.exports) == 2
+
+
+class TestModuleCompilation:
+    """Test compiling modules to bytecode."""
+
+    def test_module_body_is_compiled(self, tmp_path, linker):
+        """Test that declarations inside exports are compiled with the rest of the body."""
+        module_path = tmp_path / "module.js"
+        module_path.write_text(
+            "import { y } from './dep.js';\n"
+            "export function f() { return 1; }\n"
+            "export default 42;"
+        )
+        (tmp_path / "dep.js").write_text("export const y = 2;")
+
+        module = linker.loader.load("module.js")
+        linker.link(module)
+
+        assert module.bytecode.constant_pool.count("f") == 1
+        assert 42 in module.bytecode.constant_pool
+
+    def test_unchanged_file_reuses_compiled_module(self, tmp_path, linker, registry):
+        """Test that relinking an unchanged file reuses the cached AST and bytecode."""
+        module_path = tmp_path / "module.js"
+        module_path.write_text("export const x = 1;")
+        first = linker.loader.load("module.js")
+        linker.link(first)
+
+        registry.clear()
+        second = linker.loader.load("module.js")
+        linker.link(second)
+
+        assert second is not first
+        assert second.ast is first.ast
+        assert second.bytecode is first.bytecode
+
+    def test_changed_file_is_compiled_again(self, tmp_path, linker, registry):
+        """Test that a new modification time invalidates the cached results."""
+        module_path = tmp_path / "module.js"
+        module_path.write_text("export const x = 1;")
+        first = linker.loader.load("module.js")
+        linker.link(first)
+
+        module_path.write_text("export const x = 2;")
+        stat = os.stat(module_path)
+        os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        registry.clear()
+        second = linker.loader.load("module.js")
+        linker.link(second)
+
+        assert second.ast is not first.ast
+        assert 2 in second.bytecode.constant_pool
+
+
+class TestParallelLoading:
+    """Test breadth-first, concurrent loading of the module graph."""
+
+    def test_sibling_modules_load_concurrently(self, tmp_path, registry):
+        """Test that imports of one level are loaded at the same time."""
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.js").write_text(f"export const {name} = 1;")
+        (tmp_path / "main.js").write_text(
+            "import { a } from './a.js';\nimport { b } from './b.js';"
+        )
+        barrier = threading.Barrier(2, timeout=10)
+
+        class WaitingLoader(ModuleLoader):
+            def load_source(self, url):
+                if not url.endswith("main.js"):
+                    # Both loads must be in flight for either to continue
+                    barrier.wait()
+                return super().load_source(url)
+
+        loader = WaitingLoader(base_url=str(tmp_path))
+        linker = ModuleLinker(loader, registry, max_workers=2)
+        module = loader.load("main.js")
+
+        linker.link(module)
+
+        assert [dep.url for dep in module.dependencies] == [
+            str(tmp_path / "a.js"),
+            str(tmp_path / "b.js"),
+        ]
+        assert all(dep.status == ModuleStatus.LINKED for dep in module.dependencies)
+
+    def test_large_module_is_parsed_in_worker_process(self, tmp_path, linker, monkeypatch):
+        """Test that sources past LARGE_MODULE_SIZE are parsed and compiled out of process."""
+        from components.module_system.src import module_linker
+
+        monkeypatch.setattr(module_linker, "LARGE_MODULE_SIZE", 10)
+        (tmp_path / "big.js").write_text("export const big = 1 + 2;")
+        (tmp_path / "main.js").write_text("import { big } from './big.js';")
+
+        module = linker.loader.load("main.js")
+        linker.link(module)
+
+        (big,) = module.dependencies
+        assert big.status == ModuleStatus.LINKED
+        assert big.bytecode is not None
+
+        # The worker processes outlive link() until the linker is closed
+        pool = linker._process_pool
+        assert pool is not None
+        (tmp_path / "other.js").write_text("export const other = 1;")
+        linker.link(linker.loader.load("other.js"))
+        assert linker._process_pool is pool
+        linker.close()
+        assert linker._process_pool is None
+
+    def test_failed_dependency_leaves_siblings_linkable(self, tmp_path, linker, registry):
+        """Test that a parse error in one dependency does not leave others stuck in LINKING."""
+        (tmp_path / "good.js").write_text("export const good = 1;")
+        (tmp_path / "bad.js").write_text("export const bad = ;")
+        (tmp_path / "main.js").write_text(
+            "import { good } from './good.js';\nimport { bad } from './bad.js';"
+        )
+
+        module = linker.loader.load("main.js")
+        with pytest.raises(ModuleLinkError) as exc_info:
+            linker.link(module)
+
+        assert module.status == ModuleStatus.ERROR
+        assert "Parse error" in str(exc_info.value)
+        assert all(
+            mod.status != ModuleStatus.LINKING for mod in registry.get_all().values()
+        )
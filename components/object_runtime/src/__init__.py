@@ -6,6 +6,7 @@ This module provides:
 - JSArray: JavaScript array extending JSObject
 - JSFunction: JavaScript function extending JSObject
 - JSString: JavaScript string extending JSObject
+- ConsString: Rope node for lazily concatenated strings
 - Built-in prototype factory functions
 
 Public API:
@@ -14,6 +15,7 @@ Public API:
         - JSArray: JavaScript array class
         - JSFunction: JavaScript function class
         - JSString: JavaScript string class
+        - ConsString: Lazily concatenated (rope) string
 
     Functions:
         - CreateObjectPrototype: Create Object.prototype
@@ -46,6 +48,7 @@ from .js_object import JSObject, UNDEFINED_VALUE
 from .js_array import JSArray
 from .js_function import JSFunction
 from .js_string import JSString
+from .cons_string import ConsString, Concat, Flatten
 from .object_constructor import ObjectConstructor, Object
 
 # Export prototype factory functions
@@ -61,11 +64,14 @@ __all__ = [
     "JSArray",
     "JSFunction",
     "JSString",
+    "ConsString",
     "ObjectConstructor",
     "Object",
     # Constants
     "UNDEFINED_VALUE",
     # Factory functions
+    "Concat",
+    "Flatten",
     "CreateObjectPrototype",
     "CreateArrayPrototype",
     "CreateFunctionPrototype",
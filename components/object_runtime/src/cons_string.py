@@ -0,0 +1,306 @@
+"""
+ConsString - rope representation for concatenated JavaScript strings.
+
+Concatenating two strings copies both, so a loop that appends to a string
+copies O(n^2) characters in total. Concat() instead returns a ConsString,
+an immutable tree node that records its two halves. The characters are
+copied once, when the string is first flattened: on indexed access,
+comparison, hashing or conversion with str().
+
+Two node shapes cover the common patterns:
+
+- Appending a flat string (``s = s + piece``, template literals) extends a
+  shared parts list in O(1); the previous string keeps its own prefix
+  count, so it stays valid
+- Any other concatenation builds a binary node; these are kept
+  height-balanced (AVL join), so prepending or mixing is O(log n). An
+  appended node taking part in such a join is first rebuilt as a balanced
+  tree of its parts
+
+Flattening walks the rope with an explicit stack, so deep ropes do not
+hit the Python recursion limit.
+"""
+
+from typing import Union
+
+# Results shorter than this are built eagerly as flat strings
+CONS_MIN_LENGTH = 13
+
+# Adjacent flat pieces are merged while the merged leaf stays this short
+LEAF_MERGE_LENGTH = 256
+
+
+class ConsString:
+    """
+    Lazy concatenation of two strings.
+
+    Behaves like an immutable str for len(), indexing, slicing, ==, <,
+    hashing (equal to the flat string's hash, so it finds str dict keys)
+    and str(). Everything except len() flattens the rope first; the flat
+    result is cached and the children are released.
+
+    Attributes:
+        depth: Height of the tree (0 once flattened)
+
+    Example:
+        >>> s = Concat("Hello, ", "wonderful world")
+        >>> isinstance(s, ConsString)
+        True
+        >>> len(s)
+        22
+        >>> s == "Hello, wonderful world"
+        True
+    """
+
+    __slots__ = ("_left", "_right", "_parts", "_count", "_length", "depth", "_flat")
+
+    def __init__(self, left: Union[str, "ConsString"], right: Union[str, "ConsString"]):
+        """
+        Create a node joining left and right.
+
+        Prefer Concat(), which balances the tree and merges short pieces.
+
+        Args:
+            left: First part (str or ConsString)
+            right: Second part (str or ConsString)
+        """
+        self._left = left
+        self._right = right
+        self._parts = None
+        self._length = len(left) + len(right)
+        self.depth = max(_depth(left), _depth(right)) + 1
+        self._flat = None
+
+    @classmethod
+    def _appended(cls, parts: list, count: int, length: int, depth: int) -> "ConsString":
+        """Create a node for the first count entries of a shared parts list."""
+        node = cls.__new__(cls)
+        node._left = node._right = None
+        node._parts = parts
+        node._count = count
+        node._length = length
+        node.depth = depth
+        node._flat = None
+        return node
+
+    def is_flat(self) -> bool:
+        """True once the characters have been materialized."""
+        return self._flat is not None
+
+    def flatten(self) -> str:
+        """
+        Materialize the string.
+
+        Returns:
+            The concatenated characters as a str (computed once)
+        """
+        if self._flat is None:
+            parts = []
+            stack = [self]
+            while stack:
+                node = stack.pop()
+                if type(node) is str:
+                    parts.append(node)
+                elif node._flat is not None:
+                    parts.append(node._flat)
+                elif node._parts is not None:
+                    stack.extend(reversed(node._parts[:node._count]))
+                else:
+                    stack.append(node._right)
+                    stack.append(node._left)
+            self._flat = "".join(parts)
+            self._left = self._right = self._parts = None
+            self.depth = 0
+        return self._flat
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self.flatten()
+
+    def __repr__(self) -> str:
+        return f"ConsString({self.flatten()!r})"
+
+    def __getitem__(self, index):
+        return self.flatten()[index]
+
+    def __iter__(self):
+        return iter(self.flatten())
+
+    def __contains__(self, item) -> bool:
+        return str(item) in self.flatten()
+
+    def __hash__(self) -> int:
+        return hash(self.flatten())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (str, ConsString)):
+            if len(other) != self._length:
+                return False
+            return self.flatten() == str(other)
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, (str, ConsString)):
+            return self.flatten() < str(other)
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if isinstance(other, (str, ConsString)):
+            return self.flatten() <= str(other)
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if isinstance(other, (str, ConsString)):
+            return self.flatten() > str(other)
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if isinstance(other, (str, ConsString)):
+            return self.flatten() >= str(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, (str, ConsString)):
+            return Concat(self, other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, str):
+            return Concat(other, self)
+        return NotImplemented
+
+
+def _depth(node) -> int:
+    return 0 if type(node) is str else node.depth
+
+
+def _leaf(node):
+    """Use the flat string of an already-flattened node as a leaf."""
+    if type(node) is not str and node._flat is not None:
+        return node._flat
+    return node
+
+
+def _node(left, right):
+    """Join two subtrees whose heights differ by at most two, rotating if needed."""
+    left_depth = _depth(left)
+    right_depth = _depth(right)
+    if right_depth > left_depth + 1:
+        inner, outer = right._left, right._right
+        if _depth(inner) > _depth(outer):
+            # Right-left case: double rotation
+            return ConsString(ConsString(left, inner._left), ConsString(inner._right, outer))
+        return ConsString(ConsString(left, inner), outer)
+    if left_depth > right_depth + 1:
+        outer, inner = left._left, left._right
+        if _depth(inner) > _depth(outer):
+            # Left-right case: double rotation
+            return ConsString(ConsString(outer, inner._left), ConsString(inner._right, right))
+        return ConsString(outer, ConsString(inner, right))
+    return ConsString(left, right)
+
+
+def _tree(node):
+    """Get node as a leaf or a binary tree, rebuilding an appended node."""
+    node = _leaf(node)
+    if type(node) is str or node._parts is None:
+        return node
+    first, *rest = node._parts[:node._count]
+    # Later parts are flat pieces: merge runs of them into leaves, then
+    # join the leaves as a balanced tree
+    leaves = []
+    run = []
+    run_length = 0
+    for piece in rest:
+        if run and run_length + len(piece) > LEAF_MERGE_LENGTH:
+            leaves.append("".join(run))
+            run = []
+            run_length = 0
+        run.append(piece)
+        run_length += len(piece)
+    if run:
+        leaves.append("".join(run))
+    return _join(first, _balanced(leaves, 0, len(leaves)))
+
+
+def _balanced(leaves, start, end):
+    """Balanced tree over leaves[start:end] (which is not empty)."""
+    if end - start == 1:
+        return leaves[start]
+    middle = (start + end) // 2
+    return ConsString(_balanced(leaves, start, middle), _balanced(leaves, middle, end))
+
+
+def _join(left, right):
+    left = _tree(left)
+    right = _tree(right)
+    if type(left) is str and type(right) is str:
+        if len(left) + len(right) <= LEAF_MERGE_LENGTH:
+            return left + right
+        return ConsString(left, right)
+
+    left_depth = _depth(left)
+    right_depth = _depth(right)
+    if left_depth > right_depth + 1:
+        # Walk down the right spine of the taller tree (the append case)
+        return _node(_leaf(left._left), _join(left._right, right))
+    if right_depth > left_depth + 1:
+        return _node(_join(left, right._left), _leaf(right._right))
+    return ConsString(left, right)
+
+
+def Concat(left: Union[str, ConsString], right: Union[str, ConsString]) -> Union[str, ConsString]:
+    """
+    Concatenate two strings without copying their characters.
+
+    Args:
+        left: First string (str or ConsString)
+        right: Second string (str or ConsString)
+
+    Returns:
+        A flat str for short or trivial results, otherwise a balanced
+        ConsString
+    """
+    if not left:
+        return right
+    if not right:
+        return left
+    if len(left) + len(right) < CONS_MIN_LENGTH:
+        return str(left) + str(right)
+
+    if type(right) is str:
+        length = len(left) + len(right)
+        if type(left) is ConsString and left._parts is not None:
+            parts = left._parts
+            if left._count == len(parts):
+                # Nobody has appended past this string yet: share the list
+                parts.append(right)
+            else:
+                parts = parts[:left._count] + [right]
+            return ConsString._appended(parts, len(parts), length, left.depth)
+        left = _leaf(left)
+        if type(left) is str and len(left) + len(right) <= LEAF_MERGE_LENGTH:
+            return left + right
+        return ConsString._appended([left, right], 2, length, _depth(left) + 1)
+    return _join(left, right)
+
+
+def Flatten(value):
+    """
+    Get a flat str for a possibly-rope string value.
+
+    Args:
+        value: str, ConsString or any other value
+
+    Returns:
+        value.flatten() for a ConsString, otherwise value unchanged
+    """
+    if type(value) is ConsString:
+        return value.flatten()
+    return value
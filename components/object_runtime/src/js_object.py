@@ -7,6 +7,7 @@ object with properties and prototype chain support.
 
 from typing import Optional, Dict, List
 from components.memory_gc.src import HeapObject, GarbageCollector
+from components.shared_types.src.atoms import intern_key
 from components.value_system.src import Value
 
 
@@ -20,6 +21,9 @@ class JSObject(HeapObject):
 
     JSObject represents a JavaScript object with a dictionary-based
     property storage and support for prototype-based inheritance.
+    Property keys are stored interned (see shared_types.atoms), so lookups
+    with compiler-emitted names match by identity and all objects share
+    their key strings; dynamic keys are not added to the atom table.
 
     Attributes:
         _gc (GarbageCollector): Garbage collector managing this object
@@ -99,7 +103,11 @@ class JSObject(HeapObject):
             >>> obj.get_property("name").to_smi()
             42
         """
-        self._properties[key] = value
+        properties = self._properties
+        if key in properties:
+            properties[key] = value
+            return
+        properties[intern_key(key)] = value
 
         # Update size estimate
         self.size = 100 + len(self._properties) * 50
@@ -5,10 +5,11 @@ This module provides the JSString class which extends JSObject
 to implement JavaScript string semantics.
 """
 
-from typing import Optional
+from typing import Optional, Union
 from components.memory_gc.src import GarbageCollector
 from components.value_system.src import Value
 from .js_object import JSObject
+from .cons_string import ConsString, Concat
 
 
 class JSString(JSObject):
@@ -16,10 +17,11 @@ class JSString(JSObject):
     JavaScript string extending JSObject.
 
     JSString represents a JavaScript string with character access
-    and length property.
+    and length property. The value may be a ConsString rope (e.g. the
+    result of concat()); it is flattened on first character access.
 
     Attributes:
-        _value (str): The string value
+        _value (str | ConsString): The string value
 
     Example:
         >>> gc = GarbageCollector()
@@ -33,7 +35,10 @@ class JSString(JSObject):
     """
 
     def __init__(
-        self, gc: GarbageCollector, value: str, prototype: Optional[JSObject] = None
+        self,
+        gc: GarbageCollector,
+        value: Union[str, ConsString],
+        prototype: Optional[JSObject] = None,
     ):
         """
         Initialize JSString.
@@ -75,6 +80,8 @@ class JSString(JSObject):
             >>> s.get_value()
             'hello world'
         """
+        if type(self._value) is ConsString:
+            self._value = self._value.flatten()
         return self._value
 
     def length(self) -> int:
@@ -113,7 +120,7 @@ class JSString(JSObject):
         if index < 0 or index >= len(self._value):
             return ""
 
-        return self._value[index]
+        return self.get_value()[index]
 
     def is_well_formed(self) -> bool:
         """
@@ -140,18 +147,19 @@ class JSString(JSObject):
             >>> s.is_well_formed()
             False
         """
+        value = self.get_value()
         i = 0
-        while i < len(self._value):
-            code_point = ord(self._value[i])
+        while i < len(value):
+            code_point = ord(value[i])
 
             # Check if it's a high surrogate (0xD800-0xDBFF)
             if 0xD800 <= code_point <= 0xDBFF:
                 # High surrogate must be followed by low surrogate
-                if i + 1 >= len(self._value):
+                if i + 1 >= len(value):
                     # High surrogate at end of string (unpaired)
                     return False
 
-                next_code_point = ord(self._value[i + 1])
+                next_code_point = ord(value[i + 1])
                 # Check if next is low surrogate (0xDC00-0xDFFF)
                 if not (0xDC00 <= next_code_point <= 0xDFFF):
                     # High surrogate not followed by low surrogate (unpaired)
@@ -194,26 +202,27 @@ class JSString(JSObject):
             >>> s2.get_value()
             'test\ufffdend'
         """
+        value = self.get_value()
         result = []
         i = 0
 
-        while i < len(self._value):
-            code_point = ord(self._value[i])
+        while i < len(value):
+            code_point = ord(value[i])
 
             # Check if it's a high surrogate (0xD800-0xDBFF)
             if 0xD800 <= code_point <= 0xDBFF:
                 # High surrogate must be followed by low surrogate
-                if i + 1 >= len(self._value):
+                if i + 1 >= len(value):
                     # High surrogate at end of string (unpaired) - replace with U+FFFD
                     result.append("\uFFFD")
                     i += 1
                 else:
-                    next_code_point = ord(self._value[i + 1])
+                    next_code_point = ord(value[i + 1])
                     # Check if next is low surrogate (0xDC00-0xDFFF)
                     if 0xDC00 <= next_code_point <= 0xDFFF:
                         # Valid pair, keep both characters
-                        result.append(self._value[i])
-                        result.append(self._value[i + 1])
+                        result.append(value[i])
+                        result.append(value[i + 1])
                         i += 2
                     else:
                         # High surrogate not followed by low surrogate (unpaired)
@@ -226,8 +235,31 @@ class JSString(JSObject):
                 i += 1
             else:
                 # Regular character
-                result.append(self._value[i])
+                result.append(value[i])
                 i += 1
 
         # Create and return new JSString with the well-formed value
         return JSString(self._gc, "".join(result), self._prototype)
+
+    def concat(self, *others: "JSString") -> "JSString":
+        """
+        Concatenate strings without copying characters (String.prototype.concat).
+
+        The result holds a ConsString rope that is flattened on first
+        character access.
+
+        Args:
+            *others: Strings (JSString, str or ConsString) to append
+
+        Returns:
+            New JSString for the concatenation
+
+        Example:
+            >>> s = JSString(gc, "report: ").concat(JSString(gc, "ok"))
+            >>> s.get_value()
+            'report: ok'
+        """
+        value = self._value
+        for other in others:
+            value = Concat(value, other._value if isinstance(other, JSString) else other)
+        return JSString(self._gc, value, self._prototype)
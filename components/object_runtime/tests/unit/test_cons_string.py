@@ -0,0 +1,94 @@
+"""
+Unit tests for ConsString ropes.
+
+Tests lazy concatenation, flattening and balancing.
+"""
+
+import pytest
+
+from components.memory_gc.src import GarbageCollector
+from components.object_runtime.src import JSString
+from components.object_runtime.src.cons_string import Concat, ConsString, Flatten
+
+
+class TestConcat:
+    """Test Concat() results."""
+
+    def test_short_results_are_flat(self):
+        """Test short concatenations produce plain strings."""
+        assert Concat("ab", "cd") == "abcd"
+        assert type(Concat("ab", "cd")) is str
+        assert Concat("", "x") == "x"
+
+    def test_long_results_are_lazy(self):
+        """Test long concatenations produce a rope with the right length."""
+        rope = Concat("a" * 300, "b" * 300)
+
+        assert isinstance(rope, ConsString)
+        assert len(rope) == 600
+        assert not rope.is_flat()
+
+    def test_flatten_on_access(self):
+        """Test indexing, comparison and hashing flatten the rope once."""
+        rope = Concat("x" * 300, "y" * 300)
+
+        assert rope[300] == "y"
+        assert rope.is_flat()
+        assert rope == "x" * 300 + "y" * 300
+        assert {"x" * 300 + "y" * 300: 1}[rope] == 1
+        assert Flatten(rope) == str(rope)
+
+    def test_append_loop_keeps_earlier_versions(self):
+        """Test appending to an older version does not affect newer ones."""
+        base = Concat("a" * 300, "b")
+        first = Concat(base, "c")
+        second = Concat(base, "d")
+
+        assert str(first).endswith("bc")
+        assert str(second).endswith("bd")
+        assert str(base).endswith("b")
+
+    def test_prepend_loop_stays_balanced(self):
+        """Test repeated prepending keeps the tree depth logarithmic."""
+        rope = ""
+        expected = []
+        for i in range(2000):
+            piece = f"<{i:04d}>" * 40
+            rope = Concat(piece, rope)
+            expected.append(piece)
+
+        assert rope.depth <= 2 * (2000).bit_length()
+        assert str(rope) == "".join(reversed(expected))
+
+    def test_alternating_append_and_prepend_stays_balanced(self):
+        """Test mixing appends and prepends keeps the depth logarithmic and flattens."""
+        rope = "start-of-the-string"
+        for _ in range(3000):
+            rope = Concat(rope, "a")
+            rope = Concat("b", rope)
+
+        assert rope.depth <= 2 * (6000).bit_length()
+        assert str(rope) == "b" * 3000 + "start-of-the-string" + "a" * 3000
+
+    def test_flatten_deep_append_chain(self):
+        """Test flattening does not recurse into nested appended nodes."""
+        rope = "x" * 300
+        for _ in range(5000):
+            # Each append to an unbalanced binary node nests a parts list
+            rope = Concat(ConsString(rope, "y"), "z")
+
+        assert str(rope) == "x" * 300 + "yz" * 5000
+
+
+class TestJSStringConcat:
+    """Test JSString.concat with ropes."""
+
+    def test_concat_is_lazy(self):
+        """Test concat builds a rope that is flattened on character access."""
+        gc = GarbageCollector()
+        s = JSString(gc, "r" * 300).concat(JSString(gc, "s" * 300), "t")
+
+        assert s.length() == 601
+        assert isinstance(s._value, ConsString)
+        assert s.char_at(600) == "t"
+        assert s.get_value() == "r" * 300 + "s" * 300 + "t"
@@ -119,6 +119,40 @@ class TestJSObjectPrototypeChain:
 
         assert result.to_smi() == 2
 
+    def test_property_keys_are_stored_as_atoms(self):
+        """Test objects share one atomized key string per property name."""
+        from components.memory_gc.src import GarbageCollector
+        from components.value_system.src import Value
+        from js_object import JSObject
+
+        gc = GarbageCollector()
+        first = JSObject(gc)
+        second = JSObject(gc)
+
+        first.set_property("".join(["wid", "th"]), Value.from_smi(1))
+        second.set_property("".join(["wi", "dth"]), Value.from_smi(2))
+
+        (first_key,) = first._properties
+        (second_key,) = second._properties
+        assert first_key is second_key
+        assert second.get_property("width").to_smi() == 2
+
+    def test_dynamic_keys_do_not_grow_atom_table(self):
+        """Test runtime property keys are interned but not atomized."""
+        from components.memory_gc.src import GarbageCollector
+        from components.shared_types.src.atoms import ATOMS
+        from components.value_system.src import Value
+        from js_object import JSObject
+
+        obj = JSObject(GarbageCollector())
+        size = len(ATOMS)
+
+        for i in range(100):
+            obj.set_property(f"dynamicKey{i}", Value.from_smi(i))
+
+        assert len(ATOMS) == size
+        assert obj.get_property("dynamicKey7").to_smi() == 7
+
     def test_set_prototype(self):
         """Test setting prototype."""
         from components.memory_gc.src import GarbageCollector
@@ -18,6 +18,7 @@ Public API:
         - SpeculationManager: Guards and deoptimization
         - GraphColoringAllocator: Register allocation
         - OptimizingCodeGen: Code generation
+        - DeoptimizationExit: Raised by optimized code when a guard fails
 
     Data Classes:
         - IRGraph: IR graph structure
@@ -47,13 +48,16 @@ from .ir_nodes import (
     BranchNode,
     MergeNode,
 )
-from .ir_builder import IRBuilder, IRGraph, BasicBlock
+from .ir_builder import IRBuilder, IRGraph, BasicBlock, UnsupportedBytecodeError
 from .ssa_builder import SSABuilder, SSAGraph, DominatorTree
 
 # Optimizations
 from .optimizations.dce import DeadCodeEliminator
 from .optimizations.constant_folding import ConstantFolder
 
+# Code generation
+from .codegen import OptimizingCodeGen, DeoptimizationExit
+
 # Main compiler
 from .compiler import OptimizingJITCompiler, ProfilingData, OptimizedCode
 
@@ -75,12 +79,16 @@ __all__ = [
     "IRBuilder",
     "IRGraph",
     "BasicBlock",
+    "UnsupportedBytecodeError",
     "SSABuilder",
     "SSAGraph",
     "DominatorTree",
     # Optimizations
     "DeadCodeEliminator",
     "ConstantFolder",
+    # Code generation
+    "OptimizingCodeGen",
+    "DeoptimizationExit",
     # Main compiler
     "OptimizingJITCompiler",
     "ProfilingData",
@@ -0,0 +1,596 @@
+"""
+Optimizing Code Generation - Lowers optimized SSA IR to Python
+
+The optimizing tier's "machine code" is specialized Python source compiled
+with compile()/exec(). Lowering picks a representation per SSA value:
+
+- int: unboxed Smi payload (Smi arithmetic, guarded values, Smi phis);
+  boxed with Value.from_number(), so results that left the Smi range
+  become heap numbers
+- tagged: engine Value (parameters, loads, call results, string constants)
+- object: raw heap object behind a SHAPE_GUARD
+
+Guards compile to an inline check that raises DeoptimizationExit with the
+guard's frame state boxed back into Values; everything else assumes the
+speculation holds. Inlined calls are guarded on the callee's identity
+(CALL_TARGET_GUARD) and deoptimize to the call instruction itself. Control flow is a block dispatch loop: blocks with a
+single predecessor are emitted inline at their only edge, merge points and
+loop headers become dispatch cases, and phis are parallel assignments on
+the incoming edges.
+
+The generated function has the signature ``fn(runtime, frame_locals)``:
+runtime is the Interpreter (get_global, set_global, call_value, gc) and
+frame_locals the interpreter CallFrame's locals on entry (followed by its
+operand stack for an on-stack replacement entry).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from components.bytecode.src.feedback_vector import call_target, receiver_map
+from components.object_runtime.src import JSObject
+from components.value_system.src import ToBoolean, Value
+
+from .ir_builder import (
+    BasicBlock,
+    IRGraph,
+    RUNTIME_CALL,
+    RUNTIME_CREATE_OBJECT,
+    RUNTIME_LOAD_GLOBAL,
+    RUNTIME_LOAD_PROPERTY,
+    RUNTIME_STORE_GLOBAL,
+    UnsupportedBytecodeError,
+)
+from .ir_nodes import (
+    BinaryOpNode,
+    BranchNode,
+    CallNode,
+    ConstantNode,
+    IRNode,
+    LoadPropertyNode,
+    ParameterNode,
+    PhiNode,
+    ReturnNode,
+    StorePropertyNode,
+    UnaryOpNode,
+)
+from .optimizations.speculation_manager import GuardNode, GuardType
+
+
+# Value representations
+INT = "int"
+TAGGED = "tagged"
+OBJECT = "object"
+
+_COMPARISONS = {"EQ": "==", "NE": "!=", "LT": "<", "LE": "<=", "GT": ">", "GE": ">="}
+_ARITHMETIC = {"ADD": "+", "SUB": "-", "MUL": "*", "MOD": "%", "SHL": "<<", "AND": "&"}
+
+
+class DeoptimizationExit(Exception):
+    """
+    Raised by optimized code when a guard fails
+
+    Attributes:
+        deopt_id: Index of the failing deopt point (GeneratedCode.deopt_points)
+        values: Frame locals followed by the operand stack, as Values
+    """
+
+    def __init__(self, deopt_id: int, values: Any):
+        super().__init__(deopt_id)
+        self.deopt_id = deopt_id
+        self.values = values
+
+
+@dataclass
+class DeoptPoint:
+    """Interpreter state one guard deoptimizes to"""
+
+    deopt_id: int
+    bytecode_offset: int
+    local_count: int
+    stack_depth: int
+    guard_type: GuardType
+
+
+@dataclass
+class GeneratedCode:
+    """Output of OptimizingCodeGen.generate()"""
+
+    source: str
+    function: Callable
+    deopt_points: List[DeoptPoint] = field(default_factory=list)
+
+
+class OptimizingCodeGen:
+    """
+    Optimizing Code Generator
+
+    Lowers an optimized SSA graph (as built by IRBuilder.build_ir()) to a
+    Python function. Entry guards (GuardNodes on parameters without a
+    frame state, see SpeculationManager.insert_guards) are checked before
+    the first block and unbox the parameter for the whole function.
+    """
+
+    def generate(
+        self,
+        ir_graph: IRGraph,
+        local_count: int,
+        name: str = "optimized",
+        entry_offset: int = 0,
+        entry_stack_depth: int = 0,
+    ) -> GeneratedCode:
+        """
+        Generate a Python function for an IR graph
+
+        Args:
+            ir_graph: Optimized SSA graph
+            local_count: Interpreter frame locals (ParameterNode indices)
+            entry_offset: Bytecode offset the code is entered at (the loop
+                header for on-stack replacement); entry guards deopt there
+            entry_stack_depth: Operand stack slots passed after the locals
+                on entry (ParameterNodes local_count and up)
+            name: Function name used in the generated source
+
+        Returns:
+            GeneratedCode with source, compiled function and deopt points
+
+        Raises:
+            UnsupportedBytecodeError: If the graph contains nodes that
+                cannot be lowered
+        """
+        return _Lowering(
+            ir_graph, local_count, name, entry_offset, entry_stack_depth
+        ).run()
+
+
+class _Lowering:
+    """State of one OptimizingCodeGen.generate() call"""
+
+    def __init__(
+        self,
+        ir_graph: IRGraph,
+        local_count: int,
+        name: str,
+        entry_offset: int = 0,
+        entry_stack_depth: int = 0,
+    ):
+        self.graph = ir_graph
+        self.local_count = local_count
+        self.entry_offset = entry_offset
+        self.entry_stack_depth = entry_stack_depth
+        slot_count = local_count + entry_stack_depth
+        self.slot_count = slot_count
+        self.name = "".join(ch if ch.isalnum() else "_" for ch in name) or "optimized"
+        self.blocks: List[BasicBlock] = ir_graph.basic_blocks
+        self.placement: Dict[IRNode, BasicBlock] = {
+            node: block for block in self.blocks for node in block.nodes
+        }
+        self.namespace: Dict[str, Any] = {
+            "Value": Value,
+            "JSObject": JSObject,
+            "DeoptimizationExit": DeoptimizationExit,
+            "receiver_map": receiver_map,
+            "call_target": call_target,
+            "to_boolean": ToBoolean,
+        }
+        self.constant_names: Dict[Tuple[str, int], str] = {}
+        self.deopt_points: List[DeoptPoint] = []
+        self.lines: List[str] = []
+        self.emitted: Set[BasicBlock] = set()
+
+        # Parameters unboxed by an entry guard
+        self.entry_guards: List[GuardNode] = []
+        for node in ir_graph.nodes:
+            if (
+                isinstance(node, GuardNode)
+                and node.frame_state is None
+                and node not in self.placement
+                and node.guard_type == GuardType.TYPE_GUARD
+                and node.expected_type == "Smi"
+                and isinstance(node.inputs[0], ParameterNode)
+                and node.inputs[0].index < slot_count
+            ):
+                self.entry_guards.append(node)
+        self.smi_parameters = {guard.inputs[0] for guard in self.entry_guards}
+
+        self.rep: Dict[IRNode, str] = {}
+        self._compute_representations()
+        self.alias: Dict[IRNode, IRNode] = {}
+        self._compute_aliases()
+        self.inlined: Set[IRNode] = set()
+        self._compute_inlining()
+
+    # ------------------------------------------------------------------
+    # Analysis
+
+    def _base_rep(self, node: IRNode) -> str:
+        if isinstance(node, ConstantNode):
+            return INT if type(node.value) is int else TAGGED
+        if isinstance(node, ParameterNode):
+            return INT if node in self.smi_parameters else TAGGED
+        if isinstance(node, GuardNode):
+            if node.guard_type == GuardType.SHAPE_GUARD:
+                return OBJECT
+            return INT
+        if isinstance(node, (BinaryOpNode, UnaryOpNode)):
+            return INT
+        return TAGGED
+
+    def rep_of(self, node: IRNode) -> str:
+        rep = self.rep.get(node)
+        return rep if rep is not None else self._base_rep(node)
+
+    def _compute_representations(self):
+        phis = [node for block in self.blocks for node in block.nodes if isinstance(node, PhiNode)]
+        for phi in phis:
+            self.rep[phi] = INT  # Optimistic: Smi unless an input is not
+        changed = True
+        while changed:
+            changed = False
+            for phi in phis:
+                if self.rep[phi] == INT and any(
+                    self.rep_of(value) != INT for value in phi.inputs
+                ):
+                    self.rep[phi] = TAGGED
+                    changed = True
+
+    def _compute_aliases(self):
+        # A Smi type guard on a value that is already an int is a no-op
+        for block in self.blocks:
+            for node in block.nodes:
+                if (
+                    isinstance(node, GuardNode)
+                    and node.guard_type == GuardType.TYPE_GUARD
+                    and self.rep_of(node.inputs[0]) == INT
+                ):
+                    self.alias[node] = node.inputs[0]
+                elif isinstance(node, GuardNode) and node.guard_type in (
+                    GuardType.NONZERO_CHECK,
+                    GuardType.RANGE_GUARD,
+                    GuardType.CALL_TARGET_GUARD,
+                ):
+                    self.alias[node] = node.inputs[0]
+
+    def resolve(self, node: IRNode) -> IRNode:
+        while node in self.alias:
+            node = self.alias[node]
+        return node
+
+    def _compute_inlining(self):
+        # Pure int computations used exactly once, in the block that defines
+        # them, are emitted as an expression at that use
+        uses: Dict[IRNode, List[BasicBlock]] = {}
+        for block in self.blocks:
+            for node in block.nodes:
+                if isinstance(node, PhiNode):
+                    for index, value in enumerate(node.inputs):
+                        uses.setdefault(self.resolve(value), []).append(
+                            block.predecessors[index]
+                        )
+                    continue
+                if node in self.alias and not isinstance(node, GuardNode):
+                    continue
+                if isinstance(node, GuardNode) and node.guard_type == GuardType.TYPE_GUARD and node in self.alias:
+                    continue
+                inputs = node.inputs
+                if isinstance(node, GuardNode) and node.guard_type == GuardType.NONZERO_CHECK:
+                    inputs = inputs[1:]  # The divisor is tested in place
+                for value in inputs:
+                    uses.setdefault(self.resolve(value), []).append(block)
+        for guard in self.entry_guards:
+            for value in guard.inputs:
+                uses.setdefault(value, []).append(None)
+        for node, blocks in uses.items():
+            if (
+                isinstance(node, (BinaryOpNode, UnaryOpNode))
+                and len(blocks) == 1
+                and self.placement.get(node) is blocks[0]
+            ):
+                self.inlined.add(node)
+
+    # ------------------------------------------------------------------
+    # Expressions
+
+    def _constant(self, kind: str, value: Any) -> str:
+        key = (kind, id(value))
+        name = self.constant_names.get(key)
+        if name is None:
+            name = f"{kind}{len(self.constant_names)}"
+            self.constant_names[key] = name
+            self.namespace[name] = Value.from_object(value) if kind == "K" else value
+        return name
+
+    def expr(self, node: IRNode) -> str:
+        """Expression for node in its own representation"""
+        node = self.resolve(node)
+        if isinstance(node, ConstantNode):
+            if type(node.value) is int:
+                return repr(node.value)
+            if isinstance(node.value, str):
+                return self._constant("K", node.value)
+            return self._constant("C", node.value)
+        if node in self.inlined:
+            return f"({self._compute(node)})"
+        if node not in self.placement and not isinstance(node, (ParameterNode, PhiNode)):
+            if isinstance(node, (BinaryOpNode, UnaryOpNode)):
+                # Floating pure node (e.g. created by a pass without placement)
+                return f"({self._compute(node)})"
+            raise UnsupportedBytecodeError(f"Unscheduled node {node}")
+        return f"v{node.id}"
+
+    def tagged(self, node: IRNode) -> str:
+        """Expression for node as a Value"""
+        rep = self.rep_of(self.resolve(node))
+        code = self.expr(node)
+        if rep == INT:
+            return f"Value.from_number({code})"
+        if rep == OBJECT:
+            return f"Value.from_object({code})"
+        return code
+
+    def as_rep(self, node: IRNode, rep: str) -> str:
+        return self.expr(node) if rep == INT else self.tagged(node)
+
+    def condition(self, node: IRNode) -> str:
+        """Expression for node used as a branch condition"""
+        node = self.resolve(node)
+        if node in self.inlined and isinstance(node, BinaryOpNode):
+            left, right = (self.expr(value) for value in node.inputs)
+            if node.op in _COMPARISONS:
+                return f"{left} {_COMPARISONS[node.op]} {right}"
+            if node.op == "LAND":
+                return f"{left} and {right}"
+            if node.op == "LOR":
+                return f"{left} or {right}"
+        if node in self.inlined and isinstance(node, UnaryOpNode) and node.op == "NOT":
+            return f"not {self.expr(node.inputs[0])}"
+        if node in self.inlined and isinstance(node, UnaryOpNode) and node.op == "TO_BOOLEAN":
+            return self._to_boolean(node.inputs[0])
+        return self.expr(node)
+
+    def _to_boolean(self, node: IRNode) -> str:
+        """Truthiness of node: an int as it is, a tagged value through ToBoolean"""
+        if self.rep_of(self.resolve(node)) == INT:
+            return self.expr(node)
+        return f"to_boolean({self.tagged(node)})"
+
+    def _compute(self, node: IRNode) -> str:
+        """Right-hand side computing an int node"""
+        if isinstance(node, UnaryOpNode):
+            if node.op == "TO_BOOLEAN":
+                return f"1 if {self._to_boolean(node.inputs[0])} else 0"
+            operand = self.expr(node.inputs[0])
+            if node.op == "NEG":
+                return f"-{operand}"
+            if node.op == "NOT":
+                return f"0 if {operand} else 1"
+        elif isinstance(node, BinaryOpNode):
+            left, right = (self.expr(value) for value in node.inputs)
+            op = node.op
+            if op in _ARITHMETIC:
+                return f"{left} {_ARITHMETIC[op]} {right}"
+            if op in _COMPARISONS:
+                return f"1 if {left} {_COMPARISONS[op]} {right} else 0"
+            if op == "DIV":
+                # Guarded to be exact with a positive divisor
+                return f"{left} // {right}"
+            if op == "SHR":
+                # Rounds toward zero like the DIV it was reduced from
+                return f"{left} >> {right} if {left} >= 0 else -(-{left} >> {right})"
+            if op == "LAND":
+                return f"1 if {left} and {right} else 0"
+            if op == "LOR":
+                return f"1 if {left} or {right} else 0"
+        raise UnsupportedBytecodeError(f"Cannot lower {node}")
+
+    # ------------------------------------------------------------------
+    # Statements
+
+    def _deopt(self, guard: GuardNode) -> str:
+        state = guard.frame_state
+        deopt_id = len(self.deopt_points)
+        self.deopt_points.append(
+            DeoptPoint(
+                deopt_id,
+                state.bytecode_offset,
+                state.local_count,
+                state.stack_depth,
+                guard.guard_type,
+            )
+        )
+        values = ", ".join(self.tagged(value) for value in guard.state_values)
+        if len(guard.state_values) == 1:
+            values += ","
+        return f"raise DeoptimizationExit({deopt_id}, ({values}))"
+
+    def _emit_node(self, node: IRNode, indent: str):
+        out = self.lines.append
+        if isinstance(node, (ConstantNode, ParameterNode, PhiNode)) or node in self.inlined:
+            return
+        name = f"v{node.id}"
+
+        if isinstance(node, GuardNode):
+            value = self.expr(node.inputs[0])
+            if node.guard_type == GuardType.NONZERO_CHECK:
+                out(f"{indent}if not {value}: {self._deopt(node)}")
+            elif node.guard_type == GuardType.RANGE_GUARD:
+                bounds = [
+                    f"{bound} {comparison} {value}"
+                    for bound, comparison in ((node.min_value, "<="), (node.max_value, ">="))
+                    if bound is not None
+                ]
+                out(f"{indent}if not ({' and '.join(bounds)}): {self._deopt(node)}")
+            elif node.guard_type == GuardType.DEOPTIMIZE:
+                out(f"{indent}{self._deopt(node)}")
+            elif node.guard_type == GuardType.CALL_TARGET_GUARD:
+                callee = self.tagged(node.inputs[0])
+                expected = self._constant("C", node.expected_target)
+                out(
+                    f"{indent}if {callee}.__class__ is not Value or {callee}._raw & 3 != 1 "
+                    f"or call_target({callee}.to_object()) is not {expected}:"
+                )
+                out(f"{indent}    {self._deopt(node)}")
+            elif node in self.alias:
+                return
+            elif node.guard_type == GuardType.TYPE_GUARD:
+                out(f"{indent}if {value}.__class__ is not Value or {value}._raw & 3:")
+                out(f"{indent}    {self._deopt(node)}")
+                out(f"{indent}{name} = {value}._raw >> 2")
+            elif node.guard_type == GuardType.SHAPE_GUARD:
+                expected = self._constant("M", node.expected_shape)
+                out(
+                    f"{indent}if {value}.__class__ is not Value or {value}._raw & 3 != 1 "
+                    f"or receiver_map({name} := {value}.to_object()) is not {expected}:"
+                )
+                out(f"{indent}    {self._deopt(node)}")
+            else:
+                raise UnsupportedBytecodeError(f"Cannot lower {node}")
+        elif isinstance(node, (BinaryOpNode, UnaryOpNode)):
+            out(f"{indent}{name} = {self._compute(node)}")
+        elif isinstance(node, LoadPropertyNode):
+            receiver = node.inputs[0]
+            key = self._constant("C", node.property_name)
+            if self.rep_of(self.resolve(receiver)) == OBJECT:
+                obj = self.expr(receiver)
+                shape = getattr(self.resolve(receiver), "expected_shape", None)
+                if getattr(shape, "get_property", None) is JSObject.get_property:
+                    # Own property hit without the method call
+                    out(f"{indent}{name} = {obj}._properties.get({key}) or {obj}.get_property({key})")
+                else:
+                    out(f"{indent}{name} = {obj}.get_property({key})")
+            else:
+                out(f"{indent}{name} = {self.tagged(receiver)}.to_object().get_property({key})")
+        elif isinstance(node, StorePropertyNode):
+            receiver, value = node.inputs
+            key = self._constant("C", node.property_name)
+            if self.rep_of(self.resolve(receiver)) == OBJECT:
+                obj = self.expr(receiver)
+            else:
+                obj = f"{self.tagged(receiver)}.to_object()"
+            out(f"{indent}{obj}.set_property({key}, {self.tagged(value)})")
+        elif isinstance(node, CallNode):
+            out(f"{indent}{self._runtime_call(node, name)}")
+        elif isinstance(node, ReturnNode):
+            value = self.tagged(node.inputs[0]) if node.inputs else "Value(0)"
+            out(f"{indent}return {value}")
+        elif isinstance(node, BranchNode):
+            pass  # Emitted by _emit_block
+        else:
+            raise UnsupportedBytecodeError(f"Cannot lower {node}")
+
+    def _runtime_call(self, node: CallNode, name: str) -> str:
+        function = node.inputs[0]
+        kind = function.value if isinstance(function, ConstantNode) else None
+        args = node.inputs[1:]
+        if kind == RUNTIME_CALL:
+            callee = self.tagged(args[0])
+            arguments = ", ".join(self.tagged(arg) for arg in args[1:])
+            return f"{name} = runtime.call_value({callee}, [{arguments}])"
+        if kind == RUNTIME_LOAD_GLOBAL:
+            return f"{name} = runtime.get_global({self._constant('C', args[0].value)})"
+        if kind == RUNTIME_STORE_GLOBAL:
+            global_name = self._constant("C", args[0].value)
+            return f"runtime.set_global({global_name}, {self.tagged(args[1])})"
+        if kind == RUNTIME_CREATE_OBJECT:
+            return f"{name} = Value.from_object(JSObject(runtime.gc))"
+        if kind == RUNTIME_LOAD_PROPERTY:
+            key = self._constant("C", args[1].value)
+            return f"{name} = {self.tagged(args[0])}.to_object().get_property({key})"
+        raise UnsupportedBytecodeError(f"Cannot lower {node}")
+
+    def _emit_block(self, block: BasicBlock, indent: str):
+        self.emitted.add(block)
+        terminator = None
+        for node in block.nodes:
+            if isinstance(node, (BranchNode, ReturnNode)):
+                terminator = node
+            self._emit_node(node, indent)
+            if isinstance(node, ReturnNode) or (
+                isinstance(node, GuardNode) and node.guard_type == GuardType.DEOPTIMIZE
+            ):
+                return
+
+        if isinstance(terminator, BranchNode) and terminator.if_true is not terminator.if_false:
+            self.lines.append(f"{indent}if {self.condition(terminator.inputs[0])}:")
+            self._emit_edge(block, terminator.if_true, indent + "    ")
+            # The true path ends in return/continue, so no else is needed
+            self._emit_edge(block, terminator.if_false, indent)
+        elif block.successors:
+            self._emit_edge(block, block.successors[0], indent)
+        else:
+            raise UnsupportedBytecodeError(f"Block {block.id} has no terminator")
+
+    def _emit_edge(self, source: BasicBlock, target: BasicBlock, indent: str):
+        phis = [node for node in target.nodes if isinstance(node, PhiNode)]
+        if phis:
+            position = target.predecessors.index(source)
+            names = ", ".join(f"v{phi.id}" for phi in phis)
+            values = ", ".join(
+                self.as_rep(phi.inputs[position], self.rep[phi]) for phi in phis
+            )
+            self.lines.append(f"{indent}{names} = {values}")
+        if len(target.predecessors) == 1 and target not in self.emitted:
+            self._emit_block(target, indent)
+        else:
+            self.lines.append(f"{indent}block = {target.id}")
+            self.lines.append(f"{indent}continue")
+
+    # ------------------------------------------------------------------
+
+    def run(self) -> GeneratedCode:
+        out = self.lines.append
+        out(f"def {self.name}(runtime, frame_locals):")
+        if self.slot_count:
+            params = {
+                node.index: node for node in self.graph.nodes if isinstance(node, ParameterNode)
+            }
+            names = [
+                f"v{params[index].id}" if index in params else "_"
+                for index in range(self.slot_count)
+            ]
+            out(f"    {', '.join(names)}, = frame_locals")
+
+        for guard in self.entry_guards:
+            value = f"v{guard.inputs[0].id}"
+            deopt_id = len(self.deopt_points)
+            self.deopt_points.append(
+                DeoptPoint(
+                    deopt_id,
+                    self.entry_offset,
+                    self.local_count,
+                    self.entry_stack_depth,
+                    guard.guard_type,
+                )
+            )
+            out(f"    if {value}.__class__ is not Value or {value}._raw & 3:")
+            out(f"        raise DeoptimizationExit({deopt_id}, tuple(frame_locals))")
+        for guard in self.entry_guards:
+            value = f"v{guard.inputs[0].id}"
+            out(f"    {value} = {value}._raw >> 2")
+
+        dispatch = [block for block in self.blocks if len(block.predecessors) > 1]
+        if not dispatch:
+            self._emit_block(self.graph.entry, "    ")
+        else:
+            # Loop headers (targets of back edges) first, innermost first;
+            # the entry block runs once and goes last
+            position = {block: index for index, block in enumerate(self.blocks)}
+            headers = [
+                block
+                for block in dispatch
+                if any(position[pred] >= position[block] for pred in block.predecessors)
+            ]
+            ordered = sorted(headers, key=lambda block: -position[block]) + [
+                block for block in dispatch if block not in headers
+            ]
+            ordered.append(self.graph.entry)
+            out(f"    block = {self.graph.entry.id}")
+            out("    while True:")
+            for block in ordered:
+                out(f"        if block == {block.id}:")
+                self._emit_block(block, "            ")
+
+        source = "\n".join(self.lines) + "\n"
+        code = compile(source, f"<optimized {self.name}>", "exec")
+        exec(code, self.namespace)
+        return GeneratedCode(source, self.namespace[self.name], self.deopt_points)
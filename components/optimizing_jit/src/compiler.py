@@ -2,7 +2,7 @@
 Optimizing JIT Compiler - Main compiler class
 """
 
-from typing import Optional, Any
+from typing import Any, Callable, Optional
 from dataclasses import dataclass
 
 
@@ -17,6 +17,8 @@ class ProfilingData:
     type_feedback: dict = None  # Bytecode offset -> type info
     call_targets: dict = None  # Call site -> target distribution
     branch_frequencies: dict = None  # Branch -> taken frequency
+    parameter_types: dict = None  # Parameter index -> type info
+    invocation_count: int = 0
 
     def __post_init__(self):
         if self.type_feedback is None:
@@ -25,6 +27,44 @@ class ProfilingData:
             self.call_targets = {}
         if self.branch_frequencies is None:
             self.branch_frequencies = {}
+        if self.parameter_types is None:
+            self.parameter_types = {}
+
+    @classmethod
+    def from_feedback(cls, feedback: Any) -> "ProfilingData":
+        """
+        Build profiling data from an interpreter FeedbackVector
+
+        Arithmetic sites map to {"type", "types"} and property sites to
+        {"shape", "shapes", "megamorphic"} in type_feedback; "type" and
+        "shape" are None unless the site is monomorphic. Parameter types
+        use the same format, keyed by parameter index, which is what
+        SpeculationManager.insert_guards() reads as its type_feedback.
+
+        Args:
+            feedback: FeedbackVector (see bytecode.feedback_vector)
+
+        Returns:
+            ProfilingData snapshot of the vector
+        """
+        data = feedback.dump()
+        profile = cls(
+            parameter_types=data["parameters"],
+            invocation_count=data["invocation_count"],
+        )
+        for offset, info in data["slots"].items():
+            kind = info.pop("kind")
+            if kind == "call":
+                profile.call_targets[offset] = info
+            elif kind == "branch":
+                taken = info["taken"]
+                profile.branch_frequencies[offset] = taken / (taken + info["not_taken"])
+            elif kind == "global":
+                # Cached property cells belong to one realm: nothing to speculate on
+                continue
+            else:
+                profile.type_feedback[offset] = info
+        return profile
 
 
 @dataclass
@@ -35,10 +75,11 @@ class OptimizedCode:
     Result of optimizing JIT compilation.
     """
 
-    code: bytes  # Machine code
+    code: bytes  # Machine code (generated source for the Python backend)
     entry_point: int  # Entry point offset
-    deopt_info: list  # Deoptimization metadata
+    deopt_info: Any  # Deoptimization metadata (deopt id -> DeoptInfo)
     guards: list  # Guard instructions
+    function: Optional[Callable] = None  # Compiled entry: function(runtime, frame_locals)
 
     def __post_init__(self):
         if self.deopt_info is None:
@@ -89,72 +130,138 @@ class OptimizingJITCompiler:
 
     def compile_function(
         self, bytecode: Any, profiling_data: Optional[ProfilingData] = None
-    ) -> OptimizedCode:
+    ) -> Optional[OptimizedCode]:
         """
         Compile bytecode with aggressive optimizations
 
         Pipeline:
-        1. Build IR from bytecode
+        1. Build IR from bytecode, speculating on its type feedback and
+           inlining small callees of monomorphic call sites
         2. Convert to SSA form
         3. Apply optimizations:
-           - Dead code elimination
            - Constant folding
-           - Loop optimization (LICM, unrolling)
+           - Dead code elimination
+           - Loop optimization (LICM)
            - Escape analysis
            - Scalar replacement
-        4. Register allocation
-        5. Code generation
+           - Strength reduction
+           - Range analysis and bounds check elimination
+        4. Insert parameter guards from profiling data
+        5. Code generation (OptimizingCodeGen)
 
         Args:
-            bytecode: Bytecode to compile
+            bytecode: BytecodeArray to compile
             profiling_data: Type feedback and profiling info
 
         Returns:
-            Optimized machine code
+            Optimized code, or None if the bytecode uses operations the
+            optimizing tier does not handle
         """
-        if profiling_data is None:
-            profiling_data = ProfilingData()
-
-        # Phase 1: IR construction
-        # ir_graph = self.ir_builder.build_ir(bytecode, profiling_data)
-
-        # Phase 2: SSA conversion
-        # ssa_graph = self.ssa_builder.build_ssa(ir_graph)
-
-        # Phase 3: Optimizations
-        # Classic optimizations
-        # ssa_graph = self.constant_folder.fold(ssa_graph)
-        # ssa_graph = self.dce.eliminate(ssa_graph)
-
-        # Loop optimizations (LICM, unrolling)
-        # ssa_graph = self.loop_optimizer.optimize(ssa_graph)
+        return self._compile(bytecode, profiling_data)
+
+    def compile_osr(
+        self,
+        bytecode: Any,
+        bytecode_offset: int,
+        stack_depth: int = 0,
+        profiling_data: Optional[ProfilingData] = None,
+    ) -> Optional[OptimizedCode]:
+        """
+        Compile an on-stack replacement entry at a loop header
 
-        # Escape analysis and scalar replacement
-        # escape_info = self.escape_analyzer.analyze(ssa_graph)
-        # ssa_graph = self.scalar_replacement.replace(ssa_graph, escape_info)
+        Same pipeline as compile_function(), but the code starts at
+        bytecode_offset and its function takes the interpreter frame's
+        locals followed by its operand stack, so a running interpreter
+        frame can continue in it. profiling_data.parameter_types describes
+        those frame slots (locals, then stack) at entry. Code after the
+        loop that cannot be compiled deoptimizes back to the interpreter.
 
-        # New Phase 4 optimizations
-        # ssa_graph = self.strength_reducer.reduce(ssa_graph)
-        # range_info = self.range_analyzer.analyze(ssa_graph)
-        # ssa_graph = self.bounds_check_eliminator.eliminate_checks(ssa_graph, range_info)
+        Args:
+            bytecode: BytecodeArray containing the loop
+            bytecode_offset: Offset of the loop header
+            stack_depth: Operand stack depth at the loop header
+            profiling_data: Type feedback and entry slot types
 
-        # Speculation and guards
-        # ssa_graph, guards = self.speculation_manager.insert_guards(ssa_graph, profiling_data.__dict__)
-        # deopt_info = self.speculation_manager.generate_deopt_metadata(guards, bytecode_offset=0)
+        Returns:
+            Optimized code, or None if the loop cannot be compiled
+        """
+        return self._compile(bytecode, profiling_data, bytecode_offset, stack_depth)
+
+    def _compile(
+        self,
+        bytecode: Any,
+        profiling_data: Optional[ProfilingData],
+        osr_offset: Optional[int] = None,
+        osr_stack_depth: int = 0,
+    ) -> Optional[OptimizedCode]:
+        from components.deoptimization.src import DeoptInfo, ValueLocation
+        from .codegen import OptimizingCodeGen
+        from .ir_builder import UnsupportedBytecodeError
 
-        # Phase 5: Register allocation
-        # (Not yet implemented)
+        if profiling_data is None:
+            profiling_data = ProfilingData()
 
-        # Phase 6: Code generation
-        # (Not yet implemented)
+        try:
+            # Phase 1: IR construction
+            ir_graph = self.ir_builder.build_ir(
+                bytecode, profiling_data, osr_offset, osr_stack_depth
+            )
+
+            # Phase 2: SSA conversion
+            ssa_graph = self.ssa_builder.build_ssa(ir_graph)
+
+            # Phase 3: Optimizations
+            ssa_graph = self.constant_folder.fold(ssa_graph)
+            ssa_graph = self.dce.eliminate(ssa_graph)
+            ssa_graph = self.loop_optimizer.optimize(ssa_graph)
+            escape_info = self.escape_analyzer.analyze(ssa_graph)
+            ssa_graph = self.scalar_replacement.replace(ssa_graph, escape_info)
+            ssa_graph = self.strength_reducer.reduce(ssa_graph)
+            range_info = self.range_analyzer.analyze(ssa_graph)
+            ssa_graph = self.bounds_check_eliminator.eliminate_checks(ssa_graph, range_info)
+            ssa_graph = self.dce.eliminate(ssa_graph)
+
+            # Phase 4: Speculation on parameter types
+            ssa_graph, guards = self.speculation_manager.insert_guards(
+                ssa_graph, {"type_feedback": profiling_data.parameter_types}
+            )
+
+            # Phase 5: Code generation
+            generated = OptimizingCodeGen().generate(
+                ssa_graph,
+                bytecode.local_count,
+                name=bytecode.name or "optimized",
+                entry_offset=osr_offset or 0,
+                entry_stack_depth=osr_stack_depth,
+            )
+        except (UnsupportedBytecodeError, SyntaxError, RecursionError):
+            return None
+
+        local_count = bytecode.local_count
+        deopt_info = {}
+        for point in generated.deopt_points:
+            value_map = {
+                f"local{index}": ValueLocation("stack", index, "tagged")
+                for index in range(point.local_count)
+            }
+            stack_map = [f"stack{index}" for index in range(point.stack_depth)]
+            for index, name in enumerate(stack_map):
+                value_map[name] = ValueLocation("stack", local_count + index, "tagged")
+            deopt_info[point.deopt_id] = DeoptInfo(
+                deopt_id=point.deopt_id,
+                bytecode_offset=point.bytecode_offset,
+                value_map=value_map,
+                frame_size=point.local_count + point.stack_depth,
+                reason=_deopt_reason(point.guard_type),
+                stack_map=stack_map,
+            )
 
-        # For now, return placeholder optimized code
-        # In the future, this will contain actual machine code
         return OptimizedCode(
-            code=b"",  # Placeholder machine code
+            code=generated.source.encode(),
             entry_point=0,
-            deopt_info=[],  # Will contain deopt_info from speculation manager
-            guards=[],  # Will contain guards from speculation manager
+            deopt_info=deopt_info,
+            guards=guards,
+            function=generated.function,
         )
 
     def should_optimize(
@@ -181,3 +288,21 @@ class OptimizingJITCompiler:
         HOT_TIME_MS = 100.0
 
         return call_count >= HOT_CALL_COUNT or baseline_time >= HOT_TIME_MS
+
+
+def _deopt_reason(guard_type: Any) -> Any:
+    """Map a speculation guard type to the deoptimization reason it reports"""
+    from components.deoptimization.src import DeoptReason
+    from .optimizations.speculation_manager import GuardType
+
+    if guard_type == GuardType.SHAPE_GUARD:
+        return DeoptReason.SHAPE_MISMATCH
+    if guard_type == GuardType.NONZERO_CHECK:
+        return DeoptReason.DIV_BY_ZERO
+    if guard_type == GuardType.RANGE_GUARD:
+        return DeoptReason.OVERFLOW
+    if guard_type == GuardType.DEOPTIMIZE:
+        return DeoptReason.ASSUMPTION_VIOLATED
+    if guard_type == GuardType.CALL_TARGET_GUARD:
+        return DeoptReason.IC_MISS
+    return DeoptReason.TYPE_MISMATCH
@@ -2,9 +2,14 @@
 IR Builder - Builds high-level IR from bytecode
 
 Constructs a sea-of-nodes intermediate representation with control flow graph.
+IRBuilder.build_ir() translates a BytecodeArray, speculating on the type
+feedback the interpreter collected in it.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from components.value_system.src import Value
+
 from .ir_nodes import (
     IRNode,
     ConstantNode,
@@ -20,6 +25,22 @@ from .ir_nodes import (
 )
 
 
+def _constant_value(value: Any) -> Any:
+    """
+    Constant pool entry as the interpreter loads it
+
+    Returns:
+        int for Smis, the string for strings, 0 for other constants, None
+        for heap numbers (which the optimizing tier does not represent)
+    """
+    if isinstance(value, (int, float)):
+        number = Value.from_number(value)
+        return number.to_smi() if number.is_smi() else None
+    if isinstance(value, str):
+        return value
+    return 0  # Interpreter loads other constants as undefined
+
+
 class BasicBlock:
     """
     Basic block in control flow graph
@@ -40,6 +61,7 @@ class BasicBlock:
             block_id: Unique identifier for this block
         """
         self.id = block_id
+        self.bytecode_offset: Optional[int] = None  # First instruction (build_ir)
         self.nodes: List[IRNode] = []
         self.predecessors: List["BasicBlock"] = []
         self.successors: List["BasicBlock"] = []
@@ -127,6 +149,21 @@ class IRGraph:
         return f"IRGraph(nodes={len(self.nodes)}, blocks={len(self.basic_blocks)})"
 
 
+class UnsupportedBytecodeError(Exception):
+    """Raised by IRBuilder.build_ir() for bytecode it cannot translate"""
+
+
+# Runtime functions called through CallNode(ConstantNode(name), args)
+RUNTIME_CALL = "call"  # args: function, *arguments
+RUNTIME_LOAD_GLOBAL = "load_global"  # args: ConstantNode(name)
+RUNTIME_STORE_GLOBAL = "store_global"  # args: ConstantNode(name), value
+RUNTIME_CREATE_OBJECT = "create_object"  # args: none
+RUNTIME_LOAD_PROPERTY = "load_property"  # args: object, ConstantNode(key)
+
+# Largest callee (in instructions) inlined at a monomorphic call site
+MAX_INLINED_INSTRUCTIONS = 24
+
+
 class IRBuilder:
     """
     IR Builder - Constructs IR graphs from bytecode
@@ -137,11 +174,68 @@ class IRBuilder:
 
     def __init__(self):
         """Create a new IR builder"""
+        self._reset()
+
+    def _reset(self):
+        """Forget blocks and nodes of a previous graph"""
         self.current_block: Optional[BasicBlock] = None
         self._block_counter = 0
         self._all_blocks: List[BasicBlock] = []
         self._all_nodes: List[IRNode] = []
 
+    def build_ir(
+        self, bytecode, profiling_data=None, osr_offset=None, osr_stack_depth=0
+    ) -> IRGraph:
+        """
+        Build an IR graph from a BytecodeArray
+
+        Basic blocks start at jump targets and after jumps and returns;
+        unreachable blocks are dropped. Locals and operand stack slots are
+        renamed to SSA values while walking the blocks (Braun et al.), so
+        the graph is already in SSA form with phis aligned to each block's
+        predecessors.
+
+        Arithmetic, comparisons and conditions speculate on Smi operands:
+        the operands go through TYPE_GUARD GuardNodes that carry the frame
+        state of the instruction, so a failed guard can resume the
+        interpreter right before it. Property accesses whose feedback saw
+        a single receiver map guard that map (SHAPE_GUARD). Instructions
+        whose feedback saw non-Smi operands, or opcodes without a
+        translation, raise UnsupportedBytecodeError.
+
+        A synthetic entry block holds one ParameterNode per frame local
+        (the arguments fill the first ones, the rest start as None).
+
+        With osr_offset the graph is an on-stack replacement entry: it
+        starts at that loop header, with ParameterNodes for the frame's
+        locals followed by its osr_stack_depth operand stack slots, and
+        only the code reachable from there is translated. Opcodes without
+        a translation then become DEOPTIMIZE guards that hand the frame
+        back to the interpreter instead of failing the whole compile.
+
+        Call sites whose feedback saw a single small bytecode function are
+        inlined (see _inline_target()): a CALL_TARGET_GUARD checks the
+        callee, and guards inside the inlined body resume the interpreter
+        at the call instruction.
+
+        Args:
+            bytecode: BytecodeArray to translate; its FeedbackVector (if
+                any) drives speculation
+            profiling_data: Unused here; parameter speculation is done by
+                SpeculationManager.insert_guards()
+            osr_offset: Bytecode offset of the loop header to enter at
+                (None: enter at offset 0)
+            osr_stack_depth: Operand stack depth at osr_offset
+
+        Returns:
+            IR graph (entry: synthetic entry block, exit: None)
+
+        Raises:
+            UnsupportedBytecodeError: If the bytecode cannot be translated
+        """
+        self._reset()
+        return _BytecodeTranslator(self, bytecode, osr_offset, osr_stack_depth).translate()
+
     def create_basic_block(self) -> BasicBlock:
         """
         Create a new basic block
@@ -343,3 +437,666 @@ class IRBuilder:
         graph.set_exit(exit)
 
         return graph
+
+
+class _BytecodeTranslator:
+    """Bytecode to SSA IR translation behind IRBuilder.build_ir()"""
+
+    def __init__(self, builder: IRBuilder, bytecode, osr_offset=None, osr_stack_depth=0):
+        from components.bytecode.src import Opcode
+        from components.bytecode.src.feedback_vector import TYPE_SMI
+
+        self.builder = builder
+        self.bytecode = bytecode
+        self.instructions = bytecode.instructions
+        self.local_count = bytecode.local_count
+        self.entry_offset = osr_offset if osr_offset is not None else 0
+        self.entry_depth = osr_stack_depth
+        self.allow_exits = osr_offset is not None
+        self.exits = set()
+        feedback = bytecode.feedback
+        self.slots = feedback.slots if feedback is not None else None
+        self.Opcode = Opcode
+        self.smi_types = TYPE_SMI
+        self.binary_ops, self.translatable = _opcode_tables(Opcode)
+
+        self.current_def: Dict[BasicBlock, Dict[Tuple[str, int], IRNode]] = {}
+        self.incomplete_phis: Dict[BasicBlock, Dict[Tuple[str, int], PhiNode]] = {}
+        self.sealed = set()
+        self.filled = set()
+        self.phis: List[PhiNode] = []
+        self.phi_block: Dict[PhiNode, BasicBlock] = {}
+        self.guarded: Dict[Tuple[IRNode, str], IRNode] = {}
+        # (frame state, state values) guards resume with inside an inlined call
+        self.inline_state = None
+
+    # ------------------------------------------------------------------
+    # Control flow graph
+
+    def translate(self) -> IRGraph:
+        instructions = self.instructions
+        count = len(instructions)
+        Opcode = self.Opcode
+        jumps = (Opcode.JUMP, Opcode.JUMP_IF_TRUE, Opcode.JUMP_IF_FALSE)
+
+        entry_offset = self.entry_offset
+        if not 0 <= entry_offset < count:
+            raise UnsupportedBytecodeError(f"Bad entry offset {entry_offset}")
+        leaders = {0, entry_offset}
+        for pc, instruction in enumerate(instructions):
+            opcode = instruction.opcode
+            if opcode not in self.translatable:
+                if not self.allow_exits:
+                    raise UnsupportedBytecodeError(f"{opcode.name} at offset {pc}")
+                # Leave to the interpreter here (see _fill)
+                self.exits.add(pc)
+                leaders.add(pc + 1)
+            elif opcode in jumps:
+                target = instruction.operand1
+                if not isinstance(target, int) or not 0 <= target <= count:
+                    raise UnsupportedBytecodeError(f"Bad jump target at offset {pc}")
+                leaders.add(target)
+                leaders.add(pc + 1)
+            elif opcode == Opcode.RETURN:
+                leaders.add(pc + 1)
+
+        starts = sorted(leaders)
+        ends = {start: end for start, end in zip(starts, starts[1:] + [count])}
+        ends[count] = count  # Falling off the end returns
+
+        def successors(start):
+            end = ends[start]
+            if start == end:
+                return []
+            if end - 1 in self.exits:
+                return []
+            last = instructions[end - 1]
+            if last.opcode == Opcode.JUMP:
+                return [last.operand1]
+            if last.opcode in jumps:
+                return [end, last.operand1]
+            if last.opcode == Opcode.RETURN:
+                return []
+            return [end]
+
+        # Reverse postorder of the reachable blocks
+        postorder = []
+        visited = {entry_offset}
+        stack = [(entry_offset, iter(successors(entry_offset)))]
+        while stack:
+            start, pending = stack[-1]
+            for succ in pending:
+                if succ not in visited:
+                    visited.add(succ)
+                    stack.append((succ, iter(successors(succ))))
+                    break
+            else:
+                stack.pop()
+                postorder.append(start)
+        order = postorder[::-1]
+
+        builder = self.builder
+        entry = builder.create_basic_block()
+        blocks = {}
+        for start in order:
+            block = builder.create_basic_block()
+            block.bytecode_offset = start
+            blocks[start] = block
+        entry.add_successor(blocks[entry_offset])
+        for start in order:
+            for succ in successors(start):
+                blocks[start].add_successor(blocks[succ])
+
+        # Frame locals (and, for OSR, operand stack) on entry
+        builder.set_current_block(entry)
+        self.current_def[entry] = {
+            ("l", index): builder.build_parameter(index)
+            for index in range(self.local_count)
+        }
+        for index in range(self.entry_depth):
+            self.current_def[entry][("s", index)] = builder.build_parameter(
+                self.local_count + index
+            )
+        self.sealed.add(entry)
+        self.filled.add(entry)
+        self._seal_ready(entry)
+
+        depth_in = {blocks[entry_offset]: self.entry_depth}
+        for start in order:
+            block = blocks[start]
+            stack_values = self._fill(block, start, ends[start], depth_in[block])
+            for succ in block.successors:
+                depth = depth_in.setdefault(succ, len(stack_values))
+                if depth != len(stack_values):
+                    raise UnsupportedBytecodeError(
+                        f"Stack depth mismatch entering offset {succ.bytecode_offset}"
+                    )
+            self.filled.add(block)
+            self._seal_ready(block)
+
+        self._remove_trivial_phis()
+        return builder.finalize(entry, None)
+
+    def _seal_ready(self, block: BasicBlock):
+        for succ in block.successors:
+            if succ not in self.sealed and all(
+                pred in self.filled for pred in succ.predecessors
+            ):
+                self._seal(succ)
+
+    # ------------------------------------------------------------------
+    # SSA renaming (Braun et al., "Simple and Efficient Construction of
+    # Static Single Assignment Form")
+
+    def _write(self, var, block: BasicBlock, value: IRNode):
+        self.current_def.setdefault(block, {})[var] = value
+
+    def _read(self, var, block: BasicBlock) -> IRNode:
+        value = self.current_def.get(block, {}).get(var)
+        if value is not None:
+            return value
+        if block not in self.sealed:
+            value = self._new_phi(block)
+            self.incomplete_phis.setdefault(block, {})[var] = value
+        elif len(block.predecessors) == 1:
+            value = self._read(var, block.predecessors[0])
+        elif not block.predecessors:
+            raise UnsupportedBytecodeError(f"{var} read before it is defined")
+        else:
+            value = self._new_phi(block)
+            self._write(var, block, value)
+            self._add_phi_operands(var, value, block)
+        self._write(var, block, value)
+        return value
+
+    def _new_phi(self, block: BasicBlock) -> PhiNode:
+        phi = PhiNode([])
+        position = 0
+        while position < len(block.nodes) and isinstance(block.nodes[position], PhiNode):
+            position += 1
+        block.nodes.insert(position, phi)
+        self.builder._all_nodes.append(phi)
+        self.phis.append(phi)
+        self.phi_block[phi] = block
+        return phi
+
+    def _add_phi_operands(self, var, phi: PhiNode, block: BasicBlock):
+        for pred in block.predecessors:
+            phi.append_input(self._read(var, pred))
+
+    def _seal(self, block: BasicBlock):
+        self.sealed.add(block)
+        for var, phi in self.incomplete_phis.pop(block, {}).items():
+            self._add_phi_operands(var, phi, block)
+
+    def _remove_trivial_phis(self):
+        changed = True
+        while changed:
+            changed = False
+            for phi in list(self.phis):
+                same = None
+                for operand in phi.inputs:
+                    if operand is phi or operand is same:
+                        continue
+                    if same is not None:
+                        break
+                    same = operand
+                else:
+                    if same is None:
+                        continue
+                    for user in list(dict.fromkeys(phi.uses)):
+                        if user is not phi:
+                            user.replace_input(phi, same)
+                    self.phi_block[phi].nodes.remove(phi)
+                    self.builder._all_nodes.remove(phi)
+                    self.phis.remove(phi)
+                    changed = True
+
+    # ------------------------------------------------------------------
+    # Instructions
+
+    def _fill(self, block: BasicBlock, start: int, end: int, depth: int) -> List[IRNode]:
+        builder = self.builder
+        builder.set_current_block(block)
+        self.block = block
+        self.guarded = {}
+        stack = [self._read(("s", index), block) for index in range(depth)]
+        self.stack = stack
+        Opcode = self.Opcode
+        constant_pool = self.bytecode.constant_pool
+
+        for pc in range(start, end):
+            instruction = self.instructions[pc]
+            opcode = instruction.opcode
+            operand = instruction.operand1
+
+            if pc in self.exits:
+                # Unconditional deopt; the block ends here
+                self._guard(builder.build_constant(0), pc, "DEOPTIMIZE")
+            elif opcode == Opcode.LOAD_CONSTANT:
+                value = _constant_value(constant_pool[operand])
+                if value is None:
+                    raise UnsupportedBytecodeError(f"Heap number constant at offset {pc}")
+                stack.append(builder.build_constant(value))
+            elif opcode in (Opcode.LOAD_UNDEFINED, Opcode.LOAD_NULL, Opcode.LOAD_FALSE):
+                stack.append(builder.build_constant(0))
+            elif opcode == Opcode.LOAD_TRUE:
+                stack.append(builder.build_constant(1))
+            elif opcode == Opcode.LOAD_LOCAL:
+                stack.append(self._read(("l", self._local(operand, pc)), block))
+            elif opcode == Opcode.STORE_LOCAL:
+                self._write(("l", self._local(operand, pc)), block, self._pop(pc))
+            elif opcode == Opcode.LOAD_GLOBAL:
+                name = builder.build_constant(constant_pool[operand])
+                stack.append(self._runtime(RUNTIME_LOAD_GLOBAL, [name]))
+            elif opcode == Opcode.STORE_GLOBAL:
+                value = self._pop(pc)
+                name = builder.build_constant(constant_pool[operand])
+                self._runtime(RUNTIME_STORE_GLOBAL, [name, value])
+            elif opcode in self.binary_ops:
+                self._binary(pc, opcode)
+            elif opcode == Opcode.NEGATE:
+                self._check_feedback(pc)
+                value = self._nonzero(self._smi(stack[-1], pc), pc)
+                stack.pop()
+                stack.append(builder.build_unary_op("NEG", value))
+            elif opcode == Opcode.LOGICAL_NOT:
+                value = self._truthy(self._pop(pc))
+                stack.append(builder.build_unary_op("NOT", value))
+            elif opcode == Opcode.JUMP:
+                pass  # Edge to block.successors[0]
+            elif opcode in (Opcode.JUMP_IF_TRUE, Opcode.JUMP_IF_FALSE):
+                condition = self._truthy(self._pop(pc))
+                branch = builder.build_branch(condition)
+                fallthrough, target = block.successors[0], block.successors[-1]
+                if opcode == Opcode.JUMP_IF_TRUE:
+                    branch.if_true, branch.if_false = target, fallthrough
+                else:
+                    branch.if_true, branch.if_false = fallthrough, target
+            elif opcode == Opcode.RETURN:
+                value = stack.pop() if stack else builder.build_constant(0)
+                builder.build_return(value)
+            elif opcode == Opcode.POP:
+                if stack:
+                    stack.pop()
+            elif opcode == Opcode.DUP:
+                if not stack:
+                    raise UnsupportedBytecodeError(f"DUP on empty stack at offset {pc}")
+                stack.append(stack[-1])
+            elif opcode == Opcode.CREATE_OBJECT:
+                stack.append(self._runtime(RUNTIME_CREATE_OBJECT, []))
+            elif opcode == Opcode.LOAD_PROPERTY:
+                key = self._property_key(operand)
+                receiver = self._receiver(stack[-1], pc)
+                obj = stack.pop()
+                if receiver is None:
+                    key_node = builder.build_constant(key)
+                    stack.append(self._runtime(RUNTIME_LOAD_PROPERTY, [obj, key_node]))
+                else:
+                    stack.append(builder.build_load_property(receiver, key))
+            elif opcode == Opcode.STORE_PROPERTY:
+                key = self._property_key(operand)
+                if len(stack) < 2:
+                    raise UnsupportedBytecodeError(f"Stack underflow at offset {pc}")
+                receiver = self._receiver(stack[-2], pc)
+                value = stack.pop()
+                target = receiver if receiver is not None else stack[-1]
+                builder.build_store_property(target, key, value)
+                self._forget_shapes()
+            elif opcode == Opcode.CALL_FUNCTION:
+                arg_count = operand or 0
+                if len(stack) < arg_count + 1:
+                    raise UnsupportedBytecodeError(f"Stack underflow at offset {pc}")
+                target = self._inline_target(pc, arg_count)
+                if target is not None:
+                    self._inline_call(pc, target, arg_count)
+                    continue
+                args = stack[len(stack) - arg_count:]
+                del stack[len(stack) - arg_count:]
+                function = stack.pop()
+                stack.append(self._runtime(RUNTIME_CALL, [function] + args))
+                self._forget_shapes()
+
+        if start == end:
+            # Past the last instruction: return the stack top (or undefined)
+            value = stack[-1] if stack else builder.build_constant(0)
+            builder.build_return(value)
+
+        for index, value in enumerate(stack):
+            self._write(("s", index), block, value)
+        return stack
+
+    def _binary(self, pc: int, opcode):
+        stack = self.stack
+        if len(stack) < 2:
+            raise UnsupportedBytecodeError(f"Stack underflow at offset {pc}")
+        op = self.binary_ops[opcode]
+        if op not in ("LAND", "LOR"):
+            self._check_feedback(pc)
+        if op in ("LAND", "LOR"):
+            left = self._truthy(stack[-2])
+            right = self._truthy(stack[-1])
+        else:
+            left = self._smi(stack[-2], pc)
+            right = self._smi(stack[-1], pc)
+        if op == "DIV":
+            # Only Smi quotients: a positive divisor (no -0, no infinities)
+            # that divides exactly; anything else deoptimizes
+            if not (isinstance(right, ConstantNode) and right.value > 0):
+                right = self._guard(right, pc, "RANGE_GUARD", min_value=1)
+            remainder = self.builder.build_binary_op("MOD", left, right)
+            self._guard(remainder, pc, "RANGE_GUARD", min_value=0, max_value=0)
+        elif op == "MOD":
+            # Non-negative operands, where Python's % is ECMAScript's and
+            # the result is never -0
+            if not (isinstance(left, ConstantNode) and left.value >= 0):
+                left = self._guard(left, pc, "RANGE_GUARD", min_value=0)
+            if not (isinstance(right, ConstantNode) and right.value > 0):
+                right = self._guard(right, pc, "RANGE_GUARD", min_value=1)
+        result = self.builder.build_binary_op(op, left, right)
+        if op == "MUL" and not any(
+            isinstance(value, ConstantNode) and value.value > 0 for value in (left, right)
+        ):
+            # A zero product with a negative operand is -0, not a Smi. The
+            # product is 0 only if an operand is, so the other one is
+            # negative exactly when their sum is
+            builder = self.builder
+            zero = builder.build_constant(0)
+            minus_zero = builder.build_binary_op(
+                "LAND",
+                builder.build_binary_op("EQ", result, zero),
+                builder.build_binary_op("LT", builder.build_binary_op("ADD", left, right), zero),
+            )
+            self._guard(minus_zero, pc, "RANGE_GUARD", max_value=0)
+        del stack[-2:]
+        stack.append(result)
+
+    def _check_feedback(self, pc: int):
+        """Refuse operations that saw anything but Smi operands"""
+        slot = self.slots[pc] if self.slots is not None else None
+        if slot is not None and slot.types & ~self.smi_types:
+            raise UnsupportedBytecodeError(f"Non-Smi operands at offset {pc}")
+
+    def _smi(self, value: IRNode, pc: int) -> IRNode:
+        """Get value as a Smi, guarding it unless it is known to be one"""
+        if isinstance(value, ConstantNode) and type(value.value) is int:
+            return value
+        if isinstance(value, (BinaryOpNode, UnaryOpNode)):
+            return value  # Smi arithmetic results
+        return self._guard(value, pc, "TYPE_GUARD", expected_type="Smi")
+
+    def _nonzero(self, value: IRNode, pc: int) -> IRNode:
+        """Guard a Smi operand of NEGATE to be nonzero (-0 is not a Smi)"""
+        if not (isinstance(value, ConstantNode) and value.value != 0):
+            builder = self.builder
+            is_zero = builder.build_binary_op("EQ", value, builder.build_constant(0))
+            self._guard(is_zero, pc, "RANGE_GUARD", max_value=0)
+        return value
+
+    def _truthy(self, value: IRNode) -> IRNode:
+        """Get value as a condition: Smis as they are, anything else through ToBoolean"""
+        if isinstance(value, ConstantNode) and type(value.value) is int:
+            return value
+        if isinstance(value, (BinaryOpNode, UnaryOpNode)):
+            return value  # Smi arithmetic results
+        return self.builder.build_unary_op("TO_BOOLEAN", value)
+
+    def _receiver(self, obj: IRNode, pc: int) -> Optional[IRNode]:
+        """Guard the receiver map a property access saw, if it saw one"""
+        slot = self.slots[pc] if self.slots is not None else None
+        if slot is None or slot.megamorphic or len(slot.maps) != 1:
+            return None
+        return self._guard(obj, pc, "SHAPE_GUARD", expected_shape=slot.maps[0])
+
+    def _guard(self, value: IRNode, pc: int, guard_type: str, **expected) -> IRNode:
+        """Insert a guard deoptimizing to the state before the instruction at pc"""
+        from .optimizations.speculation_manager import FrameState, GuardNode, GuardType
+
+        key = (value, guard_type, expected.get("min_value"), expected.get("max_value"))
+        if key in self.guarded:
+            # Already checked earlier in this block
+            return self.guarded[key]
+        if self.inline_state is not None:
+            # Inside an inlined callee: redo the whole call in the interpreter
+            frame_state, state_values = self.inline_state
+        else:
+            block = self.block
+            state_values = [
+                self._read(("l", index), block) for index in range(self.local_count)
+            ] + list(self.stack)
+            frame_state = FrameState(pc, self.local_count, len(self.stack))
+        guard = GuardNode(
+            GuardType[guard_type],
+            value,
+            frame_state=frame_state,
+            state_values=list(state_values),
+            **expected,
+        )
+        self.guarded[key] = self.builder._insert_node(guard)
+        return guard
+
+    # ------------------------------------------------------------------
+    # Inlining
+
+    def _inline_target(self, pc: int, arg_count: int):
+        """
+        Callee to inline at the call at pc, or None
+
+        The call site's feedback must have seen a single bytecode function,
+        small enough and made of a single block of side-effect-free
+        instructions whose own feedback is Smi-only, so that a guard failing
+        anywhere in it can resume the interpreter before the call and let
+        the interpreter make the call instead.
+        """
+        from components.bytecode.src import BytecodeArray
+
+        slot = self.slots[pc] if self.slots is not None else None
+        if self.inline_state is not None or slot is None or slot.megamorphic:
+            return None
+        if len(slot.targets) != 1:
+            return None
+        (target,) = slot.targets
+        if (
+            not isinstance(target, BytecodeArray)
+            or target is self.bytecode
+            or len(target.instructions) > MAX_INLINED_INSTRUCTIONS
+        ):
+            return None
+
+        Opcode = self.Opcode
+        slots = target.feedback.slots if target.feedback is not None else None
+        defined = set(range(min(arg_count, target.local_count)))
+        depth = 0
+        for callee_pc, instruction in enumerate(target.instructions):
+            opcode = instruction.opcode
+            operand = instruction.operand1
+            callee_slot = slots[callee_pc] if slots is not None else None
+            if opcode == Opcode.RETURN:
+                return target
+            if opcode == Opcode.LOAD_CONSTANT:
+                if _constant_value(target.constant_pool[operand]) is None:
+                    return None
+                depth += 1
+            elif opcode in (
+                Opcode.LOAD_UNDEFINED,
+                Opcode.LOAD_NULL,
+                Opcode.LOAD_TRUE,
+                Opcode.LOAD_FALSE,
+            ):
+                depth += 1
+            elif opcode == Opcode.LOAD_LOCAL:
+                if operand not in defined:
+                    return None
+                depth += 1
+            elif opcode == Opcode.STORE_LOCAL:
+                if depth < 1 or not (
+                    isinstance(operand, int) and 0 <= operand < target.local_count
+                ):
+                    return None
+                defined.add(operand)
+                depth -= 1
+            elif opcode in self.binary_ops or opcode in (
+                Opcode.NEGATE,
+                Opcode.LOGICAL_NOT,
+            ):
+                operands = 2 if opcode in self.binary_ops else 1
+                if depth < operands:
+                    return None
+                if (
+                    callee_slot is not None
+                    and self.binary_ops.get(opcode) not in ("LAND", "LOR")
+                    and opcode != Opcode.LOGICAL_NOT
+                    and callee_slot.types & ~self.smi_types
+                ):
+                    return None
+                depth -= operands - 1
+            elif opcode == Opcode.LOAD_PROPERTY:
+                # Only shape-guarded loads: a generic one could fail
+                # outside a guard, where the call would have returned
+                if depth < 1 or callee_slot is None or callee_slot.megamorphic:
+                    return None
+                if len(callee_slot.maps) != 1:
+                    return None
+            elif opcode == Opcode.DUP:
+                if depth < 1:
+                    return None
+                depth += 1
+            elif opcode == Opcode.POP:
+                depth = max(depth - 1, 0)
+            else:
+                return None
+        return target
+
+    def _inline_call(self, pc: int, target, arg_count: int):
+        """Translate the call at pc as target's body, guarded on the callee"""
+        from .optimizations.speculation_manager import FrameState
+
+        caller_stack = self.stack
+        function = caller_stack[-arg_count - 1]
+        self._guard(function, pc, "CALL_TARGET_GUARD", expected_target=target)
+        args = caller_stack[len(caller_stack) - arg_count:]
+        inline_state = (
+            FrameState(pc, self.local_count, len(caller_stack)),
+            [self._read(("l", index), self.block) for index in range(self.local_count)]
+            + list(caller_stack),
+        )
+
+        builder = self.builder
+        Opcode = self.Opcode
+        callee_locals = (args + [None] * target.local_count)[: target.local_count]
+        saved = (self.bytecode, self.slots, self.stack)
+        self.bytecode = target
+        self.slots = target.feedback.slots if target.feedback is not None else None
+        self.stack = stack = []
+        self.inline_state = inline_state
+        result = None
+        try:
+            for callee_pc, instruction in enumerate(target.instructions):
+                opcode = instruction.opcode
+                operand = instruction.operand1
+                if opcode == Opcode.RETURN:
+                    result = stack.pop() if stack else builder.build_constant(0)
+                    break
+                if opcode == Opcode.LOAD_CONSTANT:
+                    value = _constant_value(target.constant_pool[operand])
+                    stack.append(builder.build_constant(value))
+                elif opcode in (Opcode.LOAD_UNDEFINED, Opcode.LOAD_NULL, Opcode.LOAD_FALSE):
+                    stack.append(builder.build_constant(0))
+                elif opcode == Opcode.LOAD_TRUE:
+                    stack.append(builder.build_constant(1))
+                elif opcode == Opcode.LOAD_LOCAL:
+                    stack.append(callee_locals[operand])
+                elif opcode == Opcode.STORE_LOCAL:
+                    callee_locals[operand] = stack.pop()
+                elif opcode in self.binary_ops:
+                    self._binary(callee_pc, opcode)
+                elif opcode == Opcode.NEGATE:
+                    value = self._nonzero(self._smi(stack.pop(), callee_pc), callee_pc)
+                    stack.append(builder.build_unary_op("NEG", value))
+                elif opcode == Opcode.LOGICAL_NOT:
+                    value = self._truthy(stack.pop())
+                    stack.append(builder.build_unary_op("NOT", value))
+                elif opcode == Opcode.LOAD_PROPERTY:
+                    key = self._property_key(operand)
+                    receiver = self._receiver(stack.pop(), callee_pc)
+                    stack.append(builder.build_load_property(receiver, key))
+                elif opcode == Opcode.DUP:
+                    stack.append(stack[-1])
+                elif opcode == Opcode.POP:
+                    if stack:
+                        stack.pop()
+            if result is None:
+                # Fell off the end: the stack top (or undefined)
+                result = stack[-1] if stack else builder.build_constant(0)
+        finally:
+            self.bytecode, self.slots, self.stack = saved
+            self.inline_state = None
+
+        del caller_stack[len(caller_stack) - arg_count - 1:]
+        caller_stack.append(result)
+
+    def _forget_shapes(self):
+        """Re-check receiver maps after anything that may change them"""
+        for key in [key for key in self.guarded if key[1] == "SHAPE_GUARD"]:
+            del self.guarded[key]
+
+    def _runtime(self, name: str, args: List[IRNode]) -> CallNode:
+        return self.builder.build_call(self.builder.build_constant(name), args)
+
+    def _pop(self, pc: int) -> IRNode:
+        if not self.stack:
+            raise UnsupportedBytecodeError(f"Stack underflow at offset {pc}")
+        return self.stack.pop()
+
+    def _local(self, index, pc: int) -> int:
+        if not isinstance(index, int) or not 0 <= index < self.local_count:
+            raise UnsupportedBytecodeError(f"Bad local index at offset {pc}")
+        return index
+
+    def _property_key(self, operand):
+        if isinstance(operand, int):
+            return self.bytecode.constant_pool[operand]
+        return operand  # Direct property name
+
+
+def _opcode_tables(Opcode):
+    """Binary opcode -> IR op map and the set of translatable opcodes"""
+    binary_ops = {
+        Opcode.ADD: "ADD",
+        Opcode.SUBTRACT: "SUB",
+        Opcode.MULTIPLY: "MUL",
+        Opcode.DIVIDE: "DIV",
+        Opcode.MODULO: "MOD",
+        Opcode.EQUAL: "EQ",
+        Opcode.NOT_EQUAL: "NE",
+        Opcode.LESS_THAN: "LT",
+        Opcode.LESS_EQUAL: "LE",
+        Opcode.GREATER_THAN: "GT",
+        Opcode.GREATER_EQUAL: "GE",
+        Opcode.LOGICAL_AND: "LAND",
+        Opcode.LOGICAL_OR: "LOR",
+    }
+    translatable = set(binary_ops) | {
+        Opcode.LOAD_CONSTANT,
+        Opcode.LOAD_UNDEFINED,
+        Opcode.LOAD_NULL,
+        Opcode.LOAD_TRUE,
+        Opcode.LOAD_FALSE,
+        Opcode.LOAD_LOCAL,
+        Opcode.STORE_LOCAL,
+        Opcode.LOAD_GLOBAL,
+        Opcode.STORE_GLOBAL,
+        Opcode.NEGATE,
+        Opcode.LOGICAL_NOT,
+        Opcode.JUMP,
+        Opcode.JUMP_IF_TRUE,
+        Opcode.JUMP_IF_FALSE,
+        Opcode.RETURN,
+        Opcode.POP,
+        Opcode.DUP,
+        Opcode.CREATE_OBJECT,
+        Opcode.LOAD_PROPERTY,
+        Opcode.STORE_PROPERTY,
+        Opcode.CALL_FUNCTION,
+    }
+    return binary_ops, translatable
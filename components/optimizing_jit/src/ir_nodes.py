@@ -100,6 +100,33 @@ class IRNode:
             self.inputs.remove(input_node)
             input_node.uses.remove(self)
 
+    def append_input(self, input_node: "IRNode"):
+        """
+        Append an operand, keeping duplicates
+
+        Operand lists whose positions carry meaning (x * x, phi inputs
+        per predecessor, call arguments) use this instead of add_input().
+
+        Args:
+            input_node: Node that this node depends on
+        """
+        self.inputs.append(input_node)
+        input_node.uses.append(self)
+
+    def replace_input(self, old_node: "IRNode", new_node: "IRNode"):
+        """
+        Replace every occurrence of an input in place
+
+        Args:
+            old_node: Current input
+            new_node: Node taking its positions
+        """
+        for index, input_node in enumerate(self.inputs):
+            if input_node is old_node:
+                self.inputs[index] = new_node
+                old_node.uses.remove(self)
+                new_node.uses.append(self)
+
     def __repr__(self) -> str:
         """String representation"""
         return f"{self.__class__.__name__}(id={self.id}, type={self.node_type.value})"
@@ -165,8 +192,8 @@ class BinaryOpNode(IRNode):
         """
         super().__init__(IRNodeType.BINARY_OP)
         self.op = op
-        self.add_input(left)
-        self.add_input(right)
+        self.append_input(left)
+        self.append_input(right)
 
     def __repr__(self) -> str:
         return f"BinaryOpNode(id={self.id}, op={self.op})"
@@ -220,7 +247,7 @@ class PhiNode(IRNode):
         """
         super().__init__(IRNodeType.PHI)
         for input_node in inputs:
-            self.add_input(input_node)
+            self.append_input(input_node)
 
     def __repr__(self) -> str:
         return f"PhiNode(id={self.id}, num_inputs={len(self.inputs)})"
@@ -267,8 +294,8 @@ class StorePropertyNode(IRNode):
         """
         super().__init__(IRNodeType.STORE_PROPERTY)
         self.property_name = property_name
-        self.add_input(obj)
-        self.add_input(value)
+        self.append_input(obj)
+        self.append_input(value)
 
     def __repr__(self) -> str:
         return f"StorePropertyNode(id={self.id}, property={self.property_name})"
@@ -290,9 +317,9 @@ class CallNode(IRNode):
             args: Argument list
         """
         super().__init__(IRNodeType.CALL)
-        self.add_input(func)
+        self.append_input(func)
         for arg in args:
-            self.add_input(arg)
+            self.append_input(arg)
 
     def __repr__(self) -> str:
         return f"CallNode(id={self.id}, num_args={len(self.inputs) - 1})"
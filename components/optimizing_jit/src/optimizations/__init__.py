@@ -23,17 +23,18 @@ from .graph_coloring_allocator import (
     RegisterAllocation
 )
 
-# Future optimizations (not yet implemented)
-# from .strength_reduction import StrengthReducer
-# from .range_analysis import RangeAnalyzer, ValueRange
-# from .bounds_check_elimination import BoundsCheckEliminator
-# from .speculation_manager import (
-#     SpeculationManager,
-#     GuardNode,
-#     GuardType,
-#     DeoptTrigger,
-#     DeoptReason
-# )
+# Passes run by OptimizingJITCompiler.compile_function after LICM
+from .strength_reduction import StrengthReducer
+from .range_analysis import RangeAnalyzer, ValueRange
+from .bounds_check_elimination import BoundsCheckEliminator
+from .speculation_manager import (
+    SpeculationManager,
+    GuardNode,
+    GuardType,
+    FrameState,
+    DeoptTrigger,
+    DeoptReason
+)
 
 __all__ = [
     # Core optimizations
@@ -53,14 +54,15 @@ __all__ = [
     "GraphColoringAllocator",
     "InterferenceGraph",
     "RegisterAllocation",
-    # Future optimizations (commented out until implemented)
-    # "StrengthReducer",
-    # "RangeAnalyzer",
-    # "ValueRange",
-    # "BoundsCheckEliminator",
-    # "SpeculationManager",
-    # "GuardNode",
-    # "GuardType",
-    # "DeoptTrigger",
-    # "DeoptReason",
+    # Pipeline passes
+    "StrengthReducer",
+    "RangeAnalyzer",
+    "ValueRange",
+    "BoundsCheckEliminator",
+    "SpeculationManager",
+    "GuardNode",
+    "GuardType",
+    "FrameState",
+    "DeoptTrigger",
+    "DeoptReason",
 ]
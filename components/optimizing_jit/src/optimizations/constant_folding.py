@@ -4,6 +4,8 @@ Constant Folding
 Evaluates constant expressions at compile time instead of runtime.
 """
 
+from components.value_system.src import NumberDivide, NumberRemainder
+
 from ..ssa_builder import SSAGraph
 from ..ir_nodes import IRNode, BinaryOpNode, UnaryOpNode, ConstantNode, IRNodeType
 
@@ -26,6 +28,10 @@ class ConstantFolder:
         """
         Fold constant expressions in IR
 
+        Only integer operands are folded, with the interpreter's semantics
+        (comparisons produce 1/0); DIV and MOD only fold to integers, so
+        fractions and division by zero are left to the guards and runtime.
+
         Args:
             ir_graph: SSA IR graph
 
@@ -40,14 +46,16 @@ class ConstantFolder:
                 if isinstance(node, BinaryOpNode):
                     if self._can_fold_binary(node):
                         folded = self._fold_binary(node)
-                        self._replace_node(ir_graph, node, folded)
-                        changed = True
+                        if folded is not node:
+                            self._replace_node(ir_graph, node, folded)
+                            changed = True
 
                 elif isinstance(node, UnaryOpNode):
                     if self._can_fold_unary(node):
                         folded = self._fold_unary(node)
-                        self._replace_node(ir_graph, node, folded)
-                        changed = True
+                        if folded is not node:
+                            self._replace_node(ir_graph, node, folded)
+                            changed = True
 
         return ir_graph
 
@@ -57,30 +65,39 @@ class ConstantFolder:
             len(node.inputs) == 2
             and isinstance(node.inputs[0], ConstantNode)
             and isinstance(node.inputs[1], ConstantNode)
+            and _is_int(node.inputs[0].value)
+            and _is_int(node.inputs[1].value)
         )
 
-    def _fold_binary(self, node: BinaryOpNode) -> ConstantNode:
+    def _fold_binary(self, node: BinaryOpNode) -> IRNode:
         """Fold binary operation on constants"""
         left_val = node.inputs[0].value
         right_val = node.inputs[1].value
 
+        if node.op in ("DIV", "MOD") and right_val == 0:
+            # Keep the runtime error
+            return node
+
         # Perform operation
         op_map = {
             "ADD": lambda l, r: l + r,
             "SUB": lambda l, r: l - r,
             "MUL": lambda l, r: l * r,
-            "DIV": lambda l, r: l / r if r != 0 else float("inf"),
-            "MOD": lambda l, r: l % r if r != 0 else 0,
-            "GT": lambda l, r: l > r,
-            "LT": lambda l, r: l < r,
-            "EQ": lambda l, r: l == r,
-            "NE": lambda l, r: l != r,
-            "GE": lambda l, r: l >= r,
-            "LE": lambda l, r: l <= r,
+            "DIV": NumberDivide,
+            "MOD": NumberRemainder,
+            "GT": lambda l, r: int(l > r),
+            "LT": lambda l, r: int(l < r),
+            "EQ": lambda l, r: int(l == r),
+            "NE": lambda l, r: int(l != r),
+            "GE": lambda l, r: int(l >= r),
+            "LE": lambda l, r: int(l <= r),
         }
 
         if node.op in op_map:
             result = op_map[node.op](left_val, right_val)
+            if type(result) is not int:
+                # Heap number (fraction, -0, NaN): not a Smi constant
+                return node
             return ConstantNode(result)
 
         # Unknown operation - don't fold
@@ -88,15 +105,20 @@ class ConstantFolder:
 
     def _can_fold_unary(self, node: UnaryOpNode) -> bool:
         """Check if unary op can be folded"""
-        return len(node.inputs) == 1 and isinstance(node.inputs[0], ConstantNode)
+        return (
+            len(node.inputs) == 1
+            and isinstance(node.inputs[0], ConstantNode)
+            and _is_int(node.inputs[0].value)
+        )
 
-    def _fold_unary(self, node: UnaryOpNode) -> ConstantNode:
+    def _fold_unary(self, node: UnaryOpNode) -> IRNode:
         """Fold unary operation on constant"""
         val = node.inputs[0].value
 
         op_map = {
             "NEG": lambda v: -v,
-            "NOT": lambda v: not v,
+            "NOT": lambda v: int(not v),
+            "TO_BOOLEAN": lambda v: int(v != 0),
         }
 
         if node.op in op_map:
@@ -107,10 +129,9 @@ class ConstantFolder:
 
     def _replace_node(self, ir_graph: SSAGraph, old_node: IRNode, new_node: IRNode):
         """Replace old node with new node in graph"""
-        # Update all uses of old node to use new node
+        # Update all uses of old node to use new node (operand order is kept)
         for use in old_node.uses[:]:
-            use.remove_input(old_node)
-            use.add_input(new_node)
+            use.replace_input(old_node, new_node)
 
         # Replace in graph nodes list
         if old_node in ir_graph.nodes:
@@ -122,3 +143,8 @@ class ConstantFolder:
             if old_node in block.nodes:
                 idx = block.nodes.index(old_node)
                 block.nodes[idx] = new_node
+
+
+def _is_int(value) -> bool:
+    """Check for an integer constant (bool counts as 0/1)"""
+    return isinstance(value, int)
@@ -9,7 +9,14 @@ Implements loop optimizations:
 from typing import List, Set, Optional
 from ..ssa_builder import SSAGraph
 from ..ir_builder import BasicBlock
-from ..ir_nodes import IRNode, PhiNode, BranchNode, BinaryOpNode, ConstantNode
+from ..ir_nodes import (
+    IRNode,
+    IRNodeType,
+    PhiNode,
+    BranchNode,
+    BinaryOpNode,
+    ConstantNode,
+)
 
 
 class LoopInfo:
@@ -201,8 +208,9 @@ class LoopOptimizer:
                 condition = node.inputs[0]
                 if isinstance(condition, BinaryOpNode):
                     # Check if comparing against constant
-                    if isinstance(condition.inputs[1], ConstantNode):
-                        limit_value = condition.inputs[1].value
+                    limit = condition.inputs[1]
+                    if isinstance(limit, ConstantNode) and isinstance(limit.value, int):
+                        limit_value = limit.value
                         # Assuming starting from 0 (simplified)
                         if condition.op in ["LT", "LE"]:
                             loop.trip_count = int(limit_value)
@@ -214,34 +222,67 @@ class LoopOptimizer:
         Algorithm:
         1. Identify loop-invariant operations (all inputs defined outside loop)
         2. Move invariant operations to loop pre-header
-        3. Update SSA graph
+        3. Repeat until no more nodes move (hoisting one node can make its
+           users invariant)
+
+        Nothing moves when the loop has no pre-header: a single predecessor
+        outside the loop whose only successor is the header.
 
         Args:
             ir_graph: IR graph
             loop: Loop to optimize
         """
+        loop_blocks = [loop.header] + [
+            block for block in loop.body_blocks if block is not loop.header
+        ]
+        preheader = self._find_preheader(loop, loop_blocks)
+        if preheader is None:
+            return
+
         # Collect all nodes in loop
         loop_nodes = set()
-        for block in loop.body_blocks:
+        for block in loop_blocks:
             loop_nodes.update(block.nodes)
-        if loop.header:
-            loop_nodes.update(loop.header.nodes)
 
-        # Find invariant nodes
-        invariant_nodes = []
+        # Loads may only move if nothing in the loop can write the property
+        loads_movable = not any(
+            node.node_type in (IRNodeType.STORE_PROPERTY, IRNodeType.CALL)
+            for node in loop_nodes
+        )
+
+        moved = True
+        while moved:
+            moved = False
+            for block in loop_blocks:
+                for node in block.nodes[:]:
+                    if node.node_type == IRNodeType.LOAD_PROPERTY and not loads_movable:
+                        continue
+                    if self._is_loop_invariant(node, loop_nodes):
+                        block.nodes.remove(node)
+                        preheader.nodes.append(node)
+                        loop_nodes.discard(node)
+                        moved = True
+
+    def _find_preheader(
+        self, loop: LoopInfo, loop_blocks: List[BasicBlock]
+    ) -> Optional[BasicBlock]:
+        """
+        Find the block that enters the loop
 
-        for block in loop.body_blocks:
-            for node in block.nodes[:]:
-                if self._is_loop_invariant(node, loop_nodes):
-                    invariant_nodes.append((block, node))
+        Args:
+            loop: Loop to inspect
+            loop_blocks: Header and body blocks
 
-        # Move invariant nodes to pre-header (or entry)
-        # For simplicity, we just remove from body and note they're invariant
-        # In a full implementation, we'd create a pre-header block
-        for block, node in invariant_nodes:
-            # Mark as invariant (in full implementation, would move to pre-header)
-            # For now, we just document this optimization would happen
-            pass
+        Returns:
+            Pre-header block, or None if the loop has none
+        """
+        outside = [pred for pred in loop.header.predecessors if pred not in loop_blocks]
+        if len(outside) != 1:
+            return None
+        preheader = outside[0]
+        if preheader.successors != [loop.header]:
+            return None
+        return preheader
 
     def _is_loop_invariant(self, node: IRNode, loop_nodes: Set[IRNode]) -> bool:
         """
@@ -273,24 +314,37 @@ class LoopOptimizer:
         """
         Check if node is pure (no side effects)
 
+        Division and modulo only count as pure for a non-zero constant
+        divisor; otherwise hoisting them could raise where the loop would
+        not have.
+
         Args:
             node: Node to check
 
         Returns:
             True if node has no side effects
         """
-        from ..ir_nodes import IRNodeType
-
         # Pure operations (safe to move)
         pure_types = {
             IRNodeType.BINARY_OP,
             IRNodeType.UNARY_OP,
             IRNodeType.CONSTANT,
             IRNodeType.PARAMETER,
-            IRNodeType.LOAD_PROPERTY,  # Assuming no aliasing
+            IRNodeType.LOAD_PROPERTY,  # Caller checks the loop for stores/calls
         }
 
-        return node.node_type in pure_types
+        if node.node_type not in pure_types:
+            return False
+
+        if isinstance(node, BinaryOpNode) and node.op in ("DIV", "MOD"):
+            divisor = node.inputs[1]
+            return (
+                isinstance(divisor, ConstantNode)
+                and isinstance(divisor.value, int)
+                and divisor.value != 0
+            )
+
+        return True
 
     def _apply_unrolling(self, ir_graph: SSAGraph, loop: LoopInfo):
         """
@@ -91,7 +91,7 @@ class RangeAnalyzer:
         Returns:
             Computed range for node
         """
-        if isinstance(node, ConstantNode):
+        if isinstance(node, ConstantNode) and isinstance(node.value, int):
             # Constant has exact range [value, value]
             return ValueRange(node.value, node.value)
 
@@ -199,8 +199,8 @@ class RangeAnalyzer:
             # -[a, b] = [-b, -a]
             return ValueRange(-operand_range.max_value, -operand_range.min_value)
 
-        elif node.op == "NOT":
-            # NOT returns boolean
+        elif node.op in ("NOT", "TO_BOOLEAN"):
+            # NOT and TO_BOOLEAN return booleans
             return ValueRange(0, 1)
 
         else:
@@ -106,8 +106,7 @@ class ScalarReplacement:
 
                             # Replace all uses of this load with the scalar value
                             for use in node.uses[:]:
-                                use.remove_input(node)
-                                use.add_input(scalar_value)
+                                use.replace_input(node, scalar_value)
 
                             # Mark load for removal
                             nodes_to_remove.add(node)
@@ -20,6 +20,9 @@ class GuardType(Enum):
     SHAPE_GUARD = "SHAPE_GUARD"  # Guard: object has expected shape
     RANGE_GUARD = "RANGE_GUARD"  # Guard: value in expected range
     NULL_CHECK = "NULL_CHECK"  # Guard: value is not null
+    NONZERO_CHECK = "NONZERO_CHECK"  # Guard: divisor is not zero
+    DEOPTIMIZE = "DEOPTIMIZE"  # Unconditional: the code past it was not compiled
+    CALL_TARGET_GUARD = "CALL_TARGET_GUARD"  # Guard: callee is the inlined function
 
 
 class DeoptReason(Enum):
@@ -28,6 +31,22 @@ class DeoptReason(Enum):
     SHAPE_MISMATCH = "SHAPE_MISMATCH"  # Shape guard failed
     RANGE_OVERFLOW = "RANGE_OVERFLOW"  # Range guard failed
     NULL_POINTER = "NULL_POINTER"  # Null check failed
+    DIVISION_BY_ZERO = "DIVISION_BY_ZERO"  # Nonzero check failed
+    UNCOMPILED_CODE = "UNCOMPILED_CODE"  # Reached a DEOPTIMIZE guard
+
+
+@dataclass
+class FrameState:
+    """
+    Interpreter frame a guard deoptimizes to
+
+    The guard's inputs after the guarded value are the frame's locals
+    followed by its operand stack; the interpreter resumes at
+    bytecode_offset with those values.
+    """
+    bytecode_offset: int
+    local_count: int
+    stack_depth: int
 
 
 class GuardNode(IRNode):
@@ -45,7 +64,10 @@ class GuardNode(IRNode):
         expected_type: Optional[str] = None,
         expected_shape: Optional[str] = None,
         min_value: Optional[int] = None,
-        max_value: Optional[int] = None
+        max_value: Optional[int] = None,
+        frame_state: Optional[FrameState] = None,
+        state_values: Optional[List[IRNode]] = None,
+        expected_target: Optional[Any] = None
     ):
         """
         Create guard node
@@ -57,6 +79,11 @@ class GuardNode(IRNode):
             expected_shape: Expected shape (for SHAPE_GUARD)
             min_value: Minimum value (for RANGE_GUARD)
             max_value: Maximum value (for RANGE_GUARD)
+            frame_state: Where to resume on failure (None for guards
+                checked on function entry)
+            state_values: Locals then stack values of frame_state
+            expected_target: Expected callee (for CALL_TARGET_GUARD), as
+                recorded by call feedback
         """
         super().__init__(IRNodeType.CALL)  # Guards are represented as special calls
         self.guard_type = guard_type
@@ -64,7 +91,18 @@ class GuardNode(IRNode):
         self.expected_shape = expected_shape
         self.min_value = min_value
         self.max_value = max_value
+        self.frame_state = frame_state
+        self.expected_target = expected_target
         self.add_input(value)
+        # Frame state values are inputs so passes keep them alive and
+        # rewrite them like any other use
+        for state_value in state_values or ():
+            self.append_input(state_value)
+
+    @property
+    def state_values(self) -> List[IRNode]:
+        """Locals then stack values the guard deoptimizes with"""
+        return self.inputs[1:]
 
     def __repr__(self) -> str:
         return f"GuardNode(id={self.id}, type={self.guard_type.value})"
@@ -229,7 +267,8 @@ class SpeculationManager:
 
         Args:
             guards: List of guard nodes
-            bytecode_offset: Bytecode offset for recovery
+            bytecode_offset: Bytecode offset for recovery of guards without
+                a frame state
 
         Returns:
             List of deoptimization triggers
@@ -237,6 +276,11 @@ class SpeculationManager:
         triggers = []
 
         for guard in guards:
+            frame_state = getattr(guard, "frame_state", None)
+            offset = (
+                frame_state.bytecode_offset if frame_state is not None else bytecode_offset
+            )
+
             # Determine deopt reason based on guard type
             if guard.guard_type == GuardType.TYPE_GUARD:
                 reason = DeoptReason.TYPE_MISMATCH
@@ -246,10 +290,14 @@ class SpeculationManager:
                 reason = DeoptReason.RANGE_OVERFLOW
             elif guard.guard_type == GuardType.NULL_CHECK:
                 reason = DeoptReason.NULL_POINTER
+            elif guard.guard_type == GuardType.NONZERO_CHECK:
+                reason = DeoptReason.DIVISION_BY_ZERO
+            elif guard.guard_type == GuardType.DEOPTIMIZE:
+                reason = DeoptReason.UNCOMPILED_CODE
             else:
                 reason = DeoptReason.TYPE_MISMATCH
 
-            trigger = self.create_deopt_trigger(guard, reason, bytecode_offset)
+            trigger = self.create_deopt_trigger(guard, reason, offset)
             triggers.append(trigger)
 
         return triggers
@@ -3,7 +3,8 @@ Strength Reduction Optimization
 
 Replaces expensive operations with cheaper equivalents:
 - x * 2 -> x << 1 (multiply by power of 2 -> shift left)
-- x / 2 -> x >> 1 (divide by power of 2 -> shift right)
+- x / 2 -> x >> 1 (divide by power of 2 -> shift right; SHR rounds toward
+  zero like the integer division it replaces)
 - x % 2 -> x & 1 (modulo by power of 2 -> bitwise AND)
 """
 
@@ -202,5 +203,9 @@ class StrengthReducer:
                     user.inputs[i] = new_node
                     new_node.uses.append(user)
 
-        # Optionally remove old node (or let DCE handle it)
-        # For now, we leave it (dead code elimination will remove it later)
+        # Schedule new_node where old_node was
+        for block in ir_graph.basic_blocks:
+            if old_node in block.nodes:
+                block.nodes[block.nodes.index(old_node)] = new_node
+
+        # Leave old_node in the node list (dead code elimination removes it)
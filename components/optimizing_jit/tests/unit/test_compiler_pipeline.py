@@ -0,0 +1,319 @@
+"""
+Tests for the optimizing compiler pipeline
+
+Builds IR from real bytecode, runs the optimization passes and executes
+the generated code, including guard failures.
+"""
+
+import pytest
+from components.bytecode.src import BytecodeArray, Instruction, Opcode
+from components.deoptimization.src import DeoptReason
+from components.optimizing_jit.src import (
+    DeoptimizationExit,
+    IRBuilder,
+    OptimizingJITCompiler,
+    PhiNode,
+    UnsupportedBytecodeError,
+)
+from components.value_system.src import Value
+
+
+def _sum_below():
+    """function (n) { var s = 0; var i = 0; while (i < n) { s = s + i; i = i + 1; } return s; }"""
+    bytecode = BytecodeArray(local_count=3, parameter_count=1, name="sum_below")
+    zero = bytecode.add_constant(0)
+    one = bytecode.add_constant(1)
+    for instruction in [
+        Instruction(Opcode.LOAD_CONSTANT, zero),
+        Instruction(Opcode.STORE_LOCAL, 1),
+        Instruction(Opcode.LOAD_CONSTANT, zero),
+        Instruction(Opcode.STORE_LOCAL, 2),
+        Instruction(Opcode.LOAD_LOCAL, 2),  # 4: loop header
+        Instruction(Opcode.LOAD_LOCAL, 0),
+        Instruction(Opcode.LESS_THAN),
+        Instruction(Opcode.JUMP_IF_FALSE, 17),
+        Instruction(Opcode.LOAD_LOCAL, 1),
+        Instruction(Opcode.LOAD_LOCAL, 2),
+        Instruction(Opcode.ADD),
+        Instruction(Opcode.STORE_LOCAL, 1),
+        Instruction(Opcode.LOAD_LOCAL, 2),
+        Instruction(Opcode.LOAD_CONSTANT, one),
+        Instruction(Opcode.ADD),
+        Instruction(Opcode.STORE_LOCAL, 2),
+        Instruction(Opcode.JUMP, 4),
+        Instruction(Opcode.LOAD_LOCAL, 1),  # 17: exit
+        Instruction(Opcode.RETURN),
+    ]:
+        bytecode.add_instruction(instruction)
+    return bytecode
+
+
+def _locals(bytecode, *arguments):
+    return list(arguments) + [None] * (bytecode.local_count - len(arguments))
+
+
+class TestBuildIR:
+    """Test IR construction from bytecode"""
+
+    def test_loop_variables_become_phis(self):
+        """Locals assigned in a loop should merge in phis at the loop header"""
+        graph = IRBuilder().build_ir(_sum_below())
+
+        header = next(block for block in graph.basic_blocks if block.bytecode_offset == 4)
+        phis = [node for node in header.nodes if isinstance(node, PhiNode)]
+
+        assert len(phis) == 2
+        assert len(header.predecessors) == 2
+
+    def test_unsupported_opcode(self):
+        """Opcodes the optimizing tier does not handle should be rejected"""
+        bytecode = BytecodeArray()
+        bytecode.add_instruction(Instruction(Opcode.CREATE_ARRAY))
+
+        with pytest.raises(UnsupportedBytecodeError):
+            IRBuilder().build_ir(bytecode)
+
+
+class TestCompileFunction:
+    """Test compiling and running optimized code"""
+
+    def test_optimized_code_computes_result(self):
+        """Optimized code should return what the interpreter would"""
+        bytecode = _sum_below()
+
+        code = OptimizingJITCompiler().compile_function(bytecode)
+        result = code.function(None, _locals(bytecode, Value.from_smi(10)))
+
+        assert result.to_smi() == 45
+        assert b"while True" in code.code
+
+    def test_guard_failure_exits_with_frame_state(self):
+        """A failed type guard should exit with the interpreter state to resume"""
+        bytecode = _sum_below()
+        code = OptimizingJITCompiler().compile_function(bytecode)
+        argument = Value.from_object("3")
+
+        with pytest.raises(DeoptimizationExit) as exit_info:
+            code.function(None, _locals(bytecode, argument))
+
+        deopt = code.deopt_info[exit_info.value.deopt_id]
+        assert deopt.reason == DeoptReason.TYPE_MISMATCH
+        # Before LESS_THAN, with i and n on the operand stack
+        assert deopt.bytecode_offset == 6
+        assert deopt.stack_map == ["stack0", "stack1"]
+        values = exit_info.value.values
+        assert values[0] is argument
+        assert [value.to_smi() for value in values[1:3]] == [0, 0]
+        assert values[4] is argument
+
+    def test_division_leaving_smi_range_deoptimizes(self):
+        """Quotients that are not Smis (fractions, division by zero) should leave the fast path"""
+        bytecode = BytecodeArray(local_count=2, parameter_count=2, name="div")
+        bytecode.add_instruction(Instruction(Opcode.LOAD_LOCAL, 0))
+        bytecode.add_instruction(Instruction(Opcode.LOAD_LOCAL, 1))
+        bytecode.add_instruction(Instruction(Opcode.DIVIDE))
+        bytecode.add_instruction(Instruction(Opcode.RETURN))
+        code = OptimizingJITCompiler().compile_function(bytecode)
+
+        assert code.function(None, [Value.from_smi(-6), Value.from_smi(2)]).to_smi() == -3
+        for dividend, divisor in ((-7, 2), (7, 0)):
+            with pytest.raises(DeoptimizationExit) as exit_info:
+                code.function(None, [Value.from_smi(dividend), Value.from_smi(divisor)])
+            deopt = code.deopt_info[exit_info.value.deopt_id]
+            assert deopt.reason == DeoptReason.OVERFLOW
+            assert deopt.bytecode_offset == 2
+
+    def test_minus_zero_results_deoptimize(self):
+        """Products and negations that are -0 (not a Smi) should leave the fast path"""
+        code = {}
+        for opcode, parameter_count in ((Opcode.MULTIPLY, 2), (Opcode.NEGATE, 1)):
+            bytecode = BytecodeArray(
+                local_count=parameter_count, parameter_count=parameter_count, name="f"
+            )
+            for index in range(parameter_count):
+                bytecode.add_instruction(Instruction(Opcode.LOAD_LOCAL, index))
+            bytecode.add_instruction(Instruction(opcode))
+            bytecode.add_instruction(Instruction(Opcode.RETURN))
+            code[opcode] = OptimizingJITCompiler().compile_function(bytecode)
+
+        multiply = code[Opcode.MULTIPLY].function
+        assert multiply(None, [Value.from_smi(0), Value.from_smi(5)]).to_smi() == 0
+        assert multiply(None, [Value.from_smi(-2), Value.from_smi(-3)]).to_smi() == 6
+        assert code[Opcode.NEGATE].function(None, [Value.from_smi(-5)]).to_smi() == 5
+        for opcode, arguments in (
+            (Opcode.MULTIPLY, (-19, 0)),
+            (Opcode.MULTIPLY, (0, -3)),
+            (Opcode.NEGATE, (0,)),
+        ):
+            with pytest.raises(DeoptimizationExit) as exit_info:
+                code[opcode].function(None, [Value.from_smi(value) for value in arguments])
+            deopt = code[opcode].deopt_info[exit_info.value.deopt_id]
+            assert deopt.reason == DeoptReason.OVERFLOW
+            assert deopt.bytecode_offset == len(arguments)
+
+    def test_conditions_on_heap_numbers_use_to_boolean(self):
+        """Branching on and negating a double, NaN or large integer should not deoptimize"""
+        bytecode = BytecodeArray(local_count=1, parameter_count=1, name="truthy")
+        seven = bytecode.add_constant(7)
+        for instruction in [
+            Instruction(Opcode.LOAD_LOCAL, 0),
+            Instruction(Opcode.JUMP_IF_FALSE, 4),
+            Instruction(Opcode.LOAD_CONSTANT, seven),
+            Instruction(Opcode.RETURN),
+            Instruction(Opcode.LOAD_LOCAL, 0),  # 4
+            Instruction(Opcode.LOGICAL_NOT),
+            Instruction(Opcode.RETURN),
+        ]:
+            bytecode.add_instruction(instruction)
+        code = OptimizingJITCompiler().compile_function(bytecode)
+
+        for number, expected in ((0.5, 7), (2.0**40, 7), (float("nan"), 1), (-0.0, 1), (0, 1)):
+            assert code.function(None, [Value.from_number(number)]).to_smi() == expected
+
+    def test_results_outside_smi_range_are_heap_numbers(self):
+        """Boxing an int result past the Smi range should give a heap number"""
+        bytecode = BytecodeArray(local_count=2, parameter_count=2, name="mul")
+        bytecode.add_instruction(Instruction(Opcode.LOAD_LOCAL, 0))
+        bytecode.add_instruction(Instruction(Opcode.LOAD_LOCAL, 1))
+        bytecode.add_instruction(Instruction(Opcode.MULTIPLY))
+        bytecode.add_instruction(Instruction(Opcode.RETURN))
+        code = OptimizingJITCompiler().compile_function(bytecode)
+
+        result = code.function(None, [Value.from_smi(2**20), Value.from_smi(2**20)])
+
+        assert result.is_double()
+        assert result.to_number() == 2.0**40
+
+    def test_unsupported_bytecode_is_not_compiled(self):
+        """compile_function() should return None for bytecode it cannot handle"""
+        bytecode = BytecodeArray()
+        bytecode.add_instruction(Instruction(Opcode.CREATE_ARRAY))
+
+        assert OptimizingJITCompiler().compile_function(bytecode) is None
+
+
+class TestCompileOSR:
+    """Test compiling on-stack replacement entries"""
+
+    def test_osr_entry_continues_running_loop(self):
+        """OSR code should take over the frame's current locals at the loop header"""
+        bytecode = _sum_below()
+
+        code = OptimizingJITCompiler().compile_osr(bytecode, 4)
+        # n = 10, s = 0 + 1 + 2 + 3, i = 4
+        result = code.function(None, [Value.from_smi(10), Value.from_smi(6), Value.from_smi(4)])
+
+        assert result.to_smi() == 45
+
+    def test_uncompiled_code_after_loop_deoptimizes(self):
+        """Opcodes without a translation should exit to the interpreter at their offset"""
+        bytecode = _sum_below()
+        bytecode.instructions[17] = Instruction(Opcode.CREATE_ARRAY)
+
+        assert OptimizingJITCompiler().compile_function(bytecode) is None
+        code = OptimizingJITCompiler().compile_osr(bytecode, 4)
+        with pytest.raises(DeoptimizationExit) as exit_info:
+            code.function(None, [Value.from_smi(3), Value.from_smi(0), Value.from_smi(0)])
+
+        deopt = code.deopt_info[exit_info.value.deopt_id]
+        assert deopt.bytecode_offset == 17
+        assert deopt.reason == DeoptReason.ASSUMPTION_VIOLATED
+        assert exit_info.value.values[1].to_smi() == 3
+
+
+class _Closure:
+    """Stands in for a JSFunction created from a function's bytecode"""
+
+    def __init__(self, bytecode):
+        self._properties = {"__bytecode__": Value.from_object(bytecode)}
+
+
+def _square():
+    """function (x) { return x * x; }"""
+    bytecode = BytecodeArray(local_count=1, parameter_count=1, name="square")
+    for instruction in [
+        Instruction(Opcode.LOAD_LOCAL, 0),
+        Instruction(Opcode.LOAD_LOCAL, 0),
+        Instruction(Opcode.MULTIPLY),
+        Instruction(Opcode.RETURN),
+    ]:
+        bytecode.add_instruction(instruction)
+    return bytecode
+
+
+def _call_and_add(callee):
+    """function (f, x) { return f(x) + 1; } after calling callee there"""
+    bytecode = BytecodeArray(local_count=2, parameter_count=2, name="caller")
+    one = bytecode.add_constant(1)
+    for instruction in [
+        Instruction(Opcode.LOAD_LOCAL, 0),
+        Instruction(Opcode.LOAD_LOCAL, 1),
+        Instruction(Opcode.CALL_FUNCTION, 1),  # 2
+        Instruction(Opcode.LOAD_CONSTANT, one),
+        Instruction(Opcode.ADD),
+        Instruction(Opcode.RETURN),
+    ]:
+        bytecode.add_instruction(instruction)
+    bytecode.get_feedback_vector().slots[2].record(callee)
+    return bytecode
+
+
+class TestInlining:
+    """Test inlining of monomorphic call sites"""
+
+    def test_small_monomorphic_callee_is_inlined(self):
+        """The callee's body should replace the runtime call"""
+        square = _square()
+        bytecode = _call_and_add(square)
+
+        code = OptimizingJITCompiler().compile_function(bytecode)
+        result = code.function(None, [Value.from_object(_Closure(square)), Value.from_smi(7)])
+
+        assert result.to_smi() == 50
+        assert b"call_value" not in code.code
+
+    def test_other_callee_deoptimizes_before_the_call(self):
+        """A different function at the call site should resume the interpreter at the call"""
+        square = _square()
+        bytecode = _call_and_add(square)
+        code = OptimizingJITCompiler().compile_function(bytecode)
+        other = Value.from_object(_Closure(_square()))
+
+        with pytest.raises(DeoptimizationExit) as exit_info:
+            code.function(None, [other, Value.from_smi(7)])
+
+        deopt = code.deopt_info[exit_info.value.deopt_id]
+        assert deopt.reason == DeoptReason.IC_MISS
+        assert deopt.bytecode_offset == 2
+        assert deopt.stack_map == ["stack0", "stack1"]
+
+    def test_guard_in_inlined_body_deoptimizes_before_the_call(self):
+        """A failed speculation inside the callee should redo the whole call"""
+        square = _square()
+        bytecode = _call_and_add(square)
+        code = OptimizingJITCompiler().compile_function(bytecode)
+        function = Value.from_object(_Closure(square))
+        argument = Value.from_object("7")
+
+        with pytest.raises(DeoptimizationExit) as exit_info:
+            code.function(None, [function, argument])
+
+        deopt = code.deopt_info[exit_info.value.deopt_id]
+        assert deopt.bytecode_offset == 2
+        assert exit_info.value.values[2:] == (function, argument)
+
+    def test_callee_with_side_effects_is_called(self):
+        """Callees that write globals are not inlined"""
+        callee = BytecodeArray(local_count=1, parameter_count=1, name="store")
+        name = callee.add_name("g")
+        for instruction in [
+            Instruction(Opcode.LOAD_LOCAL, 0),
+            Instruction(Opcode.STORE_GLOBAL, name),
+            Instruction(Opcode.LOAD_LOCAL, 0),
+            Instruction(Opcode.RETURN),
+        ]:
+            callee.add_instruction(instruction)
+
+        code = OptimizingJITCompiler().compile_function(_call_and_add(callee))
+
+        assert b"call_value" in code.code
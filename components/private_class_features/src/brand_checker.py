@@ -67,7 +67,7 @@ class PrivateBrandChecker:
         # Check if instance's class matches
         if instance_class_id == class_id:
             # Verify instance has been initialized with private fields
-            # (has at least one field from this class)
-            return instance in field_manager._instance_fields
+            # (carries the slot storage of this class)
+            return field_manager.has_brand(instance, class_id)
 
         return False
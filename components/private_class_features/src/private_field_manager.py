@@ -4,7 +4,14 @@ PrivateFieldManager - Manages private class fields.
 Implements FR-ES24-069: Private fields (#field)
 Implements FR-ES24-073: Private static fields
 
-Uses WeakMap-like storage to ensure proper encapsulation.
+Each class gets a fixed layout assigning its private names to slot
+indices when they are defined (at class compile time). Instances carry
+one fixed slot array per brand, keyed by the layout of the class that
+initialized it, so an instance of a subclass holds a brand for every
+class in its chain and a private read is one brand lookup plus a list
+index. Layouts belong to their manager, so two managers never share
+slot arrays. Private names stay unreachable through ordinary property
+access: they are never stored as properties.
 """
 
 from dataclasses import dataclass
@@ -12,6 +19,13 @@ from typing import Any, Callable, Dict, Optional
 import weakref
 
 
+# Marks a slot whose field has not been initialized on the instance yet
+_EMPTY = object()
+
+# Instance attribute holding the _PrivateBrands of an object
+_BRANDS_ATTRIBUTE = "_private_brands"
+
+
 @dataclass
 class PrivateField:
     """Descriptor for a private field."""
@@ -20,19 +34,45 @@ class PrivateField:
     class_id: int
     initializer: Optional[Callable[[], Any]]
     is_static: bool = False
+    slot: int = -1
+
+
+class _ClassLayout:
+    """
+    Private slot layout of one class (its brand).
+
+    Attributes:
+        class_id: Class identifier
+        slots: Private name -> slot index, in definition order
+    """
+
+    __slots__ = ("class_id", "slots")
+
+    def __init__(self, class_id: int):
+        self.class_id = class_id
+        self.slots: Dict[str, int] = {}
+
+
+class _PrivateBrands(dict):
+    """Per-instance private storage: brand (_ClassLayout) -> slot values."""
+
+    __slots__ = ()
 
 
 class PrivateFieldManager:
-    """Manages private class fields with WeakMap-based storage."""
+    """Manages private class fields with per-instance slot storage."""
 
     def __init__(self):
         """Initialize private field manager."""
         # Map: (class_id, field_name) -> PrivateField
         self._field_definitions: Dict[tuple, PrivateField] = {}
 
-        # Instance fields: WeakKeyDictionary for automatic cleanup
-        # Map: instance -> {(class_id, field_name) -> value}
-        self._instance_fields = weakref.WeakKeyDictionary()
+        # Map: class_id -> slot layout (brand) of that class
+        self._layouts: Dict[int, _ClassLayout] = {}
+
+        # Storage for instances that cannot carry attributes
+        # Map: instance -> _PrivateBrands
+        self._detached_brands = weakref.WeakKeyDictionary()
 
         # Static fields: Map: (class_id, field_name) -> value
         self._static_fields: Dict[tuple, Any] = {}
@@ -47,6 +87,9 @@ class PrivateFieldManager:
         """
         Define a private field for a class.
 
+        Instance fields are assigned the next slot index of the class
+        layout; redefining a name keeps its slot.
+
         Args:
             class_id: Class identifier
             field_name: Private field name (with #)
@@ -60,16 +103,102 @@ class PrivateFieldManager:
             raise ValueError(f"Private field name must start with #: {field_name}")
 
         key = (class_id, field_name)
+        slot = -1
+        if not is_static:
+            layout = self._layouts.get(class_id)
+            if layout is None:
+                layout = self._layouts[class_id] = _ClassLayout(class_id)
+            slot = layout.slots.setdefault(field_name, len(layout.slots))
+
         field = PrivateField(
             field_name=field_name,
             class_id=class_id,
             initializer=initializer,
             is_static=is_static,
+            slot=slot,
         )
 
         self._field_definitions[key] = field
         return field
 
+    def resolve_private_field(self, class_id: int, field_name: str) -> PrivateField:
+        """
+        Resolve a private name of a class to its field descriptor.
+
+        Compilers call this once per access site and then use
+        load_field()/store_field() with the result.
+
+        Args:
+            class_id: Class whose body contains the access
+            field_name: Private field name
+
+        Returns:
+            PrivateField descriptor (with its slot index)
+
+        Raises:
+            TypeError: If the class does not define the field
+        """
+        field = self._field_definitions.get((class_id, field_name))
+        if field is None:
+            raise TypeError(f"Cannot access private field {field_name}")
+        return field
+
+    def load_field(self, instance: Any, field: PrivateField) -> Any:
+        """
+        Read a resolved private instance field.
+
+        Args:
+            instance: Class instance
+            field: Descriptor from resolve_private_field()
+
+        Returns:
+            Field value
+
+        Raises:
+            TypeError: If instance does not carry the field's brand, the
+                field has not been initialized or field is static
+        """
+        brands = self._brands_of(instance)
+        values = None
+        if brands is not None and not field.is_static:
+            values = brands.get(self._layouts.get(field.class_id))
+        if values is None:
+            raise TypeError(f"Cannot access private field {field.field_name}")
+        value = values[field.slot] if field.slot < len(values) else _EMPTY
+        if value is _EMPTY:
+            raise TypeError(f"Cannot access private field {field.field_name}")
+        return value
+
+    def store_field(self, instance: Any, field: PrivateField, value: Any) -> None:
+        """
+        Write a resolved private instance field.
+
+        The first write stamps the instance with the class brand; an
+        instance can carry the brands of several classes (one per class
+        in its inheritance chain).
+
+        Args:
+            instance: Class instance
+            field: Descriptor from resolve_private_field()
+            value: New value
+
+        Raises:
+            TypeError: If field is static
+        """
+        if field.is_static:
+            raise TypeError(f"Cannot access private field {field.field_name}")
+        layout = self._layouts[field.class_id]
+        brands = self._brands_of(instance)
+        if brands is None:
+            brands = self._attach_brands(instance)
+        values = brands.get(layout)
+        if values is None:
+            values = brands[layout] = [_EMPTY] * len(layout.slots)
+        elif field.slot >= len(values):
+            # Field defined after this instance was branded
+            values.extend([_EMPTY] * (len(layout.slots) - len(values)))
+        values[field.slot] = value
+
     def get_private_field(self, instance: Any, field_name: str) -> Any:
         """
         Get private field value from instance.
@@ -91,22 +220,8 @@ class PrivateFieldManager:
         if class_id is None:
             raise TypeError("Instance does not have class_id")
 
-        key = (class_id, field_name)
-
-        # Check if field is defined for this class
-        if key not in self._field_definitions:
-            raise TypeError(f"Cannot access private field {field_name}")
-
-        # Get instance field storage
-        if instance not in self._instance_fields:
-            raise TypeError(f"Cannot access private field {field_name}")
-
-        instance_storage = self._instance_fields[instance]
-
-        if key not in instance_storage:
-            raise TypeError(f"Cannot access private field {field_name}")
-
-        return instance_storage[key]
+        field = self.resolve_private_field(class_id, field_name)
+        return self.load_field(instance, field)
 
     def set_private_field(self, instance: Any, field_name: str, value: Any) -> None:
         """
@@ -127,18 +242,8 @@ class PrivateFieldManager:
         if class_id is None:
             raise TypeError("Instance does not have class_id")
 
-        key = (class_id, field_name)
-
-        # Check if field is defined for this class
-        if key not in self._field_definitions:
-            raise TypeError(f"Cannot access private field {field_name}")
-
-        # Initialize instance storage if needed
-        if instance not in self._instance_fields:
-            self._instance_fields[instance] = {}
-
-        instance_storage = self._instance_fields[instance]
-        instance_storage[key] = value
+        field = self.resolve_private_field(class_id, field_name)
+        self.store_field(instance, field, value)
 
     def initialize_field(self, instance: Any, field_name: str) -> None:
         """
@@ -162,10 +267,10 @@ class PrivateFieldManager:
         # Initialize if initializer exists
         if field.initializer is not None:
             initial_value = field.initializer()
-            self.set_private_field(instance, field_name, initial_value)
+            self.store_field(instance, field, initial_value)
         else:
             # Initialize with undefined (None in Python)
-            self.set_private_field(instance, field_name, None)
+            self.store_field(instance, field, None)
 
     def get_static_field(self, class_id: int, field_name: str) -> Any:
         """
@@ -230,15 +335,43 @@ class PrivateFieldManager:
         if class_id is None:
             return False
 
-        key = (class_id, field_name)
-
-        # Check if field is defined for this class
-        if key not in self._field_definitions:
+        field = self._field_definitions.get((class_id, field_name))
+        if field is None or field.is_static:
             return False
 
-        # Check if instance has been initialized with this field
-        if instance not in self._instance_fields:
-            return False
+        brands = self._brands_of(instance)
+        values = None if brands is None else brands.get(self._layouts[class_id])
+        return values is not None and field.slot < len(values) and values[field.slot] is not _EMPTY
+
+    def has_brand(self, instance: Any, class_id: int) -> bool:
+        """
+        Check if instance has been branded by a class's private fields.
 
-        instance_storage = self._instance_fields[instance]
-        return key in instance_storage
+        Args:
+            instance: Object to check
+            class_id: Class identifier
+
+        Returns:
+            True if the instance carries private storage of that class
+        """
+        brands = self._brands_of(instance)
+        return brands is not None and self._layouts.get(class_id) in brands
+
+    def _brands_of(self, instance: Any) -> Optional[_PrivateBrands]:
+        brands = getattr(instance, _BRANDS_ATTRIBUTE, None)
+        if type(brands) is _PrivateBrands:
+            return brands
+        try:
+            return self._detached_brands.get(instance)
+        except TypeError:
+            # Not weak-referenceable, so it never had detached storage
+            return None
+
+    def _attach_brands(self, instance: Any) -> _PrivateBrands:
+        brands = _PrivateBrands()
+        try:
+            setattr(instance, _BRANDS_ATTRIBUTE, brands)
+        except (AttributeError, TypeError):
+            # Objects without an attribute dict keep their brands on the side
+            self._detached_brands[instance] = brands
+        return brands
@@ -224,3 +224,108 @@ class MockInstance:
     def __init__(self, class_id):
         self.class_id = class_id
         self._private_fields = {}
+
+
+class TestPrivateFieldSlots:
+    """Test slot-based private field storage."""
+
+    def test_fields_get_slot_indices_in_definition_order(self):
+        """Test each class numbers its private fields from zero."""
+        manager = PrivateFieldManager()
+        x = manager.define_private_field(class_id=1, field_name="#x", initializer=None)
+        y = manager.define_private_field(class_id=1, field_name="#y", initializer=None)
+        other = manager.define_private_field(class_id=2, field_name="#x", initializer=None)
+        static = manager.define_private_field(
+            class_id=1, field_name="#count", initializer=None, is_static=True
+        )
+
+        assert (x.slot, y.slot, other.slot) == (0, 1, 0)
+        assert static.slot == -1
+        assert manager.resolve_private_field(1, "#y") is y
+
+    def test_resolved_field_load_and_store(self):
+        """Test access through a field resolved once per access site."""
+        manager = PrivateFieldManager()
+        manager.define_private_field(class_id=1, field_name="#x", initializer=None)
+        field = manager.resolve_private_field(1, "#x")
+        instance = MockInstance(class_id=1)
+
+        manager.store_field(instance, field, 5)
+
+        assert manager.load_field(instance, field) == 5
+        assert manager.get_private_field(instance, "#x") == 5
+        assert "#x" not in vars(instance)
+        assert 5 not in vars(instance).values()
+
+    def test_brand_mismatch_raises(self):
+        """Test another class's instance fails the brand check."""
+        manager = PrivateFieldManager()
+        a_field = manager.define_private_field(class_id=1, field_name="#x", initializer=None)
+        manager.define_private_field(class_id=2, field_name="#x", initializer=None)
+        instance = MockInstance(class_id=2)
+        manager.set_private_field(instance, "#x", 1)
+
+        with pytest.raises(TypeError):
+            manager.load_field(instance, a_field)
+        assert manager.has_brand(instance, 2)
+        assert not manager.has_brand(instance, 1)
+
+    def test_subclass_instance_carries_brand_per_class(self):
+        """Test an instance of class B extends A holds both classes' fields."""
+        manager = PrivateFieldManager()
+        a_field = manager.define_private_field(class_id=1, field_name="#a", initializer=None)
+        b_field = manager.define_private_field(class_id=2, field_name="#b", initializer=None)
+        instance = MockInstance(class_id=2)
+
+        # Derived-class fields first, then the base class's (any order works)
+        manager.store_field(instance, b_field, "b")
+        manager.store_field(instance, a_field, "a")
+
+        assert manager.load_field(instance, a_field) == "a"
+        assert manager.load_field(instance, b_field) == "b"
+        assert manager.has_brand(instance, 1) and manager.has_brand(instance, 2)
+        assert manager.has_field(instance, "#b")
+
+    def test_field_defined_after_instance_was_branded(self):
+        """Test a later-defined field extends existing slot arrays."""
+        manager = PrivateFieldManager()
+        manager.define_private_field(class_id=1, field_name="#a", initializer=None)
+        instance = MockInstance(class_id=1)
+        manager.set_private_field(instance, "#a", 1)
+        manager.define_private_field(class_id=1, field_name="#b", initializer=None)
+
+        assert not manager.has_field(instance, "#b")
+        manager.set_private_field(instance, "#b", 2)
+        assert manager.get_private_field(instance, "#b") == 2
+
+    def test_instances_without_attribute_dict(self):
+        """Test objects without an attribute dict can carry private fields."""
+
+        class SlottedInstance:
+            __slots__ = ("class_id", "__weakref__")
+
+            def __init__(self, class_id):
+                self.class_id = class_id
+
+        manager = PrivateFieldManager()
+        manager.define_private_field(class_id=1, field_name="#x", initializer=lambda: 7)
+        instance = SlottedInstance(class_id=1)
+        manager.initialize_field(instance, "#x")
+
+        assert manager.get_private_field(instance, "#x") == 7
+        assert manager.has_brand(instance, 1)
+
+    def test_managers_keep_separate_storage(self):
+        """Test two managers defining fields on the same object do not clash."""
+        first = PrivateFieldManager()
+        second = PrivateFieldManager()
+        first.define_private_field(class_id=1, field_name="#a", initializer=None)
+        second.define_private_field(class_id=1, field_name="#b", initializer=None)
+        instance = MockInstance(class_id=1)
+
+        first.set_private_field(instance, "#a", 1)
+        second.set_private_field(instance, "#b", 2)
+
+        assert first.get_private_field(instance, "#a") == 1
+        assert second.get_private_field(instance, "#b") == 2
+        assert first.has_brand(instance, 1) and second.has_brand(instance, 1)
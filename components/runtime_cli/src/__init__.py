@@ -8,6 +8,16 @@ from .cli_options import CLIOptions
 from .execute import ExecuteFile, EvaluateExpression
 from .repl import REPL
 from .test262_runner import Test262Runner, TestResult, TestResults
+from .isolate_pool import (
+    IsolatePool,
+    IsolateJob,
+    IsolateResult,
+    BytecodeCache,
+    DataCloneError,
+    ToTransferable,
+    FromTransferable,
+)
+from .host_api import CreateHostGlobals, HostObject, MapFile, ToJSValue, FromJSValue
 from .main import main
 
 __all__ = [
@@ -19,4 +29,16 @@ __all__ = [
     "Test262Runner",
     "TestResult",
     "TestResults",
+    "IsolatePool",
+    "IsolateJob",
+    "IsolateResult",
+    "BytecodeCache",
+    "DataCloneError",
+    "ToTransferable",
+    "FromTransferable",
+    "CreateHostGlobals",
+    "HostObject",
+    "MapFile",
+    "ToJSValue",
+    "FromJSValue",
 ]
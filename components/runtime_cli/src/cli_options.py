@@ -1,7 +1,7 @@
 """Command-line options dataclass."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 
 @dataclass
@@ -17,6 +17,11 @@ class CLIOptions:
         verbose: Enable verbose output
         dump_bytecode: Dump bytecode instead of executing
         dump_ast: Dump AST instead of executing
+        workers: Number of isolate worker processes (1 = run in-process)
+        filenames: All files to execute (file mode; filename is the first)
+        profile: Profile execution and write a report (--prof)
+        profile_output: Path prefix for profile files (collapsed stacks and
+            Chrome trace); derived from the script name if None
     """
 
     mode: str
@@ -26,3 +31,7 @@ class CLIOptions:
     verbose: bool = False
     dump_bytecode: bool = False
     dump_ast: bool = False
+    workers: int = 1
+    filenames: List[str] = field(default_factory=list)
+    profile: bool = False
+    profile_output: Optional[str] = None
@@ -1,13 +1,14 @@
 """File execution and expression evaluation functions."""
 
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from components.parser.src import Parse
 from components.bytecode.src import Compile
-from components.interpreter.src import Execute, EvaluationResult
+from components.interpreter.src import Execute, EvaluationResult, ExecutionProfiler
 from components.value_system.src import Value
 from components.memory_gc.src import GarbageCollector
+from .host_api import CreateHostGlobals, ToJSValue
 
 if TYPE_CHECKING:
     from .cli_options import CLIOptions
@@ -18,16 +19,25 @@ def _create_exception(message: str) -> Exception:
     return RuntimeError(message)
 
 
-def ExecuteFile(filename: str, options: "CLIOptions") -> EvaluationResult:
+def ExecuteFile(
+    filename: str,
+    options: "CLIOptions",
+    profiler: Optional[ExecutionProfiler] = None,
+    bindings: Optional[Dict[str, Any]] = None,
+) -> EvaluationResult:
     """
     Execute JavaScript file.
 
     Reads the file, parses it, compiles it to bytecode, and executes it.
-    Handles file I/O errors and syntax/runtime errors.
+    Handles file I/O errors and syntax/runtime errors. The script sees the
+    host API globals (see host_api.CreateHostGlobals), including mapFile().
 
     Args:
         filename: Path to JavaScript file to execute
         options: CLI options (for verbose, dump flags)
+        profiler: Execution profiler to record into (optional)
+        bindings: Extra globals (name -> Python value), e.g. a
+            MappedArrayBuffer prepared by the embedder (optional)
 
     Returns:
         EvaluationResult: Execution result or exception
@@ -38,6 +48,7 @@ def ExecuteFile(filename: str, options: "CLIOptions") -> EvaluationResult:
         >>> result = ExecuteFile("test.js", options)
         >>> result.is_success()  # True if execution succeeded
     """
+    gc = GarbageCollector()
     try:
         # Read file
         with open(filename, "r", encoding="utf-8") as f:
@@ -76,8 +87,12 @@ def ExecuteFile(filename: str, options: "CLIOptions") -> EvaluationResult:
             )  # Placeholder
 
         # Execute
-        result = Execute(bytecode)
-        return result
+        return Execute(
+            bytecode,
+            gc=gc,
+            profiler=profiler,
+            host_globals=_host_globals(gc, bindings),
+        )
 
     except FileNotFoundError as e:
         return EvaluationResult(
@@ -90,7 +105,11 @@ def ExecuteFile(filename: str, options: "CLIOptions") -> EvaluationResult:
         )
 
 
-def EvaluateExpression(expression: str, options: "CLIOptions") -> EvaluationResult:
+def EvaluateExpression(
+    expression: str,
+    options: "CLIOptions",
+    profiler: Optional[ExecutionProfiler] = None,
+) -> EvaluationResult:
     """
     Evaluate single JavaScript expression.
 
@@ -99,6 +118,7 @@ def EvaluateExpression(expression: str, options: "CLIOptions") -> EvaluationResu
     Args:
         expression: JavaScript expression to evaluate
         options: CLI options (for verbose, dump flags)
+        profiler: Execution profiler to record into (optional)
 
     Returns:
         EvaluationResult: Evaluation result or exception
@@ -146,13 +166,23 @@ def EvaluateExpression(expression: str, options: "CLIOptions") -> EvaluationResu
             )  # Placeholder
 
         # Execute
-        result = Execute(bytecode)
-        return result
+        gc = GarbageCollector()
+        return Execute(
+            bytecode, gc=gc, profiler=profiler, host_globals=CreateHostGlobals(gc)
+        )
 
     except Exception as e:
         return EvaluationResult(value=None, exception=_create_exception(f"Error: {e}"))
 
 
+def _host_globals(gc: GarbageCollector, bindings: Optional[Dict[str, Any]]):
+    """Host API globals plus embedder bindings converted to Values."""
+    host_globals = CreateHostGlobals(gc)
+    for name, value in (bindings or {}).items():
+        host_globals[name] = ToJSValue(value, gc)
+    return host_globals
+
+
 def _format_ast(ast) -> str:
     """Format AST for display."""
     return f"AST: {ast}"
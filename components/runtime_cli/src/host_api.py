@@ -0,0 +1,213 @@
+"""
+Host API - binary data globals provided to scripts by the runtime.
+
+Installs ArrayBuffer, the TypedArray constructors, DataView and
+``mapFile(path, mode)`` as script globals. ``mapFile`` returns an
+ArrayBuffer backed by a memory mapping of the file ("readonly" by default,
+or "copy-on-write"), so scripts can process multi-gigabyte inputs with
+memory use proportional to the pages they actually read.
+
+Python-side typed array objects are exposed to scripts through HostObject
+wrappers: attributes become properties, methods become callables, and
+TypedArrays support indexed element access.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+from components.memory_gc.src import GarbageCollector
+from components.object_runtime.src import Flatten, JSObject
+from components.value_system.src import Value
+
+# Add typed_arrays src to path
+typed_arrays_src = Path(__file__).parent.parent.parent / "typed_arrays" / "src"
+if str(typed_arrays_src) not in sys.path:
+    sys.path.insert(0, str(typed_arrays_src))
+
+import typed_array as _typed_array_module
+from array_buffer import ArrayBuffer
+from data_view import DataView
+from mapped_array_buffer import MappedArrayBuffer
+from typed_array import TypedArray
+
+
+TYPED_ARRAY_CONSTRUCTORS = (
+    "Int8Array",
+    "Uint8Array",
+    "Uint8ClampedArray",
+    "Int16Array",
+    "Uint16Array",
+    "Int32Array",
+    "Uint32Array",
+    "Float32Array",
+    "Float64Array",
+    "BigInt64Array",
+    "BigUint64Array",
+)
+
+# Attributes scripts may read on each wrapped type (methods included)
+_BUFFER_MEMBERS = frozenset(
+    {"byteLength", "maxByteLength", "resizable", "detached", "slice", "resize",
+     "transfer", "transferToFixedLength"}
+)
+_MAPPED_MEMBERS = _BUFFER_MEMBERS | {"path", "mode", "readonly", "close"}
+_TYPED_ARRAY_MEMBERS = frozenset(
+    {"buffer", "byteLength", "byteOffset", "length", "BYTES_PER_ELEMENT",
+     "fill", "subarray", "slice", "set", "indexOf", "includes", "join"}
+)
+_DATA_VIEW_MEMBERS = frozenset(
+    {"buffer", "byteLength", "byteOffset"}
+    | {
+        prefix + kind
+        for prefix in ("get", "set")
+        for kind in ("Int8", "Uint8", "Int16", "Uint16", "Int32", "Uint32",
+                     "Float32", "Float64", "BigInt64", "BigUint64")
+    }
+)
+
+
+def _members_of(target: Any) -> frozenset:
+    if isinstance(target, MappedArrayBuffer):
+        return _MAPPED_MEMBERS
+    if isinstance(target, ArrayBuffer):
+        return _BUFFER_MEMBERS
+    if isinstance(target, TypedArray):
+        return _TYPED_ARRAY_MEMBERS
+    if isinstance(target, DataView):
+        return _DATA_VIEW_MEMBERS
+    return frozenset()
+
+
+class HostObject(JSObject):
+    """
+    JSObject view of a Python host object.
+
+    Reads of exposed attributes are forwarded to the target; own properties
+    set by the script shadow them. Wrapped TypedArrays also forward indexed
+    element access.
+
+    Attributes:
+        target: The wrapped Python object
+    """
+
+    def __init__(self, gc: GarbageCollector, target: Any):
+        super().__init__(gc)
+        self.target = target
+        self._members = _members_of(target)
+
+    def get_property(self, key: str) -> Value:
+        if key in self._properties or key not in self._members:
+            return super().get_property(key)
+        attribute = getattr(self.target, key)
+        if callable(attribute):
+            return Value.from_object(_host_function(self._gc, attribute))
+        return ToJSValue(attribute, self._gc)
+
+    def has_property(self, key: str) -> bool:
+        return key in self._members or super().has_property(key)
+
+    def get_element(self, index: int) -> Value:
+        return ToJSValue(self.target[index], self._gc)
+
+    def set_element(self, index: int, value: Value) -> None:
+        self.target[index] = FromJSValue(value)
+
+
+def ToJSValue(value: Any, gc: GarbageCollector) -> Value:
+    """
+    Convert a Python host value to a script Value.
+
+    Args:
+        value: Python value (number, string, typed array object, ...)
+        gc: Garbage collector owning created wrappers
+
+    Returns:
+        Value; typed array objects are wrapped in HostObject
+    """
+    if isinstance(value, Value):
+        return value
+    if value is None:
+        return Value.from_smi(0)  # undefined placeholder
+    if isinstance(value, bool):
+        return Value.from_smi(1 if value else 0)
+    if isinstance(value, int):
+        return Value.from_smi(value)
+    if isinstance(value, float) and value.is_integer():
+        return Value.from_smi(int(value))
+    if isinstance(value, (ArrayBuffer, TypedArray, DataView)):
+        return Value.from_object(HostObject(gc, value))
+    return Value.from_object(value)
+
+
+def FromJSValue(value: Any) -> Any:
+    """
+    Convert a script Value to the Python value host APIs expect.
+
+    Args:
+        value: Value (or raw Python value)
+
+    Returns:
+        int for SMIs, the wrapped target for HostObjects, a flat str for
+        strings, otherwise the underlying object
+    """
+    if isinstance(value, Value):
+        if value.is_smi():
+            return value.to_smi()
+        value = value.to_object()
+    if isinstance(value, HostObject):
+        return value.target
+    return Flatten(value)
+
+
+def _host_function(gc: GarbageCollector, function):
+    """Wrap a Python callable so it takes and returns script Values."""
+
+    def call(*args):
+        result = ToJSValue(function(*(FromJSValue(arg) for arg in args)), gc)
+        # The interpreter wraps non-Value results of calls and constructions
+        # itself, so objects are returned unwrapped
+        return result.to_object() if result.is_object() else result
+
+    call.__name__ = getattr(function, "__name__", "host")
+    return call
+
+
+def MapFile(path: str, mode: str = "readonly", offset: int = 0, length=None) -> MappedArrayBuffer:
+    """
+    Create an ArrayBuffer backed by a memory mapping of a file.
+
+    Args:
+        path: File to map
+        mode: "readonly" or "copy-on-write"
+        offset: Byte offset in the file
+        length: Number of bytes (default: rest of the file)
+
+    Returns:
+        MappedArrayBuffer whose pages are read from the file on first touch
+    """
+    return MappedArrayBuffer(path, mode, offset, length)
+
+
+def CreateHostGlobals(gc: GarbageCollector) -> Dict[str, Value]:
+    """
+    Build the binary-data globals installed for scripts.
+
+    Args:
+        gc: Garbage collector of the context the globals are for
+
+    Returns:
+        Dictionary of global name -> Value for Execute(host_globals=...)
+
+    Example:
+        >>> gc = GarbageCollector()
+        >>> Execute(bytecode, gc=gc, host_globals=CreateHostGlobals(gc))
+    """
+    host_globals = {
+        "mapFile": _host_function(gc, MapFile),
+        "ArrayBuffer": _host_function(gc, ArrayBuffer),
+        "DataView": _host_function(gc, DataView),
+    }
+    for name in TYPED_ARRAY_CONSTRUCTORS:
+        host_globals[name] = _host_function(gc, getattr(_typed_array_module, name))
+    return {name: Value.from_object(function) for name, function in host_globals.items()}
@@ -0,0 +1,446 @@
+"""Multi-process isolate pool for running scripts across CPU cores.
+
+The runtime is single-threaded Python, so one process uses one core.
+IsolatePool pre-forks N worker processes, each holding a warmed realm
+snapshot and a bytecode cache, and dispatches ExecuteFile/EvaluateExpression
+style jobs to them over pipes. Arguments and results cross the process
+boundary as structured clones: plain Python ints, strings, lists and dicts
+that are rebuilt as JS values on the other side.
+"""
+
+import multiprocessing
+import os
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional
+
+from components.bytecode.src import Compile
+from components.event_loop.src import EventLoop
+from components.interpreter.src import GetDefaultRealmSnapshot, Interpreter
+from components.memory_gc.src import GarbageCollector
+from components.object_runtime.src import ConsString, JSArray, JSFunction, JSObject
+from components.parser.src import Parse
+from components.promise.src import JSPromise, PromiseState
+from components.value_system.src import Value
+
+from .host_api import CreateHostGlobals
+
+
+class DataCloneError(Exception):
+    """Raised when a value cannot be transferred between isolates."""
+
+
+@dataclass
+class IsolateJob:
+    """
+    Unit of work for an isolate worker.
+
+    Attributes:
+        kind: "file" to execute a file, "eval" to evaluate an expression
+        target: Filename or expression source
+        bindings: Global variables to define before running (structured-cloned)
+    """
+
+    kind: str
+    target: str
+    bindings: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class IsolateResult:
+    """
+    Outcome of an isolate job.
+
+    Attributes:
+        value: Structured clone of the completion value (None on error)
+        error: Error message if the job failed, None otherwise
+        worker_id: Index of the worker that ran the job
+    """
+
+    value: Any = None
+    error: Optional[str] = None
+    worker_id: int = -1
+
+    def is_success(self) -> bool:
+        """Check if the job completed without error."""
+        return self.error is None
+
+
+def ToTransferable(value: Any, _memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Structured-clone a JS value into plain, picklable Python data.
+
+    SMIs become ints, strings stay strings, JSArrays become lists and
+    JSObjects become dicts of their own properties. Cycles are preserved.
+    Settled promises are unwrapped to their fulfillment value.
+    SharedArrayBuffers are shared rather than copied: they pickle as a
+    reference to their shared memory segment.
+
+    Args:
+        value: Value (or raw object) to clone
+
+    Returns:
+        Picklable Python representation
+
+    Raises:
+        DataCloneError: For functions, rejected/pending promises and other
+            values with no structured-clone representation
+    """
+    if _memo is None:
+        _memo = {}
+
+    if isinstance(value, Value):
+        if value.is_smi():
+            return value.to_smi()
+        value = value.to_object()
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, ConsString):
+        return value.flatten()
+
+    if id(value) in _memo:
+        return _memo[id(value)]
+
+    if isinstance(value, JSPromise):
+        if value.state == PromiseState.FULFILLED:
+            return ToTransferable(value.value, _memo)
+        if value.state == PromiseState.REJECTED:
+            raise DataCloneError(f"Promise rejected: {value.value}")
+        raise DataCloneError("Promise is still pending")
+
+    if isinstance(value, JSFunction) or callable(value):
+        raise DataCloneError("function could not be cloned")
+
+    if getattr(value, "_shared", False):
+        return value
+
+    if isinstance(value, JSArray):
+        result: List[Any] = []
+        _memo[id(value)] = result
+        for index in range(value._length):
+            result.append(ToTransferable(value.get_element(index), _memo))
+        return result
+
+    if isinstance(value, JSObject):
+        result_obj: Dict[str, Any] = {}
+        _memo[id(value)] = result_obj
+        for key, prop in value._properties.items():
+            result_obj[key] = ToTransferable(prop, _memo)
+        return result_obj
+
+    if isinstance(value, (list, tuple)):
+        result = []
+        _memo[id(value)] = result
+        result.extend(ToTransferable(item, _memo) for item in value)
+        return result
+
+    if isinstance(value, dict):
+        result_obj = {}
+        _memo[id(value)] = result_obj
+        for key, item in value.items():
+            result_obj[str(key)] = ToTransferable(item, _memo)
+        return result_obj
+
+    raise DataCloneError(f"{type(value).__name__} could not be cloned")
+
+
+def FromTransferable(
+    data: Any, gc: GarbageCollector, _memo: Optional[Dict[int, Value]] = None
+) -> Value:
+    """
+    Rebuild a JS value from structured-clone data.
+
+    Args:
+        data: Output of ToTransferable (or equivalent plain Python data)
+        gc: Garbage collector owning created objects
+
+    Returns:
+        Value for the data (lists become JSArrays, dicts become JSObjects)
+
+    Raises:
+        DataCloneError: For data with no JS representation in this runtime
+    """
+    if _memo is None:
+        _memo = {}
+
+    if data is None:
+        return Value.from_smi(0)  # undefined placeholder
+    if isinstance(data, bool):
+        return Value.from_smi(1 if data else 0)
+    if isinstance(data, int):
+        return Value.from_smi(data)
+    if isinstance(data, float):
+        if data.is_integer():
+            return Value.from_smi(int(data))
+        raise DataCloneError(f"number {data!r} could not be cloned")
+    if isinstance(data, str):
+        return Value.from_object(data)
+
+    if id(data) in _memo:
+        return _memo[id(data)]
+
+    if getattr(data, "_shared", False):
+        return Value.from_object(data)
+
+    if isinstance(data, (list, tuple)):
+        array = JSArray(gc)
+        value = Value.from_object(array)
+        _memo[id(data)] = value
+        for item in data:
+            array.push(FromTransferable(item, gc, _memo))
+        return value
+
+    if isinstance(data, dict):
+        obj = JSObject(gc)
+        value = Value.from_object(obj)
+        _memo[id(data)] = value
+        for key, item in data.items():
+            obj.set_property(str(key), FromTransferable(item, gc, _memo))
+        return value
+
+    raise DataCloneError(f"{type(data).__name__} could not be cloned")
+
+
+class BytecodeCache:
+    """
+    Compiled bytecode per source file, invalidated when the file changes.
+
+    Each isolate worker keeps one cache for its lifetime, so repeated jobs
+    for the same file skip parsing and compilation.
+    """
+
+    def __init__(self):
+        """Initialize empty cache."""
+        self._entries: Dict[str, tuple] = {}  # path -> (mtime_ns, size, bytecode)
+
+    def get(self, filename: str):
+        """
+        Get bytecode for a file, compiling it if missing or stale.
+
+        Args:
+            filename: Path to JavaScript file
+
+        Returns:
+            Compiled BytecodeArray
+
+        Raises:
+            OSError: If the file cannot be read
+            SyntaxError: If the file fails to parse
+        """
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+        bytecode = Compile(Parse(source, filename))
+        self._entries[path] = (stat.st_mtime_ns, stat.st_size, bytecode)
+        return bytecode
+
+    def preload(self, filenames: List[str]) -> None:
+        """Compile files ahead of time; unreadable or invalid files are skipped."""
+        for filename in filenames:
+            try:
+                self.get(filename)
+            except (OSError, SyntaxError):
+                continue
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _run_job(job: IsolateJob, snapshot, cache: BytecodeCache) -> IsolateResult:
+    """Run one job inside a worker and return its transferable result."""
+    try:
+        if job.kind == "file":
+            bytecode = cache.get(job.target)
+        elif job.kind == "eval":
+            bytecode = Compile(Parse(job.target, "<eval>"))
+        else:
+            return IsolateResult(error=f"Error: unknown job kind {job.kind!r}")
+    except FileNotFoundError:
+        return IsolateResult(error=f"FileNotFoundError: No such file: {job.target}")
+    except SyntaxError as e:
+        return IsolateResult(error=f"SyntaxError: {e}")
+    except Exception as e:
+        return IsolateResult(error=f"CompileError: {e}")
+
+    try:
+        gc = GarbageCollector()
+        event_loop = EventLoop()
+        interpreter = Interpreter(gc, event_loop, realm=snapshot)
+        for name, value in CreateHostGlobals(gc).items():
+            interpreter.set_global(name, value)
+        for name, data in job.bindings.items():
+            interpreter.set_global(name, FromTransferable(data, gc))
+
+        result = interpreter.execute(bytecode)
+        event_loop.run()
+
+        if not result.is_success():
+            return IsolateResult(error=f"{type(result.exception).__name__}: {result.exception}")
+        return IsolateResult(value=ToTransferable(result.value))
+    except DataCloneError as e:
+        return IsolateResult(error=f"DataCloneError: {e}")
+    except Exception as e:
+        return IsolateResult(error=f"Error: {e}")
+
+
+def _worker_main(conn, worker_id: int, preload: List[str]) -> None:
+    """Worker process loop: warm up, then serve jobs until told to stop."""
+    snapshot = GetDefaultRealmSnapshot()
+    cache = BytecodeCache()
+    cache.preload(preload)
+    conn.send(("ready", worker_id))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        job_id, job = message
+        result = _run_job(job, snapshot, cache)
+        result.worker_id = worker_id
+        conn.send((job_id, result))
+
+    conn.close()
+
+
+class IsolatePool:
+    """
+    Pool of pre-forked worker processes running JavaScript jobs.
+
+    Example:
+        >>> with IsolatePool(workers=4) as pool:
+        ...     results = pool.map_files(["a.js", "b.js", "c.js"])
+        ...     pool.evaluate("x * 2", bindings={"x": 21}).value
+        42
+    """
+
+    def __init__(self, workers: Optional[int] = None, preload: Optional[List[str]] = None):
+        """
+        Start worker processes.
+
+        Args:
+            workers: Number of worker processes (default: CPU count)
+            preload: Files each worker compiles into its bytecode cache at startup
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+
+        self._connections = []
+        self._processes = []
+        for worker_id in range(workers):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker_main,
+                args=(child_conn, worker_id, list(preload or [])),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+
+        # Wait for every worker to finish warming up
+        for conn in self._connections:
+            conn.recv()
+
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Number of worker processes."""
+        return len(self._processes)
+
+    def run_jobs(self, jobs: List[IsolateJob]) -> List[IsolateResult]:
+        """
+        Run jobs across all workers and return results in job order.
+
+        Each idle worker receives the next pending job as soon as it
+        finishes its previous one.
+
+        Args:
+            jobs: Jobs to run
+
+        Returns:
+            One IsolateResult per job, in the same order
+
+        Raises:
+            RuntimeError: If the pool is closed or a worker dies
+        """
+        if self._closed:
+            raise RuntimeError("IsolatePool is closed")
+
+        results: List[Optional[IsolateResult]] = [None] * len(jobs)
+        pending = iter(enumerate(jobs))
+        busy = {}  # connection -> job index
+
+        def dispatch(conn) -> None:
+            for job_id, job in pending:
+                conn.send((job_id, job))
+                busy[conn] = job_id
+                return
+
+        for conn in self._connections:
+            dispatch(conn)
+
+        while busy:
+            for conn in wait(list(busy)):
+                try:
+                    job_id, result = conn.recv()
+                except EOFError:
+                    raise RuntimeError("isolate worker exited unexpectedly")
+                del busy[conn]
+                results[job_id] = result
+                dispatch(conn)
+
+        return results
+
+    def execute_file(self, filename: str, bindings: Optional[Dict[str, Any]] = None) -> IsolateResult:
+        """Execute one file in a worker (see ExecuteFile)."""
+        return self.run_jobs([IsolateJob("file", filename, dict(bindings or {}))])[0]
+
+    def evaluate(self, expression: str, bindings: Optional[Dict[str, Any]] = None) -> IsolateResult:
+        """Evaluate one expression in a worker (see EvaluateExpression)."""
+        return self.run_jobs([IsolateJob("eval", expression, dict(bindings or {}))])[0]
+
+    def map_files(self, filenames: List[str]) -> List[IsolateResult]:
+        """Execute many files in parallel; results are in input order."""
+        return self.run_jobs([IsolateJob("file", filename) for filename in filenames])
+
+    def close(self) -> None:
+        """Stop all workers and wait for them to exit."""
+        if self._closed:
+            return
+        self._closed = True
+        for conn in self._connections:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._connections:
+            conn.close()
+
+    def __enter__(self) -> "IsolatePool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -4,10 +4,12 @@ import argparse
 import sys
 from typing import List, Optional
 
-from components.interpreter.src import Interpreter
+from components.interpreter.src import ExecutionProfiler, Interpreter
 from components.memory_gc.src import GarbageCollector
+from components.value_system.src import NumberToString
 from components.runtime_cli.src.cli_options import CLIOptions
 from components.runtime_cli.src.execute import ExecuteFile, EvaluateExpression
+from components.runtime_cli.src.isolate_pool import IsolatePool
 from components.runtime_cli.src.repl import REPL
 from components.runtime_cli.src.test262_runner import Test262Runner
 
@@ -17,7 +19,7 @@ def main(args: Optional[List[str]] = None) -> int:
     Main entry point for JavaScript runtime CLI.
 
     Parses command-line arguments and executes the appropriate mode:
-    - file: Execute a JavaScript file
+    - file: Execute a JavaScript file (or several, with --workers)
     - eval: Evaluate a single expression
     - repl: Start interactive REPL shell
     - test262: Run Test262 conformance tests
@@ -65,8 +67,10 @@ def main(args: Optional[List[str]] = None) -> int:
         help="Run Test262 test(s) at PATH",
     )
 
-    # Positional argument for file
-    parser.add_argument("filename", nargs="?", help="JavaScript file to execute")
+    # Positional argument for file(s)
+    parser.add_argument(
+        "filenames", nargs="*", metavar="filename", help="JavaScript file(s) to execute"
+    )
 
     # Optional flags
     parser.add_argument(
@@ -82,16 +86,40 @@ def main(args: Optional[List[str]] = None) -> int:
         action="store_true",
         help="Dump bytecode instead of executing",
     )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Execute files in N isolate worker processes (0 = one per CPU)",
+    )
+
+    parser.add_argument(
+        "--prof",
+        action="store_true",
+        help="Profile execution: print hot functions and opcodes, write "
+        "collapsed stacks (flamegraph) and a Chrome trace",
+    )
+    parser.add_argument(
+        "--prof-output",
+        metavar="PREFIX",
+        help="Path prefix for --prof output files (default: script name)",
+    )
 
     # Parse arguments
     parsed_args = parser.parse_args(args)
+    filename = parsed_args.filenames[0] if parsed_args.filenames else None
+    if parsed_args.prof and (parsed_args.workers != 1 or len(parsed_args.filenames) > 1):
+        # The profiler samples one interpreter; pool workers run in other processes
+        parser.error("--prof cannot be combined with --workers or several files")
 
     # Determine mode
     if parsed_args.expression:
         mode = "eval"
     elif parsed_args.test262_path:
         mode = "test262"
-    elif parsed_args.filename:
+    elif filename:
         mode = "file"
     else:
         mode = "repl"
@@ -99,30 +127,43 @@ def main(args: Optional[List[str]] = None) -> int:
     # Create CLIOptions
     options = CLIOptions(
         mode=mode,
-        filename=parsed_args.filename,
+        filename=filename,
         expression=parsed_args.expression,
         test262_path=parsed_args.test262_path,
         verbose=parsed_args.verbose,
         dump_bytecode=parsed_args.dump_bytecode,
         dump_ast=parsed_args.dump_ast,
+        workers=parsed_args.workers,
+        filenames=parsed_args.filenames,
+        profile=parsed_args.prof,
+        profile_output=parsed_args.prof_output,
     )
+    profiler = ExecutionProfiler() if options.profile else None
 
     try:
         # Execute based on mode
         if mode == "eval":
             # Evaluate expression
-            result = EvaluateExpression(parsed_args.expression, options)
+            result = EvaluateExpression(parsed_args.expression, options, profiler)
+            if profiler is not None:
+                _write_profile(profiler, options)
             if result.is_success():
                 if result.value is not None:
-                    print(result.value.to_smi())
+                    print(NumberToString(result.value.to_number()))
                 return 0
             else:
                 print(f"Error: {result.exception}", file=sys.stderr)
                 return 1
 
+        elif mode == "file" and (options.workers != 1 or len(options.filenames) > 1):
+            # Execute files in parallel isolate workers
+            return _run_files_in_pool(options)
+
         elif mode == "file":
             # Execute file
-            result = ExecuteFile(parsed_args.filename, options)
+            result = ExecuteFile(filename, options, profiler)
+            if profiler is not None:
+                _write_profile(profiler, options)
             if result.is_success():
                 return 0
             else:
@@ -169,3 +210,52 @@ def main(args: Optional[List[str]] = None) -> int:
         return 1
 
     return 0
+
+
+def _run_files_in_pool(options: CLIOptions) -> int:
+    """
+    Execute options.filenames across an isolate pool.
+
+    Args:
+        options: CLI options (workers, filenames, verbose)
+
+    Returns:
+        Exit code (0 if every file succeeded, 1 otherwise)
+    """
+    workers = options.workers if options.workers > 0 else None
+    with IsolatePool(workers=workers) as pool:
+        results = pool.map_files(options.filenames)
+
+    exit_code = 0
+    for filename, result in zip(options.filenames, results):
+        if result.is_success():
+            if options.verbose:
+                print(f"{filename}: {result.value!r}")
+        else:
+            print(f"{filename}: Error: {result.error}", file=sys.stderr)
+            exit_code = 1
+    return exit_code
+
+
+def _write_profile(profiler: ExecutionProfiler, options: CLIOptions) -> None:
+    """
+    Print the profile summary and write the profile files for --prof.
+
+    Writes PREFIX.collapsed (collapsed stacks for flamegraph tools) and
+    PREFIX.trace.json (Chrome trace-event format).
+
+    Args:
+        profiler: Profiler that recorded the run
+        options: CLI options (profile_output, filename)
+    """
+    prefix = options.profile_output
+    if prefix is None:
+        prefix = options.filename if options.mode == "file" else "eval"
+    collapsed_path = f"{prefix}.collapsed"
+    trace_path = f"{prefix}.trace.json"
+
+    profiler.write_collapsed_stacks(collapsed_path)
+    profiler.write_chrome_trace(trace_path)
+
+    print(profiler.format_report(), file=sys.stderr)
+    print(f"Profile written to {collapsed_path} and {trace_path}", file=sys.stderr)
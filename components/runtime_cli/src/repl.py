@@ -6,6 +6,7 @@ from components.parser.src import Parse
 from components.bytecode.src import Compile
 from components.interpreter.src import Interpreter
 from components.memory_gc.src import GarbageCollector
+from components.value_system.src import NumberToString
 
 if TYPE_CHECKING:
     pass
@@ -85,10 +86,8 @@ class REPL:
                 if result.is_exception():
                     print(f"Error: {result.exception}")
                 elif result.value is not None:
-                    # Print the result value
-                    # Note: This will show SMI representation for now
-                    smi = result.value.to_smi()
-                    print(smi)
+                    # Print the result value (numbers only for now)
+                    print(NumberToString(result.value.to_number()))
 
             except EOFError:
                 # Ctrl+D pressed
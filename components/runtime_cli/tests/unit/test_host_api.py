@@ -0,0 +1,97 @@
+"""Tests for the host API globals (typed arrays and mapFile)."""
+
+import os
+import struct
+import tempfile
+
+import pytest
+
+from components.memory_gc.src import GarbageCollector
+from components.runtime_cli.src.cli_options import CLIOptions
+from components.runtime_cli.src.execute import ExecuteFile
+from components.runtime_cli.src.host_api import (
+    FromJSValue,
+    HostObject,
+    MapFile,
+    ToJSValue,
+)
+
+
+@pytest.fixture
+def files():
+    """Create temporary files and remove them afterwards."""
+    paths = []
+
+    def create(content, suffix):
+        mode = "wb" if isinstance(content, bytes) else "w"
+        with tempfile.NamedTemporaryFile(mode=mode, suffix=suffix, delete=False) as f:
+            f.write(content)
+        paths.append(f.name)
+        return f.name
+
+    yield create
+    for path in paths:
+        os.unlink(path)
+
+
+def test_script_maps_file_and_reads_views(files):
+    """Test a script maps a binary file and reads it through views."""
+    data = files(struct.pack("<4I", 1, 2, 3, 40), ".bin")
+    script = files(
+        f"""
+        var buf = mapFile("{data}");
+        var view = new Uint32Array(buf);
+        var total = 0;
+        for (var i = 0; i < view.length; i = i + 1) {{ total = total + view[i]; }}
+        var dv = new DataView(buf);
+        total + dv.getUint8(12) + buf.byteLength;
+        """,
+        ".js",
+    )
+
+    result = ExecuteFile(script, CLIOptions(mode="file"))
+
+    assert result.is_success()
+    assert result.value.to_smi() == 46 + 40 + 16
+
+
+def test_script_copy_on_write_mapping(files):
+    """Test copy-on-write mappings accept writes without touching the file."""
+    data = files(bytes(4), ".bin")
+    script = files(
+        f"""
+        var bytes = new Uint8Array(mapFile("{data}", "copy-on-write"));
+        bytes.fill(7, 0, 1);
+        bytes[0];
+        """,
+        ".js",
+    )
+
+    result = ExecuteFile(script, CLIOptions(mode="file"))
+
+    assert result.value.to_smi() == 7
+    with open(data, "rb") as f:
+        assert f.read() == bytes(4)
+
+
+def test_execute_file_bindings_expose_buffers(files):
+    """Test an embedder can hand a mapped buffer to a script."""
+    data = files(bytes([5, 6, 7]), ".bin")
+    script = files("input.byteLength + new Uint8Array(input)[2];", ".js")
+
+    result = ExecuteFile(script, CLIOptions(mode="file"), bindings={"input": MapFile(data)})
+
+    assert result.value.to_smi() == 3 + 7
+
+
+def test_value_conversion_round_trip(files):
+    """Test host objects are wrapped and unwrapped."""
+    gc = GarbageCollector()
+    buffer = MapFile(files(bytes(8), ".bin"))
+
+    value = ToJSValue(buffer, gc)
+
+    assert isinstance(value.to_object(), HostObject)
+    assert FromJSValue(value) is buffer
+    assert value.to_object().get_property("readonly").to_smi() == 1
+    assert FromJSValue(ToJSValue(5, gc)) == 5
@@ -0,0 +1,158 @@
+"""Tests for the multi-process isolate pool."""
+
+import os
+import tempfile
+
+import pytest
+
+from components.memory_gc.src import GarbageCollector
+from components.object_runtime.src import JSArray, JSObject
+from components.value_system.src import Value
+from components.runtime_cli.src.isolate_pool import (
+    BytecodeCache,
+    DataCloneError,
+    FromTransferable,
+    IsolatePool,
+    ToTransferable,
+)
+from components.runtime_cli.src.main import main
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Two-worker pool shared by the tests in this module."""
+    with IsolatePool(workers=2) as isolate_pool:
+        yield isolate_pool
+
+
+@pytest.fixture
+def script_files():
+    """Create temporary script files and remove them afterwards."""
+    paths = []
+
+    def create(source):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".js", delete=False) as f:
+            f.write(source)
+        paths.append(f.name)
+        return f.name
+
+    yield create
+    for path in paths:
+        os.unlink(path)
+
+
+def test_structured_clone_round_trip():
+    """Test nested arrays and objects survive a clone round trip."""
+    gc = GarbageCollector()
+    data = {"name": "job", "items": [1, 2, [3, "four"]], "nested": {"ok": 1}}
+
+    value = FromTransferable(data, gc)
+
+    assert isinstance(value.to_object(), JSObject)
+    assert ToTransferable(value) == data
+
+
+def test_structured_clone_preserves_cycles():
+    """Test cyclic structures are cloned without infinite recursion."""
+    gc = GarbageCollector()
+    array = JSArray(gc)
+    array.push(Value.from_smi(1))
+    array.push(Value.from_object(array))
+
+    clone = ToTransferable(Value.from_object(array))
+
+    assert clone[0] == 1
+    assert clone[1] is clone
+
+
+def test_structured_clone_rejects_functions():
+    """Test functions cannot be transferred."""
+    with pytest.raises(DataCloneError):
+        ToTransferable(Value.from_object(lambda: None))
+
+
+def test_structured_clone_shares_shared_array_buffers():
+    """Test SharedArrayBuffers pass through by reference, not by copy."""
+    from components.atomics_extensions.src.shared_array_buffer import (
+        SharedArrayBufferIntegration,
+    )
+
+    gc = GarbageCollector()
+    sab = SharedArrayBufferIntegration().create_shared_buffer(8)
+
+    clone = ToTransferable({"data": sab})
+
+    assert clone["data"] is sab
+    value = FromTransferable(clone, gc)
+    assert value.to_object().get_property("data").to_object() is sab
+
+
+def test_bytecode_cache_reuses_and_invalidates(script_files):
+    """Test cached bytecode is reused until the file changes."""
+    path = script_files("1 + 1;")
+    cache = BytecodeCache()
+
+    first = cache.get(path)
+    assert cache.get(path) is first
+
+    with open(path, "w") as f:
+        f.write("2 + 2 + 2;")
+    assert cache.get(path) is not first
+
+
+def test_pool_evaluate_with_bindings(pool):
+    """Test an expression sees transferred global bindings."""
+    result = pool.evaluate("x * 2", bindings={"x": 21})
+
+    assert result.is_success()
+    assert result.value == 42
+
+
+def test_pool_returns_structured_results(pool):
+    """Test arrays come back as plain Python lists."""
+    result = pool.evaluate("[1, 2, 3]")
+
+    assert result.is_success()
+    assert result.value == [1, 2, 3]
+
+
+def test_pool_map_files_preserves_order(pool, script_files):
+    """Test map_files returns results in input order across workers."""
+    paths = [script_files(f"var x = {n}; x * 10;") for n in range(6)]
+
+    results = pool.map_files(paths)
+
+    assert [r.value for r in results] == [0, 10, 20, 30, 40, 50]
+    assert {r.worker_id for r in results} <= {0, 1}
+
+
+def test_pool_reports_errors(pool):
+    """Test failures come back as error results without killing workers."""
+    missing = pool.execute_file("/nonexistent/script.js")
+    bad = pool.evaluate("var = ;")
+
+    assert not missing.is_success()
+    assert "FileNotFoundError" in missing.error
+    assert not bad.is_success()
+    assert pool.evaluate("1 + 1").value == 2
+
+
+def test_pool_rejects_invalid_worker_count():
+    """Test a pool needs at least one worker."""
+    with pytest.raises(ValueError):
+        IsolatePool(workers=0)
+
+
+def test_main_workers_mode(script_files):
+    """Test --workers runs several files through the pool."""
+    first = script_files("var a = 1;")
+    second = script_files("var b = 2;")
+
+    assert main(["--workers", "2", first, second]) == 0
+
+
+def test_main_workers_mode_failure(script_files):
+    """Test --workers returns non-zero when any file fails."""
+    good = script_files("var a = 1;")
+
+    assert main(["--workers", "2", good, "/nonexistent/script.js"]) == 1
@@ -170,3 +170,29 @@ def test_main_no_args_uses_sys_argv(monkeypatch):
 
         assert mock_repl_class.called
         assert exit_code == 0
+
+
+def test_main_prof_writes_profile(tmp_path, capsys):
+    """Test --prof prints a report and writes collapsed stacks and a trace."""
+    script = tmp_path / "script.js"
+    script.write_text("function f(n) { return n + 1; } f(1); f(2);")
+    prefix = str(tmp_path / "out")
+
+    exit_code = main(["--prof", "--prof-output", prefix, str(script)])
+
+    assert exit_code == 0
+    assert "Functions (by self time)" in capsys.readouterr().err
+    assert os.path.exists(prefix + ".collapsed")
+    assert os.path.exists(prefix + ".trace.json")
+
+
+def test_main_prof_rejects_pool_mode(tmp_path, capsys):
+    """Test --prof with --workers or several files is an error instead of a silent no-op."""
+    script = tmp_path / "script.js"
+    script.write_text("1;")
+
+    for args in (["--workers", "2", str(script)], [str(script), str(script)]):
+        with pytest.raises(SystemExit) as exc_info:
+            main(["--prof"] + args)
+        assert exc_info.value.code == 2
+        assert "--prof cannot be combined" in capsys.readouterr().err
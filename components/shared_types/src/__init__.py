@@ -15,11 +15,16 @@ Public API:
     - JSRangeError: JavaScript RangeError with cause support
     - JSSyntaxError: JavaScript SyntaxError with cause support
     - JSReferenceError: JavaScript ReferenceError with cause support
+    - AtomTable: Interning table for property keys and identifiers
+    - ATOMS: The engine-wide AtomTable
+    - atomize: Get the engine-wide atom for a name
+    - intern_key: Intern a runtime property key without atomizing it
 """
 
 from .types import TypeTag, ErrorType
 from .location import SourceLocation
 from .utils import assert_type, format_error
+from .atoms import AtomTable, ATOMS, atomize, intern_key
 from .errors import (
     JSError,
     JSTypeError,
@@ -39,6 +44,10 @@ __all__ = [
     "JSRangeError",
     "JSSyntaxError",
     "JSReferenceError",
+    "AtomTable",
+    "ATOMS",
+    "atomize",
+    "intern_key",
 ]
 
 __version__ = "0.1.0"
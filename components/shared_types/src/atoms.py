@@ -0,0 +1,153 @@
+"""
+Engine-wide atom table for property keys and identifiers.
+
+An atom is the single canonical str object for a given name. The compiler
+atomizes the identifiers and property names it puts in a constant pool,
+and JSObject, shapes and inline caches store keys interned (intern_key).
+Both are sys.intern strings, so a key built at runtime resolves to the
+compiler's atom: dict lookups with it succeed on the identity check and
+never compare characters, and every object holding a "length" or "x"
+property shares one key object.
+
+Only atoms get a small integer ID, which is stable for the life of the
+process and usable as a compact key (e.g. in shape transition tables or
+dumps); the table holds them strongly, so it grows with the program text
+only. Runtime keys (computed property names, string data) are merely
+interned, and the interpreter drops such strings with their last reference.
+"""
+
+import sys
+import threading
+from typing import Any, Dict, List
+
+
+class AtomTable:
+    """
+    Interning table mapping names to canonical str atoms and integer IDs.
+
+    Example:
+        >>> table = AtomTable()
+        >>> a = table.atomize("".join(["na", "me"]))
+        >>> a is table.atomize("name")
+        True
+        >>> table.name_of(table.atom_id("name"))
+        'name'
+    """
+
+    def __init__(self):
+        """Initialize an empty atom table."""
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def atomize(self, name: Any) -> Any:
+        """
+        Get the atom for a name.
+
+        Args:
+            name: Property key or identifier; str subclasses and other
+                string-like values (e.g. ropes) are flattened with str().
+                Non-string keys (symbols, integers) are returned unchanged.
+
+        Returns:
+            The canonical str object for name
+        """
+        atom = intern_key(name)
+        if type(atom) is not str:
+            return atom
+        if atom not in self._ids:
+            with self._lock:
+                if atom not in self._ids:
+                    self._ids[atom] = len(self._names)
+                    self._names.append(atom)
+        return atom
+
+    def atom_id(self, name: str) -> int:
+        """
+        Get the integer ID of a name's atom, atomizing it if needed.
+
+        Args:
+            name: Property key or identifier
+
+        Returns:
+            Stable atom ID
+        """
+        atom = self.atomize(name)
+        return self._ids[atom]
+
+    def name_of(self, atom_id: int) -> str:
+        """
+        Get the atom with a given ID.
+
+        Args:
+            atom_id: ID returned by atom_id()
+
+        Returns:
+            The atom
+
+        Raises:
+            IndexError: If no atom has that ID
+        """
+        return self._names[atom_id]
+
+    def is_atom(self, name: Any) -> bool:
+        """True if name is itself the canonical atom object for its text."""
+        if type(name) is not str:
+            return False
+        atom_id = self._ids.get(name)
+        return atom_id is not None and self._names[atom_id] is name
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+# The process-wide table shared by the compiler, objects, shapes and ICs
+ATOMS = AtomTable()
+
+
+def atomize(name: Any) -> Any:
+    """
+    Get the engine-wide atom for a property key or identifier.
+
+    Args:
+        name: Property key (non-string keys are returned unchanged)
+
+    Returns:
+        The canonical str object for name
+
+    Example:
+        >>> atomize("".join(["x", "y"])) is atomize("xy")
+        True
+    """
+    return ATOMS.atomize(name)
+
+
+def intern_key(name: Any) -> Any:
+    """
+    Get the interned str for a runtime property key, without atomizing it.
+
+    The result is the atom when the name has one, but no ID is assigned
+    and nothing keeps the string alive, so dynamic keys do not grow ATOMS.
+
+    Args:
+        name: Property key; str subclasses and string-like values (e.g.
+            ropes) are flattened, non-string keys are returned unchanged
+
+    Returns:
+        Interned str for name
+
+    Example:
+        >>> intern_key("".join(["x", "y"])) is atomize("xy")
+        True
+    """
+    if type(name) is not str:
+        if isinstance(name, str):
+            name = str.__str__(name)  # exact str copy of a subclass
+        elif hasattr(name, "flatten"):
+            name = name.flatten()
+        else:
+            return name
+    return sys.intern(name)
@@ -0,0 +1,84 @@
+"""
+Unit tests for the engine-wide atom table.
+"""
+
+from components.shared_types.src.atoms import ATOMS, AtomTable, atomize, intern_key
+
+
+def _fresh(text):
+    """Build a str equal to text that is not the interned object."""
+    return "".join(list(text))
+
+
+class TestAtomTable:
+    """Test suite for AtomTable."""
+
+    def test_equal_names_share_one_atom(self):
+        table = AtomTable()
+        first = table.atomize(_fresh("propertyName"))
+        second = table.atomize(_fresh("propertyName"))
+
+        assert first == "propertyName"
+        assert first is second
+
+    def test_atom_ids_are_stable_and_reversible(self):
+        table = AtomTable()
+        x_id = table.atom_id("x")
+        y_id = table.atom_id("y")
+
+        assert x_id != y_id
+        assert table.atom_id(_fresh("x")) == x_id
+        assert table.name_of(y_id) == "y"
+        assert len(table) == 2
+        assert "x" in table
+
+    def test_is_atom_checks_identity(self):
+        table = AtomTable()
+        atom = table.atomize(_fresh("someLongPropertyName"))
+
+        assert table.is_atom(atom)
+        assert not table.is_atom(_fresh("someLongPropertyName"))
+        assert not table.is_atom(42)
+
+    def test_non_string_keys_are_returned_unchanged(self):
+        table = AtomTable()
+        key = object()
+
+        assert table.atomize(key) is key
+        assert table.atomize(3) == 3
+        assert table.atomize(None) is None
+        assert len(table) == 0
+
+    def test_string_like_values_are_flattened(self):
+        class Rope:
+            def flatten(self):
+                return _fresh("ropeKey")
+
+        class Name(str):
+            pass
+
+        table = AtomTable()
+        atom = table.atomize("ropeKey")
+
+        assert table.atomize(Rope()) is atom
+        assert type(table.atomize(Name("ropeKey"))) is str
+        assert table.atomize(Name("ropeKey")) is atom
+
+
+def test_atomize_uses_engine_wide_table():
+    atom = atomize(_fresh("engineWideAtom"))
+
+    assert atom is atomize(_fresh("engineWideAtom"))
+    assert ATOMS.is_atom(atom)
+
+
+def test_intern_key_shares_atoms_without_growing_the_table():
+    atom = atomize(_fresh("internedAtomName"))
+    size = len(ATOMS)
+
+    assert intern_key(_fresh("internedAtomName")) is atom
+    key = intern_key(_fresh("runtimeOnlyKey"))
+    assert key is intern_key(_fresh("runtimeOnlyKey"))
+    assert "runtimeOnlyKey" not in ATOMS
+    assert intern_key(3) == 3
+    assert len(ATOMS) == size
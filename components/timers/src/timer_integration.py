@@ -6,6 +6,7 @@ Provides integration between the timer system and the event loop.
 Requirement: FR-P3-090 - Timer integration with event loop
 """
 
+import time
 from typing import Optional
 from .timers import TimerManager
 
@@ -58,6 +59,48 @@ class EventLoopTimerIntegration:
         # Don't return negative timeout
         return max(0, timeout)
 
+    def wait_for_next_timer(self, max_timeout: Optional[float] = None) -> bool:
+        """
+        Sleep until the next timer is due, then process expired timers.
+
+        Blocks for exactly get_next_timer_timeout() milliseconds instead of
+        polling, so an idle event loop does not spin while waiting.
+
+        Args:
+            max_timeout: Upper bound on the wait in milliseconds (None = no bound)
+
+        Returns:
+            True if a wait was performed, False if no timers are pending
+        """
+        timeout = self.get_next_timer_timeout()
+        if timeout is None:
+            return False
+
+        if max_timeout is not None:
+            timeout = min(timeout, max_timeout)
+
+        if timeout > 0:
+            time.sleep(timeout / 1000)
+
+        self.process_timers()
+        return True
+
+    def run_until_idle(self, event_loop=None) -> None:
+        """
+        Run timers (and the event loop, if given) until no work remains.
+
+        Between timer batches the event loop is drained so microtasks and
+        macrotasks queued by timer callbacks run before the next sleep.
+
+        Args:
+            event_loop: Optional EventLoop to drain after each timer batch
+        """
+        while True:
+            if event_loop is not None:
+                event_loop.run()
+            if not self.wait_for_next_timer():
+                break
+
     def has_pending_timers(self) -> bool:
         """
         Check if there are any pending timers.
@@ -2,6 +2,9 @@
 Timer Queue Implementation - Priority queue (min-heap) for timers
 
 Provides efficient timer management ordered by expiration time.
+Cancellation is lazy: cancelled timers are flagged and left in the heap
+until they reach the top or the heap is compacted, so clearTimeout is O(1).
+
 Requirement: FR-P3-086 - Timer ordering guarantees
 """
 
@@ -28,6 +31,7 @@ class TimerInfo:
     repeat: bool = field(compare=False, default=False)
     interval: float = field(compare=False, default=0)
     nesting_level: int = field(compare=False, default=0)
+    cancelled: bool = field(compare=False, default=False)
 
     def __post_init__(self):
         """Ensure args is always a list"""
@@ -39,23 +43,35 @@ class TimerQueue:
     """
     Priority queue for timers ordered by expiration time.
 
-    Uses a min-heap for O(log n) insertion and extraction.
+    Uses a min-heap with lazy deletion:
+    - insert: O(log n)
+    - remove_by_id: O(1) - timer is flagged cancelled, not searched for
+    - get_expired_timers: O(k log n) batch pop, skipping cancelled entries
+
     Timers with earlier expiration times have higher priority.
     Timers with the same expiration time are ordered by timer_id (creation order).
+
+    Cancelled entries are purged when they reach the top of the heap, or all
+    at once when they make up more than half of it, so memory stays bounded
+    even when almost every timer is cancelled before it fires.
     """
 
+    # Don't bother compacting heaps smaller than this
+    COMPACT_MIN_SIZE = 64
+
     def __init__(self):
         """Initialize empty timer queue"""
         self._heap: List[TimerInfo] = []
-        self._timer_map: dict[int, TimerInfo] = {}  # For O(1) lookup by ID
+        self._timer_map: dict[int, TimerInfo] = {}  # Live timers by ID
+        self._cancelled_count = 0  # Cancelled entries still in the heap
 
     def is_empty(self) -> bool:
         """Check if queue is empty"""
-        return len(self._heap) == 0
+        return not self._timer_map
 
     def size(self) -> int:
         """Get number of timers in queue"""
-        return len(self._heap)
+        return len(self._timer_map)
 
     def insert(self, timer: TimerInfo) -> None:
         """
@@ -66,19 +82,38 @@ class TimerQueue:
         Args:
             timer: TimerInfo to insert
         """
+        timer.cancelled = False
         heapq.heappush(self._heap, timer)
         self._timer_map[timer.timer_id] = timer
 
+    def _discard_cancelled_head(self) -> None:
+        """Pop cancelled timers off the top of the heap."""
+        heap = self._heap
+        while heap and heap[0].cancelled:
+            heapq.heappop(heap)
+            self._cancelled_count -= 1
+
+    def _compact(self) -> None:
+        """
+        Drop all cancelled timers from the heap and restore the heap invariant.
+
+        Time complexity: O(n)
+        """
+        self._heap = [timer for timer in self._heap if not timer.cancelled]
+        heapq.heapify(self._heap)
+        self._cancelled_count = 0
+
     def peek(self) -> Optional[TimerInfo]:
         """
         Peek at the next timer without removing it.
 
-        Time complexity: O(1)
+        Time complexity: O(1) amortized
 
         Returns:
             Next timer to expire, or None if queue is empty
         """
-        if self.is_empty():
+        self._discard_cancelled_head()
+        if not self._heap:
             return None
         return self._heap[0]
 
@@ -91,7 +126,8 @@ class TimerQueue:
         Returns:
             Next timer to expire, or None if queue is empty
         """
-        if self.is_empty():
+        self._discard_cancelled_head()
+        if not self._heap:
             return None
 
         timer = heapq.heappop(self._heap)
@@ -102,7 +138,7 @@ class TimerQueue:
         """
         Remove a specific timer by ID.
 
-        Time complexity: O(n) - must search heap and re-heapify
+        Time complexity: O(1) amortized - the heap entry is only flagged
 
         Args:
             timer_id: ID of timer to remove
@@ -110,31 +146,18 @@ class TimerQueue:
         Returns:
             True if timer was found and removed, False otherwise
         """
-        # Check if timer exists
-        if timer_id not in self._timer_map:
+        timer = self._timer_map.pop(timer_id, None)
+        if timer is None:
             return False
 
-        # Remove from map
-        timer = self._timer_map.pop(timer_id)
-
-        # Find and remove from heap
-        try:
-            index = self._heap.index(timer)
-            # Replace with last element and re-heapify
-            if index < len(self._heap) - 1:
-                self._heap[index] = self._heap[-1]
-                self._heap.pop()
-                # Re-heapify from index
-                if index < len(self._heap):
-                    heapq._siftup(self._heap, index)
-                    heapq._siftdown(self._heap, 0, index)
-            else:
-                # Last element, just pop
-                self._heap.pop()
-            return True
-        except ValueError:
-            # Timer not in heap (shouldn't happen if map is in sync)
-            return False
+        timer.cancelled = True
+        self._cancelled_count += 1
+
+        # Compact once cancelled entries dominate the heap
+        if (self._cancelled_count >= self.COMPACT_MIN_SIZE
+                and self._cancelled_count * 2 > len(self._heap)):
+            self._compact()
+        return True
 
     def get_expired_timers(self, current_time: float) -> List[TimerInfo]:
         """
@@ -149,14 +172,17 @@ class TimerQueue:
             List of expired timers in expiration order
         """
         expired = []
-
-        while not self.is_empty():
-            timer = self.peek()
-            if timer is None or timer.expiration > current_time:
-                break
-
-            # Timer has expired
-            expired.append(self.extract_min())
+        heap = self._heap
+        timer_map = self._timer_map
+        heappop = heapq.heappop
+
+        while heap and heap[0].expiration <= current_time:
+            timer = heappop(heap)
+            if timer.cancelled:
+                self._cancelled_count -= 1
+                continue
+            del timer_map[timer.timer_id]
+            expired.append(timer)
 
         return expired
 
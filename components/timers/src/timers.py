@@ -154,10 +154,10 @@ class TimerManager:
             - No-op if timer already fired or invalid ID
             - Safe to call multiple times with same ID
         """
-        # Remove timer from queue (no-op if not found)
-        self._queue.remove_by_id(timer_id)
-        # Track that this timer was cancelled (for execution loop)
-        self._cancelled_during_execution.add(timer_id)
+        # Remove timer from queue; if it isn't queued it may already be in
+        # the batch being executed, so track it for the execution loop
+        if not self._queue.remove_by_id(timer_id):
+            self._cancelled_during_execution.add(timer_id)
 
     def setInterval(
         self,
@@ -233,10 +233,10 @@ class TimerManager:
             - No-op if interval already cleared or invalid ID
             - Safe to call multiple times with same ID
         """
-        # Remove timer from queue (no-op if not found)
-        self._queue.remove_by_id(interval_id)
-        # Track that this timer was cancelled (for execution loop)
-        self._cancelled_during_execution.add(interval_id)
+        # Remove timer from queue; if it isn't queued it may already be in
+        # the batch being executed, so track it for the execution loop
+        if not self._queue.remove_by_id(interval_id):
+            self._cancelled_during_execution.add(interval_id)
 
     def has_timer(self, timer_id: int) -> bool:
         """
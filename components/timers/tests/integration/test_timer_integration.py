@@ -357,3 +357,40 @@ class TestEventLoopTimerIntegrationClass:
         next_timeout = integration.get_next_timer_timeout()
 
         assert next_timeout is None
+
+    def test_wait_for_next_timer_sleeps_until_due(self):
+        """Test wait_for_next_timer blocks until the timer is due, then runs it"""
+        manager = TimerManager()
+        integration = EventLoopTimerIntegration(manager)
+        callback = Mock()
+
+        manager.setTimeout(callback, 20)
+
+        start = time.time()
+        assert integration.wait_for_next_timer() is True
+        elapsed_ms = (time.time() - start) * 1000
+
+        callback.assert_called_once()
+        assert elapsed_ms >= 15
+
+    def test_wait_for_next_timer_without_timers(self):
+        """Test wait_for_next_timer returns immediately when nothing is pending"""
+        integration = EventLoopTimerIntegration(TimerManager())
+
+        assert integration.wait_for_next_timer() is False
+
+    def test_run_until_idle_runs_chained_timers(self):
+        """Test run_until_idle processes timers scheduled by other timers"""
+        manager = TimerManager()
+        integration = EventLoopTimerIntegration(manager)
+        order = []
+
+        def first():
+            order.append('first')
+            manager.setTimeout(lambda: order.append('second'), 5)
+
+        manager.setTimeout(first, 5)
+        integration.run_until_idle()
+
+        assert order == ['first', 'second']
+        assert integration.has_pending_timers() is False
@@ -180,6 +180,62 @@ class TestTimerQueue:
         assert queue.peek().timer_id == 3
 
 
+class TestLazyCancellation:
+    """Test O(1) cancellation with lazy deletion from the heap"""
+
+    def _timer(self, timer_id, expiration):
+        return TimerInfo(expiration=expiration, timer_id=timer_id, callback=lambda: None)
+
+    def test_removed_timer_is_skipped_by_peek(self):
+        """Test a cancelled timer at the top of the heap is never returned"""
+        queue = TimerQueue()
+        queue.insert(self._timer(1, 1000.0))
+        queue.insert(self._timer(2, 2000.0))
+
+        assert queue.remove_by_id(1) is True
+        assert queue.has_timer(1) is False
+        assert queue.peek().timer_id == 2
+        assert queue.extract_min().timer_id == 2
+        assert queue.is_empty() is True
+
+    def test_removed_timer_not_returned_as_expired(self):
+        """Test cancelled timers are dropped from expired batches"""
+        queue = TimerQueue()
+        for timer_id in range(1, 6):
+            queue.insert(self._timer(timer_id, timer_id * 100.0))
+
+        queue.remove_by_id(2)
+        queue.remove_by_id(4)
+
+        expired = queue.get_expired_timers(1000.0)
+        assert [t.timer_id for t in expired] == [1, 3, 5]
+        assert queue.is_empty() is True
+
+    def test_remove_twice_returns_false(self):
+        """Test removing an already-cancelled timer is a no-op"""
+        queue = TimerQueue()
+        queue.insert(self._timer(1, 1000.0))
+
+        assert queue.remove_by_id(1) is True
+        assert queue.remove_by_id(1) is False
+        assert queue.size() == 0
+
+    def test_mass_cancellation_compacts_heap(self):
+        """Test heap memory stays bounded when most timers are cancelled"""
+        queue = TimerQueue()
+        for timer_id in range(1, 10001):
+            queue.insert(self._timer(timer_id, 30000.0 + timer_id))
+
+        for timer_id in range(1, 10001):
+            if timer_id % 100 != 0:
+                queue.remove_by_id(timer_id)
+
+        assert queue.size() == 100
+        assert len(queue._heap) < 2 * queue.COMPACT_MIN_SIZE + 200
+        expired = queue.get_expired_timers(50000.0)
+        assert [t.timer_id for t in expired] == list(range(100, 10001, 100))
+
+
 class TestTimerInfo:
     """Test TimerInfo data structure"""
 
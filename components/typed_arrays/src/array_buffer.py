@@ -1,11 +1,41 @@
 """
 ArrayBuffer implementation following ECMAScript 2024 specification.
 Fixed-length (or resizable) raw binary data buffer.
+
+The backing store is allocated once at maxByteLength, so resize() only moves
+the length within the reservation, and transfer() hands the same store to the
+new buffer instead of copying it. Bytes past byteLength are kept zeroed.
 """
 
 import math
+import mmap
+import threading
+from contextlib import contextmanager
 from exceptions import RangeError, TypeError as JSTypeError
 
+# Stores at least this large are anonymous mappings: the OS commits pages
+# only when they are first touched, so a large reservation costs nothing
+_MMAP_THRESHOLD = 64 * 1024
+
+# A non-shared buffer is only reachable from one agent, so one lock is
+# enough to make its Atomics read-modify-write operations indivisible
+_ATOMICS_LOCK = threading.Lock()
+
+
+def allocate_store(capacity):
+    """
+    Allocate a zero-filled backing store.
+
+    Args:
+        capacity: Size in bytes
+
+    Returns:
+        Writable buffer-protocol object (bytearray or anonymous mmap)
+    """
+    if capacity >= _MMAP_THRESHOLD:
+        return mmap.mmap(-1, capacity)
+    return bytearray(capacity)
+
 
 class ArrayBuffer:
     """
@@ -49,10 +79,32 @@ class ArrayBuffer:
             self._resizable = False
             self._maxByteLength = byteLength
 
-        # Initialize buffer data
-        self._data = bytearray(byteLength)
+        # Reserve the whole maxByteLength up front
+        self._data = allocate_store(self._maxByteLength)
         self._byteLength = byteLength
         self._detached = False
+        # Bumped whenever _data or _byteLength changes, so views re-bind
+        # (and re-check their bounds)
+        self._generation = 0
+
+    @classmethod
+    def _from_store(cls, data, byteLength, maxByteLength=None):
+        """
+        Wrap an existing backing store without copying (internal use).
+
+        Args:
+            data: Backing store, at least max(byteLength, maxByteLength) long
+            byteLength: Length in bytes
+            maxByteLength: Maximum length for a resizable buffer, or None
+        """
+        buffer = cls.__new__(cls)
+        buffer._data = data
+        buffer._byteLength = byteLength
+        buffer._resizable = maxByteLength is not None
+        buffer._maxByteLength = byteLength if maxByteLength is None else maxByteLength
+        buffer._detached = False
+        buffer._generation = 0
+        return buffer
 
     @property
     def byteLength(self):
@@ -121,7 +173,7 @@ class ArrayBuffer:
 
         # Copy data
         if sliceLength > 0:
-            newBuffer._data[:] = self._data[begin:end]
+            newBuffer._data[:] = memoryview(self._data)[begin:end]
 
         return newBuffer
 
@@ -129,6 +181,10 @@ class ArrayBuffer:
         """
         Transfer ArrayBuffer, detaching original (ES2024).
 
+        The backing store moves to the new buffer without copying whenever
+        it is large enough for newByteLength. Resizable buffers stay
+        resizable with the same maxByteLength.
+
         Args:
             newByteLength: Optional new size for transferred buffer
 
@@ -137,7 +193,27 @@ class ArrayBuffer:
 
         Raises:
             TypeError: If buffer is already detached
+            RangeError: If newByteLength is negative or exceeds maxByteLength
         """
+        return self._transfer(newByteLength, preserve_resizability=True)
+
+    def transferToFixedLength(self, newByteLength=None):
+        """
+        Transfer ArrayBuffer into a fixed-length buffer, detaching original.
+
+        Args:
+            newByteLength: Optional new size for transferred buffer
+
+        Returns:
+            New non-resizable ArrayBuffer with transferred data
+
+        Raises:
+            TypeError: If buffer is already detached
+            RangeError: If newByteLength is negative
+        """
+        return self._transfer(newByteLength, preserve_resizability=False)
+
+    def _transfer(self, newByteLength, preserve_resizability):
         if self._detached:
             raise JSTypeError("Cannot transfer detached ArrayBuffer")
 
@@ -150,23 +226,42 @@ class ArrayBuffer:
         if newByteLength < 0:
             raise RangeError(f"Invalid array buffer length: {newByteLength}")
 
-        # Create new buffer
-        newBuffer = ArrayBuffer(newByteLength)
+        maxByteLength = None
+        if preserve_resizability and self._resizable:
+            maxByteLength = self._maxByteLength
+            if newByteLength > maxByteLength:
+                raise RangeError(
+                    f"Cannot transfer beyond maxByteLength "
+                    f"({newByteLength} > {maxByteLength})"
+                )
+
+        data = self._data
+        if newByteLength <= len(data):
+            # Move the store; only clear the tail a shrink cuts off
+            if newByteLength < self._byteLength:
+                memoryview(data)[newByteLength:self._byteLength] = bytes(
+                    self._byteLength - newByteLength
+                )
+        else:
+            # Growing past the reservation of a fixed-length buffer
+            data = allocate_store(newByteLength)
+            data[:self._byteLength] = memoryview(self._data)[:self._byteLength]
 
-        # Copy existing data (truncate or zero-extend)
-        copyLength = min(self._byteLength, newByteLength)
-        if copyLength > 0:
-            newBuffer._data[:copyLength] = self._data[:copyLength]
+        newBuffer = ArrayBuffer._from_store(data, newByteLength, maxByteLength)
 
         # Detach this buffer
         self._detached = True
-        self._data = bytearray(0)  # Clear data
+        self._data = bytearray(0)
+        self._generation += 1
 
         return newBuffer
 
     def resize(self, newByteLength):
         """
-        Resize this buffer (only for resizable buffers).
+        Resize this buffer in place (only for resizable buffers).
+
+        The backing store was reserved at maxByteLength, so no reallocation
+        or copy happens; shrinking zeroes the bytes that fall off the end.
 
         Args:
             newByteLength: New size in bytes
@@ -192,15 +287,14 @@ class ArrayBuffer:
                 f"({newByteLength} > {self._maxByteLength})"
             )
 
-        # Resize the underlying buffer
-        if newByteLength > self._byteLength:
-            # Extend with zeros
-            self._data.extend(bytearray(newByteLength - self._byteLength))
-        elif newByteLength < self._byteLength:
-            # Truncate
-            self._data = self._data[:newByteLength]
-
-        self._byteLength = newByteLength
+        oldByteLength = self._byteLength
+        if newByteLength < oldByteLength:
+            memoryview(self._data)[newByteLength:oldByteLength] = bytes(
+                oldByteLength - newByteLength
+            )
+        if newByteLength != oldByteLength:
+            self._byteLength = newByteLength
+            self._generation += 1
 
     @staticmethod
     def isView(value):
@@ -220,6 +314,12 @@ class ArrayBuffer:
         return isinstance(value, (TypedArray, DataView))
 
     # Internal methods for TypedArray/DataView access
+    @contextmanager
+    def _atomic_section(self, byte_offset, size):
+        """Hold exclusive access to bytes for an atomic operation (internal use)"""
+        with _ATOMICS_LOCK:
+            yield
+
     def _get_byte(self, index):
         """Get byte at index (internal use)"""
         if self._detached:
@@ -8,6 +8,13 @@ from array_buffer import ArrayBuffer
 from exceptions import RangeError, TypeError as JSTypeError
 
 
+# Precompiled (big-endian, little-endian) codecs per element format; values
+# are read and written in place in the buffer with unpack_from/pack_into
+_STRUCTS = {
+    code: (struct.Struct('>' + code), struct.Struct('<' + code))
+    for code in 'bBhHiIfdqQ'
+}
+
 class DataView:
     """
     Low-level interface for reading/writing binary data.
@@ -76,6 +83,8 @@ class DataView:
             raise RangeError(
                 f"Byte offset {byteOffset} + size {size} exceeds view bounds {self._byteLength}"
             )
+        if self._byteOffset + byteOffset + size > self._buffer._byteLength:
+            raise RangeError("DataView is out of bounds of its resized buffer")
 
         return byteOffset
 
@@ -83,8 +92,9 @@ class DataView:
     def getInt8(self, byteOffset):
         """Get signed 8-bit integer"""
         byteOffset = self._check_bounds(byteOffset, 1)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 1)
-        return struct.unpack('b', raw_bytes)[0]
+        return _STRUCTS['b'][0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setInt8(self, byteOffset, value):
         """Set signed 8-bit integer"""
@@ -94,31 +104,33 @@ class DataView:
         value = (value % 256)
         if value >= 128:
             value -= 256
-        encoded = struct.pack('b', value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['b'][0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
 
     # Uint8 getters/setters
     def getUint8(self, byteOffset):
         """Get unsigned 8-bit integer"""
         byteOffset = self._check_bounds(byteOffset, 1)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 1)
-        return struct.unpack('B', raw_bytes)[0]
+        return _STRUCTS['B'][0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setUint8(self, byteOffset, value):
         """Set unsigned 8-bit integer"""
         byteOffset = self._check_bounds(byteOffset, 1)
         value = int(value) % 256  # Wrap to 0..255
-        encoded = struct.pack('B', value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['B'][0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
 
     # Int16 getters/setters
     def getInt16(self, byteOffset, littleEndian=False):
         """Get signed 16-bit integer"""
         byteOffset = self._check_bounds(byteOffset, 2)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 2)
-
-        fmt = '<h' if littleEndian else '>h'
-        return struct.unpack(fmt, raw_bytes)[0]
+        return _STRUCTS['h'][1 if littleEndian else 0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setInt16(self, byteOffset, value, littleEndian=False):
         """Set signed 16-bit integer"""
@@ -130,36 +142,34 @@ class DataView:
         if value >= 32768:
             value -= 65536
 
-        fmt = '<h' if littleEndian else '>h'
-        encoded = struct.pack(fmt, value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['h'][1 if littleEndian else 0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
 
     # Uint16 getters/setters
     def getUint16(self, byteOffset, littleEndian=False):
         """Get unsigned 16-bit integer"""
         byteOffset = self._check_bounds(byteOffset, 2)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 2)
-
-        fmt = '<H' if littleEndian else '>H'
-        return struct.unpack(fmt, raw_bytes)[0]
+        return _STRUCTS['H'][1 if littleEndian else 0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setUint16(self, byteOffset, value, littleEndian=False):
         """Set unsigned 16-bit integer"""
         byteOffset = self._check_bounds(byteOffset, 2)
         value = int(value) % 65536  # Wrap to 0..65535
 
-        fmt = '<H' if littleEndian else '>H'
-        encoded = struct.pack(fmt, value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['H'][1 if littleEndian else 0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
 
     # Int32 getters/setters
     def getInt32(self, byteOffset, littleEndian=False):
         """Get signed 32-bit integer"""
         byteOffset = self._check_bounds(byteOffset, 4)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 4)
-
-        fmt = '<i' if littleEndian else '>i'
-        return struct.unpack(fmt, raw_bytes)[0]
+        return _STRUCTS['i'][1 if littleEndian else 0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setInt32(self, byteOffset, value, littleEndian=False):
         """Set signed 32-bit integer"""
@@ -171,72 +181,68 @@ class DataView:
         if value >= 2147483648:
             value -= 4294967296
 
-        fmt = '<i' if littleEndian else '>i'
-        encoded = struct.pack(fmt, value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['i'][1 if littleEndian else 0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
 
     # Uint32 getters/setters
     def getUint32(self, byteOffset, littleEndian=False):
         """Get unsigned 32-bit integer"""
         byteOffset = self._check_bounds(byteOffset, 4)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 4)
-
-        fmt = '<I' if littleEndian else '>I'
-        return struct.unpack(fmt, raw_bytes)[0]
+        return _STRUCTS['I'][1 if littleEndian else 0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setUint32(self, byteOffset, value, littleEndian=False):
         """Set unsigned 32-bit integer"""
         byteOffset = self._check_bounds(byteOffset, 4)
         value = int(value) % 4294967296  # Wrap to 0..4294967295
 
-        fmt = '<I' if littleEndian else '>I'
-        encoded = struct.pack(fmt, value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['I'][1 if littleEndian else 0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
 
     # Float32 getters/setters
     def getFloat32(self, byteOffset, littleEndian=False):
         """Get 32-bit floating point"""
         byteOffset = self._check_bounds(byteOffset, 4)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 4)
-
-        fmt = '<f' if littleEndian else '>f'
-        return struct.unpack(fmt, raw_bytes)[0]
+        return _STRUCTS['f'][1 if littleEndian else 0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setFloat32(self, byteOffset, value, littleEndian=False):
         """Set 32-bit floating point"""
         byteOffset = self._check_bounds(byteOffset, 4)
         value = float(value)
 
-        fmt = '<f' if littleEndian else '>f'
-        encoded = struct.pack(fmt, value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['f'][1 if littleEndian else 0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
 
     # Float64 getters/setters
     def getFloat64(self, byteOffset, littleEndian=False):
         """Get 64-bit floating point"""
         byteOffset = self._check_bounds(byteOffset, 8)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 8)
-
-        fmt = '<d' if littleEndian else '>d'
-        return struct.unpack(fmt, raw_bytes)[0]
+        return _STRUCTS['d'][1 if littleEndian else 0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setFloat64(self, byteOffset, value, littleEndian=False):
         """Set 64-bit floating point"""
         byteOffset = self._check_bounds(byteOffset, 8)
         value = float(value)
 
-        fmt = '<d' if littleEndian else '>d'
-        encoded = struct.pack(fmt, value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['d'][1 if littleEndian else 0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
 
     # BigInt64 getters/setters
     def getBigInt64(self, byteOffset, littleEndian=False):
         """Get signed 64-bit BigInt"""
         byteOffset = self._check_bounds(byteOffset, 8)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 8)
-
-        fmt = '<q' if littleEndian else '>q'
-        return struct.unpack(fmt, raw_bytes)[0]
+        return _STRUCTS['q'][1 if littleEndian else 0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setBigInt64(self, byteOffset, value, littleEndian=False):
         """Set signed 64-bit BigInt"""
@@ -248,24 +254,23 @@ class DataView:
         if value >= 2**63:
             value -= 2**64
 
-        fmt = '<q' if littleEndian else '>q'
-        encoded = struct.pack(fmt, value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['q'][1 if littleEndian else 0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
 
     # BigUint64 getters/setters
     def getBigUint64(self, byteOffset, littleEndian=False):
         """Get unsigned 64-bit BigInt"""
         byteOffset = self._check_bounds(byteOffset, 8)
-        raw_bytes = self._buffer._get_bytes(self._byteOffset + byteOffset, 8)
-
-        fmt = '<Q' if littleEndian else '>Q'
-        return struct.unpack(fmt, raw_bytes)[0]
+        return _STRUCTS['Q'][1 if littleEndian else 0].unpack_from(
+            self._buffer._data, self._byteOffset + byteOffset
+        )[0]
 
     def setBigUint64(self, byteOffset, value, littleEndian=False):
         """Set unsigned 64-bit BigInt"""
         byteOffset = self._check_bounds(byteOffset, 8)
         value = int(value) % (2**64)  # Wrap to 0..2^64-1
 
-        fmt = '<Q' if littleEndian else '>Q'
-        encoded = struct.pack(fmt, value)
-        self._buffer._set_bytes(self._byteOffset + byteOffset, encoded)
+        _STRUCTS['Q'][1 if littleEndian else 0].pack_into(
+            self._buffer._data, self._byteOffset + byteOffset, value
+        )
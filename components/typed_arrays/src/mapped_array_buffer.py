@@ -0,0 +1,148 @@
+"""
+ArrayBuffer backed by a memory-mapped file.
+
+The file is mapped rather than read, so creating the buffer is O(1) whatever
+the file size, and TypedArray/DataView views over it only fault in the pages
+they actually touch. Two mapping modes are supported:
+
+- "readonly": views can read but any write raises TypeError
+- "copy-on-write": writes go to private copies of the touched pages and
+  never reach the file
+"""
+
+import mmap
+import os
+
+from array_buffer import ArrayBuffer
+from exceptions import RangeError, TypeError as JSTypeError
+
+READONLY = "readonly"
+COPY_ON_WRITE = "copy-on-write"
+
+_ACCESS = {
+    READONLY: mmap.ACCESS_READ,
+    COPY_ON_WRITE: mmap.ACCESS_COPY,
+}
+
+
+class MappedArrayBuffer(ArrayBuffer):
+    """
+    Fixed-length ArrayBuffer whose bytes are a mapping of (part of) a file.
+
+    Example:
+        >>> buffer = MappedArrayBuffer("events.bin")
+        >>> header = DataView(buffer, 0, 16)
+        >>> records = Uint32Array(buffer, 16)
+    """
+
+    def __init__(self, path, mode=READONLY, offset=0, length=None):
+        """
+        Map a file into a new ArrayBuffer.
+
+        Args:
+            path: Path of the file to map
+            mode: "readonly" or "copy-on-write"
+            offset: Byte offset in the file where the buffer starts
+            length: Number of bytes to map (default: to the end of the file)
+
+        Raises:
+            TypeError: If mode is not a supported mapping mode
+            RangeError: If offset/length fall outside the file
+            OSError: If the file cannot be opened
+        """
+        if mode not in _ACCESS:
+            raise JSTypeError(f"Invalid mapping mode: {mode!r}")
+
+        offset = int(offset)
+        with open(path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if offset < 0 or offset > file_size:
+                raise RangeError(f"Offset {offset} out of range for file of {file_size} bytes")
+            if length is None:
+                length = file_size - offset
+            length = int(length)
+            if length < 0 or offset + length > file_size:
+                raise RangeError(
+                    f"Mapping [{offset}, {offset + length}) exceeds file of {file_size} bytes"
+                )
+
+            if length == 0:
+                # mmap cannot map zero bytes
+                self._mmap = None
+                data = bytearray(0) if mode == COPY_ON_WRITE else memoryview(b"")
+            else:
+                # Map from the preceding allocation boundary, then slice
+                start = offset - offset % mmap.ALLOCATIONGRANULARITY
+                self._mmap = mmap.mmap(
+                    f.fileno(), length + offset - start, access=_ACCESS[mode], offset=start
+                )
+                data = memoryview(self._mmap)[offset - start:offset - start + length]
+
+        self._data = data
+        self._byteLength = length
+        self._maxByteLength = length
+        self._resizable = False
+        self._detached = False
+        self._generation = 0
+        self._path = os.fspath(path)
+        self._mode = mode
+
+    @property
+    def path(self):
+        """Path of the mapped file"""
+        return self._path
+
+    @property
+    def mode(self):
+        """Mapping mode: "readonly" or "copy-on-write" """
+        return self._mode
+
+    @property
+    def readonly(self):
+        """Whether writes through views are rejected"""
+        return self._mode == READONLY
+
+    def transfer(self, newByteLength=None):
+        """
+        Transfer the mapping to a new buffer, detaching this one.
+
+        Copy-on-write mappings move without copying; read-only mappings
+        cannot be transferred because the result would be writable.
+        """
+        if self.readonly:
+            raise JSTypeError("Cannot transfer read-only ArrayBuffer")
+        return super().transfer(newByteLength)
+
+    def transferToFixedLength(self, newByteLength=None):
+        """Transfer the mapping to a new fixed-length buffer (see transfer())."""
+        if self.readonly:
+            raise JSTypeError("Cannot transfer read-only ArrayBuffer")
+        return super().transferToFixedLength(newByteLength)
+
+    def close(self):
+        """
+        Detach the buffer and release the mapping.
+
+        The file is unmapped immediately if no view still holds it,
+        otherwise as soon as the last view is garbage collected.
+        """
+        if self._detached:
+            return
+        self._detached = True
+        self._generation += 1
+        data, self._data = self._data, bytearray(0)
+        mapping, self._mmap = self._mmap, None
+        if isinstance(data, memoryview):
+            data.release()
+        if mapping is not None:
+            try:
+                mapping.close()
+            except BufferError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,238 @@
+"""
+SharedArrayBuffer implementation backed by OS shared memory.
+
+The bytes live in a multiprocessing.shared_memory segment, so a
+SharedArrayBuffer pickled to another process (a worker, a Queue, a Pipe)
+attaches to the same memory instead of copying it. Growable buffers reserve
+maxByteLength up front and keep the current length in a small header inside
+the segment, so grow() in one process is seen by all of them.
+
+Atomic element access is serialized with a per-process lock plus a POSIX
+record lock on the element's bytes in the segment, which makes
+read-modify-write operations atomic across processes as well as threads.
+"""
+
+import math
+import os
+import struct
+import threading
+import weakref
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from array_buffer import ArrayBuffer
+from exceptions import RangeError, TypeError as JSTypeError
+
+# Segment layout: [byteLength: int64][data: maxByteLength bytes]
+_HEADER = struct.Struct("<q")
+_HEADER_SIZE = 8
+
+
+class _Segment(shared_memory.SharedMemory):
+    """SharedMemory that tolerates views outliving it at collection time."""
+
+    def __del__(self):
+        try:
+            self.close()
+        except BufferError:
+            # A view still exports the mapping; it is unmapped with the view
+            pass
+
+
+def _release_segment(segment, data, owner_pid):
+    """Unmap a segment and, in the creating process, remove its name."""
+    try:
+        data.release()
+        segment.close()
+    except BufferError:
+        # A view still exports the mapping; it is unmapped with the process
+        pass
+    # Forked children inherit the buffer object but not ownership
+    if owner_pid == os.getpid():
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedArrayBuffer(ArrayBuffer):
+    """
+    Fixed-length or growable raw binary buffer shared between agents.
+
+    Unlike ArrayBuffer it can never be detached, cannot be transferred or
+    shrunk, and slice() returns a new SharedArrayBuffer. The process that
+    creates the buffer owns the segment name; it is unlinked when that
+    buffer is garbage collected (processes already attached keep their
+    mapping).
+    """
+
+    _shared = True
+
+    def __init__(self, byteLength, options=None):
+        """
+        Create a new SharedArrayBuffer.
+
+        Args:
+            byteLength: Length in bytes (converted to integer)
+            options: Optional dict with 'maxByteLength' for growable buffers
+
+        Raises:
+            RangeError: If a length is invalid
+        """
+        if isinstance(byteLength, float) and math.isnan(byteLength):
+            raise RangeError("Invalid array buffer length: NaN")
+        byteLength = int(byteLength)
+        if byteLength < 0:
+            raise RangeError(f"Invalid array buffer length: {byteLength}")
+
+        maxByteLength = (options or {}).get('maxByteLength', None)
+        if maxByteLength is not None:
+            maxByteLength = int(maxByteLength)
+            if maxByteLength < byteLength:
+                raise RangeError(
+                    f"maxByteLength ({maxByteLength}) must be >= byteLength ({byteLength})"
+                )
+
+        capacity = byteLength if maxByteLength is None else maxByteLength
+        segment = _Segment(
+            create=True, size=_HEADER_SIZE + max(capacity, 1)
+        )
+        _HEADER.pack_into(segment.buf, 0, byteLength)
+        self._attach(segment, maxByteLength, owner=True)
+
+    @classmethod
+    def _from_segment_name(cls, name, maxByteLength):
+        """Attach to an existing segment by name (used when unpickling)."""
+        buffer = cls.__new__(cls)
+        buffer._attach(_Segment(name=name), maxByteLength, owner=False)
+        return buffer
+
+    def _attach(self, segment, maxByteLength, owner):
+        self._segment = segment
+        self._growable = maxByteLength is not None
+        self._resizable = False
+        self._detached = False
+        self._generation = 0
+        byteLength = _HEADER.unpack_from(segment.buf, 0)[0]
+        self._maxByteLength = byteLength if maxByteLength is None else maxByteLength
+        self._data = segment.buf[_HEADER_SIZE:_HEADER_SIZE + self._maxByteLength]
+        self._fixedByteLength = byteLength
+        self._thread_lock = threading.Lock()
+        self._finalizer = weakref.finalize(
+            self, _release_segment, segment, self._data, os.getpid() if owner else None
+        )
+
+    def __reduce__(self):
+        maxByteLength = self._maxByteLength if self._growable else None
+        return (SharedArrayBuffer._from_segment_name, (self._segment.name, maxByteLength))
+
+    @property
+    def _byteLength(self):
+        # Growable buffers read the length other processes may have grown
+        if self._growable:
+            return _HEADER.unpack_from(self._segment.buf, 0)[0]
+        return self._fixedByteLength
+
+    @property
+    def name(self):
+        """Name of the shared memory segment backing this buffer"""
+        return self._segment.name
+
+    @property
+    def growable(self):
+        """Whether the buffer can grow (ES2024)"""
+        return self._growable
+
+    @property
+    def maxByteLength(self):
+        """Maximum byte length for growable buffers"""
+        return self._maxByteLength
+
+    def grow(self, newByteLength):
+        """
+        Grow this buffer within its reserved maxByteLength.
+
+        Args:
+            newByteLength: New size in bytes
+
+        Raises:
+            TypeError: If the buffer is not growable
+            RangeError: If newByteLength is smaller than the current length
+                or larger than maxByteLength
+        """
+        if not self._growable:
+            raise JSTypeError("Cannot grow non-growable SharedArrayBuffer")
+
+        newByteLength = int(newByteLength)
+        if newByteLength > self._maxByteLength:
+            raise RangeError(
+                f"Cannot grow beyond maxByteLength "
+                f"({newByteLength} > {self._maxByteLength})"
+            )
+
+        with self._atomic_section(-_HEADER_SIZE, _HEADER_SIZE):
+            current = self._byteLength
+            if newByteLength < current:
+                raise RangeError(
+                    f"SharedArrayBuffer cannot shrink ({newByteLength} < {current})"
+                )
+            _HEADER.pack_into(self._segment.buf, 0, newByteLength)
+
+    def slice(self, begin=0, end=None):
+        """
+        Copy region to a new SharedArrayBuffer.
+
+        Args:
+            begin: Start index (default 0)
+            end: End index (default buffer length)
+
+        Returns:
+            New SharedArrayBuffer with copied data
+        """
+        length = self._byteLength
+        begin = max(0, length + begin) if begin < 0 else min(begin, length)
+        if end is None:
+            end = length
+        else:
+            end = max(0, length + end) if end < 0 else min(end, length)
+        begin = min(begin, end)
+
+        newBuffer = SharedArrayBuffer(end - begin)
+        if end > begin:
+            newBuffer._data[:] = self._data[begin:end]
+        return newBuffer
+
+    def transfer(self, newByteLength=None):
+        raise JSTypeError("SharedArrayBuffer cannot be transferred")
+
+    def transferToFixedLength(self, newByteLength=None):
+        raise JSTypeError("SharedArrayBuffer cannot be transferred")
+
+    def resize(self, newByteLength):
+        raise JSTypeError("SharedArrayBuffer cannot be resized, use grow()")
+
+    @contextmanager
+    def _atomic_section(self, byte_offset, size):
+        """
+        Hold exclusive access to buffer bytes across threads and processes.
+
+        Args:
+            byte_offset: Offset of the first byte in the buffer data
+            size: Number of bytes to lock
+        """
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            start = _HEADER_SIZE + byte_offset
+            fd = self._segment._fd
+            fcntl.lockf(fd, fcntl.LOCK_EX, size, start)
+            try:
+                yield
+            finally:
+                fcntl.lockf(fd, fcntl.LOCK_UN, size, start)
@@ -1,9 +1,18 @@
 """
 TypedArray implementation following ECMAScript 2024 specification.
 Implements all 11 TypedArray variants with full array-like API.
+
+Each TypedArray holds a memoryview over its ArrayBuffer's bytes, cast to the
+element format, so element reads/writes index the buffer directly and bulk
+operations (fill, set, slice, sort, reverse, copyWithin, indexOf...) run as
+slice assignments or whole-view operations instead of per-element struct
+calls. Elements use platform byte order, as the spec prescribes.
 """
 
-import struct
+import functools
+import math
+from array import array
+from bisect import bisect_left, bisect_right
 from array_buffer import ArrayBuffer
 from exceptions import RangeError, TypeError as JSTypeError
 from type_conversions import CONVERTERS
@@ -17,8 +26,14 @@ class TypedArray:
 
     # Subclasses must define these
     _type_name = None  # e.g., 'Int8', 'Uint8', etc.
+    _format = None  # memoryview/array format code, e.g. 'b', 'B', 'd'
     BYTES_PER_ELEMENT = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._type_name is not None:
+            cls._converter = staticmethod(CONVERTERS[cls._type_name])
+
     def __init__(self, *args):
         """
         TypedArray construction supports multiple patterns:
@@ -49,11 +64,16 @@ class TypedArray:
             length = int(arg0)
             if length < 0:
                 raise RangeError(f"Invalid typed array length: {length}")
-            byte_length = length * self.BYTES_PER_ELEMENT
-            self._buffer = ArrayBuffer(byte_length)
-            self._byteOffset = 0
-            self._length = length
-            self._byteLength = byte_length
+            self._init_new_buffer(length)
+
+    def _init_new_buffer(self, length):
+        """Initialize with a fresh zero-filled buffer of length elements"""
+        byte_length = length * self.BYTES_PER_ELEMENT
+        self._buffer = ArrayBuffer(byte_length)
+        self._byteOffset = 0
+        self._length = length
+        self._byteLength = byte_length
+        self._bind_view()
 
     def _init_from_buffer(self, buffer, byteOffset=0, length=None):
         """Initialize as view of ArrayBuffer"""
@@ -95,36 +115,50 @@ class TypedArray:
         self._byteOffset = byteOffset
         self._length = length
         self._byteLength = byte_length
+        self._bind_view()
 
     def _init_from_typed_array(self, source):
         """Initialize by copying from another TypedArray"""
-        # Create new buffer
-        byte_length = source.length * self.BYTES_PER_ELEMENT
-        self._buffer = ArrayBuffer(byte_length)
-        self._byteOffset = 0
-        self._length = source.length
-        self._byteLength = byte_length
-
-        # Copy elements (with type conversion)
-        for i in range(source.length):
-            self[i] = source[i]
+        self._init_new_buffer(source.length)
+        self.set(source)
 
     def _init_from_iterable(self, iterable):
         """Initialize from array-like or iterable"""
-        # Convert to list first
         items = list(iterable)
-        length = len(items)
+        self._init_new_buffer(len(items))
+        if items:
+            self._view[:] = self._pack(map(self._converter, items))
+
+    # View management
+    def _bind_view(self):
+        """(Re)create the element view over the buffer's current backing store"""
+        buffer = self._buffer
+        end = self._byteOffset + self._byteLength
+        if end > buffer._byteLength:
+            raise RangeError(
+                f"TypedArray is out of bounds ({end} > {buffer._byteLength})"
+            )
+        data = memoryview(buffer._data)[self._byteOffset:end]
+        self._view = data.cast(self._format)
+        self._generation = buffer._generation
 
-        # Create buffer
-        byte_length = length * self.BYTES_PER_ELEMENT
-        self._buffer = ArrayBuffer(byte_length)
-        self._byteOffset = 0
-        self._length = length
-        self._byteLength = byte_length
+    def _elements(self):
+        """
+        Get the element view, checking the buffer is still usable.
+
+        Returns:
+            memoryview cast to this array's element format
+        """
+        buffer = self._buffer
+        if buffer._detached:
+            raise JSTypeError("Cannot access detached buffer")
+        if self._generation != buffer._generation:
+            self._bind_view()
+        return self._view
 
-        # Fill with values
-        for i, value in enumerate(items):
-            self[i] = value
+    def _pack(self, values):
+        """Pack already-converted values for slice assignment into the view"""
+        return array(self._format, values)
 
     # Properties
     @property
@@ -156,44 +190,28 @@ class TypedArray:
     # Element access
     def __getitem__(self, index):
         """Get element at index"""
-        if isinstance(index, slice):
-            raise JSTypeError("Slice access not supported, use slice() method")
+        if type(index) is not int:
+            if isinstance(index, slice):
+                raise JSTypeError("Slice access not supported, use slice() method")
+            index = int(index)
 
-        index = int(index)
         if index < 0 or index >= self._length:
             return None  # undefined in JavaScript
 
-        if self._buffer.detached:
-            raise JSTypeError("Cannot access detached buffer")
-
-        # Read raw bytes
-        byte_index = self._byteOffset + index * self.BYTES_PER_ELEMENT
-        raw_bytes = self._buffer._get_bytes(byte_index, self.BYTES_PER_ELEMENT)
-
-        # Decode based on type
-        return self._decode_element(raw_bytes)
+        return self._elements()[index]
 
     def __setitem__(self, index, value):
         """Set element at index"""
-        if isinstance(index, slice):
-            raise JSTypeError("Slice access not supported, use set() method")
+        if type(index) is not int:
+            if isinstance(index, slice):
+                raise JSTypeError("Slice access not supported, use set() method")
+            index = int(index)
 
-        index = int(index)
         if index < 0 or index >= self._length:
             return  # Out of bounds set is ignored
 
-        if self._buffer.detached:
-            raise JSTypeError("Cannot modify detached buffer")
-
-        # Convert value to correct type
-        converted = self._convert_value(value)
-
-        # Encode to bytes
-        encoded_bytes = self._encode_element(converted)
-
-        # Write to buffer
-        byte_index = self._byteOffset + index * self.BYTES_PER_ELEMENT
-        self._buffer._set_bytes(byte_index, encoded_bytes)
+        view = self._elements()
+        view[index] = self._converter(value)
 
     def __len__(self):
         """Length for Python len()"""
@@ -203,19 +221,22 @@ class TypedArray:
         """Iterator protocol"""
         return self.values()
 
-    # Type conversion methods (overridden by subclasses)
     def _convert_value(self, value):
         """Convert value to correct type using converter"""
-        converter = CONVERTERS[self._type_name]
-        return converter(value)
+        return self._converter(value)
 
-    def _decode_element(self, raw_bytes):
-        """Decode bytes to element value (overridden by subclasses)"""
-        raise NotImplementedError("Subclass must implement _decode_element")
-
-    def _encode_element(self, value):
-        """Encode value to bytes (overridden by subclasses)"""
-        raise NotImplementedError("Subclass must implement _encode_element")
+    def _relative_range(self, start, end):
+        """Resolve relative start/end arguments to a clamped [start, end) range"""
+        length = self._length
+        start = int(start)
+        end = length if end is None else int(end)
+        if start < 0:
+            start = max(0, length + start)
+        if end < 0:
+            end = max(0, length + end)
+        start = min(start, length)
+        end = max(start, min(end, length))
+        return start, end
 
     # Static methods
     @classmethod
@@ -250,23 +271,10 @@ class TypedArray:
 
     def fill(self, value, start=0, end=None):
         """Fill array with value"""
-        if end is None:
-            end = self._length
-
-        start = int(start)
-        end = int(end)
-
-        if start < 0:
-            start = max(0, self._length + start)
-        if end < 0:
-            end = max(0, self._length + end)
-
-        start = max(0, min(start, self._length))
-        end = max(0, min(end, self._length))
-
-        for i in range(start, end):
-            self[i] = value
-
+        start, end = self._relative_range(start, end)
+        view = self._elements()
+        if end > start:
+            view[start:end] = self._pack([self._converter(value)]) * (end - start)
         return self
 
     def slice(self, start=0, end=None):
@@ -274,51 +282,16 @@ class TypedArray:
         if self._buffer.detached:
             raise JSTypeError("Cannot slice detached buffer")
 
-        if end is None:
-            end = self._length
-
-        start = int(start)
-        end = int(end)
-
-        if start < 0:
-            start = max(0, self._length + start)
-        if end < 0:
-            end = max(0, self._length + end)
-
-        start = max(0, min(start, self._length))
-        end = max(start, min(end, self._length))
-
-        length = end - start
-
-        # Create new array
-        result = type(self)(length)
-
-        # Copy elements
-        for i in range(length):
-            result[i] = self[start + i]
-
+        start, end = self._relative_range(start, end)
+        result = type(self)(end - start)
+        result._view[:] = self._elements()[start:end]
         return result
 
     def subarray(self, begin=0, end=None):
         """Create new view of same buffer"""
-        if end is None:
-            end = self._length
-
-        begin = int(begin)
-        end = int(end)
-
-        if begin < 0:
-            begin = max(0, self._length + begin)
-        if end < 0:
-            end = max(0, self._length + end)
-
-        begin = max(0, min(begin, self._length))
-        end = max(begin, min(end, self._length))
-
-        length = end - begin
+        begin, end = self._relative_range(begin, end)
         byteOffset = self._byteOffset + begin * self.BYTES_PER_ELEMENT
-
-        return type(self)(self._buffer, byteOffset, length)
+        return type(self)(self._buffer, byteOffset, end - begin)
 
     def set(self, source, offset=0):
         """Copy values from source array"""
@@ -326,14 +299,28 @@ class TypedArray:
         if offset < 0:
             raise RangeError(f"Invalid offset: {offset}")
 
-        source_list = list(source) if not isinstance(source, TypedArray) else [source[i] for i in range(source.length)]
+        if isinstance(source, TypedArray):
+            source_view = source._elements()
+            source_length = len(source_view)
+            if offset + source_length > self._length:
+                raise RangeError("Source array too large for target")
+            view = self._elements()
+            if source._format == self._format:
+                # Same representation: a memmove (overlap-safe)
+                view[offset:offset + source_length] = source_view
+            else:
+                values = map(self._converter, source_view.tolist())
+                view[offset:offset + source_length] = self._pack(values)
+            return
+
+        source_list = list(source)
         source_length = len(source_list)
-
         if offset + source_length > self._length:
             raise RangeError("Source array too large for target")
-
-        for i, value in enumerate(source_list):
-            self[offset + i] = value
+        view = self._elements()
+        view[offset:offset + source_length] = self._pack(
+            map(self._converter, source_list)
+        )
 
     def copyWithin(self, target, start, end=None):
         """Copy portion of array within itself"""
@@ -355,10 +342,9 @@ class TypedArray:
         if count <= 0:
             return self
 
-        # Copy to temp to handle overlapping regions
-        temp = [self[start + i] for i in range(count)]
-        for i in range(count):
-            self[target + i] = temp[i]
+        # memoryview slice assignment handles overlapping regions
+        view = self._elements()
+        view[target:target + count] = view[start:start + count]
 
         return self
 
@@ -370,8 +356,9 @@ class TypedArray:
     def map(self, callback, thisArg=None):
         """Create new array with mapped values"""
         result = type(self)(self._length)
-        for i in range(self._length):
-            result[i] = callback(self[i], i, self)
+        mapped = [callback(self[i], i, self) for i in range(self._length)]
+        if mapped:
+            result._view[:] = result._pack(map(result._converter, mapped))
         return result
 
     def filter(self, callback, thisArg=None):
@@ -444,72 +431,94 @@ class TypedArray:
                 return i
         return -1
 
+    def _searchable(self, value):
+        """True if value can equal an element (a non-boolean number)"""
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
     def includes(self, value, fromIndex=0):
-        """Check if array includes value"""
+        """Check if array includes value (SameValueZero)"""
         fromIndex = int(fromIndex)
         if fromIndex < 0:
             fromIndex = max(0, self._length + fromIndex)
+        if not self._searchable(value) or fromIndex >= self._length:
+            return False
 
-        for i in range(fromIndex, self._length):
-            if self[i] == value:
-                return True
-        return False
+        values = self._elements()[fromIndex:].tolist()
+        if value != value:
+            return any(v != v for v in values)
+        return value in values
 
     def indexOf(self, value, fromIndex=0):
-        """Find first index of value"""
+        """Find first index of value (strict equality)"""
         fromIndex = int(fromIndex)
         if fromIndex < 0:
             fromIndex = max(0, self._length + fromIndex)
+        if not self._searchable(value) or value != value or fromIndex >= self._length:
+            return -1
 
-        for i in range(fromIndex, self._length):
-            if self[i] == value:
-                return i
-        return -1
+        try:
+            return self._elements().tolist().index(value, fromIndex)
+        except ValueError:
+            return -1
 
     def lastIndexOf(self, value, fromIndex=None):
-        """Find last index of value"""
+        """Find last index of value (strict equality)"""
         if fromIndex is None:
             fromIndex = self._length - 1
         else:
             fromIndex = int(fromIndex)
             if fromIndex < 0:
                 fromIndex = self._length + fromIndex
+        end = min(fromIndex, self._length - 1) + 1
+        if not self._searchable(value) or value != value or end <= 0:
+            return -1
 
-        for i in range(min(fromIndex, self._length - 1), -1, -1):
-            if self[i] == value:
-                return i
-        return -1
+        values = self._elements()[:end].tolist()
+        values.reverse()
+        try:
+            return end - 1 - values.index(value)
+        except ValueError:
+            return -1
 
     def join(self, separator=','):
         """Join elements to string"""
-        return separator.join(str(self[i]) for i in range(self._length))
+        if self._length == 0:
+            return ''
+        return separator.join(map(str, self._elements().tolist()))
 
     def reverse(self):
         """Reverse array in place"""
-        for i in range(self._length // 2):
-            j = self._length - 1 - i
-            temp = self[i]
-            self[i] = self[j]
-            self[j] = temp
+        view = self._elements()
+        view[:] = view[::-1]
         return self
 
     def sort(self, compareFn=None):
         """Sort array in place"""
-        # Extract elements
-        elements = [self[i] for i in range(self._length)]
+        view = self._elements()
+        elements = view.tolist()
 
-        # Sort
-        if compareFn is None:
-            elements.sort()
-        else:
+        if compareFn is not None:
             # Python's sort expects: negative if a<b, 0 if a==b, positive if a>b
-            import functools
             elements.sort(key=functools.cmp_to_key(compareFn))
+        elif self._format in 'fd':
+            # Numeric order with -0 before +0 and NaNs last
+            nan_count = sum(1 for v in elements if v != v)
+            if nan_count:
+                elements = [v for v in elements if v == v]
+            elements.sort()
+            lo = bisect_left(elements, 0.0)
+            hi = bisect_right(elements, 0.0)
+            if hi > lo:
+                negative = sum(
+                    1 for v in elements[lo:hi] if math.copysign(1.0, v) < 0
+                )
+                elements[lo:hi] = [-0.0] * negative + [0.0] * (hi - lo - negative)
+            elements.extend([math.nan] * nan_count)
+        else:
+            elements.sort()
 
-        # Write back
-        for i, value in enumerate(elements):
-            self[i] = value
-
+        if elements:
+            view[:] = self._pack(elements)
         return self
 
     def toLocaleString(self):
@@ -537,135 +546,80 @@ class TypedArray:
             yield (i, self[i])
 
 
-# Now define all 11 TypedArray variants with their specific encoding/decoding
+# Now define all 11 TypedArray variants with their element formats
 
 class Int8Array(TypedArray):
     """8-bit signed integer array"""
     _type_name = 'Int8'
+    _format = 'b'
     BYTES_PER_ELEMENT = 1
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('b', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('b', value)
-
 
 class Uint8Array(TypedArray):
     """8-bit unsigned integer array"""
     _type_name = 'Uint8'
+    _format = 'B'
     BYTES_PER_ELEMENT = 1
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('B', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('B', value)
-
 
 class Uint8ClampedArray(TypedArray):
     """8-bit unsigned integer array with clamping"""
     _type_name = 'Uint8Clamped'
+    _format = 'B'
     BYTES_PER_ELEMENT = 1
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('B', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('B', value)
-
 
 class Int16Array(TypedArray):
     """16-bit signed integer array"""
     _type_name = 'Int16'
+    _format = 'h'
     BYTES_PER_ELEMENT = 2
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('<h', raw_bytes)[0]  # Little-endian
-
-    def _encode_element(self, value):
-        return struct.pack('<h', value)
-
 
 class Uint16Array(TypedArray):
     """16-bit unsigned integer array"""
     _type_name = 'Uint16'
+    _format = 'H'
     BYTES_PER_ELEMENT = 2
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('<H', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('<H', value)
-
 
 class Int32Array(TypedArray):
     """32-bit signed integer array"""
     _type_name = 'Int32'
+    _format = 'i'
     BYTES_PER_ELEMENT = 4
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('<i', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('<i', value)
-
 
 class Uint32Array(TypedArray):
     """32-bit unsigned integer array"""
     _type_name = 'Uint32'
+    _format = 'I'
     BYTES_PER_ELEMENT = 4
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('<I', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('<I', value)
-
 
 class Float32Array(TypedArray):
     """32-bit floating point array"""
     _type_name = 'Float32'
+    _format = 'f'
     BYTES_PER_ELEMENT = 4
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('<f', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('<f', value)
-
 
 class Float64Array(TypedArray):
     """64-bit floating point array"""
     _type_name = 'Float64'
+    _format = 'd'
     BYTES_PER_ELEMENT = 8
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('<d', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('<d', value)
-
 
 class BigInt64Array(TypedArray):
     """64-bit signed BigInt array"""
     _type_name = 'BigInt64'
+    _format = 'q'
     BYTES_PER_ELEMENT = 8
 
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('<q', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('<q', value)
-
 
 class BigUint64Array(TypedArray):
     """64-bit unsigned BigInt array"""
     _type_name = 'BigUint64'
+    _format = 'Q'
     BYTES_PER_ELEMENT = 8
-
-    def _decode_element(self, raw_bytes):
-        return struct.unpack('<Q', raw_bytes)[0]
-
-    def _encode_element(self, value):
-        return struct.pack('<Q', value)
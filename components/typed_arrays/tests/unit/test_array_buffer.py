@@ -84,6 +84,28 @@ class TestArrayBufferResizable:
         buf.resize(32)
         assert buf.byteLength == 32
 
+    def test_resize_does_not_reallocate(self):
+        """resize() stays within the store reserved at construction"""
+        buf = ArrayBuffer(16, {'maxByteLength': 64})
+        store = buf._data
+        buf._set_byte(15, 9)
+
+        buf.resize(64)
+        buf.resize(8)
+        buf.resize(16)
+
+        assert buf._data is store
+        assert buf._get_byte(15) == 0
+
+    def test_large_reservation_is_lazy(self):
+        """Large reservations use an anonymous mapping"""
+        import mmap
+        buf = ArrayBuffer(0, {'maxByteLength': 1 << 30})
+        assert isinstance(buf._data, mmap.mmap)
+        buf.resize(1 << 20)
+        buf._set_byte((1 << 20) - 1, 1)
+        assert buf._get_byte((1 << 20) - 1) == 1
+
     def test_resize_beyond_max_throws(self):
         """Resizing beyond maxByteLength throws"""
         buf = ArrayBuffer(16, {'maxByteLength': 64})
@@ -177,6 +199,46 @@ class TestArrayBufferTransfer:
         buf2 = buf1.transfer(16)
         assert buf2.byteLength == 16
 
+    def test_transfer_moves_backing_store(self):
+        """transfer() hands over the backing store without copying"""
+        buf1 = ArrayBuffer(16)
+        store = buf1._data
+        store[3] = 7
+
+        buf2 = buf1.transfer()
+
+        assert buf2._data is store
+        assert buf2._get_byte(3) == 7
+
+    def test_transfer_smaller_clears_cut_bytes(self):
+        """Bytes cut off by a shrinking transfer read as zero if grown back"""
+        buf1 = ArrayBuffer(8, {'maxByteLength': 16})
+        buf1._set_bytes(0, bytes(range(1, 9)))
+
+        buf2 = buf1.transfer(4)
+        buf2.resize(8)
+
+        assert buf2._get_bytes(0, 8) == bytes([1, 2, 3, 4, 0, 0, 0, 0])
+
+    def test_transfer_preserves_resizability(self):
+        """transfer() keeps a resizable buffer resizable"""
+        buf1 = ArrayBuffer(8, {'maxByteLength': 64})
+        buf2 = buf1.transfer(32)
+
+        assert buf2.resizable
+        assert buf2.maxByteLength == 64
+        with pytest.raises(RangeError):
+            buf2.transfer(128)
+
+    def test_transfer_to_fixed_length(self):
+        """transferToFixedLength() returns a non-resizable buffer"""
+        buf1 = ArrayBuffer(8, {'maxByteLength': 64})
+        buf2 = buf1.transferToFixedLength(16)
+
+        assert not buf2.resizable
+        assert buf2.byteLength == 16
+        assert buf1.detached
+
 
 class TestArrayBufferDetached:
     """Test detached buffer behavior (FR-P3-069)"""
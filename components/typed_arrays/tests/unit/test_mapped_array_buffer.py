@@ -0,0 +1,98 @@
+"""
+Unit tests for MappedArrayBuffer (file-backed ArrayBuffer).
+"""
+
+import builtins
+import os
+import struct
+import tempfile
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from array_buffer import ArrayBuffer
+from data_view import DataView
+from exceptions import RangeError, TypeError
+from mapped_array_buffer import MappedArrayBuffer
+from typed_array import Uint32Array, Uint8Array
+
+
+@pytest.fixture
+def data_file():
+    """Temporary file holding four little-endian uint32 values"""
+    with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+        f.write(struct.pack("<4I", 1, 2, 3, 0xDEADBEEF))
+    yield f.name
+    os.unlink(f.name)
+
+
+class TestMappedArrayBuffer:
+    """Test file-backed ArrayBuffers"""
+
+    def test_views_read_file_contents(self, data_file):
+        """TypedArray and DataView views read the mapped bytes"""
+        buf = MappedArrayBuffer(data_file)
+
+        assert isinstance(buf, ArrayBuffer)
+        assert buf.byteLength == 16
+        assert list(Uint32Array(buf)) == [1, 2, 3, 0xDEADBEEF]
+        assert DataView(buf).getUint32(12, True) == 0xDEADBEEF
+
+    def test_readonly_rejects_writes(self, data_file):
+        """Writes through a read-only mapping fail"""
+        buf = MappedArrayBuffer(data_file)
+        assert buf.readonly
+        # The read-only mapping itself rejects the store
+        with pytest.raises(builtins.TypeError):
+            Uint8Array(buf)[0] = 9
+        with pytest.raises(TypeError):
+            buf.transfer()
+
+    def test_copy_on_write_keeps_file_intact(self, data_file):
+        """Copy-on-write writes are private to the buffer"""
+        buf = MappedArrayBuffer(data_file, "copy-on-write")
+        Uint32Array(buf)[0] = 99
+
+        assert Uint32Array(buf)[0] == 99
+        with open(data_file, "rb") as f:
+            assert struct.unpack("<I", f.read(4))[0] == 1
+
+    def test_unaligned_offset_and_length(self, data_file):
+        """Offsets need not be page aligned"""
+        buf = MappedArrayBuffer(data_file, offset=4, length=8)
+
+        assert list(Uint32Array(buf)) == [2, 3]
+        with pytest.raises(RangeError):
+            MappedArrayBuffer(data_file, offset=8, length=16)
+
+    def test_invalid_mode_throws(self, data_file):
+        """Unknown mapping modes are rejected"""
+        with pytest.raises(TypeError):
+            MappedArrayBuffer(data_file, "read-write")
+
+    def test_close_detaches(self, data_file):
+        """close() detaches the buffer"""
+        buf = MappedArrayBuffer(data_file)
+        view = Uint32Array(buf)
+        buf.close()
+
+        assert buf.detached
+        with pytest.raises(TypeError):
+            view[0]
+
+    def test_large_sparse_file_maps_lazily(self):
+        """Mapping a large file does not read it"""
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            f.truncate(1 << 30)
+        try:
+            with MappedArrayBuffer(f.name) as buf:
+                view = Uint8Array(buf)
+                assert view.length == 1 << 30
+                assert view[(1 << 30) - 1] == 0
+        finally:
+            os.unlink(f.name)
+
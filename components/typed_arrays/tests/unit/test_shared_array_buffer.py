@@ -0,0 +1,94 @@
+"""
+Unit tests for SharedArrayBuffer backed by shared memory.
+"""
+
+import multiprocessing
+import pickle
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from array_buffer import ArrayBuffer
+from exceptions import RangeError, TypeError
+from shared_array_buffer import SharedArrayBuffer
+from typed_array import Int32Array
+
+
+def _fill_in_child(payload, value):
+    """Attach to a pickled buffer in a child process and write to it"""
+    view = Int32Array(pickle.loads(payload))
+    for i in range(view.length):
+        view[i] = value
+
+
+class TestSharedArrayBuffer:
+    """Test SharedArrayBuffer construction and behaviour"""
+
+    def test_is_array_buffer(self):
+        """SharedArrayBuffer works wherever ArrayBuffer is accepted"""
+        sab = SharedArrayBuffer(16)
+        view = Int32Array(sab)
+        view[1] = 42
+
+        assert isinstance(sab, ArrayBuffer)
+        assert sab._shared
+        assert sab.byteLength == 16
+        assert view[1] == 42
+
+    def test_cannot_transfer_or_resize(self):
+        """SharedArrayBuffer is never detached"""
+        sab = SharedArrayBuffer(16)
+        with pytest.raises(TypeError):
+            sab.transfer()
+        with pytest.raises(TypeError):
+            sab.resize(8)
+        assert not sab.detached
+
+    def test_slice_returns_shared_copy(self):
+        """slice() copies into a new SharedArrayBuffer"""
+        sab = SharedArrayBuffer(8)
+        sab._set_bytes(0, bytes(range(8)))
+
+        copy = sab.slice(2, 6)
+        sab._set_byte(2, 99)
+
+        assert isinstance(copy, SharedArrayBuffer)
+        assert copy._get_bytes(0, 4) == bytes([2, 3, 4, 5])
+
+    def test_grow_within_max(self):
+        """grow() extends a growable buffer but never shrinks it"""
+        sab = SharedArrayBuffer(8, {'maxByteLength': 32})
+        sab.grow(24)
+
+        assert sab.growable
+        assert sab.byteLength == 24
+        with pytest.raises(RangeError):
+            sab.grow(16)
+        with pytest.raises(RangeError):
+            sab.grow(64)
+
+    def test_pickle_attaches_to_same_memory(self):
+        """Unpickling attaches to the segment instead of copying it"""
+        sab = SharedArrayBuffer(8, {'maxByteLength': 16})
+        other = pickle.loads(pickle.dumps(sab))
+
+        other._set_byte(0, 5)
+        sab.grow(16)
+
+        assert other is not sab
+        assert sab._get_byte(0) == 5
+        assert other.byteLength == 16
+
+    def test_visible_across_processes(self):
+        """Writes made by a child process are seen by the parent"""
+        sab = SharedArrayBuffer(64)
+        context = multiprocessing.get_context("fork")
+        child = context.Process(target=_fill_in_child, args=(pickle.dumps(sab), 7))
+        child.start()
+        child.join()
+
+        assert child.exitcode == 0
+        assert list(Int32Array(sab)) == [7] * 16
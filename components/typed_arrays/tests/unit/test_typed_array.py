@@ -580,3 +580,70 @@ class TestTypedArrayDetachedBuffer:
 
         with pytest.raises(TypeError):
             arr.slice()
+
+
+class TestTypedArrayBulkOperations:
+    """Test bulk operations running over the shared element view"""
+
+    def test_views_share_memory(self):
+        """Writes through one view are visible through another view of the buffer"""
+        buf = ArrayBuffer(8)
+        ints = Int32Array(buf)
+        bytes_view = Uint8Array(buf, 4, 4)
+
+        ints[1] = 0x01020304
+        assert sorted(bytes_view) == [1, 2, 3, 4]
+
+    def test_set_overlapping_same_buffer(self):
+        """set() from an overlapping view of the same buffer behaves like a copy"""
+        arr = Int16Array([1, 2, 3, 4, 5])
+        arr.set(arr.subarray(0, 4), 1)
+        assert list(arr) == [1, 1, 2, 3, 4]
+
+    def test_set_converts_between_types(self):
+        """set() from another element type converts each value"""
+        target = Int8Array(3)
+        target.set(Float64Array([1.9, 200.0, -1.5]))
+        assert list(target) == [1, -56, -1]
+
+    def test_copy_within_overlapping(self):
+        """copyWithin handles overlapping source and target"""
+        arr = Uint8Array([1, 2, 3, 4, 5])
+        arr.copyWithin(1, 0, 4)
+        assert list(arr) == [1, 1, 2, 3, 4]
+
+    def test_float_sort_orders_zeros_and_nan(self):
+        """Default sort puts -0 before +0 and NaN last"""
+        import math
+        arr = Float64Array([float('nan'), 0.0, 3.0, -0.0, -1.0])
+        arr.sort()
+
+        values = list(arr)
+        assert values[:4] == [-1.0, 0.0, 0.0, 3.0]
+        assert math.copysign(1.0, values[1]) == -1.0
+        assert math.copysign(1.0, values[2]) == 1.0
+        assert math.isnan(values[4])
+
+    def test_search_uses_strict_equality(self):
+        """indexOf ignores NaN and booleans, includes finds NaN"""
+        arr = Float32Array([1.0, float('nan'), 1.0])
+        assert arr.indexOf(float('nan')) == -1
+        assert arr.includes(float('nan')) is True
+        assert arr.indexOf(True) == -1
+        assert arr.lastIndexOf(1) == 2
+        assert arr.indexOf(1, 1) == 2
+
+    def test_view_rebinds_after_resize(self):
+        """Views keep working after their resizable buffer is resized"""
+        buf = ArrayBuffer(8, {'maxByteLength': 32})
+        arr = Uint8Array(buf, 0, 4)
+        arr[0] = 7
+
+        buf.resize(32)
+        arr[1] = 9
+        assert list(arr) == [7, 9, 0, 0]
+        assert Uint8Array(buf)[1] == 9
+
+        buf.resize(2)
+        with pytest.raises(RangeError):
+            arr[0]
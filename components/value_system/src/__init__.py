@@ -15,6 +15,9 @@ Public API:
     - ToNumber: Convert value to number
     - ToString: Convert value to string
     - ToBoolean: Convert value to boolean
+    - NumberMultiply, NumberDivide, NumberRemainder, NumberUnaryMinus:
+      Number arithmetic where it differs from Python's
+    - NumberToString: Format a number like JavaScript
     - NULL_VALUE: Sentinel for JavaScript null
 """
 
@@ -28,6 +31,13 @@ from .type_check import (
     NULL_VALUE,
 )
 from .conversions import ToNumber, ToString, ToBoolean
+from .number import (
+    NumberMultiply,
+    NumberDivide,
+    NumberRemainder,
+    NumberUnaryMinus,
+    NumberToString,
+)
 
 __all__ = [
     "Value",
@@ -40,6 +50,11 @@ __all__ = [
     "ToString",
     "ToBoolean",
     "NULL_VALUE",
+    "NumberMultiply",
+    "NumberDivide",
+    "NumberRemainder",
+    "NumberUnaryMinus",
+    "NumberToString",
 ]
 
 __version__ = "0.1.0"
@@ -9,6 +9,7 @@ the ECMAScript specification semantics.
 import math
 from .value import Value
 from .type_check import NULL_VALUE
+from .number import NumberToString
 
 
 def ToNumber(value: Value) -> float:
@@ -86,7 +87,7 @@ def ToString(value: Value) -> str:
     Convert value to string per ECMAScript ToString abstract operation.
 
     Conversion rules (ECMAScript spec):
-    - SMI: String representation of the number
+    - Number (SMI or heap number): Number::toString
     - String: Return unchanged
     - Undefined: "undefined"
     - Null: "null"
@@ -126,6 +127,10 @@ def ToString(value: Value) -> str:
         if isinstance(obj, str):
             return obj
 
+        # Heap number -> JavaScript number formatting
+        if type(obj) is float:
+            return NumberToString(obj)
+
         # Other objects: use Python's str()
         return str(obj)
 
@@ -138,7 +143,7 @@ def ToBoolean(value: Value) -> bool:
     Convert value to boolean per ECMAScript ToBoolean abstract operation.
 
     Conversion rules (ECMAScript spec):
-    - Falsy values: 0, "", undefined, null -> False
+    - Falsy values: 0, -0, NaN, "", undefined, null -> False
     - Everything else -> True
 
     Args:
@@ -178,6 +183,10 @@ def ToBoolean(value: Value) -> bool:
         if isinstance(obj, str):
             return len(obj) > 0
 
+        # Heap numbers: -0 and NaN are falsy
+        if type(obj) is float:
+            return obj != 0 and obj == obj
+
         # All other objects are truthy (including empty lists/dicts)
         # This matches JavaScript semantics where objects are always truthy
         return True
@@ -0,0 +1,134 @@
+"""
+ECMAScript Number operations.
+
+Number arithmetic on the numeric values of SMIs (Python ints) and heap
+numbers (Python floats), following the Number::* abstract operations.
+Results are ints when they are exact integers and floats otherwise (-0,
+fractions, NaN, infinities); Value.from_number() boxes them.
+
+Addition and subtraction are plain Python + and -; the operations here are
+the ones where Python's semantics differ from ECMAScript's.
+"""
+
+import math
+from decimal import Decimal
+from typing import Union
+
+Number = Union[int, float]
+
+
+def NumberMultiply(x: Number, y: Number) -> Number:
+    """
+    Multiply per Number::multiply.
+
+    Integer products are exact, except that a zero product with a negative
+    factor is -0.
+
+    Example:
+        >>> NumberMultiply(0, -3)
+        -0.0
+    """
+    result = x * y
+    if result == 0 and type(result) is int and (x < 0 or y < 0):
+        return -0.0
+    return result
+
+
+def NumberDivide(x: Number, y: Number) -> Number:
+    """
+    Divide per Number::divide.
+
+    Division by zero gives NaN or a signed infinity instead of raising.
+
+    Example:
+        >>> NumberDivide(7, 2)
+        3.5
+        >>> NumberDivide(-1, 0)
+        -inf
+    """
+    if y == 0:
+        if x == 0 or x != x:
+            return math.nan
+        sign = math.copysign(1.0, x) * math.copysign(1.0, y)
+        return math.copysign(math.inf, sign)
+    if type(x) is int and type(y) is int and x % y == 0 and (x != 0 or y > 0):
+        return x // y
+    return x / y
+
+
+def NumberRemainder(x: Number, y: Number) -> Number:
+    """
+    Remainder per Number::remainder: the result has the sign of x.
+
+    Example:
+        >>> NumberRemainder(-7, 2)
+        -1
+        >>> NumberRemainder(5, 0)
+        nan
+    """
+    if y == 0 or x != x or y != y or math.isinf(x):
+        return math.nan
+    if type(x) is int and type(y) is int:
+        result = abs(x) % abs(y)
+        if x < 0:
+            return -result if result else -0.0
+        return result
+    return math.fmod(x, y)
+
+
+def NumberUnaryMinus(x: Number) -> Number:
+    """
+    Negate per Number::unaryMinus: negating integer 0 gives -0.
+
+    Example:
+        >>> NumberUnaryMinus(0)
+        -0.0
+    """
+    if x == 0 and type(x) is int:
+        return -0.0
+    return -x
+
+
+def NumberToString(x: Number) -> str:
+    """
+    Convert a number to a string per Number::toString (radix 10).
+
+    Integral values print without a fraction, very large and very small
+    magnitudes use exponent notation.
+
+    Example:
+        >>> NumberToString(3.0)
+        '3'
+        >>> NumberToString(1e21)
+        '1e+21'
+        >>> NumberToString(0.000001)
+        '0.000001'
+    """
+    if type(x) is int:
+        return str(x)
+    if x != x:
+        return "NaN"
+    if x == 0:
+        return "0"
+    if math.isinf(x):
+        return "Infinity" if x > 0 else "-Infinity"
+    if x < 0:
+        return "-" + NumberToString(-x)
+
+    # Shortest round-tripping digits (repr) as digits * 10^(n - k)
+    _, digit_tuple, exponent = Decimal(repr(x)).as_tuple()
+    digits = "".join(map(str, digit_tuple)).rstrip("0")
+    exponent += len(digit_tuple) - len(digits)
+    k = len(digits)
+    n = exponent + k
+
+    if k <= n <= 21:
+        return digits + "0" * (n - k)
+    if 0 < n <= 21:
+        return digits[:n] + "." + digits[n:]
+    if -6 < n <= 0:
+        return "0." + "0" * -n + digits
+    e = n - 1
+    sign = "+" if e >= 0 else "-"
+    mantissa = digits if k == 1 else digits[0] + "." + digits[1:]
+    return f"{mantissa}e{sign}{abs(e)}"
@@ -24,8 +24,7 @@ def IsNumber(value: Value) -> bool:
     """
     Check if value is number (SMI or boxed double).
 
-    In this implementation, we consider SMI values as numbers.
-    Boxed doubles would also be numbers but are not yet implemented.
+    Numbers are SMIs and heap numbers (boxed floats).
 
     Args:
         value: Value to check
@@ -38,9 +37,7 @@ def IsNumber(value: Value) -> bool:
         >>> IsNumber(v)
         True
     """
-    # For now, only SMI values are numbers
-    # Future: check for boxed double objects
-    return value.is_smi()
+    return value.is_number()
 
 
 def IsString(value: Value) -> bool:
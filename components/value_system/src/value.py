@@ -6,11 +6,18 @@ to efficiently represent JavaScript values with SMI (Small Integer)
 optimization.
 
 Tagged Pointer Encoding:
-    - SMI: Tag in low 2 bits = 0b00, value in upper bits (30-bit signed)
+    - SMI: Tag in low 2 bits = 0b00, value in upper bits (31-bit signed)
     - Object: Tag in low 2 bits = 0b01, pointer/id in upper bits
+
+Numbers that do not fit a SMI (fractions, NaN, infinities, -0 and
+integers outside the SMI range) are heap numbers: object-tagged Values
+that carry their Python float inline instead of in the object registry,
+so they are freed with the Value. Value.from_number() picks the
+representation.
 """
 
-from typing import Any
+import math
+from typing import Any, Union
 
 
 # Tag masks and values
@@ -21,6 +28,11 @@ OBJECT_TAG = 0b01  # Tag for heap object
 # Bit positions
 TAG_BITS = 2  # Number of bits used for tag
 
+# SMI payload range (31-bit signed); arithmetic results outside it are
+# promoted to heap numbers
+SMI_MIN_VALUE = -(2**30)
+SMI_MAX_VALUE = 2**30 - 1
+
 
 class Value:
     """
@@ -33,8 +45,11 @@ class Value:
 
     Attributes:
         _raw (int): Raw tagged pointer value containing type tag and data
+        _double (float): Number of a heap number, None for other values
     """
 
+    _double = None
+
     def __init__(self, raw: int) -> None:
         """
         Create Value from raw tagged pointer.
@@ -54,7 +69,7 @@ class Value:
         the tag.
 
         Args:
-            value: Integer value to encode (-2^29 to 2^29-1)
+            value: Integer value to encode (SMI_MIN_VALUE to SMI_MAX_VALUE)
 
         Returns:
             Value object with SMI encoding
@@ -93,6 +108,9 @@ class Value:
             >>> v.to_object() is obj
             True
         """
+        if type(obj) is float:
+            return Value.from_double(obj)
+
         # Store object in registry and get ID
         obj_id = id(obj)
         _object_registry[obj_id] = obj
@@ -101,6 +119,59 @@ class Value:
         raw = (obj_id << TAG_BITS) | OBJECT_TAG
         return Value(raw)
 
+    @staticmethod
+    def from_double(value: float) -> "Value":
+        """
+        Create a heap number.
+
+        Args:
+            value: Number to box as a float
+
+        Returns:
+            Object-tagged Value holding the float
+
+        Example:
+            >>> Value.from_double(1.5).to_number()
+            1.5
+        """
+        number = float(value)
+        # The id only fills the tag bits' payload; the float itself lives
+        # on the Value, so nothing outlives it in the registry
+        result = Value((id(number) << TAG_BITS) | OBJECT_TAG)
+        result._double = number
+        return result
+
+    @staticmethod
+    def from_number(value: Union[int, float]) -> "Value":
+        """
+        Create a number value in its smallest representation.
+
+        Integers (and integral floats other than -0) in the SMI range become
+        SMIs; everything else becomes a heap number. Arithmetic uses this to
+        promote overflowing SMI results.
+
+        Args:
+            value: int or float
+
+        Returns:
+            SMI or heap number Value
+
+        Example:
+            >>> Value.from_number(2**30).is_smi()
+            False
+            >>> Value.from_number(4.0).is_smi()
+            True
+        """
+        if isinstance(value, float):
+            if not value.is_integer() or (
+                value == 0 and math.copysign(1.0, value) < 0
+            ):
+                return Value.from_double(value)
+            value = int(value)
+        if SMI_MIN_VALUE <= value <= SMI_MAX_VALUE:
+            return Value((value << TAG_BITS) | SMI_TAG)
+        return Value.from_double(value)
+
     def is_smi(self) -> bool:
         """
         Check if value is SMI (Small Integer).
@@ -119,6 +190,41 @@ class Value:
         """
         return (self._raw & TAG_MASK) == OBJECT_TAG
 
+    def is_double(self) -> bool:
+        """
+        Check if value is a heap number.
+
+        Returns:
+            True if value is a boxed float, False otherwise
+        """
+        return self._double is not None
+
+    def is_number(self) -> bool:
+        """
+        Check if value is a number (SMI or heap number).
+
+        Returns:
+            True if value is a number, False otherwise
+        """
+        return self.is_smi() or self.is_double()
+
+    def to_number(self) -> Union[int, float]:
+        """
+        Extract the numeric value of a SMI or heap number.
+
+        Returns:
+            int for SMIs, float for heap numbers
+
+        Raises:
+            TypeError: If value is not a number
+        """
+        if (self._raw & TAG_MASK) == SMI_TAG:
+            return self._raw >> TAG_BITS
+        value = self._double
+        if value is None:
+            raise TypeError("Value is not a number")
+        return value
+
     def to_smi(self) -> int:
         """
         Extract SMI integer value.
@@ -153,6 +259,8 @@ class Value:
         """
         if not self.is_object():
             raise TypeError("Value is not an object")
+        if self._double is not None:
+            return self._double
 
         # Extract object ID
         obj_id = self._raw >> TAG_BITS
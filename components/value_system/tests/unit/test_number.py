@@ -0,0 +1,130 @@
+"""
+Unit tests for number representation and Number operations.
+
+This module tests SMI/heap number selection in Value.from_number() and
+the Number::* operations whose semantics differ from Python's.
+"""
+
+import math
+
+import pytest
+
+
+class TestFromNumber:
+    """Test choosing between SMI and heap number."""
+
+    def test_small_integers_are_smis(self):
+        """
+        Given integers inside the SMI range (and integral floats)
+        When creating number values
+        Then they are SMIs
+        """
+        from components.value_system.src.value import SMI_MAX_VALUE, SMI_MIN_VALUE, Value
+
+        for number in (0, -5, SMI_MAX_VALUE, SMI_MIN_VALUE, 4.0):
+            value = Value.from_number(number)
+            assert value.is_smi()
+            assert value.to_number() == number
+
+    def test_other_numbers_are_heap_numbers(self):
+        """
+        Given fractions, -0, NaN, infinities and integers past the SMI range
+        When creating number values
+        Then they are heap numbers holding a float
+        """
+        from components.value_system.src.value import SMI_MAX_VALUE, Value
+
+        for number in (1.5, -0.0, math.inf, SMI_MAX_VALUE + 1):
+            value = Value.from_number(number)
+            assert value.is_double()
+            assert value.is_number()
+            assert math.copysign(1, value.to_number()) == math.copysign(1, number)
+        assert math.isnan(Value.from_number(math.nan).to_number())
+
+    def test_heap_numbers_stay_out_of_object_registry(self):
+        """
+        Given many heap numbers created and dropped
+        When they go out of scope
+        Then the object registry has not grown
+        """
+        from components.value_system.src.value import Value, _object_registry
+
+        initial_size = len(_object_registry)
+        for i in range(1000):
+            Value.from_number(i + 0.5)
+            Value.from_object(i + 0.25)
+
+        assert len(_object_registry) == initial_size
+        assert Value.from_object(0.25).to_object() == 0.25
+
+    def test_to_number_rejects_non_numbers(self):
+        """
+        Given a string value
+        When extracting its number
+        Then TypeError is raised
+        """
+        from components.value_system.src.value import Value
+
+        with pytest.raises(TypeError):
+            Value.from_object("1").to_number()
+
+
+class TestNumberOperations:
+    """Test Number::* operations."""
+
+    @pytest.mark.parametrize(
+        "x, y, expected",
+        [(6, 3, 2), (7, 2, 3.5), (-7, 2, -3.5), (0, -5, -0.0), (1, 0, math.inf), (-1, 0, -math.inf)],
+    )
+    def test_divide(self, x, y, expected):
+        """Division is exact for integers and never raises."""
+        from components.value_system.src import NumberDivide
+
+        result = NumberDivide(x, y)
+
+        assert result == expected
+        assert type(result) is type(expected)
+        assert math.copysign(1, result) == math.copysign(1, expected)
+
+    def test_divide_zero_by_zero_is_nan(self):
+        """0 / 0 is NaN."""
+        from components.value_system.src import NumberDivide
+
+        assert math.isnan(NumberDivide(0, 0))
+
+    @pytest.mark.parametrize(
+        "x, y, expected", [(7, 2, 1), (-7, 2, -1), (7, -2, 1), (7.5, 2, 1.5)]
+    )
+    def test_remainder_takes_sign_of_dividend(self, x, y, expected):
+        """The remainder has the sign of the dividend."""
+        from components.value_system.src import NumberRemainder
+
+        assert NumberRemainder(x, y) == expected
+
+    def test_negative_zero_results(self):
+        """Integer operations that produce -0 return the float -0.0."""
+        from components.value_system.src import NumberMultiply, NumberRemainder, NumberUnaryMinus
+
+        for result in (NumberMultiply(0, -3), NumberRemainder(-4, 2), NumberUnaryMinus(0)):
+            assert result == 0 and math.copysign(1, result) == -1
+
+    @pytest.mark.parametrize(
+        "number, text",
+        [
+            (3.0, "3"),
+            (-2.5, "-2.5"),
+            (0.1 + 0.2, "0.30000000000000004"),
+            (-0.0, "0"),
+            (1e21, "1e+21"),
+            (1e20, "100000000000000000000"),
+            (0.000001, "0.000001"),
+            (1.5e-7, "1.5e-7"),
+            (math.nan, "NaN"),
+            (-math.inf, "-Infinity"),
+        ],
+    )
+    def test_to_string(self, number, text):
+        """Numbers print like JavaScript's Number::toString."""
+        from components.value_system.src import NumberToString
+
+        assert NumberToString(number) == text